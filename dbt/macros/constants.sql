@@ -9,6 +9,7 @@
      - evt_*()          → lowercase event types (event stream layer)
      - EVT_*()          → UPPERCASE event types (seed/parameter layer)
      - cat_*()          → event category values
+     - chg_*()          → enrollment_change_type payload values
      - dq_*()           → data quality flag values
      - default_*()      → default identifiers
 
@@ -54,6 +55,21 @@
 {% macro cat_benefits() %}'benefits'{% endmacro %}
 {% macro cat_eligibility() %}'eligibility'{% endmacro %}
 
+{# ── Enrollment change types (EnrollmentChangePayload.change_type) ── #}
+
+{% macro chg_opt_out() %}'opt_out'{% endmacro %}
+{% macro chg_rate_change() %}'rate_change'{% endmacro %}
+
+{# Returns TRUE when the event is an opt-out. Rows published before
+   enrollment_change_type existed hold NULL there (on_schema_change sync), so
+   they fall back to the event_details text the accumulators used to match. #}
+{% macro is_opt_out(change_type_col, details_col) %}
+COALESCE(
+    {{ change_type_col }},
+    CASE WHEN LOWER({{ details_col }}) LIKE '%opt-out%' THEN {{ chg_opt_out() }} END
+) = {{ chg_opt_out() }}
+{% endmacro %}
+
 {# ── Data quality ─────────────────────────────────────── #}
 
 {% macro dq_valid() %}'VALID'{% endmacro %}
@@ -23,6 +23,18 @@ Provides standardized deferral rate configuration functions
     )
 {% endmacro %}
 
+{#
+    Deferral rate of an enrollment event: the typed rate published by
+    int_current_year_events, or for rows published before it was always set,
+    the rate printed in event_details. NULL when neither is present.
+#}
+{% macro enrollment_deferral_rate(rate_field, details_field) %}
+    COALESCE(
+        {{ rate_field }},
+        CAST(NULLIF(REGEXP_EXTRACT({{ details_field }}, '([0-9]+\.?[0-9]*)%\s*deferral', 1), '') AS DECIMAL(6,4)) / 100.0
+    )
+{% endmacro %}
+
 {% macro census_fallback_rate() %}
     {{ var('census_fallback_rate', 0.03) }}
 {% endmacro %}
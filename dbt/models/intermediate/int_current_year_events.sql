@@ -266,8 +266,25 @@ final_events AS (
     event_details,
     compensation_amount,
     previous_compensation,
-    employee_deferral_rate,
+    -- Typed payload: enrollment rows always carry their rate, so readers never
+    -- re-parse event_details. The text is parsed here once, at publication.
+    CASE
+      WHEN employee_deferral_rate IS NULL AND event_type = {{ evt_enrollment() }}
+      THEN CAST(
+        CAST(NULLIF(REGEXP_EXTRACT(event_details, '([0-9]+\.?[0-9]*)%\s*deferral', 1), '') AS DECIMAL(6,4)) / 100.0
+        AS DECIMAL(5,4))
+      ELSE employee_deferral_rate
+    END AS employee_deferral_rate,
     prev_employee_deferral_rate,
+    -- Opt-outs are classified exactly as the accumulators' text match did.
+    CASE
+      WHEN event_type = {{ evt_enrollment_change() }}
+      THEN CASE
+        WHEN LOWER(event_details) LIKE '%opt-out%'
+        THEN {{ chg_opt_out() }}
+        ELSE {{ chg_rate_change() }}
+      END
+    END AS enrollment_change_type,
     employee_age,
     employee_tenure,
     level_id,
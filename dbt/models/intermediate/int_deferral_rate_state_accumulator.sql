@@ -41,16 +41,8 @@ current_year_new_enrollments AS (
     SELECT
         employee_id,
         effective_date as enrollment_date,
-        -- Use employee_deferral_rate if available, otherwise extract from event_details
-        COALESCE(
-            employee_deferral_rate,
-            CASE
-                WHEN REGEXP_EXTRACT(event_details, '([0-9]+\.?[0-9]*)%\s*deferral', 1) IS NOT NULL
-                     AND REGEXP_EXTRACT(event_details, '([0-9]+\.?[0-9]*)%\s*deferral', 1) != ''
-                THEN CAST(REGEXP_EXTRACT(event_details, '([0-9]+\.?[0-9]*)%\s*deferral', 1) AS DECIMAL(6,4)) / 100.0
-                ELSE 0.06
-            END
-        ) as initial_deferral_rate,
+        -- Typed rate from publication (int_current_year_events), else the legacy text
+        {{ enrollment_deferral_rate('employee_deferral_rate', 'event_details') }} as initial_deferral_rate,
         simulation_year,
         'fct_yearly_events' as source,
         ROW_NUMBER() OVER (
@@ -138,16 +130,8 @@ historical_enrollments AS (
     SELECT
         employee_id,
         effective_date as enrollment_date,
-        -- Use employee_deferral_rate if available, otherwise extract from event_details
-        COALESCE(
-            employee_deferral_rate,
-            CASE
-                WHEN REGEXP_EXTRACT(event_details, '([0-9]+\.?[0-9]*)%\s*deferral', 1) IS NOT NULL
-                     AND REGEXP_EXTRACT(event_details, '([0-9]+\.?[0-9]*)%\s*deferral', 1) != ''
-                THEN CAST(REGEXP_EXTRACT(event_details, '([0-9]+\.?[0-9]*)%\s*deferral', 1) AS DECIMAL(6,4)) / 100.0
-                ELSE 0.06
-            END
-        ) as initial_deferral_rate,
+        -- Typed rate from publication (int_current_year_events), else the legacy text
+        {{ enrollment_deferral_rate('employee_deferral_rate', 'event_details') }} as initial_deferral_rate,
         simulation_year as enrollment_year,
         'fct_yearly_events' as source,
         ROW_NUMBER() OVER (
@@ -118,18 +118,16 @@ enrollment_state AS (
 
 -- Feature 101: Same-year enroll → opt-out active-enrollment window.
 -- The year-end deferral rate is 0 (post-opt-out), so recover the deferral rate
--- that was in effect during the enrollment window from the enrollment event payload,
--- mirroring int_deferral_rate_state_accumulator's parse.
+-- that was in effect during the enrollment window from the enrollment event's typed
+-- employee_deferral_rate, published by int_current_year_events.
 enroll_optout_window AS (
     SELECT
         employee_id,
         MAX(CASE WHEN event_type = {{ evt_enrollment() }} THEN effective_date::DATE END) AS enroll_date,
         MAX(CASE WHEN event_type = {{ evt_enrollment_change() }}
-                  AND LOWER(event_details) LIKE '%opt-out%' THEN effective_date::DATE END) AS opt_out_date,
+                  AND enrollment_change_type = {{ chg_opt_out() }} THEN effective_date::DATE END) AS opt_out_date,
         MAX(CASE WHEN event_type = {{ evt_enrollment() }}
-                  THEN COALESCE(
-                      CAST(NULLIF(REGEXP_EXTRACT(event_details, '([0-9]+\.?[0-9]*)%\s*deferral', 1), '') AS DECIMAL(6,4)) / 100.0,
-                      0.06)
+                  THEN COALESCE(employee_deferral_rate, 0.06)
             END) AS enrollment_window_deferral_rate
     FROM {{ ref('fct_yearly_events') }}
     WHERE simulation_year = (SELECT current_year FROM simulation_parameters)
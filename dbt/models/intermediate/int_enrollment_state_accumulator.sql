@@ -55,7 +55,7 @@ WITH current_year_enrollment_events AS (
         END AS new_enrollment_date,
         CASE
             WHEN event_type = {{ evt_enrollment() }} THEN true
-            WHEN event_type = {{ evt_enrollment_change() }} AND LOWER(event_details) LIKE '%opt-out%' THEN false
+            WHEN event_type = {{ evt_enrollment_change() }} AND {{ is_opt_out('enrollment_change_type', 'event_details') }} THEN false
             ELSE NULL
         END AS enrollment_status_change,
         -- Track enrollment method from event_category
@@ -66,7 +66,7 @@ WITH current_year_enrollment_events AS (
         END AS enrollment_method,
         -- Track opt-out events
         CASE
-            WHEN event_type = {{ evt_enrollment_change() }} AND LOWER(event_details) LIKE '%opt-out%' THEN true
+            WHEN event_type = {{ evt_enrollment_change() }} AND {{ is_opt_out('enrollment_change_type', 'event_details') }} THEN true
             ELSE false
         END AS is_opt_out_event,
         -- Add event priority for handling multiple events per employee
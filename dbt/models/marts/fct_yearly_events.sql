@@ -24,6 +24,7 @@ SELECT
   previous_compensation,
   employee_deferral_rate,
   prev_employee_deferral_rate,
+  enrollment_change_type,
   employee_age,
   CAST(employee_tenure AS DECIMAL(12,2)) AS employee_tenure,
   level_id,
@@ -59,6 +59,7 @@ from .services.scenario_read_warning import (
     ScenarioReadRef,
     build_scenario_read_headers,
 )
+from .storage.catalog_index import catalog_for
 from .storage.workspace_storage import WorkspaceStorage
 
 # Configure logging to show in console
@@ -97,6 +98,7 @@ SCENARIO_READ_ROUTES = {
     "list_runs",
     "get_run",
     "get_run_logs",
+    "get_run_trace",
     "get_results",
     "export_results",
     "get_active_simulations",
@@ -116,6 +118,7 @@ SCENARIO_READ_ROUTES = {
     "run_adp_test",
     "search_employees",
     "get_employee_timeline",
+    "get_payroll_ledger",
     "get_scenario_evidence_pack",
 }
 
@@ -194,6 +197,9 @@ async def lifespan(app: FastAPI):
     # Startup: ensure workspaces directory exists
     settings.workspaces_root.mkdir(parents=True, exist_ok=True)
 
+    # Validate the workspace catalog against file mtimes before serving.
+    await asyncio.to_thread(catalog_for, settings.workspaces_root)
+
     yield
 
     # Shutdown: cleanup if needed
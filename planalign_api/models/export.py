@@ -19,6 +19,21 @@ class ManifestContents(BaseModel):
     )
 
 
+class ArchiveFormat(str, Enum):
+    """Workspace archive container format."""
+
+    SEVEN_ZIP = "7z"
+    ZSTD = "tar.zst"
+
+
+class ExportedFile(BaseModel):
+    """One workspace file recorded in a ``tar.zst`` manifest."""
+
+    sha256: str = Field(..., description="SHA256 of the file contents")
+    size_bytes: int = Field(..., ge=0, description="File size in bytes")
+    mtime_ns: int = Field(..., description="Modification time when exported")
+
+
 class ExportManifest(BaseModel):
     """Manifest file included in every workspace archive for integrity and version tracking."""
 
@@ -32,6 +47,26 @@ class ExportManifest(BaseModel):
     workspace_id: str = Field(..., description="Original workspace UUID")
     workspace_name: str = Field(..., description="Human-readable workspace name")
     contents: ManifestContents = Field(..., description="Inventory of archive contents")
+    format: ArchiveFormat = Field(
+        default=ArchiveFormat.SEVEN_ZIP, description="Archive container format"
+    )
+    export_id: Optional[str] = Field(
+        None, description="ID of this export, usable as a later incremental base"
+    )
+    base_export_id: Optional[str] = Field(
+        None, description="Export this archive is incremental to, if any"
+    )
+    current_results_only: bool = Field(
+        default=False, description="Only each scenario's current-result run included"
+    )
+    files: Dict[str, ExportedFile] = Field(
+        default_factory=dict,
+        description="Every workspace file by relative path (tar.zst only)",
+    )
+    blobs: List[str] = Field(
+        default_factory=list,
+        description="Content hashes stored in this archive (tar.zst only)",
+    )
 
     class Config:
         json_encoders = {
@@ -55,6 +90,9 @@ class ExportResult(BaseModel):
     size_bytes: int = Field(default=0, ge=0, description="Archive size in bytes")
     status: ExportStatus = Field(..., description="Export status")
     error: Optional[str] = Field(None, description="Error message if failed")
+    export_id: Optional[str] = Field(
+        None, description="ID a later incremental tar.zst export can build on"
+    )
 
 
 class BulkExportRequest(BaseModel):
@@ -66,6 +104,13 @@ class BulkExportRequest(BaseModel):
         max_length=50,
         description="List of workspace UUIDs to export",
     )
+    format: ArchiveFormat = Field(
+        default=ArchiveFormat.SEVEN_ZIP, description="Archive container format"
+    )
+    current_results_only: bool = Field(
+        default=False,
+        description="Export only each scenario's current-result run",
+    )
 
 
 class BulkOperationStatus(str, Enum):
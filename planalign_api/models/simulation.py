@@ -34,6 +34,52 @@ class LogPage(BaseModel):
     log_available: bool = Field(..., description="False if no log file exists yet")
 
 
+class RunTraceSpan(BaseModel):
+    """One span of a run trace (run, year, stage, dbt invocation or model)."""
+
+    span_id: int = Field(..., description="Span identifier within the run")
+    parent_id: Optional[int] = Field(default=None, description="Enclosing span")
+    name: str = Field(..., description="Span name, e.g. a stage or dbt model")
+    category: str = Field(
+        ...,
+        description="run, year, phase, stage, dbt_invocation, dbt_node or dbt_phase",
+    )
+    thread: Optional[str] = Field(
+        default=None, description="Orchestrator or dbt worker thread"
+    )
+    start_seconds: float = Field(..., description="Start offset from the run start")
+    duration_seconds: float = Field(..., description="Wall-clock duration")
+    residue_seconds: Optional[float] = Field(
+        default=None, description="Time not covered by any child span"
+    )
+    year: Optional[int] = Field(default=None, description="Simulation year")
+    stage: Optional[str] = Field(default=None, description="Workflow stage")
+    status: Optional[str] = Field(default=None, description="Outcome of the span")
+    rows_affected: Optional[int] = Field(
+        default=None, description="Rows reported by dbt"
+    )
+    peak_rss_mb: Optional[float] = Field(
+        default=None, description="Peak orchestrator RSS"
+    )
+    peak_tree_rss_mb: Optional[float] = Field(
+        default=None, description="Peak RSS of the orchestrator and its dbt children"
+    )
+    tree_cpu_seconds: Optional[float] = Field(
+        default=None, description="CPU time of the process tree during the span"
+    )
+
+
+class RunTrace(BaseModel):
+    """Span trace of a simulation run, read from simulation.trace.json."""
+
+    run_id: str = Field(..., description="The run this trace belongs to")
+    trace_available: bool = Field(..., description="False if the run wrote no trace")
+    total_seconds: Optional[float] = Field(
+        default=None, description="Duration of the root run span"
+    )
+    spans: List[RunTraceSpan] = Field(default_factory=list)
+
+
 class PerformanceMetrics(BaseModel):
     """Real-time performance metrics during simulation."""
 
@@ -81,3 +81,27 @@ class EmployeeSearchResponse(BaseModel):
     total: int
     page: int
     page_size: int
+
+
+class PayPeriodEarnings(BaseModel):
+    employee_id: str
+    simulation_year: int
+    pay_period_number: int
+    pay_period_start_date: date
+    pay_period_end_date: date
+    total_periods_in_year: int
+    annual_salary_rate_on_pay_date: float
+    period_earnings: float
+    is_first_period_after_hire: bool | None = None
+    is_last_period_before_termination: bool
+
+
+class PayrollLedgerResponse(BaseModel):
+    workspace_id: str
+    scenario_id: str
+    years: list[int]
+    available_years: list[int]
+    results: list[PayPeriodEarnings]
+    total: int
+    page: int
+    page_size: int
@@ -17,6 +17,8 @@ from ..models.simulation import (
     RunRequest,
     RunSummary,
     RunTelemetryResponse,
+    RunTrace,
+    RunTraceSpan,
     SimulationLogLine,
     SimulationResults,
     SimulationRun,
@@ -598,6 +600,67 @@ async def get_run_logs(
     )
 
 
+@router.get("/{scenario_id}/runs/{run_id}/trace", response_model=RunTrace)
+async def get_run_trace(
+    scenario_id: str,
+    run_id: str,
+    include_phases: bool = Query(
+        default=False, description="Include dbt compile/execute phase spans"
+    ),
+    storage: WorkspaceStorage = Depends(get_storage),
+) -> RunTrace:
+    """Get the span trace (run, years, stages, dbt models) of a simulation run."""
+    from planalign_orchestrator.monitoring.tracing import (
+        load_trace_spans,
+        trace_path_for,
+    )
+
+    workspace, scenario = _find_scenario_and_workspace(storage, scenario_id)
+    if not scenario or not workspace:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Scenario {scenario_id} not found",
+        )
+
+    scenario_path = storage._scenario_path(workspace.id, scenario_id)
+
+    try:
+        run_path = resolve_run_directory(scenario_path, run_id)
+    except RunPathError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        )
+    except RunNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Run {run_id} not found",
+        )
+    canonical_run_id = run_path.name
+    trace_file = trace_path_for(run_path / "simulation.duckdb")
+    if not trace_file.exists():
+        return RunTrace(run_id=canonical_run_id, trace_available=False)
+
+    try:
+        raw_spans = load_trace_spans(trace_file)
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Unreadable trace for run {canonical_run_id}: {e}")
+        return RunTrace(run_id=canonical_run_id, trace_available=False)
+
+    spans = [
+        RunTraceSpan.model_validate(span)
+        for span in raw_spans
+        if include_phases or span.get("category") != "dbt_phase"
+    ]
+    root = next((span for span in spans if span.category == "run"), None)
+    return RunTrace(
+        run_id=canonical_run_id,
+        trace_available=True,
+        total_seconds=root.duration_seconds if root else None,
+        spans=spans,
+    )
+
+
 def _parse_log_file(log_file: Path) -> List[SimulationLogLine]:
     """Read simulation.log and return a list of SimulationLogLine objects."""
     from datetime import datetime, timezone
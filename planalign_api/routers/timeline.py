@@ -1,9 +1,15 @@
-"""Read-only employee discovery and storyline endpoints."""
+"""Read-only employee discovery, storyline and payroll ledger endpoints."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
+from planalign_orchestrator.payroll_ledger import PayrollLedgerError
+
 from ..config import APISettings, get_settings
-from ..models.timeline import EmployeeSearchResponse, EmployeeTimelineResponse
+from ..models.timeline import (
+    EmployeeSearchResponse,
+    EmployeeTimelineResponse,
+    PayrollLedgerResponse,
+)
 from ..services.timeline_service import TimelineDatabaseNotFoundError, TimelineService
 from ..storage.workspace_storage import WorkspaceStorage
 
@@ -91,3 +97,28 @@ def get_employee_timeline(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=str(error)
         ) from error
+
+
+@router.get(
+    "/{workspace_id}/scenarios/{scenario_id}/payroll-ledger",
+    response_model=PayrollLedgerResponse,
+)
+def get_payroll_ledger(
+    workspace_id: str,
+    scenario_id: str,
+    year: list[int] | None = Query(None),
+    employee_id: list[str] | None = Query(None),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(500, ge=1, le=5000),
+    storage: WorkspaceStorage = Depends(get_storage),
+    service: TimelineService = Depends(get_timeline_service),
+) -> PayrollLedgerResponse:
+    _validate_scope(storage, workspace_id, scenario_id)
+    try:
+        return service.get_payroll_ledger(
+            workspace_id, scenario_id, year, employee_id, page, page_size
+        )
+    except (TimelineDatabaseNotFoundError, PayrollLedgerError) as error:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=str(error)
+        ) from error
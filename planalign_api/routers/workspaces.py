@@ -8,10 +8,12 @@ from fastapi.responses import FileResponse
 
 from ..config import APISettings, get_settings
 from ..models.export import (
+    ArchiveFormat,
     BulkExportRequest,
     BulkExportStatus,
     BulkImportStatus,
     ConflictResolution,
+    ExportStatus,
     ImportResponse,
     ImportStatus,
     ImportValidationResponse,
@@ -23,7 +25,11 @@ from ..models.workspace import (
     WorkspaceSummary,
     WorkspaceUpdate,
 )
-from ..services.export_service import ExportService, MAX_IMPORT_SIZE_BYTES
+from ..services.export_service import (
+    ExportService,
+    MAX_IMPORT_SIZE_BYTES,
+    archive_media_type,
+)
 from ..services.seed_config_validator import validate_seed_configs
 from ..services.upload_stream import stream_upload_to_tempfile
 from ..storage.workspace_storage import WorkspaceStorage
@@ -216,20 +222,32 @@ async def delete_workspace(
 @router.post("/{workspace_id}/export")
 async def export_workspace(
     workspace_id: str,
+    format: ArchiveFormat = ArchiveFormat.SEVEN_ZIP,
+    current_results_only: bool = False,
+    since_export_id: Optional[str] = None,
     export_service: ExportService = Depends(get_export_service),
 ) -> FileResponse:
     """
-    Export a workspace as a 7z archive.
+    Export a workspace as a 7z or tar.zst archive.
 
     Returns a downloadable archive containing the workspace data and manifest.
     The archive filename includes the workspace name and timestamp.
 
+    tar.zst archives store each distinct file once and compress on every
+    core. Pass the X-Export-Id of an earlier tar.zst export as
+    since_export_id to send only files that changed since it.
+
     Raises:
         404: Workspace not found
         409: Simulation is currently running
     """
     try:
-        archive_path, result = export_service.export_workspace(workspace_id)
+        archive_path, result = export_service.export_workspace(
+            workspace_id,
+            archive_format=format,
+            current_results_only=current_results_only,
+            since_export_id=since_export_id,
+        )
     except ValueError as e:
         error_msg = str(e)
         if "not found" in error_msg.lower():
@@ -248,10 +266,17 @@ async def export_workspace(
                 detail=error_msg,
             )
 
+    if result.status != ExportStatus.SUCCESS:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=result.error or "Export failed",
+        )
+
     return FileResponse(
         path=archive_path,
         filename=result.filename,
-        media_type="application/x-7z-compressed",
+        media_type=archive_media_type(format),
+        headers={"X-Export-Id": result.export_id} if result.export_id else None,
     )
 
 
@@ -270,7 +295,10 @@ async def start_bulk_export(
 
     # Execute export in background (synchronously for now)
     return export_service.execute_bulk_export(
-        status_obj.operation_id, request.workspace_ids
+        status_obj.operation_id,
+        request.workspace_ids,
+        archive_format=request.format,
+        current_results_only=request.current_results_only,
     )
 
 
@@ -311,10 +339,15 @@ async def download_bulk_export(
             detail=f"Archive not found for workspace {workspace_id} in operation {operation_id}",
         )
 
+    media_type = archive_media_type(
+        ArchiveFormat.ZSTD
+        if archive_path.name.endswith(ArchiveFormat.ZSTD.value)
+        else ArchiveFormat.SEVEN_ZIP
+    )
     return FileResponse(
         path=archive_path,
         filename=archive_path.name,
-        media_type="application/x-7z-compressed",
+        media_type=media_type,
     )
 
 
@@ -374,23 +407,36 @@ async def import_workspace(
     file: UploadFile = File(...),
     conflict_resolution: Optional[str] = Form(None),
     new_name: Optional[str] = Form(None),
+    base_files: List[UploadFile] = File(default=[]),
     export_service: ExportService = Depends(get_export_service),
 ) -> ImportResponse:
     """
-    Import a workspace from a 7z archive.
+    Import a workspace from a 7z or tar.zst archive.
 
     If a name conflict exists, provide conflict_resolution:
     - 'rename': Use new_name or auto-generated unique name
     - 'replace': Delete existing workspace and import
     - 'skip': Skip this import (not applicable for single import)
+
+    An incremental tar.zst export also needs the archives it builds on,
+    uploaded as base_files.
     """
     temp_path, _ = await stream_upload_to_tempfile(
         file,
         suffix=".7z",
         max_file_bytes=MAX_IMPORT_SIZE_BYTES,
     )
+    base_paths: List[Path] = []
 
     try:
+        for base_file in base_files:
+            base_path, _ = await stream_upload_to_tempfile(
+                base_file,
+                suffix=".tar.zst",
+                max_file_bytes=MAX_IMPORT_SIZE_BYTES,
+            )
+            base_paths.append(base_path)
+
         # Parse conflict resolution
         resolution = None
         if conflict_resolution:
@@ -408,6 +454,7 @@ async def import_workspace(
             archive_path=temp_path,
             conflict_resolution=resolution,
             new_name=new_name,
+            base_archives=base_paths,
         )
 
         return result
@@ -418,8 +465,10 @@ async def import_workspace(
             detail=str(e),
         )
     finally:
-        # Clean up temp file
+        # Clean up temp files
         temp_path.unlink(missing_ok=True)
+        for base_path in base_paths:
+            base_path.unlink(missing_ok=True)
 
 
 def _failed_import(filename: Optional[str], warning: str) -> ImportResponse:
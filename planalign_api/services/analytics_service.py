@@ -13,6 +13,7 @@ from ..models.analytics import (
     ParticipationByMethod,
 )
 from planalign_core.constants import TABLE_FCT_WORKFORCE_SNAPSHOT
+from planalign_orchestrator.resources.duckdb_profile import read_connection_config
 
 from ..storage.workspace_storage import WorkspaceStorage
 from .employer_cost_service import (
@@ -195,7 +196,9 @@ class AnalyticsService:
                 logger.error(f"Database not found for scenario {scenario_id}")
                 return None
 
-            conn = duckdb.connect(str(resolved.path), read_only=True)
+            conn = duckdb.connect(
+                str(resolved.path), read_only=True, config=read_connection_config()
+            )
 
             first_simulation_year = self._resolve_first_simulation_year(
                 conn, workspace_id, scenario_id
@@ -1,7 +1,7 @@
 """Comparison service for scenario analysis."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Dict, List, Optional
 
 from ..models.comparison import (
     ComparisonResponse,
@@ -20,7 +20,6 @@ from planalign_core.constants import (
     TABLE_FCT_WORKFORCE_SNAPSHOT,
     TABLE_FCT_YEARLY_EVENTS,
 )
-
 from ..storage.workspace_storage import WorkspaceStorage
 from .employer_cost_service import (
     GROSS_CORE_SQL,
@@ -32,6 +31,7 @@ from .database_path_resolver import (
     DatabasePathResolver,
     create_api_database_path_resolver,
 )
+from .scenario_federation import ScenarioFederation
 
 logger = logging.getLogger(__name__)
 
@@ -66,41 +66,27 @@ class ComparisonService:
             logger.error(f"Baseline {baseline_id} not in scenario list")
             return None
 
-        # Load data from each scenario
-        scenario_data: Dict[str, Dict[str, Any]] = {}
-
-        for scenario_id in scenario_ids:
-            data = self._load_scenario_data(workspace_id, scenario_id)
-            if data:
-                scenario_data[scenario_id] = data
-            else:
+        with ScenarioFederation.for_scenarios(
+            self.db_resolver, workspace_id, scenario_ids
+        ) as federation:
+            for scenario_id in federation.missing:
                 logger.warning(f"Could not load data for scenario {scenario_id}")
 
-        if baseline_id not in scenario_data:
-            logger.error(f"Could not load baseline scenario {baseline_id}")
-            return None
-
-        baseline_data = scenario_data[baseline_id]
-
-        # Build workforce comparison by year
-        workforce_comparison = self._build_workforce_comparison(
-            scenario_data, baseline_data, baseline_id
-        )
-
-        # Build event comparison
-        event_comparison = self._build_event_comparison(
-            scenario_data, baseline_data, baseline_id
-        )
+            if baseline_id not in federation.scenario_ids:
+                logger.error(f"Could not load baseline scenario {baseline_id}")
+                return None
 
-        # Build DC plan comparison
-        dc_plan_comparison = self._build_dc_plan_comparison(
-            scenario_data, baseline_data, baseline_id
-        )
+            try:
+                self._stage_comparison_tables(federation)
+            except Exception as e:
+                logger.error(f"Failed to load scenario data: {e}")
+                return None
 
-        # Build summary deltas
-        summary_deltas = self._build_summary_deltas(
-            scenario_data, baseline_data, baseline_id
-        )
+            conn = federation.connection
+            workforce_comparison = self._build_workforce_comparison(conn, baseline_id)
+            event_comparison = self._build_event_comparison(conn, baseline_id)
+            dc_plan_comparison = self._build_dc_plan_comparison(conn, baseline_id)
+            summary_deltas = self._build_summary_deltas(conn, baseline_id)
 
         return ComparisonResponse(
             scenarios=scenario_ids,
@@ -112,595 +98,387 @@ class ComparisonService:
             summary_deltas=summary_deltas,
         )
 
-    _WORKFORCE_COUNTS_CTE = """
-            simulation_year,
-            COUNT(DISTINCT employee_id) as headcount,
-            COUNT(DISTINCT CASE WHEN UPPER(employment_status) = 'ACTIVE' THEN employee_id END) as active,
-            COUNT(DISTINCT CASE WHEN UPPER(employment_status) = 'TERMINATED' THEN employee_id END) as terminated"""
-
-    @classmethod
-    def _query_workforce(cls, conn) -> List[Dict[str, Any]]:
-        """Query workforce snapshots grouped by simulation year.
-
-        avg_compensation is queried separately from headcount/active/
-        terminated: an older scenario database whose fct_workforce_snapshot
-        predates the prorated_annual_compensation column must still return
-        headcount data, not blank the whole comparison.
+    # Every snapshot column the comparison reads; older databases may lack some.
+    _SNAPSHOT_COLUMNS = (
+        "employee_id",
+        "simulation_year",
+        "employment_status",
+        "prorated_annual_compensation",
+        "is_enrolled_flag",
+        "current_deferral_rate",
+        "prorated_annual_contributions",
+        "employer_match_amount",
+        "employer_core_amount",
+    )
+
+    # A scenario gets DC plan metrics only if its snapshot has all of these.
+    _DC_PLAN_COLUMNS = (
+        "employment_status",
+        "is_enrolled_flag",
+        "current_deferral_rate",
+        "prorated_annual_contributions",
+        "employer_match_amount",
+        "employer_core_amount",
+        "prorated_annual_compensation",
+    )
+
+    _WORKFORCE_METRICS = (
+        "headcount",
+        "active",
+        "terminated",
+        "new_hires",
+        "growth_pct",
+        "avg_compensation",
+    )
+
+    _DC_PLAN_METRICS = (
+        "participation_rate",
+        "avg_deferral_rate",
+        "total_employee_contributions",
+        "total_employer_match",
+        "total_employer_core",
+        "total_employer_cost",
+        "employer_cost_rate",
+        "participant_count",
+    )
+
+    def _stage_comparison_tables(self, federation: ScenarioFederation) -> None:
+        """Aggregate each federated table once, per scenario and year.
+
+        ``comparison_snapshot`` and ``comparison_events`` are the only scans of
+        the scenario databases; every builder below reads these small tables.
         """
-        try:
-            df = conn.execute(
-                f"""
-                SELECT{cls._WORKFORCE_COUNTS_CTE},
-                    ROUND(COALESCE(AVG(CASE
-                        WHEN UPPER(employment_status) = 'ACTIVE'
-                        THEN prorated_annual_compensation
-                    END), 0.0), 2) AS avg_compensation
-                FROM {TABLE_FCT_WORKFORCE_SNAPSHOT}
-                GROUP BY simulation_year
-                ORDER BY simulation_year
-            """
-            ).fetchdf()
-            return df.to_dict("records")
-        except Exception as exc:
-            logger.warning(
-                "Workforce+compensation query failed (%s); retrying without "
-                "avg_compensation for older scenario databases.",
-                exc,
-            )
-        try:
-            df = conn.execute(
-                f"""
-                SELECT{cls._WORKFORCE_COUNTS_CTE}
-                FROM {TABLE_FCT_WORKFORCE_SNAPSHOT}
-                GROUP BY simulation_year
-                ORDER BY simulation_year
-            """
-            ).fetchdf()
-            return df.to_dict("records")
-        except Exception as exc:
-            logger.error("Workforce comparison query failed: %s", exc)
-            return []
+        conn = federation.connection
+        snapshot_scenarios = federation.union(
+            TABLE_FCT_WORKFORCE_SNAPSHOT, self._SNAPSHOT_COLUMNS
+        )
+        federation.union(TABLE_FCT_YEARLY_EVENTS, ("simulation_year", "event_type"))
 
-    @staticmethod
-    def _query_events(conn) -> List[Dict[str, Any]]:
-        """Query event counts grouped by simulation year and event type."""
-        try:
-            df = conn.execute(
-                f"""
-                SELECT
-                    simulation_year,
-                    event_type,
-                    COUNT(*) as count
-                FROM {TABLE_FCT_YEARLY_EVENTS}
-                GROUP BY simulation_year, event_type
-                ORDER BY simulation_year, event_type
+        conn.execute(
+            "CREATE TEMP TABLE comparison_scenarios "
+            "(scenario_id VARCHAR, ordinal INTEGER, has_dc_plan BOOLEAN)"
+        )
+        conn.executemany(
+            "INSERT INTO comparison_scenarios VALUES (?, ?, ?)",
+            [
+                [
+                    scenario_id,
+                    ordinal,
+                    scenario_id in snapshot_scenarios
+                    and set(self._DC_PLAN_COLUMNS).issubset(
+                        federation.columns(scenario_id, TABLE_FCT_WORKFORCE_SNAPSHOT)
+                    ),
+                ]
+                for ordinal, scenario_id in enumerate(federation.scenario_ids)
+            ],
+        )
+        conn.execute(
+            f"""
+            CREATE TEMP TABLE comparison_snapshot AS
+            SELECT
+                scenario_id,
+                simulation_year,
+                COUNT(DISTINCT employee_id) AS headcount,
+                COUNT(DISTINCT CASE WHEN UPPER(employment_status) = 'ACTIVE' THEN employee_id END) AS active,
+                COUNT(DISTINCT CASE WHEN UPPER(employment_status) = 'TERMINATED' THEN employee_id END) AS terminated,
+                CAST(ROUND(COALESCE(AVG(CASE
+                    WHEN UPPER(employment_status) = 'ACTIVE'
+                    THEN prorated_annual_compensation
+                END), 0.0), 2) AS DOUBLE) AS avg_compensation,
+                CAST(COALESCE(
+                    COUNT(CASE WHEN UPPER(employment_status) = 'ACTIVE'
+                               AND is_enrolled_flag THEN 1 END) * 100.0
+                    / NULLIF(COUNT(CASE WHEN UPPER(employment_status) = 'ACTIVE'
+                                       THEN 1 END), 0),
+                    0
+                ) AS DOUBLE) AS participation_rate,
+                CAST(COALESCE(AVG(CASE WHEN is_enrolled_flag
+                    THEN current_deferral_rate ELSE NULL END
+                ), 0) AS DOUBLE) AS avg_deferral_rate,
+                CAST(COALESCE(SUM(prorated_annual_contributions), 0) AS DOUBLE)
+                    AS total_employee_contributions,
+                CAST({GROSS_MATCH_SQL} AS DOUBLE) AS total_employer_match,
+                CAST({GROSS_CORE_SQL} AS DOUBLE) AS total_employer_core,
+                CAST({GROSS_EMPLOYER_COST_SQL} AS DOUBLE) AS total_employer_cost,
+                CAST({TOTAL_COMPENSATION_SQL} AS DOUBLE) AS total_compensation,
+                COUNT(CASE WHEN is_enrolled_flag THEN 1 END) AS participant_count
+            FROM {TABLE_FCT_WORKFORCE_SNAPSHOT}
+            GROUP BY scenario_id, simulation_year
             """
-            ).fetchdf()
-            return df.to_dict("records")
-        except Exception:
-            return []
-
-    @staticmethod
-    def _query_hires_by_year(conn) -> Dict[int, int]:
-        """Query hire counts grouped by simulation year."""
-        try:
-            df = conn.execute(
-                f"""
-                SELECT
-                    simulation_year,
-                    COUNT(*) as hires
-                FROM {TABLE_FCT_YEARLY_EVENTS}
-                WHERE event_type = '{EVENT_TYPE_HIRE}'
-                GROUP BY simulation_year
-                ORDER BY simulation_year
+        )
+        conn.execute(
+            f"""
+            CREATE TEMP TABLE comparison_events AS
+            SELECT scenario_id, simulation_year, event_type, COUNT(*) AS count
+            FROM {TABLE_FCT_YEARLY_EVENTS}
+            GROUP BY scenario_id, simulation_year, event_type
             """
-            ).fetchdf()
-            return {
-                row["simulation_year"]: row["hires"] for row in df.to_dict("records")
-            }
-        except Exception:
-            return {}
+        )
 
     @staticmethod
-    def _query_dc_plan(conn) -> List[Dict[str, Any]]:
-        """Query DC plan metrics grouped by simulation year."""
-        try:
-            df = conn.execute(
-                f"""
-                SELECT
-                    simulation_year,
-                    COALESCE(
-                        COUNT(CASE WHEN UPPER(employment_status) = 'ACTIVE'
-                                   AND is_enrolled_flag THEN 1 END) * 100.0
-                        / NULLIF(COUNT(CASE WHEN UPPER(employment_status) = 'ACTIVE'
-                                           THEN 1 END), 0),
-                        0
-                    ) AS participation_rate,
-                    AVG(CASE WHEN is_enrolled_flag
-                        THEN current_deferral_rate ELSE NULL END
-                    ) AS avg_deferral_rate,
-                    COALESCE(SUM(prorated_annual_contributions), 0)
-                        AS total_employee_contributions,
-                    {GROSS_MATCH_SQL}
-                        AS total_employer_match,
-                    {GROSS_CORE_SQL}
-                        AS total_employer_core,
-                    {GROSS_EMPLOYER_COST_SQL} AS total_employer_cost,
-                    {TOTAL_COMPENSATION_SQL}
-                        AS total_compensation,
-                    COUNT(CASE WHEN is_enrolled_flag THEN 1 END)
-                        AS participant_count
-                FROM {TABLE_FCT_WORKFORCE_SNAPSHOT}
-                GROUP BY simulation_year
-                ORDER BY simulation_year
-            """
-            ).fetchdf()
-            dc_plan = df.to_dict("records")
-            for row in dc_plan:
-                total_comp = row.get("total_compensation", 0) or 0
-                total_cost = row.get("total_employer_cost", 0) or 0
-                row["employer_cost_rate"] = (
-                    (total_cost / total_comp * 100) if total_comp > 0 else 0.0
-                )
-                avg_def = row.get("avg_deferral_rate")
-                if avg_def is None or (
-                    isinstance(avg_def, float) and avg_def != avg_def
-                ):
-                    row["avg_deferral_rate"] = 0.0
-            return dc_plan
-        except Exception:
-            return []
+    def _baseline_delta_query(source: str, metrics: tuple) -> str:
+        """Each scenario's row per year beside its difference from the baseline.
 
-    def _load_scenario_data(
-        self, workspace_id: str, scenario_id: str
-    ) -> Optional[Dict[str, Any]]:
-        """Load simulation data for a scenario from its DuckDB database."""
-        try:
-            import duckdb
-
-            resolved = self.db_resolver.resolve(workspace_id, scenario_id)
-            if not resolved.exists:
-                return None
-
-            conn = duckdb.connect(str(resolved.path), read_only=True)
-
-            result = {
-                "workforce": self._query_workforce(conn),
-                "events": self._query_events(conn),
-                "hires_by_year": self._query_hires_by_year(conn),
-                "dc_plan": self._query_dc_plan(conn),
-            }
-
-            conn.close()
-            return result
-
-        except Exception as e:
-            logger.error(f"Failed to load scenario data: {e}")
-            return None
+        Only years the baseline has are returned; ``$baseline`` is its id.
+        """
+        values = ", ".join(f"r.{metric}" for metric in metrics)
+        deltas = ", ".join(
+            f"r.{metric} - b.{metric} AS {metric}_delta" for metric in metrics
+        )
+        return f"""
+            WITH source AS ({source})
+            SELECT r.simulation_year, r.scenario_id, {values}, {deltas}
+            FROM source r
+            JOIN source b
+              ON b.simulation_year = r.simulation_year AND b.scenario_id = $baseline
+            JOIN comparison_scenarios s ON s.scenario_id = r.scenario_id
+            ORDER BY r.simulation_year, s.ordinal
+        """
 
     def _build_workforce_comparison(
-        self,
-        scenario_data: Dict[str, Dict[str, Any]],
-        baseline_data: Dict[str, Any],
-        baseline_id: str,
+        self, conn, baseline_id: str
     ) -> List[WorkforceComparisonYear]:
-        """Build year-by-year workforce comparison."""
-        # Get all years across all scenarios
-        all_years = set()
-        for data in scenario_data.values():
-            for row in data.get("workforce", []):
-                all_years.add(row["simulation_year"])
-
-        comparison = []
-        prev_headcounts: Dict[str, int] = {}
-
-        for year in sorted(all_years):
-            values = {}
-            deltas = {}
-
-            # Get baseline values for this year
-            baseline_workforce = next(
-                (
-                    w
-                    for w in baseline_data.get("workforce", [])
-                    if w["simulation_year"] == year
-                ),
-                None,
-            )
-            baseline_hires = baseline_data.get("hires_by_year", {}).get(year, 0)
-
-            if not baseline_workforce:
-                continue
-
-            baseline_headcount = baseline_workforce.get("headcount", 0)
-            baseline_active = baseline_workforce.get("active", 0)
-            baseline_terminated = baseline_workforce.get("terminated", 0)
-            baseline_avg_compensation = baseline_workforce.get("avg_compensation", 0.0)
-            baseline_prev = prev_headcounts.get(baseline_id, baseline_headcount)
-            baseline_growth = (
-                ((baseline_headcount - baseline_prev) / baseline_prev * 100)
-                if baseline_prev > 0
-                else 0
-            )
+        """Build year-by-year workforce comparison.
 
-            baseline_metrics = WorkforceMetrics(
-                headcount=baseline_headcount,
-                active=baseline_active,
-                terminated=baseline_terminated,
-                new_hires=baseline_hires,
-                growth_pct=baseline_growth,
-                avg_compensation=baseline_avg_compensation,
+        Growth is measured against the scenario's previous compared year, so
+        years the baseline lacks are skipped before ``LAG``.
+        """
+        source = f"""
+            SELECT *,
+                CASE WHEN prev_headcount > 0
+                     THEN CAST(headcount - prev_headcount AS DOUBLE) / prev_headcount * 100
+                     ELSE 0.0 END AS growth_pct
+            FROM (
+                SELECT
+                    c.scenario_id, c.simulation_year, c.headcount, c.active,
+                    c.terminated, c.avg_compensation,
+                    COALESCE(e.count, 0) AS new_hires,
+                    COALESCE(LAG(c.headcount) OVER (
+                        PARTITION BY c.scenario_id ORDER BY c.simulation_year
+                    ), c.headcount) AS prev_headcount
+                FROM comparison_snapshot c
+                LEFT JOIN comparison_events e
+                  ON e.scenario_id = c.scenario_id
+                 AND e.simulation_year = c.simulation_year
+                 AND e.event_type = '{EVENT_TYPE_HIRE}'
+                WHERE c.simulation_year IN (
+                    SELECT simulation_year FROM comparison_snapshot
+                    WHERE scenario_id = $baseline
+                )
             )
-            values[baseline_id] = baseline_metrics
-            deltas[baseline_id] = WorkforceMetrics(
-                headcount=0,
-                active=0,
-                terminated=0,
-                new_hires=0,
-                growth_pct=0.0,
-                avg_compensation=0.0,
+        """
+        try:
+            rows = self._fetch_delta_rows(
+                conn, source, self._WORKFORCE_METRICS, baseline_id
             )
-
-            # Calculate for each non-baseline scenario
-            for scenario_id, data in scenario_data.items():
-                if scenario_id == baseline_id:
-                    continue
-
-                workforce = next(
-                    (
-                        w
-                        for w in data.get("workforce", [])
-                        if w["simulation_year"] == year
-                    ),
-                    None,
-                )
-                hires = data.get("hires_by_year", {}).get(year, 0)
-
-                if not workforce:
-                    continue
-
-                headcount = workforce.get("headcount", 0)
-                active = workforce.get("active", 0)
-                terminated = workforce.get("terminated", 0)
-                avg_compensation = workforce.get("avg_compensation", 0.0)
-                prev = prev_headcounts.get(scenario_id, headcount)
-                growth = ((headcount - prev) / prev * 100) if prev > 0 else 0
-
-                values[scenario_id] = WorkforceMetrics(
-                    headcount=headcount,
-                    active=active,
-                    terminated=terminated,
-                    new_hires=hires,
-                    growth_pct=growth,
-                    avg_compensation=avg_compensation,
-                )
-
-                deltas[scenario_id] = WorkforceMetrics(
-                    headcount=headcount - baseline_headcount,
-                    active=active - baseline_active,
-                    terminated=terminated - baseline_terminated,
-                    new_hires=hires - baseline_hires,
-                    growth_pct=growth - baseline_growth,
-                    avg_compensation=avg_compensation - baseline_avg_compensation,
-                )
-
-                prev_headcounts[scenario_id] = headcount
-
-            prev_headcounts[baseline_id] = baseline_headcount
-
-            comparison.append(
-                WorkforceComparisonYear(
-                    year=year,
-                    values=values,
-                    deltas=deltas,
-                )
+        except Exception as exc:
+            logger.error("Workforce comparison query failed: %s", exc)
+            return []
+        return [
+            WorkforceComparisonYear(
+                year=year,
+                values={
+                    scenario_id: WorkforceMetrics(**values)
+                    for scenario_id, (values, _) in scenarios.items()
+                },
+                deltas={
+                    scenario_id: WorkforceMetrics(**deltas)
+                    for scenario_id, (_, deltas) in scenarios.items()
+                },
             )
+            for year, scenarios in rows.items()
+        ]
 
-        return comparison
+    def _fetch_delta_rows(
+        self, conn, source: str, metrics: tuple, baseline_id: str
+    ) -> Dict[int, Dict[str, tuple]]:
+        """Run :meth:`_baseline_delta_query`; ``{year: {scenario: (values, deltas)}}``."""
+        cursor = conn.execute(
+            self._baseline_delta_query(source, metrics), {"baseline": baseline_id}
+        )
+        by_year: Dict[int, Dict[str, tuple]] = {}
+        for row in cursor.fetchall():
+            year, scenario_id = row[0], row[1]
+            values = dict(zip(metrics, row[2 : 2 + len(metrics)]))
+            deltas = dict(zip(metrics, row[2 + len(metrics) :]))
+            by_year.setdefault(year, {})[scenario_id] = (values, deltas)
+        return by_year
 
     def _build_event_comparison(
-        self,
-        scenario_data: Dict[str, Dict[str, Any]],
-        baseline_data: Dict[str, Any],
-        baseline_id: str,
+        self, conn, baseline_id: str
     ) -> List[EventComparisonMetric]:
-        """Build event comparison across scenarios."""
+        """Build event comparison across scenarios.
+
+        Every compared scenario appears for every year with events in any
+        scenario; a missing count is zero.
+        """
         event_types = [
             EVENT_TYPE_HIRE,
             EVENT_TYPE_TERMINATION,
             EVENT_TYPE_PROMOTION,
             EVENT_TYPE_RAISE,
         ]
-        comparison = []
-
-        # Get all years
-        all_years = set()
-        for data in scenario_data.values():
-            for event in data.get("events", []):
-                all_years.add(event["simulation_year"])
-
-        for year in sorted(all_years):
-            for event_type in event_types:
-                # Get baseline value
-                baseline_events = baseline_data.get("events", [])
-                baseline_value = next(
-                    (
-                        e["count"]
-                        for e in baseline_events
-                        if e["simulation_year"] == year
-                        and e["event_type"] == event_type
-                    ),
-                    0,
-                )
-
-                scenarios = {}
-                deltas = {}
-                delta_pcts = {}
-
-                for scenario_id, data in scenario_data.items():
-                    if scenario_id == baseline_id:
-                        scenarios[scenario_id] = baseline_value
-                        deltas[scenario_id] = 0
-                        delta_pcts[scenario_id] = 0.0
-                        continue
-
-                    events = data.get("events", [])
-                    value = next(
-                        (
-                            e["count"]
-                            for e in events
-                            if e["simulation_year"] == year
-                            and e["event_type"] == event_type
-                        ),
-                        0,
-                    )
-
-                    scenarios[scenario_id] = value
-                    deltas[scenario_id] = value - baseline_value
-                    delta_pcts[scenario_id] = (
-                        ((value - baseline_value) / baseline_value * 100)
-                        if baseline_value > 0
-                        else 0.0
-                    )
-
-                comparison.append(
-                    EventComparisonMetric(
-                        metric=event_type.lower() + "s",
-                        year=year,
-                        baseline=baseline_value,
-                        scenarios=scenarios,
-                        deltas=deltas,
-                        delta_pcts=delta_pcts,
-                    )
+        type_rows = ", ".join(
+            f"('{event_type}', {order})" for order, event_type in enumerate(event_types)
+        )
+        try:
+            rows = conn.execute(
+                f"""
+                WITH grid AS (
+                    SELECT y.simulation_year, t.event_type, t.type_order,
+                           s.scenario_id, s.ordinal, COALESCE(e.count, 0) AS value
+                    FROM (SELECT DISTINCT simulation_year FROM comparison_events) y
+                    CROSS JOIN (VALUES {type_rows}) t(event_type, type_order)
+                    CROSS JOIN comparison_scenarios s
+                    LEFT JOIN comparison_events e
+                      ON e.scenario_id = s.scenario_id
+                     AND e.simulation_year = y.simulation_year
+                     AND e.event_type = t.event_type
                 )
+                SELECT g.simulation_year, g.event_type, g.scenario_id, g.value,
+                       b.value AS baseline, g.value - b.value AS delta,
+                       CASE WHEN b.value > 0
+                            THEN CAST(g.value - b.value AS DOUBLE) / b.value * 100
+                            ELSE 0.0 END AS delta_pct
+                FROM grid g
+                JOIN grid b
+                  ON b.simulation_year = g.simulation_year
+                 AND b.event_type = g.event_type
+                 AND b.scenario_id = $baseline
+                ORDER BY g.simulation_year, g.type_order, g.ordinal
+                """,
+                {"baseline": baseline_id},
+            ).fetchall()
+        except Exception as exc:
+            logger.error("Event comparison query failed: %s", exc)
+            return []
 
-        return comparison
+        comparison: Dict[tuple, EventComparisonMetric] = {}
+        for year, event_type, scenario_id, value, baseline, delta, delta_pct in rows:
+            metric = comparison.setdefault(
+                (year, event_type),
+                EventComparisonMetric(
+                    metric=event_type.lower() + "s",
+                    year=year,
+                    baseline=baseline,
+                    scenarios={},
+                    deltas={},
+                    delta_pcts={},
+                ),
+            )
+            metric.scenarios[scenario_id] = value
+            metric.deltas[scenario_id] = delta
+            metric.delta_pcts[scenario_id] = delta_pct
+        return list(comparison.values())
 
     def _build_dc_plan_comparison(
-        self,
-        scenario_data: Dict[str, Dict[str, Any]],
-        baseline_data: Dict[str, Any],
-        baseline_id: str,
+        self, conn, baseline_id: str
     ) -> List[DCPlanComparisonYear]:
         """Build year-by-year DC plan comparison with deltas."""
-        # Collect all years across all scenarios
-        all_years: set = set()
-        for data in scenario_data.values():
-            for row in data.get("dc_plan", []):
-                all_years.add(row["simulation_year"])
-
-        comparison = []
-
-        for year in sorted(all_years):
-            values: Dict[str, DCPlanMetrics] = {}
-            deltas: Dict[str, DCPlanMetrics] = {}
-
-            # Get baseline DC plan row for this year
-            baseline_row = next(
-                (
-                    r
-                    for r in baseline_data.get("dc_plan", [])
-                    if r["simulation_year"] == year
-                ),
-                None,
-            )
-
-            if not baseline_row:
-                continue
-
-            baseline_metrics = DCPlanMetrics(
-                participation_rate=baseline_row.get("participation_rate", 0.0),
-                avg_deferral_rate=baseline_row.get("avg_deferral_rate", 0.0),
-                total_employee_contributions=baseline_row.get(
-                    "total_employee_contributions", 0.0
-                ),
-                total_employer_match=baseline_row.get("total_employer_match", 0.0),
-                total_employer_core=baseline_row.get("total_employer_core", 0.0),
-                total_employer_cost=baseline_row.get("total_employer_cost", 0.0),
-                employer_cost_rate=baseline_row.get("employer_cost_rate", 0.0),
-                participant_count=int(baseline_row.get("participant_count", 0)),
-            )
-            values[baseline_id] = baseline_metrics
-            deltas[baseline_id] = DCPlanMetrics()  # All zeros
-
-            # Calculate for each non-baseline scenario
-            for scenario_id, data in scenario_data.items():
-                if scenario_id == baseline_id:
-                    continue
-
-                scenario_row = next(
-                    (
-                        r
-                        for r in data.get("dc_plan", [])
-                        if r["simulation_year"] == year
-                    ),
-                    None,
-                )
-
-                if not scenario_row:
-                    continue
-
-                scenario_metrics = DCPlanMetrics(
-                    participation_rate=scenario_row.get("participation_rate", 0.0),
-                    avg_deferral_rate=scenario_row.get("avg_deferral_rate", 0.0),
-                    total_employee_contributions=scenario_row.get(
-                        "total_employee_contributions", 0.0
-                    ),
-                    total_employer_match=scenario_row.get("total_employer_match", 0.0),
-                    total_employer_core=scenario_row.get("total_employer_core", 0.0),
-                    total_employer_cost=scenario_row.get("total_employer_cost", 0.0),
-                    employer_cost_rate=scenario_row.get("employer_cost_rate", 0.0),
-                    participant_count=int(scenario_row.get("participant_count", 0)),
-                )
-                values[scenario_id] = scenario_metrics
-
-                deltas[scenario_id] = DCPlanMetrics(
-                    participation_rate=scenario_metrics.participation_rate
-                    - baseline_metrics.participation_rate,
-                    avg_deferral_rate=scenario_metrics.avg_deferral_rate
-                    - baseline_metrics.avg_deferral_rate,
-                    total_employee_contributions=scenario_metrics.total_employee_contributions
-                    - baseline_metrics.total_employee_contributions,
-                    total_employer_match=scenario_metrics.total_employer_match
-                    - baseline_metrics.total_employer_match,
-                    total_employer_core=scenario_metrics.total_employer_core
-                    - baseline_metrics.total_employer_core,
-                    total_employer_cost=scenario_metrics.total_employer_cost
-                    - baseline_metrics.total_employer_cost,
-                    employer_cost_rate=scenario_metrics.employer_cost_rate
-                    - baseline_metrics.employer_cost_rate,
-                    participant_count=scenario_metrics.participant_count
-                    - baseline_metrics.participant_count,
-                )
-
-            comparison.append(
-                DCPlanComparisonYear(year=year, values=values, deltas=deltas)
-            )
-
-        return comparison
-
-    def _build_summary_deltas(
-        self,
-        scenario_data: Dict[str, Dict[str, Any]],
-        baseline_data: Dict[str, Any],
-        baseline_id: str,
-    ) -> Dict[str, DeltaValue]:
-        """Build summary delta calculations."""
-        summary = {}
-
-        # Final headcount
-        baseline_workforce = baseline_data.get("workforce", [])
-        baseline_final = (
-            baseline_workforce[-1].get("headcount", 0) if baseline_workforce else 0
-        )
-        baseline_initial = (
-            baseline_workforce[0].get("headcount", 0) if baseline_workforce else 0
-        )
-
-        headcount_scenarios = {}
-        headcount_deltas = {}
-        headcount_delta_pcts = {}
-
-        for scenario_id, data in scenario_data.items():
-            workforce = data.get("workforce", [])
-            final = workforce[-1].get("headcount", 0) if workforce else 0
-            headcount_scenarios[scenario_id] = float(final)
-            delta = final - baseline_final
-            headcount_deltas[scenario_id] = float(delta)
-            headcount_delta_pcts[scenario_id] = (
-                (delta / baseline_final * 100) if baseline_final > 0 else 0.0
-            )
-
-        summary["final_headcount"] = DeltaValue(
-            baseline=float(baseline_final),
-            scenarios=headcount_scenarios,
-            deltas=headcount_deltas,
-            delta_pcts=headcount_delta_pcts,
-        )
-
-        # Total growth percentage
-        baseline_growth = (
-            ((baseline_final - baseline_initial) / baseline_initial * 100)
-            if baseline_initial > 0
-            else 0.0
-        )
-
-        growth_scenarios = {}
-        growth_deltas = {}
-        growth_delta_pcts = {}
-
-        for scenario_id, data in scenario_data.items():
-            workforce = data.get("workforce", [])
-            initial = workforce[0].get("headcount", 0) if workforce else 0
-            final = workforce[-1].get("headcount", 0) if workforce else 0
-            growth = ((final - initial) / initial * 100) if initial > 0 else 0.0
-            growth_scenarios[scenario_id] = growth
-            delta = growth - baseline_growth
-            growth_deltas[scenario_id] = delta
-            growth_delta_pcts[scenario_id] = (
-                (delta / abs(baseline_growth) * 100)
-                if abs(baseline_growth) > 1e-9
-                else 0.0
+        source = """
+            SELECT c.*,
+                CASE WHEN total_compensation > 0
+                     THEN total_employer_cost / total_compensation * 100
+                     ELSE 0.0 END AS employer_cost_rate
+            FROM comparison_snapshot c
+            JOIN comparison_scenarios s ON s.scenario_id = c.scenario_id
+            WHERE s.has_dc_plan
+        """
+        try:
+            rows = self._fetch_delta_rows(
+                conn, source, self._DC_PLAN_METRICS, baseline_id
             )
-
-        summary["total_growth_pct"] = DeltaValue(
-            baseline=baseline_growth,
-            scenarios=growth_scenarios,
-            deltas=growth_deltas,
-            delta_pcts=growth_delta_pcts,
-        )
-
-        # Final participation rate (from DC plan data)
-        baseline_dc = baseline_data.get("dc_plan", [])
-        baseline_pr = (
-            baseline_dc[-1].get("participation_rate", 0.0) if baseline_dc else 0.0
-        )
-
-        pr_scenarios: Dict[str, float] = {}
-        pr_deltas: Dict[str, float] = {}
-        pr_delta_pcts: Dict[str, float] = {}
-
-        for scenario_id, data in scenario_data.items():
-            dc_plan = data.get("dc_plan", [])
-            pr = dc_plan[-1].get("participation_rate", 0.0) if dc_plan else 0.0
-            pr_scenarios[scenario_id] = pr
-            delta = pr - baseline_pr
-            pr_deltas[scenario_id] = delta
-            pr_delta_pcts[scenario_id] = (
-                (delta / abs(baseline_pr) * 100) if abs(baseline_pr) > 1e-9 else 0.0
+        except Exception as exc:
+            logger.error("DC plan comparison query failed: %s", exc)
+            return []
+        return [
+            DCPlanComparisonYear(
+                year=year,
+                values={
+                    scenario_id: DCPlanMetrics(**values)
+                    for scenario_id, (values, _) in scenarios.items()
+                },
+                deltas={
+                    scenario_id: DCPlanMetrics(**deltas)
+                    for scenario_id, (_, deltas) in scenarios.items()
+                },
             )
+            for year, scenarios in rows.items()
+        ]
 
-        summary["final_participation_rate"] = DeltaValue(
-            baseline=baseline_pr,
-            scenarios=pr_scenarios,
-            deltas=pr_deltas,
-            delta_pcts=pr_delta_pcts,
-        )
-
-        # Final employer cost (from DC plan data)
-        baseline_ec = (
-            baseline_dc[-1].get("total_employer_cost", 0.0) if baseline_dc else 0.0
-        )
-
-        ec_scenarios: Dict[str, float] = {}
-        ec_deltas: Dict[str, float] = {}
-        ec_delta_pcts: Dict[str, float] = {}
-
-        for scenario_id, data in scenario_data.items():
-            dc_plan = data.get("dc_plan", [])
-            ec = dc_plan[-1].get("total_employer_cost", 0.0) if dc_plan else 0.0
-            ec_scenarios[scenario_id] = ec
-            delta = ec - baseline_ec
-            ec_deltas[scenario_id] = delta
-            ec_delta_pcts[scenario_id] = (
-                (delta / abs(baseline_ec) * 100) if abs(baseline_ec) > 1e-9 else 0.0
-            )
+    def _build_summary_deltas(self, conn, baseline_id: str) -> Dict[str, DeltaValue]:
+        """Build summary delta calculations.
 
-        summary["final_employer_cost"] = DeltaValue(
-            baseline=baseline_ec,
-            scenarios=ec_scenarios,
-            deltas=ec_deltas,
-            delta_pcts=ec_delta_pcts,
+        Each scenario is summarised from its own first and last simulated
+        years; scenarios without DC plan columns report zero for DC metrics.
+        """
+        metrics = (
+            "final_headcount",
+            "total_growth_pct",
+            "final_participation_rate",
+            "final_employer_cost",
         )
+        try:
+            rows = conn.execute(
+                f"""
+                WITH finals AS (
+                    SELECT
+                        s.scenario_id,
+                        s.ordinal,
+                        CAST(COALESCE(arg_max(c.headcount, c.simulation_year), 0) AS DOUBLE)
+                            AS final_headcount,
+                        CAST(COALESCE(arg_min(c.headcount, c.simulation_year), 0) AS DOUBLE)
+                            AS initial_headcount,
+                        CASE WHEN s.has_dc_plan THEN COALESCE(
+                            arg_max(c.participation_rate, c.simulation_year), 0.0
+                        ) ELSE 0.0 END AS final_participation_rate,
+                        CASE WHEN s.has_dc_plan THEN COALESCE(
+                            arg_max(c.total_employer_cost, c.simulation_year), 0.0
+                        ) ELSE 0.0 END AS final_employer_cost
+                    FROM comparison_scenarios s
+                    LEFT JOIN comparison_snapshot c ON c.scenario_id = s.scenario_id
+                    GROUP BY s.scenario_id, s.ordinal, s.has_dc_plan
+                ),
+                summary AS (
+                    SELECT scenario_id, ordinal,
+                        unnest([{", ".join(f"'{m}'" for m in metrics)}]) AS metric,
+                        unnest([
+                            final_headcount,
+                            CASE WHEN initial_headcount > 0
+                                 THEN (final_headcount - initial_headcount)
+                                      / initial_headcount * 100
+                                 ELSE 0.0 END,
+                            final_participation_rate,
+                            final_employer_cost
+                        ]) AS value
+                    FROM finals
+                )
+                SELECT r.metric, r.scenario_id, r.value, b.value AS baseline,
+                       r.value - b.value AS delta,
+                       CASE
+                           WHEN r.metric = 'final_headcount' AND b.value > 0
+                               THEN (r.value - b.value) / b.value * 100
+                           WHEN r.metric != 'final_headcount' AND abs(b.value) > 1e-9
+                               THEN (r.value - b.value) / abs(b.value) * 100
+                           ELSE 0.0
+                       END AS delta_pct
+                FROM summary r
+                JOIN summary b ON b.metric = r.metric AND b.scenario_id = $baseline
+                ORDER BY r.ordinal
+                """,
+                {"baseline": baseline_id},
+            ).fetchall()
+        except Exception as exc:
+            logger.error("Summary delta query failed: %s", exc)
+            return {}
 
+        summary = {
+            metric: DeltaValue(baseline=0.0, scenarios={}, deltas={}, delta_pcts={})
+            for metric in metrics
+        }
+        for metric, scenario_id, value, baseline, delta, delta_pct in rows:
+            summary[metric].baseline = baseline
+            summary[metric].scenarios[scenario_id] = value
+            summary[metric].deltas[scenario_id] = delta
+            summary[metric].delta_pcts[scenario_id] = delta_pct
         return summary
@@ -18,6 +18,7 @@ from planalign_orchestrator.run_metadata import (
     compute_config_fingerprint,
     evaluate_drift,
 )
+from planalign_orchestrator.resources.duckdb_profile import read_connection_config
 
 from ..models.comparison import ConfigDelta, ConfigDiffResponse, ScenarioProvenance
 from ..models.workspace import Workspace
@@ -125,7 +126,9 @@ class ConfigDiffService:
         if not resolved.exists or resolved.source not in {"scenario", "run"}:
             return ScenarioProvenance(available=False)
         try:
-            with duckdb.connect(str(resolved.path), read_only=True) as connection:
+            with duckdb.connect(
+                str(resolved.path), read_only=True, config=read_connection_config()
+            ) as connection:
                 rows = connection.execute(
                     "SELECT run_timestamp, run_type, config_fingerprint, "
                     "random_seed, full_reset, planalign_version "
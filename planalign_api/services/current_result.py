@@ -14,6 +14,7 @@ import yaml
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from planalign_core.constants import DATABASE_FILENAME
+from planalign_orchestrator.resources.duckdb_profile import read_connection_config
 
 POINTER_FILENAME = "current_result.json"
 RUN_METADATA_FILENAME = "run_metadata.json"
@@ -153,7 +154,9 @@ def _validate_target(
     # is always proven to name a completed run whose database file is present.
     if verify_database:
         try:
-            with duckdb.connect(str(database_path), read_only=True) as connection:
+            with duckdb.connect(
+                str(database_path), read_only=True, config=read_connection_config()
+            ) as connection:
                 connection.execute("SELECT 1").fetchone()
         except Exception as exc:
             raise CurrentResultIntegrityError(
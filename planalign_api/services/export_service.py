@@ -1,7 +1,8 @@
 """Export and import service for workspace backup functionality.
 
 This service handles:
-- Creating 7z archives of workspaces with manifests
+- Creating 7z or deduplicated, incremental tar.zst archives of workspaces
+  with manifests (see workspace_archive for the tar.zst format)
 - Extracting and validating workspace archives
 - Managing bulk export/import operations with progress tracking
 """
@@ -10,15 +11,20 @@ import hashlib
 import json
 import logging
 import shutil
+import tarfile
 import tempfile
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import py7zr
+import zstandard
 
 from ..models.export import (
+    ArchiveFormat,
     BulkExportStatus,
     BulkImportStatus,
     BulkOperationStatus,
@@ -33,6 +39,7 @@ from ..models.export import (
     ManifestContents,
 )
 from ..storage.workspace_storage import WorkspaceStorage
+from . import workspace_archive
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +55,20 @@ MAX_IMPORT_SIZE_BYTES = 1 * 1024 * 1024 * 1024
 # Current manifest schema version
 MANIFEST_VERSION = "1.0"
 
+# Workspaces exported concurrently by a bulk export. Each tar.zst export
+# already compresses on every core, so this mainly overlaps file I/O.
+BULK_EXPORT_WORKERS = 4
+
+_ARCHIVE_MEDIA_TYPES = {
+    ArchiveFormat.SEVEN_ZIP: "application/x-7z-compressed",
+    ArchiveFormat.ZSTD: "application/zstd",
+}
+
+
+def archive_media_type(archive_format: ArchiveFormat) -> str:
+    """HTTP media type for an archive of ``archive_format``."""
+    return _ARCHIVE_MEDIA_TYPES[archive_format]
+
 
 class ExportService:
     """Service for exporting and importing workspaces."""
@@ -70,6 +91,8 @@ class ExportService:
         workspace_id: str,
         workspace_name: str,
         workspace_path: Path,
+        *,
+        current_results_only: bool = False,
     ) -> ExportManifest:
         """Create export manifest for a workspace.
 
@@ -77,6 +100,7 @@ class ExportService:
             workspace_id: UUID of the workspace
             workspace_name: Human-readable workspace name
             workspace_path: Path to workspace directory
+            current_results_only: Count only each scenario's current-result run
 
         Returns:
             ExportManifest with inventory of workspace contents
@@ -98,10 +122,11 @@ class ExportService:
                         scenarios.append(scenario_data.get("name", scenario_dir.name))
 
         # Count files and calculate total size
-        for file_path in workspace_path.rglob("*"):
-            if file_path.is_file():
-                file_count += 1
-                total_size += file_path.stat().st_size
+        for relative in workspace_archive.workspace_files(
+            workspace_path, current_results_only=current_results_only
+        ):
+            file_count += 1
+            total_size += (workspace_path / relative).stat().st_size
 
         # Calculate checksum of workspace.json
         workspace_json_path = workspace_path / "workspace.json"
@@ -126,6 +151,7 @@ class ExportService:
             workspace_id=workspace_id,
             workspace_name=workspace_name,
             contents=contents,
+            current_results_only=current_results_only,
         )
 
     # ==================== Archive Operations ====================
@@ -160,25 +186,73 @@ class ExportService:
                 # Add manifest
                 archive.write(manifest_path, "manifest.json")
 
-                # Add all workspace files
-                for file_path in workspace_path.rglob("*"):
-                    if file_path.is_file():
-                        # Calculate relative path from workspace root
-                        rel_path = file_path.relative_to(workspace_path)
-                        archive.write(file_path, str(rel_path))
+                # Add workspace files
+                for relative in workspace_archive.workspace_files(
+                    workspace_path, current_results_only=manifest.current_results_only
+                ):
+                    archive.write(workspace_path / relative, relative)
 
         return output_path.stat().st_size
 
+    def create_zstd_archive(
+        self,
+        workspace_path: Path,
+        manifest: ExportManifest,
+        output_path: Path,
+        since_export_id: Optional[str] = None,
+    ) -> Tuple[int, ExportManifest]:
+        """Create a deduplicated tar.zst archive of a workspace.
+
+        Args:
+            workspace_path: Path to workspace directory
+            manifest: Export manifest from create_manifest
+            output_path: Path for output archive file
+            since_export_id: Earlier tar.zst export of this workspace to make
+                the archive incremental to
+
+        Returns:
+            Tuple of (archive size in bytes, completed manifest)
+
+        Raises:
+            ValueError: If since_export_id is not an export of this workspace
+        """
+        base = (
+            workspace_archive.load_export_manifest(workspace_path, since_export_id)
+            if since_export_id
+            else None
+        )
+        files = workspace_archive.fingerprint_files(
+            workspace_path,
+            workspace_archive.workspace_files(
+                workspace_path, current_results_only=manifest.current_results_only
+            ),
+            base.files if base else None,
+        )
+        manifest = manifest.model_copy(
+            update={
+                "format": ArchiveFormat.ZSTD,
+                "export_id": str(uuid.uuid4()),
+                "base_export_id": base.export_id if base else None,
+                "files": files,
+                "blobs": workspace_archive.new_blobs(files, base),
+            }
+        )
+        size = workspace_archive.write_archive(workspace_path, manifest, output_path)
+        workspace_archive.save_export_manifest(workspace_path, manifest)
+        return size, manifest
+
     def extract_archive(
         self,
         archive_path: Path,
         output_path: Path,
+        base_archives: Sequence[Path] = (),
     ) -> ExportManifest:
-        """Extract 7z archive and return manifest.
+        """Extract a 7z or tar.zst archive and return manifest.
 
         Args:
-            archive_path: Path to 7z archive
+            archive_path: Path to the archive
             output_path: Directory to extract to
+            base_archives: Archives an incremental tar.zst archive builds on
 
         Returns:
             Parsed ExportManifest from archive
@@ -186,6 +260,11 @@ class ExportService:
         Raises:
             ValueError: If archive is invalid or missing manifest
         """
+        if workspace_archive.is_zstd_archive(archive_path):
+            return workspace_archive.extract_archive(
+                archive_path, output_path, base_archives
+            )
+
         output_path.mkdir(parents=True, exist_ok=True)
 
         with py7zr.SevenZipFile(archive_path, "r") as archive:
@@ -209,7 +288,7 @@ class ExportService:
         """Validate an archive before import.
 
         Args:
-            archive_path: Path to 7z archive file
+            archive_path: Path to 7z or tar.zst archive file
             file_size: Size of the file in bytes
 
         Returns:
@@ -240,6 +319,11 @@ class ExportService:
                     f"Archive was created with a newer version ({manifest.version}) "
                     f"than current ({MANIFEST_VERSION}). Some features may not import correctly."
                 )
+            if manifest.base_export_id:
+                warnings.append(
+                    f"Incremental export of {manifest.base_export_id}; "
+                    "importing it requires the base archive"
+                )
 
             conflict = self._check_name_conflicts(manifest.workspace_name)
 
@@ -266,12 +350,27 @@ class ExportService:
         """Extract manifest from archive and validate its format.
 
         Args:
-            archive_path: Path to 7z archive file
+            archive_path: Path to 7z or tar.zst archive file
             errors: List to append error messages to
 
         Returns:
             Parsed ExportManifest, or None if extraction/validation failed
         """
+        if workspace_archive.is_zstd_archive(archive_path):
+            try:
+                manifest_data = workspace_archive.read_manifest(archive_path)
+            except (zstandard.ZstdError, tarfile.TarError, EOFError):
+                errors.append("Invalid or corrupted tar.zst archive")
+                return None
+            except ValueError as e:
+                errors.append(str(e))
+                return None
+            try:
+                return ExportManifest(**manifest_data)
+            except Exception as e:
+                errors.append(f"Invalid manifest format: {e}")
+                return None
+
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
 
@@ -346,12 +445,21 @@ class ExportService:
         self,
         workspace_id: str,
         output_dir: Optional[Path] = None,
+        *,
+        archive_format: ArchiveFormat = ArchiveFormat.SEVEN_ZIP,
+        current_results_only: bool = False,
+        since_export_id: Optional[str] = None,
     ) -> Tuple[Path, ExportResult]:
-        """Export a single workspace to a 7z archive.
+        """Export a single workspace to an archive.
 
         Args:
             workspace_id: UUID of workspace to export
             output_dir: Directory to save archive (uses temp if None)
+            archive_format: 7z, or deduplicated multithreaded tar.zst
+            current_results_only: Leave out runs other than each scenario's
+                current result
+            since_export_id: Earlier tar.zst export to make this one
+                incremental to (tar.zst only)
 
         Returns:
             Tuple of (archive_path, ExportResult)
@@ -371,6 +479,11 @@ class ExportService:
         if self.storage.is_simulation_running(workspace_id):
             raise ValueError("Cannot export workspace while simulation is running")
 
+        if since_export_id:
+            if archive_format != ArchiveFormat.ZSTD:
+                raise ValueError("Incremental exports require the tar.zst format")
+            workspace_archive.load_export_manifest(workspace_path, since_export_id)
+
         # Generate archive filename
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         # Sanitize workspace name for filename
@@ -378,7 +491,7 @@ class ExportService:
             c if c.isalnum() or c in " -_" else "_" for c in workspace_name
         )
         safe_name = safe_name.strip().replace(" ", "_")
-        filename = f"{safe_name}_{timestamp}.7z"
+        filename = f"{safe_name}_{timestamp}.{archive_format.value}"
 
         # Determine output path
         if output_dir is None:
@@ -389,11 +502,21 @@ class ExportService:
         try:
             # Create manifest
             manifest = self.create_manifest(
-                workspace_id, workspace_name, workspace_path
+                workspace_id,
+                workspace_name,
+                workspace_path,
+                current_results_only=current_results_only,
             )
 
             # Create archive
-            archive_size = self.create_archive(workspace_path, manifest, archive_path)
+            if archive_format == ArchiveFormat.ZSTD:
+                archive_size, manifest = self.create_zstd_archive(
+                    workspace_path, manifest, archive_path, since_export_id
+                )
+            else:
+                archive_size = self.create_archive(
+                    workspace_path, manifest, archive_path
+                )
 
             logger.info(
                 f"Exported workspace '{workspace_name}' to {archive_path} ({archive_size} bytes)"
@@ -405,6 +528,7 @@ class ExportService:
                 filename=filename,
                 size_bytes=archive_size,
                 status=ExportStatus.SUCCESS,
+                export_id=manifest.export_id,
             )
 
         except Exception as e:
@@ -424,13 +548,15 @@ class ExportService:
         archive_path: Path,
         conflict_resolution: Optional[ConflictResolution] = None,
         new_name: Optional[str] = None,
+        base_archives: Sequence[Path] = (),
     ) -> ImportResponse:
-        """Import a workspace from a 7z archive.
+        """Import a workspace from a 7z or tar.zst archive.
 
         Args:
-            archive_path: Path to 7z archive file
+            archive_path: Path to archive file
             conflict_resolution: How to handle name conflicts
             new_name: Custom name if conflict_resolution=rename
+            base_archives: Archives an incremental tar.zst archive builds on
 
         Returns:
             ImportResponse with import results
@@ -455,7 +581,9 @@ class ExportService:
             manifest.workspace_name, validation.conflict, conflict_resolution, new_name
         )
 
-        return self._create_workspace_from_archive(archive_path, final_name, warnings)
+        return self._create_workspace_from_archive(
+            archive_path, final_name, warnings, base_archives
+        )
 
     def _resolve_conflict(
         self,
@@ -498,13 +626,15 @@ class ExportService:
         archive_path: Path,
         final_name: str,
         warnings: List[str],
+        base_archives: Sequence[Path] = (),
     ) -> ImportResponse:
         """Extract archive and create a new workspace from its contents.
 
         Args:
-            archive_path: Path to 7z archive file
+            archive_path: Path to 7z or tar.zst archive file
             final_name: Name to assign to the new workspace
             warnings: List to append warning messages to
+            base_archives: Archives an incremental tar.zst archive builds on
 
         Returns:
             ImportResponse with import results
@@ -513,7 +643,9 @@ class ExportService:
             temp_path = Path(temp_dir)
 
             # Extract archive
-            extracted_manifest = self.extract_archive(archive_path, temp_path)
+            extracted_manifest = self.extract_archive(
+                archive_path, temp_path, base_archives
+            )
 
             # Validate checksum
             workspace_json_path = temp_path / "workspace.json"
@@ -540,6 +672,11 @@ class ExportService:
                 else:
                     shutil.copy2(item, dest)
 
+            # Archived runs are views over absolute Parquet paths; repoint them.
+            from .simulation.columnar_archive import relink_archives
+
+            relink_archives(new_workspace_path)
+
             # Update workspace.json with new ID and name
             workspace_json_path = new_workspace_path / "workspace.json"
             if workspace_json_path.exists():
@@ -610,15 +747,24 @@ class ExportService:
         return status
 
     def execute_bulk_export(
-        self, operation_id: str, workspace_ids: List[str]
+        self,
+        operation_id: str,
+        workspace_ids: List[str],
+        *,
+        archive_format: ArchiveFormat = ArchiveFormat.SEVEN_ZIP,
+        current_results_only: bool = False,
     ) -> BulkExportStatus:
         """Execute bulk export operation.
 
-        This should be called after start_bulk_export to actually perform the exports.
+        This should be called after start_bulk_export to actually perform the
+        exports. Up to BULK_EXPORT_WORKERS workspaces export concurrently;
+        results are reported in request order.
 
         Args:
             operation_id: Operation ID from start_bulk_export
             workspace_ids: List of workspace UUIDs to export
+            archive_format: Archive format for every workspace
+            current_results_only: Export only current-result runs
 
         Returns:
             Updated BulkExportStatus
@@ -632,8 +778,10 @@ class ExportService:
         # Create temp directory for exports
         export_dir = Path(tempfile.gettempdir()) / "planalign_exports" / operation_id
         export_dir.mkdir(parents=True, exist_ok=True)
+        progress = threading.Lock()
 
-        for workspace_id in workspace_ids:
+        def export_one(workspace_id: str) -> ExportResult:
+            workspace = None
             try:
                 # Get workspace name for status update
                 workspace = self.storage.get_workspace(workspace_id)
@@ -641,25 +789,35 @@ class ExportService:
                     status.current_workspace = workspace.name
 
                 # Export workspace
-                archive_path, result = self.export_workspace(workspace_id, export_dir)
+                archive_path, result = self.export_workspace(
+                    workspace_id,
+                    export_dir,
+                    archive_format=archive_format,
+                    current_results_only=current_results_only,
+                )
 
                 if result.status == ExportStatus.SUCCESS:
-                    self._export_temp_files[operation_id][workspace_id] = archive_path
-
-                status.results.append(result)
+                    with progress:
+                        self._export_temp_files[operation_id][
+                            workspace_id
+                        ] = archive_path
 
             except Exception as e:
                 logger.exception(f"Failed to export workspace {workspace_id}")
-                status.results.append(
-                    ExportResult(
-                        workspace_id=workspace_id,
-                        workspace_name=workspace.name if workspace else "Unknown",
-                        status=ExportStatus.FAILED,
-                        error=str(e),
-                    )
+                result = ExportResult(
+                    workspace_id=workspace_id,
+                    workspace_name=workspace.name if workspace else "Unknown",
+                    status=ExportStatus.FAILED,
+                    error=str(e),
                 )
 
-            status.completed += 1
+            with progress:
+                status.completed += 1
+            return result
+
+        workers = max(1, min(BULK_EXPORT_WORKERS, len(workspace_ids)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            status.results.extend(pool.map(export_one, workspace_ids))
 
         status.current_workspace = None
         status.status = (
@@ -9,6 +9,8 @@ from typing import Dict, List, Optional, Set
 import yaml
 from pydantic import BaseModel
 
+from planalign_orchestrator.resources.duckdb_profile import read_connection_config
+
 from ..storage.workspace_storage import WorkspaceStorage
 from .database_path_resolver import (
     DatabasePathResolver,
@@ -328,7 +330,9 @@ class NDTService:
             return AvailableYearsResponse(years=[], default_year=None)
 
         try:
-            conn = duckdb.connect(str(resolved.path), read_only=True)
+            conn = duckdb.connect(
+                str(resolved.path), read_only=True, config=read_connection_config()
+            )
             result = conn.execute(
                 "SELECT DISTINCT simulation_year FROM fct_workforce_snapshot ORDER BY simulation_year"
             ).fetchall()
@@ -368,7 +372,9 @@ class NDTService:
             # Ensure seed table has the hce_compensation_threshold column
             self._ensure_seed_current(resolved.path)
 
-            conn = duckdb.connect(str(resolved.path), read_only=True)
+            conn = duckdb.connect(
+                str(resolved.path), read_only=True, config=read_connection_config()
+            )
 
             # Get HCE threshold for the prior year (used for HCE determination)
             hce_threshold_row = conn.execute(
@@ -673,7 +679,9 @@ class NDTService:
 
         try:
             self._ensure_seed_current(resolved.path)
-            conn = duckdb.connect(str(resolved.path), read_only=True)
+            conn = duckdb.connect(
+                str(resolved.path), read_only=True, config=read_connection_config()
+            )
 
             # Get HCE threshold for the prior year
             hce_threshold_row = conn.execute(
@@ -1045,7 +1053,9 @@ class NDTService:
         assert resolved.path is not None  # guaranteed by resolved.exists check above
         try:
             self._ensure_seed_current(resolved.path)
-            conn = duckdb.connect(str(resolved.path), read_only=True)
+            conn = duckdb.connect(
+                str(resolved.path), read_only=True, config=read_connection_config()
+            )
 
             # Get IRS limits for the test year
             limits_row = conn.execute(
@@ -1219,7 +1229,9 @@ class NDTService:
         assert resolved.path is not None  # guaranteed by resolved.exists check above
         try:
             self._ensure_seed_current(resolved.path)
-            conn = duckdb.connect(str(resolved.path), read_only=True)
+            conn = duckdb.connect(
+                str(resolved.path), read_only=True, config=read_connection_config()
+            )
 
             # Get HCE threshold for the prior year
             hce_threshold_row = conn.execute(
@@ -27,6 +27,7 @@ from planalign_api.services.database_path_resolver import (
 )
 from planalign_api.services.run_trust import add_current_config_drift, read_run_trust
 from planalign_api.storage.workspace_storage import WorkspaceStorage
+from planalign_orchestrator.resources.duckdb_profile import read_connection_config
 
 
 class ReportNotFoundError(ValueError):
@@ -180,7 +181,9 @@ def _workforce_by_year(database_path: Path) -> dict[int, dict[str, float | int]]
         FROM fct_workforce_snapshot
         GROUP BY simulation_year ORDER BY simulation_year
     """
-    with duckdb.connect(str(database_path), read_only=True) as conn:
+    with duckdb.connect(
+        str(database_path), read_only=True, config=read_connection_config()
+    ) as conn:
         return {
             int(year): {
                 "headcount": int(headcount),
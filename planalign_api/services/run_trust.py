@@ -10,6 +10,7 @@ import duckdb
 from planalign_orchestrator.run_metadata import DriftStatus, evaluate_drift
 from planalign_orchestrator.run_metadata import compute_config_fingerprint
 from planalign_orchestrator.config import SimulationConfig
+from planalign_orchestrator.resources.duckdb_profile import read_connection_config
 from pydantic import ValidationError
 from _version import __version__
 
@@ -75,7 +76,9 @@ __all__ = ["evaluate_run_trust"]
 def read_run_trust(database_path, run_id: str | None) -> RunTrustResult:
     """Read at most the selected and prior metadata generations read-only."""
     try:
-        with duckdb.connect(str(database_path), read_only=True) as connection:
+        with duckdb.connect(
+            str(database_path), read_only=True, config=read_connection_config()
+        ) as connection:
             columns = {
                 row[0]
                 for row in connection.execute(
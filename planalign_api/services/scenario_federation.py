@@ -0,0 +1,168 @@
+"""Federated read-only queries across several scenarios' result databases.
+
+Multi-scenario screens used to open one connection per scenario, run the same
+query in each, and merge the results in Python. ``ScenarioFederation`` attaches
+every requested database read-only to a single in-memory DuckDB session
+instead, so a comparison is one query per table over a view that unions the
+scenarios and tags each row with ``scenario_id``::
+
+    with ScenarioFederation.for_scenarios(resolver, workspace_id, ids) as fed:
+        fed.union("fct_workforce_snapshot", ["employee_id", "simulation_year"])
+        fed.connection.execute(
+            "SELECT scenario_id, COUNT(*) FROM fct_workforce_snapshot GROUP BY 1"
+        )
+
+Columns a scenario's table lacks (older databases) read as NULL in the view.
+Helpers written against a single database can still run in the session
+through :meth:`ScenarioFederation.use`.
+"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence
+
+import duckdb
+
+from planalign_orchestrator.resources.duckdb_profile import read_connection_config
+
+from .database_path_resolver import DatabasePathResolver
+
+logger = logging.getLogger(__name__)
+
+_SESSION_CATALOG = "memory"
+
+
+class ScenarioFederation:
+    """One read-only DuckDB session over several scenario databases.
+
+    Scenarios are kept in the order given. Scenarios that share a database
+    file share one attachment. A scenario whose database cannot be attached
+    is logged and left out; its id is listed in ``missing``.
+    """
+
+    def __init__(self, databases: Mapping[str, Path]):
+        self.databases: Dict[str, Path] = {
+            scenario_id: Path(path) for scenario_id, path in databases.items()
+        }
+        self.missing: List[str] = []
+        self._aliases: Dict[str, str] = {}
+        self._columns: Dict[tuple[str, str], frozenset[str]] = {}
+        self._conn: Optional[duckdb.DuckDBPyConnection] = None
+
+    @classmethod
+    def for_scenarios(
+        cls,
+        resolver: DatabasePathResolver,
+        workspace_id: str,
+        scenario_ids: Sequence[str],
+    ) -> "ScenarioFederation":
+        """Resolve each scenario's selected result; unresolved ones are missing."""
+        databases: Dict[str, Path] = {}
+        missing: List[str] = []
+        for scenario_id in dict.fromkeys(scenario_ids):
+            resolved = resolver.resolve(workspace_id, scenario_id)
+            if resolved.exists and resolved.path is not None:
+                databases[scenario_id] = Path(resolved.path)
+            else:
+                logger.warning(f"Database not found for scenario {scenario_id}")
+                missing.append(scenario_id)
+        federation = cls(databases)
+        federation.missing.extend(missing)
+        return federation
+
+    def __enter__(self) -> "ScenarioFederation":
+        self._conn = duckdb.connect(config=read_connection_config())
+        attached: Dict[Path, str] = {}
+        for scenario_id, path in self.databases.items():
+            key = path.resolve()
+            alias = attached.get(key)
+            if alias is None:
+                alias = f"scenario_{len(attached)}"
+                quoted = str(key).replace("'", "''")
+                try:
+                    self._conn.execute(f"ATTACH '{quoted}' AS {alias} (READ_ONLY)")
+                except duckdb.Error as e:
+                    logger.error(f"Could not attach database for {scenario_id}: {e}")
+                    self.missing.append(scenario_id)
+                    continue
+                attached[key] = alias
+            self._aliases[scenario_id] = alias
+        for alias, table, column in self._conn.execute(
+            "SELECT table_catalog, table_name, column_name "
+            "FROM information_schema.columns WHERE table_schema = 'main'"
+        ).fetchall():
+            self._columns[(alias, table)] = self._columns.get(
+                (alias, table), frozenset()
+            ) | {column}
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @property
+    def connection(self) -> duckdb.DuckDBPyConnection:
+        if self._conn is None:
+            raise RuntimeError("ScenarioFederation is not open")
+        return self._conn
+
+    @property
+    def scenario_ids(self) -> List[str]:
+        """Attached scenarios, in request order."""
+        return list(self._aliases)
+
+    def columns(self, scenario_id: str, table: str) -> frozenset[str]:
+        """Columns of ``table`` in one scenario's database (empty if absent)."""
+        alias = self._aliases.get(scenario_id)
+        return self._columns.get((alias, table), frozenset()) if alias else frozenset()
+
+    def union(self, table: str, columns: Sequence[str]) -> List[str]:
+        """Expose ``table`` from every scenario as one view tagged by scenario.
+
+        The view is named after ``table`` and has ``scenario_id`` followed by
+        ``columns``. Scenarios without the table are left out of the view
+        (with none, the view is empty); the scenarios it covers are returned.
+        """
+        selects = []
+        included = []
+        for scenario_id, alias in self._aliases.items():
+            available = self.columns(scenario_id, table)
+            if not available:
+                continue
+            projected = ", ".join(
+                f'"{column}"' if column in available else f'NULL AS "{column}"'
+                for column in columns
+            )
+            literal = scenario_id.replace("'", "''")
+            selects.append(
+                f"SELECT '{literal}' AS scenario_id, {projected} "
+                f'FROM {alias}.main."{table}"'
+            )
+            included.append(scenario_id)
+        if not selects:
+            nulls = ", ".join(f'NULL AS "{column}"' for column in columns)
+            selects.append(f"SELECT NULL::VARCHAR AS scenario_id, {nulls} WHERE false")
+        self.connection.execute(
+            f'CREATE OR REPLACE VIEW {_SESSION_CATALOG}.main."{table}" AS '
+            + " UNION ALL ".join(selects)
+        )
+        return included
+
+    @contextmanager
+    def use(self, scenario_id: str) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Point unqualified table names at one scenario for the block."""
+        self.connection.execute(f"USE {self._aliases[scenario_id]}")
+        try:
+            yield self.connection
+        finally:
+            self.connection.execute(f"USE {_SESSION_CATALOG}")
+
+
+__all__ = ["ScenarioFederation"]
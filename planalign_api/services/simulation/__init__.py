@@ -15,6 +15,7 @@ from .db_cleanup import cleanup_years_outside_range
 from .output_parser import SimulationOutputParser
 from .results_reader import read_results
 from .run_archiver import archive_run, prune_old_runs
+from .columnar_archive import compact_published_run
 from .service import SimulationService
 
 __all__ = [
@@ -30,6 +31,7 @@ __all__ = [
     "read_results",
     "archive_run",
     "prune_old_runs",
+    "compact_published_run",
     # Main service
     "SimulationService",
 ]
@@ -0,0 +1,244 @@
+"""Columnar archival of published runs.
+
+A completed run keeps its full working ``simulation.duckdb`` -- every staging
+and intermediate table the pipeline built -- plus dbt's ``target/`` and
+``logs/`` directories. Published runs are immutable, so once a run has been
+promoted through ``current_result`` none of that working state is read again.
+
+``compact_published_run`` exports the public tables to zstd-compressed Parquet
+sorted by ``simulation_year`` and ``employee_id``, drops the intermediate tables
+and dbt artifacts, and rewrites ``simulation.duckdb`` as a thin catalog of views
+over the Parquet files. The database path, table names and column types are
+unchanged, so ``DatabasePathResolver`` and every read service work on it as
+before; sorted row groups let year-filtered scans skip most of the data.
+
+Views hold absolute Parquet paths (DuckDB resolves relative paths against the
+process working directory, not the database). ``relink_archives`` rewrites them
+when a workspace is copied to a new location.
+"""
+
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import duckdb
+
+from planalign_core.constants import DATABASE_FILENAME
+from planalign_orchestrator.resources.duckdb_profile import read_connection_config
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIRNAME = "archive"
+MANIFEST_FILENAME = "archive.json"
+ARCHIVE_FORMAT_VERSION = 1
+
+# Clustering order for every exported table that has these columns.
+SORT_COLUMNS = ("simulation_year", "employee_id")
+
+# Working-state tables no read path consumes once a run is published.
+INTERMEDIATE_PREFIXES = ("int_", "stg_")
+
+# dbt artifacts written inside the run directory (relative to it).
+ARTIFACT_PATHS = ("dbt_project/target", "dbt_project/logs", "dbt_artifacts")
+
+
+def compact_published_run(run_dir: Path, config: Dict[str, Any]) -> None:
+    """Archive a promoted run unless ``storage.columnar_archive`` is false.
+
+    Best effort: the run is already published, so a failure leaves the full
+    database in place and is only logged.
+    """
+    if not config.get("storage", {}).get("columnar_archive", True):
+        return
+    try:
+        manifest = archive_run_database(run_dir)
+    except Exception as e:
+        logger.warning(f"Columnar archival failed for {run_dir.name} (non-fatal): {e}")
+        return
+    if manifest is not None:
+        before_mb = manifest["bytes_before"] / (1024 * 1024)
+        after_mb = manifest["bytes_after"] / (1024 * 1024)
+        logger.info(
+            f"Archived run {run_dir.name}: {len(manifest['tables'])} tables, "
+            f"{before_mb:.1f}MB -> {after_mb:.1f}MB"
+        )
+
+
+def is_archived(run_dir: Path) -> bool:
+    return (run_dir / MANIFEST_FILENAME).is_file()
+
+
+def archive_run_database(run_dir: Path) -> Optional[Dict[str, Any]]:
+    """Rewrite ``run_dir``'s database as views over sorted Parquet files.
+
+    Returns:
+        The archive manifest, or None if there is no database or the run is
+        already archived.
+
+    The manifest is written only after the thin catalog is complete and just
+    before it replaces the database, so an interrupted archival either leaves
+    the original database untouched or a finished archive. Leftover Parquet
+    from an interrupted attempt is discarded and rebuilt.
+    """
+    run_dir = run_dir.resolve()
+    database = run_dir / DATABASE_FILENAME
+    if not database.is_file() or is_archived(run_dir):
+        return None
+
+    archive_dir = run_dir / ARCHIVE_DIRNAME
+    staging = run_dir / f".{ARCHIVE_DIRNAME}.tmp"
+    catalog = run_dir / f".{DATABASE_FILENAME}.archive.tmp"
+    for leftover in (archive_dir, staging):
+        if leftover.exists():
+            shutil.rmtree(leftover)
+    catalog.unlink(missing_ok=True)
+    staging.mkdir()
+    bytes_before = _tree_bytes(run_dir)
+
+    tables: Dict[str, Dict[str, Any]] = {}
+    with duckdb.connect(
+        str(database), read_only=True, config=read_connection_config()
+    ) as source:
+        names = [
+            row[0]
+            for row in source.execute(
+                "SELECT table_name FROM duckdb_tables() "
+                "WHERE schema_name = 'main' AND NOT temporary ORDER BY table_name"
+            ).fetchall()
+            if not row[0].startswith(INTERMEDIATE_PREFIXES)
+        ]
+        views = [
+            list(row)
+            for row in source.execute(
+                "SELECT view_name, sql FROM duckdb_views() "
+                "WHERE schema_name = 'main' AND NOT internal AND NOT temporary "
+                "ORDER BY view_name"
+            ).fetchall()
+        ]
+        for name in names:
+            columns = source.execute(f'DESCRIBE "{name}"').fetchall()
+            column_names = {column[0] for column in columns}
+            sort = [column for column in SORT_COLUMNS if column in column_names]
+            order = f" ORDER BY {', '.join(sort)}" if sort else ""
+            target = staging / f"{name}.parquet"
+            source.execute(
+                f"COPY (SELECT * FROM \"{name}\"{order}) TO '{_quote(target)}' "
+                "(FORMAT PARQUET, COMPRESSION ZSTD)"
+            )
+            tables[name] = {
+                "file": target.name,
+                "sort": sort,
+                "types": {column[0]: column[1] for column in columns},
+            }
+
+    os.replace(staging, archive_dir)
+    manifest: Dict[str, Any] = {
+        "format_version": ARCHIVE_FORMAT_VERSION,
+        "archive_dir": str(archive_dir),
+        "tables": tables,
+        "views": views,
+        "bytes_before": bytes_before,
+    }
+    manifest["skipped_views"] = _write_catalog(catalog, archive_dir, tables, views)
+
+    _write_manifest(run_dir, manifest)
+    os.replace(catalog, database)
+    Path(f"{database}.wal").unlink(missing_ok=True)
+    for relative in ARTIFACT_PATHS:
+        artifact = run_dir / relative
+        if artifact.is_dir():
+            shutil.rmtree(artifact, ignore_errors=True)
+    manifest["bytes_after"] = _tree_bytes(run_dir)
+    _write_manifest(run_dir, manifest)
+    return manifest
+
+
+def relink_archives(root: Path) -> int:
+    """Repoint archived run catalogs under ``root`` at their current location.
+
+    Returns:
+        Number of run databases rewritten
+    """
+    relinked = 0
+    for manifest_path in sorted(root.rglob(MANIFEST_FILENAME)):
+        run_dir = manifest_path.parent.resolve()
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        archive_dir = run_dir / ARCHIVE_DIRNAME
+        if manifest.get("archive_dir") == str(archive_dir):
+            continue
+        database = run_dir / DATABASE_FILENAME
+        catalog = run_dir / f".{DATABASE_FILENAME}.archive.tmp"
+        catalog.unlink(missing_ok=True)
+        manifest["skipped_views"] = _write_catalog(
+            catalog, archive_dir, manifest["tables"], manifest["views"]
+        )
+        manifest["archive_dir"] = str(archive_dir)
+        os.replace(catalog, database)
+        _write_manifest(run_dir, manifest)
+        relinked += 1
+    return relinked
+
+
+def _write_catalog(
+    catalog: Path,
+    archive_dir: Path,
+    tables: Dict[str, Dict[str, Any]],
+    views: Sequence[Sequence[str]],
+) -> List[str]:
+    """Create one view per archived table, then the run's own views.
+
+    Parquet does not carry every DuckDB type (ENUMs come back as VARCHAR, for
+    example), so any column that reads back differently is cast to its
+    original type. Views over dropped intermediate tables no longer bind and
+    are skipped; their names are returned.
+    """
+    skipped: List[str] = []
+    with duckdb.connect(str(catalog)) as conn:
+        for name, table in tables.items():
+            path = _quote(archive_dir / table["file"])
+            read_back = dict(
+                (column[0], column[1])
+                for column in conn.execute(
+                    f"DESCRIBE SELECT * FROM read_parquet('{path}')"
+                ).fetchall()
+            )
+            casts = [
+                f'CAST("{column}" AS {original}) AS "{column}"'
+                for column, original in table["types"].items()
+                if read_back.get(column) != original
+            ]
+            replace = f" REPLACE ({', '.join(casts)})" if casts else ""
+            conn.execute(
+                f'CREATE VIEW "{name}" AS '
+                f"SELECT *{replace} FROM read_parquet('{path}')"
+            )
+        for name, sql in views:
+            try:
+                conn.execute(sql)
+            except duckdb.Error as e:
+                skipped.append(name)
+                logger.debug(f"Skipping view {name}, which no longer binds: {e}")
+    return skipped
+
+
+def _write_manifest(run_dir: Path, manifest: Dict[str, Any]) -> None:
+    path = run_dir / MANIFEST_FILENAME
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with temporary.open("w", encoding="utf-8") as handle:
+        handle.write(json.dumps(manifest, indent=2) + "\n")
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temporary, path)
+
+
+def _tree_bytes(path: Path) -> int:
+    from ..storage_usage import _scan_directory_bytes
+
+    return _scan_directory_bytes(path)
+
+
+def _quote(path: Path) -> str:
+    return str(path).replace("'", "''")
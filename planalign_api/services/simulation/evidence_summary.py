@@ -0,0 +1,56 @@
+"""Publish-time evidence precomputation.
+
+Evidence packs for a published run decompose the same immutable snapshot on
+every request. ``precompute_published_evidence`` answers every canonical
+metric for every pair of simulated years once, right after promotion, and
+leaves the result beside the run's database (see ``planalign_evidence.summary``).
+Packs read from it and fall back to the live query whenever it is absent.
+"""
+
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+from planalign_core.constants import DATABASE_FILENAME
+from planalign_evidence.service import EvidenceTarget
+from planalign_evidence.summary import precompute_evidence_summary
+
+logger = logging.getLogger(__name__)
+
+
+def precompute_published_evidence(
+    run_dir: Path, scenario_id: str, run_id: str, config: Dict[str, Any]
+) -> None:
+    """Precompute evidence unless ``storage.evidence_summary`` is false.
+
+    Best effort: the run is already published, so a failure only costs packs
+    the live query and is logged.
+    """
+    if not config.get("storage", {}).get("evidence_summary", True):
+        return
+    database = run_dir / DATABASE_FILENAME
+    if not database.is_file():
+        return
+    started = time.perf_counter()
+    try:
+        manifest = precompute_evidence_summary(
+            EvidenceTarget(
+                database_path=database,
+                result_store=f"runs/{run_id}/{DATABASE_FILENAME}",
+                scenario_id=scenario_id,
+                run_id=run_id,
+                run_dir=run_dir,
+            )
+        )
+    except Exception as e:
+        logger.warning(
+            f"Evidence precomputation failed for {run_dir.name} (non-fatal): {e}"
+        )
+        return
+    if manifest is not None:
+        logger.info(
+            f"Precomputed evidence for run {run_dir.name}: "
+            f"{len(manifest['metrics'])} metrics over {len(manifest['years'])} years "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
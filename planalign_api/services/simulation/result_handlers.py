@@ -54,6 +54,7 @@ def export_results_to_excel(
         from planalign_orchestrator.utils import DatabaseConnectionManager
         from planalign_orchestrator.excel_exporter import ExcelExporter
         from planalign_orchestrator.config import SimulationConfig
+        from planalign_orchestrator.resources.duckdb_profile import profile_from_env
 
         # Find the database - prefer run-specific database if run_dir provided
         db_path = (
@@ -78,7 +79,10 @@ def export_results_to_excel(
         # for large populations), blocking every other reader — the Studio UI's
         # results endpoints, publish_current_result's validation, etc. Read-only
         # connections can coexist with other processes' access to the same file.
-        with DatabaseConnectionManager(db_path, read_only=True) as db_manager:
+        # It shares the API's DuckDB resource profile like every other read.
+        with DatabaseConnectionManager(
+            db_path, read_only=True, resource_profile=profile_from_env()
+        ) as db_manager:
             # Create exporter
             exporter = ExcelExporter(db_manager)
 
@@ -9,6 +9,7 @@ from planalign_core.constants import (
     TABLE_FCT_WORKFORCE_SNAPSHOT,
     TABLE_FCT_YEARLY_EVENTS,
 )
+from planalign_orchestrator.resources.duckdb_profile import read_connection_config
 
 from ...constants import DEFAULT_PARTICIPATION_RATE
 from ...models.simulation import SimulationResults
@@ -62,7 +63,9 @@ def read_results(
     logger.info(f"Loading results from {db_source} database: {resolved.path}")
 
     try:
-        conn = duckdb.connect(str(resolved.path), read_only=True)
+        conn = duckdb.connect(
+            str(resolved.path), read_only=True, config=read_connection_config()
+        )
     except Exception as e:
         logger.error(f"Failed to connect to database: {e}")
         return None
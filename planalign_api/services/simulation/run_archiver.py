@@ -12,6 +12,7 @@ import yaml  # type: ignore[import]  # types-PyYAML not in CI deps
 
 from planalign_core.constants import DATABASE_FILENAME, STATUS_COMPLETED
 from planalign_orchestrator.config.export import resolve_effective_core_contribution
+from planalign_orchestrator.resources.duckdb_profile import read_connection_config
 
 from ...constants import DEFAULT_MAX_RUNS_PER_SCENARIO
 from ...storage.workspace_storage import WorkspaceStorage
@@ -86,7 +87,9 @@ def archive_run(
     if not run_database.is_file():
         raise FileNotFoundError(f"run-local database is missing: {run_database}")
     try:
-        with duckdb.connect(str(run_database), read_only=True) as connection:
+        with duckdb.connect(
+            str(run_database), read_only=True, config=read_connection_config()
+        ) as connection:
             connection.execute("SELECT 1").fetchone()
     except Exception as exc:
         raise RuntimeError("run-local database is not readable") from exc
@@ -236,6 +236,8 @@ def build_command(
         "--dbt-project-dir",
         os.fspath(dbt_project_dir),
         "--verbose",
+        # Studio runs always keep simulation.trace.json beside the run database.
+        "--trace",
     ]
 
 
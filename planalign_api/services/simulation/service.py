@@ -21,6 +21,8 @@ from ..database_path_resolver import (
 from .log_writer import SimulationLogWriter
 from .output_parser import SimulationOutputParser
 from .results_reader import read_results
+from .columnar_archive import compact_published_run
+from .evidence_summary import precompute_published_evidence
 from .run_archiver import archive_failed_run, archive_run, export_run_excel
 from .run_execution import (
     active_process_registry as _active_process_registry,
@@ -313,6 +315,14 @@ class SimulationService:
                 run_id,
                 exc,
             )
+        # Published runs are immutable: archive them as Parquet-backed views once
+        # the export no longer needs the working tables (best effort, logged).
+        published_dir = run_dir or (scenario_path / "runs" / run_id)
+        await asyncio.to_thread(compact_published_run, published_dir, config)
+        # Reads the compacted catalog, so it runs last.
+        await asyncio.to_thread(
+            precompute_published_evidence, published_dir, scenario_id, run_id, config
+        )
 
     def _handle_simulation_failure(
         self,
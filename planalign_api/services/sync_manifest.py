@@ -0,0 +1,184 @@
+"""Change manifest and artifact rules for workspace Git sync.
+
+Sync used to glob ``**/*.json``, ``**/*.yaml`` and ``**/*.yml`` across the whole
+workspaces root and ask Git for its full status. Each run directory holds a
+``dbt_project/`` overlay whose symlinks lead into the dbt tree, plus dbt
+``target/`` manifests, so both walks grew with every run ever executed.
+
+This module keeps sync proportional to the metadata that actually changed:
+
+- Generated run artifacts are excluded by rule, and their directories are
+  pruned from the walk rather than filtered after it.
+- A manifest of ``(path, mtime_ns, size, blob sha)`` lets a file whose stat is
+  unchanged reuse its hash without being read. The hash is Git's blob SHA-1,
+  so it compares directly with the index entry.
+
+The manifest lives inside the Git directory, so it is never itself synced.
+"""
+
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "planalign-sync-manifest.json"
+SYNCABLE_SUFFIXES = (".json", ".yaml", ".yml")
+
+# Directories (relative to the workspaces root) holding regenerable output.
+GENERATED_ARTIFACT_DIRS = (
+    "*/runs/*/dbt_project",  # per-run overlay: symlinks into dbt/, target/, logs/
+    "*/runs/*/seeds",
+    "*/runs/*/archive",
+    "*/dbt_artifacts",
+    "*/target",
+    "*/logs",
+    "*/checkpoints",
+    "*.payroll_ledger",  # on-demand ledger cache beside a database (Parquet + sidecars)
+)
+GENERATED_ARTIFACT_FILES = (
+    "*/runs/*/archive.json",
+    "*/runs/*/*.trace.json",  # per-run span trace (simulation.trace.json)
+    "*/runs/*/evidence_summary.json",  # describes the unsynced summary Parquet
+)
+
+
+@dataclass(frozen=True)
+class SyncChanges:
+    """Syncable files that differ from the Git index."""
+
+    modified: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return len(self.modified) + len(self.deleted)
+
+
+def _excluded_dir(relative: str) -> bool:
+    name = relative.rsplit("/", 1)[-1]
+    return name.startswith(".") or any(
+        fnmatch.fnmatchcase(relative, pattern) for pattern in GENERATED_ARTIFACT_DIRS
+    )
+
+
+def is_syncable(relative: str, always_synced: Sequence[str] = ()) -> bool:
+    """Whether a root-relative POSIX path is workspace metadata to sync."""
+    if relative in always_synced:
+        return True
+    parts = relative.split("/")
+    if not relative.endswith(SYNCABLE_SUFFIXES) or any(
+        part.startswith(".") for part in parts
+    ):
+        return False
+    if any(
+        fnmatch.fnmatchcase(relative, pattern) for pattern in GENERATED_ARTIFACT_FILES
+    ):
+        return False
+    return not any(
+        _excluded_dir("/".join(parts[:depth])) for depth in range(1, len(parts))
+    )
+
+
+def git_blob_sha(path: Path) -> str:
+    """SHA-1 Git assigns to the blob of ``path``'s contents."""
+    data = path.read_bytes()
+    digest = hashlib.sha1(f"blob {len(data)}\0".encode("ascii"))
+    digest.update(data)
+    return digest.hexdigest()
+
+
+class SyncManifest:
+    """Stat-keyed blob hashes for the syncable files under a workspaces root."""
+
+    def __init__(
+        self, workspaces_root: Path, path: Path, always_synced: Sequence[str] = ()
+    ):
+        self.workspaces_root = workspaces_root
+        self.path = path
+        self.always_synced = tuple(always_synced)
+        self._entries: Dict[str, Tuple[int, int, str]] = self._load()
+
+    def _load(self) -> Dict[str, Tuple[int, int, str]]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            return {key: (int(v[0]), int(v[1]), str(v[2])) for key, v in data.items()}
+        except (OSError, ValueError, TypeError, IndexError) as e:
+            logger.warning(f"Discarding unreadable sync manifest {self.path}: {e}")
+            return {}
+
+    def save(self) -> None:
+        temporary = self.path.with_name(f"{self.path.name}.tmp")
+        with open(temporary, "w") as f:
+            json.dump({key: list(value) for key, value in self._entries.items()}, f)
+        os.replace(temporary, self.path)
+
+    def syncable_files(self) -> List[str]:
+        """Root-relative paths of every syncable file, pruning artifact trees."""
+        files = [
+            name
+            for name in self.always_synced
+            if (self.workspaces_root / name).is_file()
+        ]
+        for directory, dirnames, filenames in os.walk(self.workspaces_root):
+            relative_dir = os.path.relpath(directory, self.workspaces_root)
+            prefix = (
+                "" if relative_dir == "." else relative_dir.replace(os.sep, "/") + "/"
+            )
+            dirnames[:] = sorted(
+                name for name in dirnames if not _excluded_dir(prefix + name)
+            )
+            for name in sorted(filenames):
+                relative = prefix + name
+                if relative not in self.always_synced and is_syncable(relative):
+                    files.append(relative)
+        return files
+
+    def blob_sha(self, relative: str) -> str:
+        """Blob SHA of a file, rehashing only when its size or mtime changed."""
+        path = self.workspaces_root / relative
+        stat = path.stat()
+        known = self._entries.get(relative)
+        if (
+            known is not None
+            and known[0] == stat.st_mtime_ns
+            and known[1] == stat.st_size
+        ):
+            return known[2]
+        sha = git_blob_sha(path)
+        self._entries[relative] = (stat.st_mtime_ns, stat.st_size, sha)
+        return sha
+
+    def changes(self, tracked: Mapping[str, str]) -> SyncChanges:
+        """Compare the working tree's syncable files with ``tracked``.
+
+        Args:
+            tracked: Blob SHA (hex) by path for every stage-0 index entry
+
+        Forgets manifest entries for files that no longer exist.
+        """
+        present = self.syncable_files()
+        modified = [
+            relative
+            for relative in present
+            if tracked.get(relative) != self.blob_sha(relative)
+        ]
+        present_set = set(present)
+        deleted = sorted(
+            relative
+            for relative in tracked
+            if relative not in present_set
+            and is_syncable(relative, self.always_synced)
+            and not (self.workspaces_root / relative).exists()
+        )
+        for relative in set(self._entries) - present_set:
+            del self._entries[relative]
+        return SyncChanges(modified=modified, deleted=deleted)
@@ -35,6 +35,8 @@ from ..models.sync import (
     SyncPullResult,
     WorkspaceSyncInfo,
 )
+from ..storage.catalog_index import catalog_for
+from .sync_manifest import MANIFEST_FILENAME, SyncChanges, SyncManifest
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +60,14 @@ __pycache__/
 # Exclude checkpoints (can be large)
 checkpoints/
 
+# Exclude generated run artifacts
+runs/*/dbt_project/
+runs/*/archive/
+*.payroll_ledger/
+dbt_artifacts/
+target/
+logs/
+
 # Keep important metadata files
 !**/workspace.json
 !**/scenario.json
@@ -313,7 +323,10 @@ class SyncService:
 
     def _create_initial_commit(self, repo: Repo, branch: str) -> None:
         """Create initial commit if repo is empty."""
-        if branch not in [h.name for h in repo.heads]:
+        if not repo.head.is_valid():
+            # An unborn HEAD has no commit to branch from; just point it
+            repo.git.symbolic_ref("HEAD", f"refs/heads/{branch}")
+        elif branch not in [h.name for h in repo.heads]:
             repo.head.reference = repo.create_head(branch)
 
         # Stage all syncable files
@@ -327,40 +340,34 @@ class SyncService:
         ):
             repo.index.commit("Initial PlanAlign workspace sync")
 
+    def _local_changes(self, repo: Repo) -> SyncChanges:
+        """Diff syncable files against the index via the change manifest."""
+        manifest = SyncManifest(
+            self.workspaces_root,
+            Path(repo.git_dir) / MANIFEST_FILENAME,
+            always_synced=(".gitignore", SYNC_CONFIG_FILE),
+        )
+        tracked = {
+            path: entry.hexsha
+            for (path, stage), entry in repo.index.entries.items()
+            if stage == 0
+        }
+        changes = manifest.changes(tracked)
+        manifest.save()
+        return changes
+
     def _stage_syncable_files(self, repo: Repo) -> int:
-        """Stage all syncable files (JSON, YAML).
+        """Stage new, modified and deleted syncable files in one index update.
 
         Returns:
             Number of files staged
         """
-        count = 0
-        for pattern in ["**/*.json", "**/*.yaml", "**/*.yml"]:
-            for filepath in self.workspaces_root.glob(pattern):
-                if filepath.is_file() and not str(filepath).startswith("."):
-                    rel_path = filepath.relative_to(self.workspaces_root)
-                    # Skip excluded paths
-                    if any(
-                        part.startswith(".")
-                        for part in rel_path.parts
-                        if part != "." and not part.startswith(".planalign")
-                    ):
-                        continue
-                    try:
-                        repo.index.add([str(rel_path)])
-                        count += 1
-                    except Exception as e:
-                        logger.warning(f"Failed to stage {rel_path}: {e}")
-
-        # Also add sync config and gitignore
-        for special_file in [".gitignore", SYNC_CONFIG_FILE]:
-            special_path = self.workspaces_root / special_file
-            if special_path.exists():
-                try:
-                    repo.index.add([special_file])
-                except Exception:
-                    pass
-
-        return count
+        changes = self._local_changes(repo)
+        if changes.modified:
+            repo.index.add(changes.modified)
+        if changes.deleted:
+            repo.index.remove(changes.deleted, working_tree=False)
+        return changes.total
 
     def _count_content(self) -> Tuple[int, int]:
         """Count workspaces and scenarios.
@@ -397,8 +404,7 @@ class SyncService:
         config = self.get_sync_config()
 
         try:
-            # Count local changes (untracked + modified)
-            local_changes = len(repo.untracked_files) + len(repo.index.diff(None))
+            local_changes = self._local_changes(repo).total
 
             # Get ahead/behind counts
             ahead = 0
@@ -464,7 +470,9 @@ class SyncService:
             files_staged = self._stage_syncable_files(repo)
 
             # Check if there are changes to commit
-            if not repo.is_dirty(untracked_files=True):
+            if not (
+                repo.index.diff("HEAD") if repo.head.is_valid() else repo.index.entries
+            ):
                 return SyncPushResult(
                     success=True,
                     files_pushed=0,
@@ -596,6 +604,9 @@ class SyncService:
                                 conflicting_files=conflicts,
                             )
 
+            # Pulled metadata was written behind the catalog's back.
+            catalog_for(self.workspaces_root).reconcile()
+
             workspaces, scenarios = self._count_content()
             self._log_operation(
                 "pull",
@@ -692,6 +703,11 @@ class SyncService:
     def get_workspace_sync_info(self) -> List[WorkspaceSyncInfo]:
         """Get sync information for all workspaces."""
         infos = []
+        repo = self.repo
+        changed_paths = []
+        if repo:
+            changes = self._local_changes(repo)
+            changed_paths = changes.modified + changes.deleted
 
         for workspace_dir in sorted(self.workspaces_root.iterdir()):
             if not workspace_dir.is_dir() or workspace_dir.name.startswith("."):
@@ -716,20 +732,8 @@ class SyncService:
                     )
 
                 # Check for local changes
-                has_changes = False
-                repo = self.repo
-                if repo:
-                    rel_path = workspace_dir.relative_to(self.workspaces_root)
-                    # Check if any files in this workspace are modified
-                    for item in repo.untracked_files:
-                        if item.startswith(str(rel_path)):
-                            has_changes = True
-                            break
-                    if not has_changes:
-                        for diff in repo.index.diff(None):
-                            if diff.a_path and diff.a_path.startswith(str(rel_path)):
-                                has_changes = True
-                                break
+                prefix = f"{workspace_dir.name}/"
+                has_changes = any(path.startswith(prefix) for path in changed_paths)
 
                 infos.append(
                     WorkspaceSyncInfo(
@@ -1,15 +1,25 @@
 """Read-only queries for an employee's event-sourced storyline."""
 
 from contextlib import contextmanager
+from pathlib import Path
 from typing import Iterator
 
 import duckdb
 
+from planalign_orchestrator.payroll_ledger import (
+    LEDGER_COLUMNS,
+    PayrollLedger,
+    ledger_directory,
+)
+from planalign_orchestrator.resources.duckdb_profile import read_connection_config
+
 from ..models.timeline import (
     EmployeeIdentity,
     EmployeeSearchResponse,
     EmployeeSearchResult,
     EmployeeTimelineResponse,
+    PayPeriodEarnings,
+    PayrollLedgerResponse,
     TimelineEvent,
     TimelineYear,
     YearState,
@@ -36,16 +46,23 @@ class TimelineService:
         self.storage = storage
         self.db_resolver = db_resolver or create_api_database_path_resolver(storage)
 
-    @contextmanager
-    def _connect(
-        self, workspace_id: str, scenario_id: str
-    ) -> Iterator[duckdb.DuckDBPyConnection]:
+    def _database_path(self, workspace_id: str, scenario_id: str) -> Path:
         resolved = self.db_resolver.resolve(workspace_id, scenario_id)
         if not resolved.exists or resolved.path is None:
             raise TimelineDatabaseNotFoundError(
                 f"Scenario {scenario_id} has no results database"
             )
-        connection = duckdb.connect(str(resolved.path), read_only=True)
+        return Path(resolved.path)
+
+    @contextmanager
+    def _connect(
+        self, workspace_id: str, scenario_id: str
+    ) -> Iterator[duckdb.DuckDBPyConnection]:
+        connection = duckdb.connect(
+            str(self._database_path(workspace_id, scenario_id)),
+            read_only=True,
+            config=read_connection_config(),
+        )
         try:
             yield connection
         finally:
@@ -193,6 +210,42 @@ class TimelineService:
             page_size=result_limit,
         )
 
+    def get_payroll_ledger(
+        self,
+        workspace_id: str,
+        scenario_id: str,
+        years: list[int] | None = None,
+        employee_ids: list[str] | None = None,
+        page: int = 1,
+        page_size: int = 500,
+    ) -> PayrollLedgerResponse:
+        """Page through pay-period earnings, building the ledger on demand.
+
+        Whole years are cached as Parquet beside the run database on first
+        request; requests scoped to employees only compute their rows.
+        Raises ``PayrollLedgerError`` for a year the run did not simulate.
+        """
+        database = self._database_path(workspace_id, scenario_id)
+        employees = [item.strip() for item in employee_ids or [] if item.strip()]
+        with self._connect(workspace_id, scenario_id) as connection:
+            ledger = PayrollLedger(connection, ledger_directory(database))
+            available_years = ledger.simulated_years()
+            relation = ledger.query(years, employees or None)
+            total_row = relation.aggregate("count(*)").fetchone()
+            rows = relation.limit(page_size, offset=(page - 1) * page_size).fetchall()
+        return PayrollLedgerResponse(
+            workspace_id=workspace_id,
+            scenario_id=scenario_id,
+            years=sorted(set(years)) if years else available_years,
+            available_years=available_years,
+            results=[
+                PayPeriodEarnings(**dict(zip(LEDGER_COLUMNS, row))) for row in rows
+            ],
+            total=total_row[0] if total_row else 0,
+            page=page,
+            page_size=page_size,
+        )
+
     @staticmethod
     def _canonical_employee_id(
         connection: duckdb.DuckDBPyConnection, employee_id: str
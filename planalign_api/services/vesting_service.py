@@ -6,6 +6,8 @@ import logging
 from decimal import Decimal
 from typing import List, Optional
 
+from planalign_orchestrator.resources.duckdb_profile import read_connection_config
+
 from ..models.vesting import (
     EmployeeVestingDetail,
     ForfeitureProjectionResponse,
@@ -29,6 +31,7 @@ from .database_path_resolver import (
     create_api_database_path_resolver,
 )
 from .employer_cost_service import build_employer_cost_offsets
+from .scenario_federation import ScenarioFederation
 
 logger = logging.getLogger(__name__)
 
@@ -375,7 +378,9 @@ class VestingService:
             logger.error(f"Database not found for scenario {scenario_id}")
             return None
 
-        conn = duckdb.connect(str(resolved.path), read_only=True)
+        conn = duckdb.connect(
+            str(resolved.path), read_only=True, config=read_connection_config()
+        )
         try:
             rows = conn.execute(
                 "SELECT DISTINCT simulation_year FROM fct_workforce_snapshot ORDER BY simulation_year ASC"
@@ -692,45 +697,43 @@ class VestingService:
         rather than failing the whole request. Each series also carries the
         per-year employer cost offsets implied by ``policy`` (#444), so the
         Cost Comparison page never has to re-implement the policy semantics.
+        All scenarios are read through one federated session.
         """
-        import duckdb
-
         series: List[ScenarioForfeitureSeries] = []
         skipped: List[SkippedScenario] = []
 
-        for scenario_id, scenario_name in scenarios:
-            resolved = self.db_resolver.resolve(workspace_id, scenario_id)
-            if not resolved.exists:
-                logger.warning(
-                    f"Skipping {scenario_id}: database not found at {resolved.path}"
-                )
-                skipped.append(
-                    SkippedScenario(
-                        scenario_id=scenario_id,
-                        scenario_name=scenario_name,
-                        reason="Simulation database not found for this scenario",
+        with ScenarioFederation.for_scenarios(
+            self.db_resolver,
+            workspace_id,
+            [scenario_id for scenario_id, _ in scenarios],
+        ) as federation:
+            for scenario_id, scenario_name in scenarios:
+                if scenario_id not in federation.scenario_ids:
+                    logger.warning(f"Skipping {scenario_id}: database not found")
+                    skipped.append(
+                        SkippedScenario(
+                            scenario_id=scenario_id,
+                            scenario_name=scenario_name,
+                            reason="Simulation database not found for this scenario",
+                        )
                     )
-                )
-                continue
+                    continue
 
-            conn = duckdb.connect(str(resolved.path), read_only=True)
-            try:
-                built = self._build_scenario_series(
-                    scenario_id, scenario_name, conn, schedule, policy
-                )
-            finally:
-                conn.close()
-
-            if built is None:
-                skipped.append(
-                    SkippedScenario(
-                        scenario_id=scenario_id,
-                        scenario_name=scenario_name,
-                        reason="Scenario database contains no simulation years",
+                with federation.use(scenario_id) as conn:
+                    built = self._build_scenario_series(
+                        scenario_id, scenario_name, conn, schedule, policy
                     )
-                )
-                continue
-            series.append(built)
+
+                if built is None:
+                    skipped.append(
+                        SkippedScenario(
+                            scenario_id=scenario_id,
+                            scenario_name=scenario_name,
+                            reason="Scenario database contains no simulation years",
+                        )
+                    )
+                    continue
+                series.append(built)
 
         all_years = sorted(
             {row.simulation_year for item in series for row in item.years}
@@ -758,7 +761,9 @@ class VestingService:
             logger.error(f"Database not found for scenario {scenario_id}")
             return None
 
-        conn = duckdb.connect(str(resolved.path), read_only=True)
+        conn = duckdb.connect(
+            str(resolved.path), read_only=True, config=read_connection_config()
+        )
         try:
             # Get final year if not specified
             year = request.simulation_year or self._get_final_year(conn)
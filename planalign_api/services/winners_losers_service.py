@@ -1,11 +1,11 @@
 """Winners & Losers comparison service."""
 
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-import duckdb
 import pandas as pd
 
+from planalign_core.constants import TABLE_FCT_WORKFORCE_SNAPSHOT
 from ..models.winners_losers import (
     BandGroupResult,
     HeatmapCell,
@@ -16,6 +16,7 @@ from .database_path_resolver import (
     DatabasePathResolver,
     create_api_database_path_resolver,
 )
+from .scenario_federation import ScenarioFederation
 
 logger = logging.getLogger(__name__)
 
@@ -44,8 +45,11 @@ class WinnersLosersService:
         winner, loser, or neutral based on total employer contributions.
         """
         try:
-            df_a, year_a = self._query_scenario_contributions(workspace_id, plan_a)
-            df_b, year_b = self._query_scenario_contributions(workspace_id, plan_b)
+            contributions = self._query_scenario_contributions(
+                workspace_id, [plan_a, plan_b]
+            )
+            df_a, year_a = contributions.get(plan_a, (None, 0))
+            df_b, year_b = contributions.get(plan_b, (None, 0))
 
             if df_a is None or df_b is None:
                 return None
@@ -81,45 +85,79 @@ class WinnersLosersService:
     # Private helpers
     # ------------------------------------------------------------------
 
+    _CONTRIBUTION_COLUMNS = (
+        "employee_id",
+        "age_band",
+        "tenure_band",
+        "employer_match_amount",
+        "employer_core_amount",
+        "simulation_year",
+        "employment_status",
+    )
+
     def _query_scenario_contributions(
-        self, workspace_id: str, scenario_id: str
-    ) -> tuple:
+        self, workspace_id: str, scenario_ids: List[str]
+    ) -> Dict[str, tuple]:
         """Query employer contributions for active employees at final year.
 
-        Returns (DataFrame, final_year) or (None, 0) on failure.
+        Both scenarios are read in one query over a federated snapshot, each at
+        its own final year. Returns ``{scenario_id: (DataFrame, final_year)}``;
+        scenarios that cannot be read are left out.
         """
-        resolved = self.db_resolver.resolve(workspace_id, scenario_id)
-        if not resolved.exists:
-            logger.error(f"Database not found for scenario {scenario_id}")
-            return None, 0
-
-        conn = duckdb.connect(str(resolved.path), read_only=True)
-        try:
-            df = conn.execute(
-                """
+        with ScenarioFederation.for_scenarios(
+            self.db_resolver, workspace_id, scenario_ids
+        ) as federation:
+            for scenario_id in federation.missing:
+                logger.error(f"Database not found for scenario {scenario_id}")
+            readable = [
+                scenario_id
+                for scenario_id in federation.scenario_ids
+                if set(self._CONTRIBUTION_COLUMNS).issubset(
+                    federation.columns(scenario_id, TABLE_FCT_WORKFORCE_SNAPSHOT)
+                )
+            ]
+            for scenario_id in set(federation.scenario_ids) - set(readable):
+                logger.error(
+                    f"Snapshot for scenario {scenario_id} lacks contribution columns"
+                )
+            federation.union(TABLE_FCT_WORKFORCE_SNAPSHOT, self._CONTRIBUTION_COLUMNS)
+            df = federation.connection.execute(
+                f"""
                 SELECT
+                    scenario_id,
                     employee_id,
                     age_band,
                     tenure_band,
                     COALESCE(employer_match_amount, 0)
                         + COALESCE(employer_core_amount, 0) AS employer_total,
                     simulation_year
-                FROM fct_workforce_snapshot
-                WHERE simulation_year = (
-                    SELECT MAX(simulation_year) FROM fct_workforce_snapshot
+                FROM (
+                    SELECT *, MAX(simulation_year) OVER (
+                        PARTITION BY scenario_id
+                    ) AS final_year
+                    FROM {TABLE_FCT_WORKFORCE_SNAPSHOT}
+                    WHERE scenario_id IN (SELECT unnest(?::VARCHAR[]))
                 )
+                WHERE simulation_year = final_year
                 AND LOWER(employment_status) = 'active'
-                """
+                """,
+                [readable],
             ).fetchdf()
 
-            if df.empty:
+        contributions = {}
+        for scenario_id in readable:
+            rows = df[df["scenario_id"] == scenario_id]
+            if rows.empty:
                 logger.warning(f"No active employees found for scenario {scenario_id}")
-                return None, 0
-
-            final_year = int(df["simulation_year"].iloc[0])
-            return df.drop(columns=["simulation_year"]), final_year
-        finally:
-            conn.close()
+                continue
+            final_year = int(rows["simulation_year"].iloc[0])
+            contributions[scenario_id] = (
+                rows.drop(columns=["scenario_id", "simulation_year"]).reset_index(
+                    drop=True
+                ),
+                final_year,
+            )
+        return contributions
 
     @staticmethod
     def _classify_employees(df_a: pd.DataFrame, df_b: pd.DataFrame) -> tuple:
@@ -0,0 +1,302 @@
+"""Deduplicated, incremental ``tar.zst`` workspace archives.
+
+The original export format is an LZMA ``.7z`` built single-threaded by py7zr,
+and it stores every file it walks -- including one copy per run of files that
+are byte-identical across runs. This format fixes both costs:
+
+- The tar stream is compressed with multithreaded zstd.
+- Files are stored once per content hash under ``blobs/<sha256>``; the
+  manifest maps every relative path to its hash, size and mtime.
+- An export can be incremental to an earlier one. Files whose size and mtime
+  match the base manifest reuse its hash without being re-read, and only hashes
+  the base does not already hold are written. Import resolves the rest from the
+  base archive(s).
+
+Manifests of past exports are kept under ``<workspace>/.exports/`` so a later
+export can name one as its base. That directory is never exported.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import shutil
+import tarfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Mapping, Optional, Sequence, Set
+
+import zstandard
+
+from ..models.export import ExportedFile, ExportManifest
+
+logger = logging.getLogger(__name__)
+
+EXPORTS_DIRNAME = ".exports"
+MANIFEST_MEMBER = "manifest.json"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+ZSTD_LEVEL = 3
+
+# hashlib releases the GIL on large updates, so threads hash in parallel.
+HASH_WORKERS = min(8, os.cpu_count() or 1)
+_CHUNK_BYTES = 1024 * 1024
+_BLOB_RE = re.compile(r"^blobs/([0-9a-f]{64})$")
+
+
+def is_zstd_archive(archive_path: Path) -> bool:
+    """Whether ``archive_path`` starts with a zstd frame."""
+    with open(archive_path, "rb") as f:
+        return f.read(len(ZSTD_MAGIC)) == ZSTD_MAGIC
+
+
+def workspace_files(
+    workspace_path: Path, *, current_results_only: bool = False
+) -> List[str]:
+    """Relative POSIX paths of the workspace files an export includes.
+
+    With ``current_results_only``, run directories other than each scenario's
+    current-result run are left out. A scenario whose pointer cannot be read
+    keeps all of its runs rather than silently losing results.
+    """
+    skipped = {workspace_path / EXPORTS_DIRNAME}
+    if current_results_only:
+        skipped.update(_superseded_runs(workspace_path))
+
+    files: List[str] = []
+    for directory, dirnames, filenames in os.walk(workspace_path):
+        current = Path(directory)
+        dirnames[:] = sorted(d for d in dirnames if current / d not in skipped)
+        for name in sorted(filenames):
+            path = current / name
+            if path.is_file():
+                files.append(path.relative_to(workspace_path).as_posix())
+    return files
+
+
+def _superseded_runs(workspace_path: Path) -> List[Path]:
+    from .current_result import CurrentResultIntegrityError, read_current_result
+
+    superseded: List[Path] = []
+    scenarios_dir = workspace_path / "scenarios"
+    if not scenarios_dir.is_dir():
+        return superseded
+    for scenario_dir in scenarios_dir.iterdir():
+        runs_dir = scenario_dir / "runs"
+        if not runs_dir.is_dir():
+            continue
+        try:
+            pointer = read_current_result(scenario_dir, verify_database=False)
+        except (CurrentResultIntegrityError, ValueError) as e:
+            logger.warning(f"Exporting every run of {scenario_dir.name}: {e}")
+            continue
+        keep = str(pointer.run_id) if pointer else None
+        superseded.extend(
+            run_dir
+            for run_dir in runs_dir.iterdir()
+            if run_dir.is_dir() and run_dir.name != keep
+        )
+    return superseded
+
+
+def fingerprint_files(
+    workspace_path: Path,
+    paths: Sequence[str],
+    previous: Optional[Mapping[str, ExportedFile]] = None,
+) -> Dict[str, ExportedFile]:
+    """Hash ``paths``, reusing ``previous`` entries whose size and mtime match."""
+    previous = previous or {}
+    entries: Dict[str, ExportedFile] = {}
+    pending: List[tuple] = []
+    for relative in paths:
+        stat = (workspace_path / relative).stat()
+        known = previous.get(relative)
+        if (
+            known is not None
+            and known.size_bytes == stat.st_size
+            and known.mtime_ns == stat.st_mtime_ns
+        ):
+            entries[relative] = known
+        else:
+            pending.append((relative, stat.st_size, stat.st_mtime_ns))
+
+    with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+        digests = pool.map(lambda item: _sha256(workspace_path / item[0]), pending)
+        for (relative, size, mtime_ns), digest in zip(pending, digests):
+            entries[relative] = ExportedFile(
+                sha256=digest, size_bytes=size, mtime_ns=mtime_ns
+            )
+    return {relative: entries[relative] for relative in paths}
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def new_blobs(
+    files: Mapping[str, ExportedFile], base: Optional[ExportManifest] = None
+) -> List[str]:
+    """Content hashes to store: each distinct hash the base does not hold."""
+    held = {entry.sha256 for entry in base.files.values()} if base else set()
+    blobs: List[str] = []
+    seen: Set[str] = set()
+    for entry in files.values():
+        if entry.sha256 not in held and entry.sha256 not in seen:
+            seen.add(entry.sha256)
+            blobs.append(entry.sha256)
+    return blobs
+
+
+def write_archive(
+    workspace_path: Path, manifest: ExportManifest, output_path: Path
+) -> int:
+    """Write ``manifest`` and its blobs as a multithreaded zstd tar stream.
+
+    Returns:
+        Size of the created archive in bytes
+    """
+    sources = {}
+    for relative, entry in manifest.files.items():
+        sources.setdefault(entry.sha256, workspace_path / relative)
+    payload = manifest.model_dump_json(indent=2).encode("utf-8")
+
+    compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+    with open(output_path, "wb") as f:
+        with compressor.stream_writer(f, closefd=False) as stream:
+            with tarfile.open(fileobj=stream, mode="w|") as tar:
+                info = tarfile.TarInfo(MANIFEST_MEMBER)
+                info.size = len(payload)
+                tar.addfile(info, io.BytesIO(payload))
+                for sha256 in manifest.blobs:
+                    tar.add(sources[sha256], arcname=f"blobs/{sha256}", recursive=False)
+    return output_path.stat().st_size
+
+
+def read_manifest(archive_path: Path) -> dict:
+    """Read the manifest, which is always the first member of the stream.
+
+    Raises:
+        ValueError: If the first member is not the manifest
+    """
+    with open(archive_path, "rb") as f:
+        reader = zstandard.ZstdDecompressor().stream_reader(f)
+        with tarfile.open(fileobj=reader, mode="r|") as tar:
+            member = tar.next()
+            if member is None or member.name != MANIFEST_MEMBER:
+                raise ValueError("Archive does not contain manifest.json")
+            handle = tar.extractfile(member)
+            assert handle is not None
+            return json.load(handle)
+
+
+def extract_archive(
+    archive_path: Path,
+    output_path: Path,
+    base_archives: Sequence[Path] = (),
+) -> ExportManifest:
+    """Rebuild the workspace tree described by an archive's manifest.
+
+    Blobs this archive does not hold are taken from ``base_archives``; each
+    blob's hash is verified as it is written.
+
+    Raises:
+        ValueError: If a path escapes the output directory, a blob is corrupt,
+            or an incremental archive's base blobs were not supplied
+    """
+    manifest = ExportManifest(**read_manifest(archive_path))
+    output_path.mkdir(parents=True, exist_ok=True)
+    blob_dir = output_path / ".blobs"
+    blob_dir.mkdir()
+    try:
+        needed = {entry.sha256 for entry in manifest.files.values()}
+        have: Set[str] = set()
+        for source in (archive_path, *base_archives):
+            if needed <= have:
+                break
+            _extract_blobs(source, blob_dir, needed, have)
+        missing = needed - have
+        if missing:
+            raise ValueError(
+                f"Archive needs {len(missing)} file(s) from base export "
+                f"{manifest.base_export_id}; provide its archive to import"
+            )
+
+        for relative, entry in manifest.files.items():
+            target = _safe_target(output_path, relative)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(blob_dir / entry.sha256, target)
+            os.utime(target, ns=(entry.mtime_ns, entry.mtime_ns))
+    finally:
+        shutil.rmtree(blob_dir, ignore_errors=True)
+
+    (output_path / MANIFEST_MEMBER).write_text(
+        manifest.model_dump_json(indent=2), encoding="utf-8"
+    )
+    return manifest
+
+
+def _extract_blobs(
+    archive_path: Path, blob_dir: Path, needed: Set[str], have: Set[str]
+) -> None:
+    with open(archive_path, "rb") as f:
+        reader = zstandard.ZstdDecompressor().stream_reader(f)
+        with tarfile.open(fileobj=reader, mode="r|") as tar:
+            for member in tar:
+                match = _BLOB_RE.match(member.name)
+                if not match or not member.isfile():
+                    continue
+                sha256 = match.group(1)
+                if sha256 not in needed or sha256 in have:
+                    continue
+                handle = tar.extractfile(member)
+                assert handle is not None
+                digest = hashlib.sha256()
+                with open(blob_dir / sha256, "wb") as out:
+                    while chunk := handle.read(_CHUNK_BYTES):
+                        digest.update(chunk)
+                        out.write(chunk)
+                if digest.hexdigest() != sha256:
+                    raise ValueError(f"Archive blob {sha256[:12]} is corrupt")
+                have.add(sha256)
+
+
+def _safe_target(output_path: Path, relative: str) -> Path:
+    parts = PurePosixPath(relative).parts
+    if not parts or PurePosixPath(relative).is_absolute() or ".." in parts:
+        raise ValueError(f"Archive path escapes the workspace: {relative!r}")
+    return output_path.joinpath(*parts)
+
+
+# ==================== Export History ====================
+
+
+def save_export_manifest(workspace_path: Path, manifest: ExportManifest) -> Path:
+    """Keep ``manifest`` so a later export can be incremental to it."""
+    assert manifest.export_id is not None
+    exports_dir = workspace_path / EXPORTS_DIRNAME
+    exports_dir.mkdir(exist_ok=True)
+    path = exports_dir / f"{manifest.export_id}.json"
+    path.write_text(manifest.model_dump_json(indent=2), encoding="utf-8")
+    return path
+
+
+def load_export_manifest(workspace_path: Path, export_id: str) -> ExportManifest:
+    """Load the manifest of an earlier export of this workspace.
+
+    Raises:
+        ValueError: If ``export_id`` is malformed or was not exported here
+    """
+    try:
+        canonical = str(uuid.UUID(export_id))
+    except ValueError:
+        raise ValueError(f"Invalid export ID: {export_id}")
+    path = workspace_path / EXPORTS_DIRNAME / f"{canonical}.json"
+    if not path.is_file():
+        raise ValueError(f"Base export not found: {export_id}")
+    return ExportManifest.model_validate_json(path.read_text(encoding="utf-8"))
@@ -0,0 +1,451 @@
+"""Persistent catalog of workspaces and scenarios under a workspaces root.
+
+``list_workspaces`` used to open every ``workspace.json`` and every
+``scenario.json`` on each navigation request, and the response-header
+middleware resolved a scenario's owning workspace by probing the filesystem of
+every workspace. Both grow with the number of workspaces rather than with the
+size of the answer.
+
+The catalog is a SQLite file (``.catalog.sqlite``) at the workspaces root that
+indexes workspaces, scenarios, last-run times, current-result pointers and the
+last measured storage total. ``WorkspaceStorage`` updates it in one transaction
+after each mutation it makes, and the catalog is reconciled against file
+signatures (mtime and size) the first time a process opens it, so edits made
+while the API was down -- imports, sync pulls, hand edits -- are picked up. Only
+files whose signature changed are re-read.
+
+Changes made behind the API's back while it runs are caught in two ways: a
+change to the root directory's mtime (a workspace added or removed) triggers a
+reconcile on the next read, and a scenario-lookup miss falls back to a probe.
+Anything else that rewrites metadata out of band should call ``reconcile``.
+
+The catalog is derived state. A corrupt or outdated file is discarded and
+rebuilt from the workspace tree.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..services.storage_usage import iter_workspace_dirs
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILENAME = ".catalog.sqlite"
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS workspaces (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT,
+    created_at TEXT NOT NULL,
+    storage_bytes INTEGER,
+    signature TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scenarios (
+    workspace_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    status TEXT,
+    last_run_at TEXT,
+    last_run_ts REAL,
+    last_run_id TEXT,
+    current_run_id TEXT,
+    signature TEXT NOT NULL,
+    pointer_signature TEXT,
+    PRIMARY KEY (workspace_id, id)
+);
+CREATE INDEX IF NOT EXISTS scenarios_by_id ON scenarios (id);
+"""
+
+_catalogs: Dict[Path, "CatalogIndex"] = {}
+_catalogs_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class WorkspaceEntry:
+    """One workspace as indexed by the catalog."""
+
+    id: str
+    name: str
+    description: Optional[str]
+    created_at: str
+    scenario_count: int
+    last_run_at: Optional[str]
+    storage_bytes: Optional[int]
+
+
+def catalog_for(workspaces_root: Path) -> "CatalogIndex":
+    """Return this process's catalog for ``workspaces_root``.
+
+    The first call per root reconciles the catalog against the workspace tree;
+    later calls return the same instance.
+    """
+    root = Path(workspaces_root).resolve()
+    with _catalogs_lock:
+        catalog = _catalogs.get(root)
+        if catalog is None:
+            catalog = CatalogIndex(root)
+            catalog.reconcile()
+            _catalogs[root] = catalog
+    return catalog
+
+
+def _signature(path: Path) -> Optional[str]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _timestamp(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+
+
+def _load_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Catalog skipping unreadable {path}: {e}")
+        return None
+    return data if isinstance(data, dict) else None
+
+
+class CatalogIndex:
+    """SQLite index over one workspaces root."""
+
+    def __init__(self, workspaces_root: Path):
+        self.workspaces_root = Path(workspaces_root)
+        self.path = self.workspaces_root / CATALOG_FILENAME
+        self._lock = threading.Lock()
+        self._root_signature: Optional[str] = None
+        self._initialize()
+
+    # ==================== Connection ====================
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), timeout=30.0)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _initialize(self) -> None:
+        """Create the schema, discarding a corrupt or outdated catalog file."""
+        try:
+            self._create_schema()
+        except sqlite3.DatabaseError as e:
+            logger.warning(f"Rebuilding unreadable workspace catalog {self.path}: {e}")
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{self.path}{suffix}").unlink(missing_ok=True)
+            self._create_schema()
+
+    def _create_schema(self) -> None:
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            row = None
+            if conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'catalog_meta'"
+            ).fetchone():
+                row = conn.execute(
+                    "SELECT value FROM catalog_meta WHERE key = 'schema_version'"
+                ).fetchone()
+            with conn:
+                if row is not None and row[0] != str(SCHEMA_VERSION):
+                    for table in ("catalog_meta", "workspaces", "scenarios"):
+                        conn.execute(f"DROP TABLE IF EXISTS {table}")
+                conn.executescript(_SCHEMA)
+                conn.execute(
+                    "INSERT OR REPLACE INTO catalog_meta VALUES ('schema_version', ?)",
+                    (str(SCHEMA_VERSION),),
+                )
+        finally:
+            conn.close()
+
+    def _transaction(self) -> "_Transaction":
+        return _Transaction(self._connect())
+
+    # ==================== Reconciliation ====================
+
+    def reconcile(self) -> None:
+        """Bring the catalog in line with the workspace tree.
+
+        Every ``workspace.json``, ``scenario.json`` and ``current_result.json``
+        is stat'ed; only files whose signature differs from the catalog's are
+        parsed.
+        """
+        with self._lock:
+            root_signature = _signature(self.workspaces_root)
+            with self._transaction() as conn:
+                known_workspaces = dict(
+                    conn.execute("SELECT id, signature FROM workspaces").fetchall()
+                )
+                known_scenarios = {
+                    (row[0], row[1]): (row[2], row[3])
+                    for row in conn.execute(
+                        "SELECT workspace_id, id, signature, pointer_signature "
+                        "FROM scenarios"
+                    ).fetchall()
+                }
+                seen_workspaces = set()
+                seen_scenarios = set()
+                for workspace_dir in iter_workspace_dirs(self.workspaces_root):
+                    workspace_id = workspace_dir.name
+                    workspace_json = workspace_dir / "workspace.json"
+                    signature = _signature(workspace_json)
+                    if signature is None:
+                        continue
+                    if known_workspaces.get(workspace_id) != signature:
+                        if not self._write_workspace(conn, workspace_id):
+                            continue
+                    seen_workspaces.add(workspace_id)
+
+                    for scenario_id in self._scenario_ids(workspace_dir):
+                        key = (workspace_id, scenario_id)
+                        if known_scenarios.get(key) != self._scenario_signatures(
+                            workspace_id, scenario_id
+                        ):
+                            if not self._write_scenario(conn, *key):
+                                continue
+                        seen_scenarios.add(key)
+
+                for workspace_id in set(known_workspaces) - seen_workspaces:
+                    self._delete_workspace(conn, workspace_id)
+                for workspace_id, scenario_id in set(known_scenarios) - seen_scenarios:
+                    conn.execute(
+                        "DELETE FROM scenarios WHERE workspace_id = ? AND id = ?",
+                        (workspace_id, scenario_id),
+                    )
+            self._root_signature = root_signature
+
+    def ensure_fresh(self) -> None:
+        """Reconcile if a workspace directory was added or removed out of band."""
+        if _signature(self.workspaces_root) != self._root_signature:
+            self.reconcile()
+
+    def invalidate(self) -> None:
+        """Force a reconcile on the next read."""
+        self._root_signature = None
+
+    def _scenario_ids(self, workspace_dir: Path) -> Iterator[str]:
+        scenarios_dir = workspace_dir / "scenarios"
+        if not scenarios_dir.is_dir():
+            return
+        for scenario_dir in scenarios_dir.iterdir():
+            if scenario_dir.is_dir() and (scenario_dir / "scenario.json").exists():
+                yield scenario_dir.name
+
+    def _scenario_dir(self, workspace_id: str, scenario_id: str) -> Path:
+        return self.workspaces_root / workspace_id / "scenarios" / scenario_id
+
+    def _scenario_signatures(
+        self, workspace_id: str, scenario_id: str
+    ) -> Tuple[Optional[str], Optional[str]]:
+        scenario_dir = self._scenario_dir(workspace_id, scenario_id)
+        return (
+            _signature(scenario_dir / "scenario.json"),
+            _signature(scenario_dir / "current_result.json"),
+        )
+
+    # ==================== Writes ====================
+
+    def _write_workspace(self, conn: sqlite3.Connection, workspace_id: str) -> bool:
+        workspace_json = self.workspaces_root / workspace_id / "workspace.json"
+        signature = _signature(workspace_json)
+        data = _load_json(workspace_json) if signature else None
+        if data is None or "name" not in data or "created_at" not in data:
+            self._delete_workspace(conn, workspace_id)
+            return False
+        conn.execute(
+            """
+            INSERT INTO workspaces (id, name, description, created_at, signature)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (id) DO UPDATE SET
+                name = excluded.name,
+                description = excluded.description,
+                created_at = excluded.created_at,
+                signature = excluded.signature
+            """,
+            (
+                workspace_id,
+                data["name"],
+                data.get("description"),
+                data["created_at"],
+                signature,
+            ),
+        )
+        return True
+
+    def _write_scenario(
+        self, conn: sqlite3.Connection, workspace_id: str, scenario_id: str
+    ) -> bool:
+        scenario_dir = self._scenario_dir(workspace_id, scenario_id)
+        signature, pointer_signature = self._scenario_signatures(
+            workspace_id, scenario_id
+        )
+        data = _load_json(scenario_dir / "scenario.json") if signature else None
+        if data is None:
+            conn.execute(
+                "DELETE FROM scenarios WHERE workspace_id = ? AND id = ?",
+                (workspace_id, scenario_id),
+            )
+            return False
+        pointer = (
+            _load_json(scenario_dir / "current_result.json")
+            if pointer_signature
+            else None
+        )
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO scenarios (
+                workspace_id, id, status, last_run_at, last_run_ts, last_run_id,
+                current_run_id, signature, pointer_signature
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                workspace_id,
+                scenario_id,
+                data.get("status", "not_run"),
+                data.get("last_run_at"),
+                _timestamp(data.get("last_run_at")),
+                data.get("last_run_id"),
+                pointer.get("run_id") if pointer else None,
+                signature,
+                pointer_signature,
+            ),
+        )
+        return True
+
+    @staticmethod
+    def _delete_workspace(conn: sqlite3.Connection, workspace_id: str) -> None:
+        conn.execute("DELETE FROM scenarios WHERE workspace_id = ?", (workspace_id,))
+        conn.execute("DELETE FROM workspaces WHERE id = ?", (workspace_id,))
+
+    def refresh_workspace(self, workspace_id: str) -> None:
+        """Re-index one workspace's metadata after ``WorkspaceStorage`` wrote it."""
+        with self._transaction() as conn:
+            self._write_workspace(conn, workspace_id)
+        self._root_signature = _signature(self.workspaces_root)
+
+    def refresh_scenario(self, workspace_id: str, scenario_id: str) -> None:
+        """Re-index one scenario's metadata and current-result pointer."""
+        with self._transaction() as conn:
+            self._write_scenario(conn, workspace_id, scenario_id)
+
+    def remove_workspace(self, workspace_id: str) -> None:
+        with self._transaction() as conn:
+            self._delete_workspace(conn, workspace_id)
+        self._root_signature = _signature(self.workspaces_root)
+
+    def remove_scenario(self, workspace_id: str, scenario_id: str) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM scenarios WHERE workspace_id = ? AND id = ?",
+                (workspace_id, scenario_id),
+            )
+
+    def record_storage_bytes(
+        self, workspace_id: str, storage_bytes: Optional[int]
+    ) -> None:
+        """Persist the last measured size of a workspace (None = unknown)."""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE workspaces SET storage_bytes = ? WHERE id = ?",
+                (storage_bytes, workspace_id),
+            )
+
+    # ==================== Reads ====================
+
+    def workspaces(self) -> List[WorkspaceEntry]:
+        """All indexed workspaces, ordered by ID."""
+        self.ensure_fresh()
+        conn = self._connect()
+        try:
+            # SQLite returns the bare last_run_at column from the row that
+            # supplied MAX(last_run_ts).
+            rows = conn.execute(
+                """
+                SELECT w.id, w.name, w.description, w.created_at, w.storage_bytes,
+                       COUNT(s.id), s.last_run_at, MAX(s.last_run_ts)
+                FROM workspaces w
+                LEFT JOIN scenarios s ON s.workspace_id = w.id
+                GROUP BY w.id
+                ORDER BY w.id
+                """
+            ).fetchall()
+        finally:
+            conn.close()
+        return [
+            WorkspaceEntry(
+                id=row[0],
+                name=row[1],
+                description=row[2],
+                created_at=row[3],
+                storage_bytes=row[4],
+                scenario_count=row[5],
+                last_run_at=row[6] if row[7] is not None else None,
+            )
+            for row in rows
+        ]
+
+    def workspace_for_scenario(self, scenario_id: str) -> Optional[str]:
+        """The indexed owner of ``scenario_id`` (lowest workspace ID on a tie)."""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT workspace_id FROM scenarios WHERE id = ? "
+                "ORDER BY workspace_id LIMIT 1",
+                (scenario_id,),
+            ).fetchone()
+        finally:
+            conn.close()
+        return row[0] if row else None
+
+    def current_run_id(self, workspace_id: str, scenario_id: str) -> Optional[str]:
+        """Run ID the scenario's ``current_result.json`` pointed at when indexed."""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT current_run_id FROM scenarios "
+                "WHERE workspace_id = ? AND id = ?",
+                (workspace_id, scenario_id),
+            ).fetchone()
+        finally:
+            conn.close()
+        return row[0] if row else None
+
+
+class _Transaction:
+    """Commit on success, roll back on error, and always close the connection."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self.conn.commit()
+            else:
+                self.conn.rollback()
+        finally:
+            self.conn.close()
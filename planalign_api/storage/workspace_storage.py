@@ -3,10 +3,11 @@
 import json
 import logging
 import shutil
+import sqlite3
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 import yaml  # type: ignore[import]  # types-PyYAML not in CI deps
 
@@ -20,6 +21,8 @@ from ..models.workspace import (
 )
 from ..models.scenario import Scenario, ScenarioCreate
 from ..services.storage_usage import directory_bytes, iter_workspace_dirs
+from ..services.storage_usage import invalidate as invalidate_storage_usage
+from .catalog_index import CatalogIndex, catalog_for
 
 if TYPE_CHECKING:
     from ..services.current_result import ResolvedScenarioReadContext
@@ -59,16 +62,92 @@ class WorkspaceStorage:
         """Get path to scenario.json file."""
         return self._scenario_path(workspace_id, scenario_id) / "scenario.json"
 
+    def _catalog(self) -> Optional[CatalogIndex]:
+        """The root's catalog index, or None if it cannot be opened."""
+        try:
+            return catalog_for(self.workspaces_root)
+        except sqlite3.Error as e:
+            logger.warning(f"Workspace catalog unavailable, reading files: {e}")
+            return None
+
+    def _update_catalog(self, update: Callable[[CatalogIndex], None]) -> None:
+        """Apply one mutation to the catalog.
+
+        The catalog is derived from the files just written, so a failure here
+        only logs and forces a reconcile on the next read.
+        """
+        catalog = self._catalog()
+        if catalog is None:
+            return
+        try:
+            update(catalog)
+        except sqlite3.Error as e:
+            logger.warning(f"Workspace catalog update failed: {e}")
+            catalog.invalidate()
+
+    def _storage_changed(self, workspace_id: str) -> None:
+        """Forget a workspace's measured size after its runs changed."""
+        invalidate_storage_usage(self._workspace_path(workspace_id))
+        self._update_catalog(lambda c: c.record_storage_bytes(workspace_id, None))
+
     # ==================== Workspace Operations ====================
 
     def list_workspaces(self) -> List[WorkspaceSummary]:
-        """List all workspaces with summary info."""
+        """List all workspaces with summary info, from the catalog index."""
+        catalog = self._catalog()
+        if catalog is None:
+            return self._list_workspaces_from_files()
+        try:
+            entries = catalog.workspaces()
+        except sqlite3.Error as e:
+            logger.warning(f"Workspace catalog read failed, reading files: {e}")
+            return self._list_workspaces_from_files()
+
         summaries = []
+        for entry in entries:
+            # Storage size comes from the shared TTL cache and is never
+            # scanned here: listing workspaces is on the navigation path, and
+            # a workspace tree is large enough that walking it dominates the
+            # request. /api/system/status performs the scan; the catalog keeps
+            # the last measured size so it survives a restart.
+            storage_bytes = directory_bytes(
+                self._workspace_path(entry.id), allow_scan=False
+            )
+            if storage_bytes is None:
+                storage_bytes = entry.storage_bytes
+            elif storage_bytes != entry.storage_bytes:
+                measured = storage_bytes
+                self._update_catalog(
+                    lambda c, w=entry.id: c.record_storage_bytes(w, measured)
+                )
 
-        for workspace_dir in sorted(self.workspaces_root.iterdir()):
-            if not workspace_dir.is_dir() or workspace_dir.name.startswith("."):
-                continue
+            summaries.append(
+                WorkspaceSummary(
+                    id=entry.id,
+                    name=entry.name,
+                    description=entry.description,
+                    created_at=datetime.fromisoformat(entry.created_at),
+                    scenario_count=entry.scenario_count,
+                    last_run_at=(
+                        datetime.fromisoformat(entry.last_run_at)
+                        if entry.last_run_at
+                        else None
+                    ),
+                    storage_used_mb=(
+                        storage_bytes / (1024 * 1024)
+                        if storage_bytes is not None
+                        else None
+                    ),
+                )
+            )
+
+        return summaries
 
+    def _list_workspaces_from_files(self) -> List[WorkspaceSummary]:
+        """List workspaces by reading every metadata file (catalog fallback)."""
+        summaries = []
+
+        for workspace_dir in iter_workspace_dirs(self.workspaces_root):
             workspace_json = workspace_dir / "workspace.json"
             if not workspace_json.exists():
                 continue
@@ -76,35 +155,16 @@ class WorkspaceStorage:
             with open(workspace_json) as f:
                 data = json.load(f)
 
-            # Count scenarios
-            scenarios_dir = workspace_dir / "scenarios"
             scenario_count = 0
             last_run_at = None
+            for scenario in self.list_scenarios(workspace_dir.name):
+                scenario_count += 1
+                if scenario.last_run_at and (
+                    last_run_at is None or scenario.last_run_at > last_run_at
+                ):
+                    last_run_at = scenario.last_run_at
 
-            if scenarios_dir.exists():
-                for scenario_dir in scenarios_dir.iterdir():
-                    if scenario_dir.is_dir():
-                        scenario_count += 1
-                        scenario_json = scenario_dir / "scenario.json"
-                        if scenario_json.exists():
-                            with open(scenario_json) as f:
-                                scenario_data = json.load(f)
-                            if scenario_data.get("last_run_at"):
-                                run_at = datetime.fromisoformat(
-                                    scenario_data["last_run_at"]
-                                )
-                                if last_run_at is None or run_at > last_run_at:
-                                    last_run_at = run_at
-
-            # Storage size comes from the shared TTL cache and is never
-            # scanned here: listing workspaces is on the navigation path, and
-            # a workspace tree is large enough that walking it dominates the
-            # request. /api/system/status performs the scan.
             cached_bytes = directory_bytes(workspace_dir, allow_scan=False)
-            storage_mb = (
-                cached_bytes / (1024 * 1024) if cached_bytes is not None else None
-            )
-
             summaries.append(
                 WorkspaceSummary(
                     id=data["id"],
@@ -113,7 +173,11 @@ class WorkspaceStorage:
                     created_at=datetime.fromisoformat(data["created_at"]),
                     scenario_count=scenario_count,
                     last_run_at=last_run_at,
-                    storage_used_mb=storage_mb,
+                    storage_used_mb=(
+                        cached_bytes / (1024 * 1024)
+                        if cached_bytes is not None
+                        else None
+                    ),
                 )
             )
 
@@ -123,13 +187,29 @@ class WorkspaceStorage:
         """Find which workspace owns a scenario, by ID.
 
         Routes under /api/scenarios/{scenario_id} and the response-header
-        middleware both need this mapping. Deriving it from list_workspaces()
-        is orders of magnitude more expensive than it needs to be, because
-        that builds full summaries; this only probes for scenario.json.
+        middleware both need this mapping on every request, so it is a catalog
+        lookup plus one stat to confirm the hit. A miss falls back to probing
+        each workspace for scenario.json, and indexes what it finds.
         """
+        catalog = self._catalog()
+        if catalog is not None:
+            try:
+                workspace_id = catalog.workspace_for_scenario(scenario_id)
+            except sqlite3.Error as e:
+                logger.warning(f"Workspace catalog read failed, probing files: {e}")
+                workspace_id = None
+            if workspace_id is not None:
+                if self._scenario_json_path(workspace_id, scenario_id).exists():
+                    return workspace_id
+                self._update_catalog(
+                    lambda c: c.remove_scenario(workspace_id, scenario_id)
+                )
+
         for workspace_dir in iter_workspace_dirs(self.workspaces_root):
             if (workspace_dir / "scenarios" / scenario_id / "scenario.json").exists():
-                return workspace_dir.name
+                found = workspace_dir.name
+                self._update_catalog(lambda c: c.refresh_scenario(found, scenario_id))
+                return found
         return None
 
     def get_workspace(self, workspace_id: str) -> Optional[Workspace]:
@@ -190,6 +270,8 @@ class WorkspaceStorage:
         with open(self._base_config_path(workspace_id), "w") as f:
             yaml.dump(base_config, f, default_flow_style=False)
 
+        self._update_catalog(lambda c: c.refresh_workspace(workspace_id))
+
         return Workspace(
             id=workspace_id,
             name=create_data.name,
@@ -233,6 +315,7 @@ class WorkspaceStorage:
             with open(self._base_config_path(workspace_id), "w") as f:
                 yaml.dump(base_config, f, default_flow_style=False)
 
+        self._update_catalog(lambda c: c.refresh_workspace(workspace_id))
         return self.get_workspace(workspace_id)
 
     def delete_workspace(self, workspace_id: str) -> bool:
@@ -242,6 +325,8 @@ class WorkspaceStorage:
             return False
 
         shutil.rmtree(workspace_path)
+        invalidate_storage_usage(workspace_path)
+        self._update_catalog(lambda c: c.remove_workspace(workspace_id))
         return True
 
     # ==================== Scenario Operations ====================
@@ -347,6 +432,8 @@ class WorkspaceStorage:
         with open(scenario_path / "overrides.yaml", "w") as f:
             yaml.dump(create_data.config_overrides, f, default_flow_style=False)
 
+        self._update_catalog(lambda c: c.refresh_scenario(workspace_id, scenario_id))
+
         return Scenario(
             id=scenario_id,
             workspace_id=workspace_id,
@@ -388,6 +475,7 @@ class WorkspaceStorage:
         with open(scenario_json_path, "w") as f:
             json.dump(data, f, indent=2)
 
+        self._update_catalog(lambda c: c.refresh_scenario(workspace_id, scenario_id))
         return self.get_scenario(workspace_id, scenario_id)
 
     def update_scenario_status(
@@ -418,6 +506,7 @@ class WorkspaceStorage:
         with open(scenario_json_path, "w") as f:
             json.dump(data, f, indent=2)
 
+        self._update_catalog(lambda c: c.refresh_scenario(workspace_id, scenario_id))
         return self.get_scenario(workspace_id, scenario_id)
 
     def delete_scenario(self, workspace_id: str, scenario_id: str) -> bool:
@@ -427,6 +516,8 @@ class WorkspaceStorage:
             return False
 
         shutil.rmtree(scenario_path)
+        self._update_catalog(lambda c: c.remove_scenario(workspace_id, scenario_id))
+        self._storage_changed(workspace_id)
         return True
 
     def delete_scenario_database(self, workspace_id: str, scenario_id: str) -> bool:
@@ -459,6 +550,11 @@ class WorkspaceStorage:
                             db_file.unlink()
                             deleted = True
 
+        if deleted:
+            self._update_catalog(
+                lambda c: c.refresh_scenario(workspace_id, scenario_id)
+            )
+            self._storage_changed(workspace_id)
         return deleted
 
     def cleanup_old_runs(
@@ -545,6 +641,8 @@ class WorkspaceStorage:
             except Exception as e:
                 logger.warning(f"Failed to remove run {run_id}: {e}")
 
+        if result["removed_count"]:
+            self._storage_changed(workspace_id)
         return result
 
     def get_scenario_database_path(self, workspace_id: str, scenario_id: str) -> Path:
@@ -570,6 +668,8 @@ class WorkspaceStorage:
         pointer = publish_current_result(
             self._scenario_path(workspace_id, scenario_id), run_id
         )
+        self._update_catalog(lambda c: c.refresh_scenario(workspace_id, scenario_id))
+        self._storage_changed(workspace_id)
         assert pointer.database_path is not None
         return pointer.database_path
 
@@ -603,6 +703,8 @@ class WorkspaceStorage:
                 raise ValueError("run is the current successful result")
             (scenario_path / "current_result.json").unlink()
         shutil.rmtree(run_dir)
+        self._update_catalog(lambda c: c.refresh_scenario(workspace_id, scenario_id))
+        self._storage_changed(workspace_id)
         return True
 
     def get_merged_config(
@@ -904,6 +1006,8 @@ class WorkspaceStorage:
                     if repair_result:
                         report["repairs"].append(repair_result)
 
+        self._update_catalog(lambda c: c.reconcile())
+
         logger.info(
             f"Workspace repair complete: {report['workspaces_scanned']} workspaces, "
             f"{report['scenarios_scanned']} scenarios, {len(report['repairs'])} repairs"
@@ -1,17 +1,30 @@
 """Backtest fitted parameter packs against held-out census history."""
 
 from planalign_backtest.errors import BacktestError
-from planalign_backtest.models import BacktestOptions, MetricThresholds, Scorecard
+from planalign_backtest.models import (
+    BacktestOptions,
+    MetricThresholds,
+    RollingScorecard,
+    Scorecard,
+)
 from planalign_backtest.report import load_scorecard, write_scorecard
-from planalign_backtest.runner import BacktestRun, run_backtest
+from planalign_backtest.runner import (
+    BacktestRun,
+    RollingBacktestRun,
+    run_backtest,
+    run_rolling_backtest,
+)
 
 __all__ = [
     "BacktestError",
     "BacktestOptions",
     "BacktestRun",
     "MetricThresholds",
+    "RollingBacktestRun",
+    "RollingScorecard",
     "Scorecard",
     "load_scorecard",
     "run_backtest",
+    "run_rolling_backtest",
     "write_scorecard",
 ]
@@ -11,6 +11,7 @@ class SimulationFailure(BacktestError):
     def __init__(self, seed: int, year: int, detail: str) -> None:
         self.seed = seed
         self.year = year
+        self.detail = detail
         super().__init__(
             f"Backtest simulation failed for seed {seed}, year {year}. "
             f"No scorecard was written. {detail}"
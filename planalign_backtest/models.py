@@ -85,6 +85,9 @@ class BacktestOptions(FrozenModel):
     overridden_thresholds: tuple[Family, ...] = ()
     notes: str = ""
     verbose: bool = False
+    # Concurrent seed (and, for rolling origins, fit) workers; None sizes the
+    # pool from CPU and measured per-run memory.
+    parallel: Optional[int] = Field(default=None, ge=1)
 
     @field_validator("seeds")
     @classmethod
@@ -249,18 +252,66 @@ class Scorecard(FrozenModel):
         )
         object.__setattr__(self, "verdict", verdict)
         object.__setattr__(self, "verdict_summary", summary)
-        payload = self.model_dump(mode="json", exclude={"scorecard_fingerprint"})
-        canonical = json.dumps(
-            payload, sort_keys=True, separators=(",", ":"), allow_nan=False
+        object.__setattr__(self, "scorecard_fingerprint", _fingerprint(self))
+        return self
+
+
+class MetricTrend(FrozenModel):
+    """One metric's cumulative error at each rolling origin, oldest first."""
+
+    metric: str
+    family: Family
+    boundary_years: tuple[int, ...]
+    percent_errors: tuple[float | None, ...]
+    statuses: tuple[Status, ...]
+    # Least-squares change in |percent error| per origin year; positive means
+    # the model is getting worse on more recent history.
+    slope: float | None = None
+
+    @model_validator(mode="after")
+    def validate_alignment(self) -> "MetricTrend":
+        if (
+            not len(self.boundary_years)
+            == len(self.percent_errors)
+            == len(self.statuses)
+        ):
+            raise ValueError("trend series must align with boundary_years")
+        return self
+
+
+class RollingScorecard(FrozenModel):
+    """Backtests at every feasible origin, combined into one verdict."""
+
+    schema_version: str = "1.0.0"
+    scorecard_fingerprint: str = ""
+    origins: tuple[Scorecard, ...] = Field(min_length=1)
+    trends: tuple[MetricTrend, ...] = ()
+    verdict: Literal["pass", "warn", "fail"] = "pass"
+    verdict_summary: str = ""
+
+    @model_validator(mode="after")
+    def derive_summary_and_fingerprint(self) -> "RollingScorecard":
+        verdicts = [origin.verdict for origin in self.origins]
+        verdict = (
+            "fail" if "fail" in verdicts else "warn" if "warn" in verdicts else "pass"
         )
-        object.__setattr__(
-            self,
-            "scorecard_fingerprint",
-            hashlib.sha256(canonical.encode()).hexdigest(),
+        summary = "; ".join(
+            f"{origin.split.boundary_year}: {origin.verdict}" for origin in self.origins
         )
+        object.__setattr__(self, "verdict", verdict)
+        object.__setattr__(self, "verdict_summary", summary)
+        object.__setattr__(self, "scorecard_fingerprint", _fingerprint(self))
         return self
 
 
+def _fingerprint(model: BaseModel) -> str:
+    payload = model.model_dump(mode="json", exclude={"scorecard_fingerprint"})
+    canonical = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), allow_nan=False
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
 @dataclass(frozen=True)
 class MetricDefinition:
     identifier: str
@@ -6,15 +6,17 @@ import json
 from pathlib import Path
 
 from planalign_backtest.errors import BacktestError
-from planalign_backtest.models import Scorecard
+from planalign_backtest.models import RollingScorecard, Scorecard
 from planalign_fit.pack import ParameterPack, _fingerprint
 
 SCORECARD_DIR = "backtest"
 JSON_NAME = "scorecard.json"
 MARKDOWN_NAME = "scorecard.md"
+ROLLING_JSON_NAME = "rolling_scorecard.json"
+ROLLING_MARKDOWN_NAME = "rolling_scorecard.md"
 
 
-def to_json(scorecard: Scorecard) -> str:
+def to_json(scorecard: Scorecard | RollingScorecard) -> str:
     payload = scorecard.model_dump(mode="json")
     return json.dumps(payload, sort_keys=True, indent=2, allow_nan=False) + "\n"
 
@@ -128,20 +130,85 @@ def scorecard_is_current(scorecard: Scorecard, pack: ParameterPack) -> bool:
 def write_scorecard(
     scorecard: Scorecard, pack_dir: Path | str, *, force: bool = False
 ) -> tuple[Path, Path]:
-    directory = Path(pack_dir) / SCORECARD_DIR
-    json_path, markdown_path = directory / JSON_NAME, directory / MARKDOWN_NAME
+    return _write_pair(
+        to_json(scorecard),
+        render_markdown(scorecard),
+        Path(pack_dir) / SCORECARD_DIR,
+        (JSON_NAME, MARKDOWN_NAME),
+        scored_on=scorecard.provenance.backtest_date,
+        force=force,
+    )
+
+
+def render_rolling_markdown(rolling: RollingScorecard) -> str:
+    boundaries = [origin.split.boundary_year for origin in rolling.origins]
+    lines = [
+        "# Rolling-origin backtest",
+        "",
+        f"Origins (last fitted year): {', '.join(str(year) for year in boundaries)} · "
+        f"seeds {', '.join(str(seed) for seed in rolling.origins[-1].seeds)}",
+        "",
+        "## Cumulative percent error by origin",
+        "",
+        "| Metric | "
+        + " | ".join(str(year) for year in boundaries)
+        + " | Trend (|error|/year) |",
+        "|---|" + "---:|" * len(boundaries) + "---:|",
+    ]
+    for trend in rolling.trends:
+        cells = [
+            "—" if error is None else f"{error:+.2%} {status}"
+            for error, status in zip(trend.percent_errors, trend.statuses)
+        ]
+        slope = "—" if trend.slope is None else f"{trend.slope:+.2%}"
+        lines.append(f"| `{trend.metric}` | {' | '.join(cells)} | {slope} |")
+    lines.extend(
+        [
+            "",
+            f"**Verdict: {rolling.verdict.upper()}** — {rolling.verdict_summary}",
+            "",
+            f"Scorecard fingerprint: `{rolling.scorecard_fingerprint}`",
+            "",
+        ]
+    )
+    return "\n".join(lines)
+
+
+def write_rolling_scorecard(
+    rolling: RollingScorecard, pack_dir: Path | str, *, force: bool = False
+) -> tuple[Path, Path]:
+    return _write_pair(
+        to_json(rolling),
+        render_rolling_markdown(rolling),
+        Path(pack_dir) / SCORECARD_DIR,
+        (ROLLING_JSON_NAME, ROLLING_MARKDOWN_NAME),
+        scored_on=rolling.origins[-1].provenance.backtest_date,
+        force=force,
+    )
+
+
+def _write_pair(
+    json_text: str,
+    markdown_text: str,
+    directory: Path,
+    names: tuple[str, str],
+    *,
+    scored_on: str,
+    force: bool,
+) -> tuple[Path, Path]:
+    json_path, markdown_path = directory / names[0], directory / names[1]
     if json_path.exists() and not force:
         raise BacktestError(
-            f"{json_path} already exists, scored on {scorecard.provenance.backtest_date}. "
+            f"{json_path} already exists, scored on {scored_on}. "
             "Pass --force to replace it."
         )
     directory.mkdir(parents=True, exist_ok=True)
     json_tmp, markdown_tmp = (
-        directory / f".{JSON_NAME}.tmp",
-        directory / f".{MARKDOWN_NAME}.tmp",
+        directory / f".{names[0]}.tmp",
+        directory / f".{names[1]}.tmp",
     )
-    json_tmp.write_text(to_json(scorecard), encoding="utf-8")
-    markdown_tmp.write_text(render_markdown(scorecard), encoding="utf-8")
+    json_tmp.write_text(json_text, encoding="utf-8")
+    markdown_tmp.write_text(markdown_text, encoding="utf-8")
     json_tmp.replace(json_path)
     markdown_tmp.replace(markdown_path)
     return json_path, markdown_path
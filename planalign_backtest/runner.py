@@ -3,20 +3,24 @@
 from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 import logging
 
 import duckdb
 
 from _version import __version__
 from planalign_backtest.actuals import extract_actuals
+from planalign_backtest.errors import BacktestError, SimulationFailure
 from planalign_backtest.models import (
     BacktestOptions,
     BacktestProvenance,
+    MetricTrend,
+    RollingScorecard,
     Scorecard,
     SeedRun,
     SnapshotRef,
     SnapshotSplit,
+    metric_definition,
 )
 from planalign_backtest.predicted import extract_predicted
 from planalign_backtest.scoring import score
@@ -25,11 +29,17 @@ from planalign_backtest.simulate import (
     prepare_boundary_census,
     run_seed,
 )
-from planalign_backtest.split import plan_split
+from planalign_backtest.split import plan_rolling_splits, plan_split
 from planalign_fit.apply import apply_pack
 from planalign_fit.pack import ParameterPack, write_pack
-from planalign_fit.runner import fit_parameter_pack
-from planalign_fit.snapshots import load_snapshots
+from planalign_fit.runner import FitOptions, FitRun, fit_parameter_pack
+from planalign_fit.snapshots import SnapshotSet, load_snapshots
+from planalign_orchestrator.run_pool import (
+    JobResult,
+    ScenarioJob,
+    ScenarioRunPool,
+    resolve_worker_count,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +53,15 @@ class BacktestRun:
     diagnostics: dict[str, object]
 
 
+@dataclass
+class RollingBacktestRun:
+    """Every origin's backtest; ``origins[-1]`` is the latest (default) split."""
+
+    origins: tuple[BacktestRun, ...]
+    scorecard: RollingScorecard
+    diagnostics: dict[str, object]
+
+
 def run_backtest(
     snapshots_dir: Path | str, options: Optional[BacktestOptions] = None
 ) -> BacktestRun:
@@ -50,10 +69,7 @@ def run_backtest(
     with duckdb.connect(":memory:") as conn:
         snapshot_set = load_snapshots(snapshots_dir, conn)
     split = plan_split(snapshot_set, options.holdout_years)
-    fit_options = replace(options.fit_options, only_years=split.fit_years)
-    if options.output is not None and fit_options.pack_id is None:
-        fit_options = replace(fit_options, pack_id=options.output.name)
-    fit_run = fit_parameter_pack(snapshots_dir, fit_options)
+    fit_run = fit_parameter_pack(snapshots_dir, _fit_options(options, split))
 
     # Absolute: the orchestrator invokes dbt with the dbt project as its working
     # directory, so a relative workdir (the default is `var/backtests/...`) would
@@ -62,6 +78,152 @@ def run_backtest(
         options.workdir or _default_workdir(fit_run.pack.manifest.pack_id)
     ).resolve()
     root.mkdir(parents=True, exist_ok=True)
+    jobs = _seed_jobs(snapshot_set, split, fit_run, options, root)
+    budget = resolve_worker_count(options.parallel, len(jobs))
+    results = ScenarioRunPool(budget.workers).run(run_seed_worker, jobs)
+    return _score_origin(
+        snapshot_set, split, fit_run, options, root, _seed_runs(jobs, results)
+    )
+
+
+def run_rolling_backtest(
+    snapshots_dir: Path | str, options: Optional[BacktestOptions] = None
+) -> RollingBacktestRun:
+    """Backtest every feasible boundary year and combine the scorecards.
+
+    All origins share one pool: each origin's fit is a job, and its seeds are
+    queued the moment that fit finishes, so early origins simulate while later
+    ones are still fitting.
+    """
+    options = options or BacktestOptions()
+    with duckdb.connect(":memory:") as conn:
+        snapshot_set = load_snapshots(snapshots_dir, conn)
+    splits = plan_rolling_splits(snapshot_set, options.holdout_years)
+    root = (options.workdir or _default_workdir("rolling")).resolve()
+    root.mkdir(parents=True, exist_ok=True)
+
+    fit_jobs = [
+        ScenarioJob(
+            name=f"fit_{split.boundary_year}",
+            config=None,
+            db_path=_origin_root(root, split) / "fit",
+            seed=0,
+            payload={
+                "snapshots_dir": Path(snapshots_dir).resolve(),
+                "fit_options": _fit_options(options, split, latest=split is splits[-1]),
+            },
+        )
+        for split in splits
+    ]
+    by_fit = {job.name: split for job, split in zip(fit_jobs, splits)}
+    fits: dict[int, FitRun] = {}
+    seed_jobs: dict[int, list[ScenarioJob]] = {}
+    errors: list[str] = []
+
+    def release_seeds(result: JobResult) -> list[ScenarioJob]:
+        split = by_fit.get(result.name)
+        if split is None:
+            return []
+        if not result.succeeded or result.value is None:
+            errors.append(f"fit for boundary {split.boundary_year}: {result.error}")
+            return []
+        fit_run = result.value["fit_run"]
+        try:
+            jobs = _seed_jobs(
+                snapshot_set, split, fit_run, options, _origin_root(root, split)
+            )
+        except Exception as exc:  # noqa: BLE001 - keep the pool draining
+            errors.append(f"seeds for boundary {split.boundary_year}: {exc}")
+            return []
+        fits[split.boundary_year] = fit_run
+        seed_jobs[split.boundary_year] = jobs
+        return jobs
+
+    budget = resolve_worker_count(
+        options.parallel, len(splits) * max(len(options.seeds), 1)
+    )
+    results = ScenarioRunPool(budget.workers).run_incremental(
+        _rolling_worker, fit_jobs, release_seeds
+    )
+    if errors:
+        raise BacktestError("Rolling backtest failed: " + "; ".join(errors))
+    origins = tuple(
+        _score_origin(
+            snapshot_set,
+            split,
+            fits[split.boundary_year],
+            options,
+            _origin_root(root, split),
+            _seed_runs(seed_jobs[split.boundary_year], results),
+        )
+        for split in splits
+    )
+    scorecard = RollingScorecard(
+        origins=tuple(origin.scorecard for origin in origins),
+        trends=_trends(origins),
+    )
+    return RollingBacktestRun(
+        origins=origins,
+        scorecard=scorecard,
+        diagnostics={
+            "workdir": str(root),
+            "origins": [split.boundary_year for split in splits],
+            "workers": budget.workers,
+        },
+    )
+
+
+def run_seed_worker(job: ScenarioJob) -> dict[str, Any]:
+    """Simulate one configured seed in its own database (pool worker).
+
+    Module-level so it pickles across the pool's process boundary. A
+    simulation failure is returned rather than raised so the parent can
+    report the failing year exactly as a serial run did.
+    """
+    try:
+        completed = run_seed(
+            job.payload["applied_pack"],
+            job.payload["split"],
+            job.seed,
+            job.payload["workdir"],
+        )
+    except SimulationFailure as exc:
+        return {"failure": {"year": exc.year, "detail": exc.detail}}
+    return {"seed_run": completed}
+
+
+def _rolling_worker(job: ScenarioJob) -> dict[str, Any]:
+    if "fit_options" in job.payload:
+        return {
+            "fit_run": fit_parameter_pack(
+                job.payload["snapshots_dir"], job.payload["fit_options"]
+            )
+        }
+    return run_seed_worker(job)
+
+
+def _fit_options(
+    options: BacktestOptions, split: SnapshotSplit, latest: bool = True
+) -> FitOptions:
+    fit_options = replace(options.fit_options, only_years=split.fit_years)
+    if latest and options.output is not None and fit_options.pack_id is None:
+        fit_options = replace(fit_options, pack_id=options.output.name)
+    return fit_options
+
+
+def _origin_root(root: Path, split: SnapshotSplit) -> Path:
+    return root / f"origin_{split.boundary_year}"
+
+
+def _seed_jobs(
+    snapshot_set: SnapshotSet,
+    split: SnapshotSplit,
+    fit_run: FitRun,
+    options: BacktestOptions,
+    root: Path,
+) -> list[ScenarioJob]:
+    """Apply the fitted pack and resolve one isolated job per seed."""
+    root.mkdir(parents=True, exist_ok=True)
     scratch_pack = root / "parameter_pack"
     write_pack(fit_run.pack, scratch_pack)
     base_config = options.base_config or Path("config/simulation_config.yaml")
@@ -74,19 +236,59 @@ def run_backtest(
         snapshot for snapshot in snapshot_set if snapshot.year == split.boundary_year
     )
     boundary_path = prepare_boundary_census(boundary, root)
-
-    actuals = extract_actuals(snapshot_set, split, fit_run.bands)
-    seed_runs: list[SeedRun] = []
-    predictions = []
+    jobs = []
     for seed in options.seeds:
         logger.info(
             "Backtest seed %s: simulating %s",
             seed,
             ", ".join(str(year) for year in split.holdout_years),
         )
-        seeded = configure_seed(applied, split, seed, boundary_path, root)
-        completed = run_seed(seeded, split, seed, root)
-        seed_runs.append(completed)
+        jobs.append(
+            ScenarioJob(
+                name=f"{root.name}_seed_{seed}",
+                config=None,
+                db_path=root / f"seed_{seed}.duckdb",
+                seed=seed,
+                payload={
+                    "applied_pack": configure_seed(
+                        applied, split, seed, boundary_path, root
+                    ),
+                    "split": split,
+                    "workdir": root,
+                },
+            )
+        )
+    return jobs
+
+
+def _seed_runs(jobs: list[ScenarioJob], results: dict[str, JobResult]) -> list[SeedRun]:
+    """Completed seed runs in seed order; the first failure raises."""
+    seed_runs = []
+    for job in jobs:
+        result = results[job.name]
+        split = job.payload["split"]
+        if not result.succeeded or result.value is None:
+            raise SimulationFailure(
+                job.seed, split.holdout_years[0], result.error or "no result"
+            )
+        if "failure" in result.value:
+            failure = result.value["failure"]
+            raise SimulationFailure(job.seed, failure["year"], failure["detail"])
+        seed_runs.append(result.value["seed_run"])
+    return seed_runs
+
+
+def _score_origin(
+    snapshot_set: SnapshotSet,
+    split: SnapshotSplit,
+    fit_run: FitRun,
+    options: BacktestOptions,
+    root: Path,
+    seed_runs: list[SeedRun],
+) -> BacktestRun:
+    actuals = extract_actuals(snapshot_set, split, fit_run.bands)
+    predictions = []
+    for completed in seed_runs:
         predictions.append(extract_predicted(completed.database, split))
         if not options.keep_databases:
             completed.database.unlink(missing_ok=True)
@@ -115,6 +317,47 @@ def run_backtest(
     )
 
 
+def _trends(origins: tuple[BacktestRun, ...]) -> tuple[MetricTrend, ...]:
+    """Cumulative error per metric across origins, with a least-squares slope."""
+    boundaries = tuple(origin.split.boundary_year for origin in origins)
+    by_metric: dict[str, dict[int, Any]] = {}
+    for origin in origins:
+        for comparison in origin.scorecard.comparisons:
+            if comparison.period == "cumulative":
+                by_metric.setdefault(comparison.metric, {})[
+                    origin.split.boundary_year
+                ] = comparison
+    trends = []
+    for metric in sorted(by_metric):
+        series = [by_metric[metric].get(year) for year in boundaries]
+        errors = tuple(None if item is None else item.percent_error for item in series)
+        trends.append(
+            MetricTrend(
+                metric=metric,
+                family=metric_definition(metric).family,
+                boundary_years=boundaries,
+                percent_errors=errors,
+                statuses=tuple(
+                    "not_observable" if item is None else item.status for item in series
+                ),
+                slope=_slope(boundaries, errors),
+            )
+        )
+    return tuple(trends)
+
+
+def _slope(years: tuple[int, ...], errors: tuple[float | None, ...]) -> float | None:
+    points = [
+        (year, abs(error)) for year, error in zip(years, errors) if error is not None
+    ]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
 def _default_workdir(pack_id: str) -> Path:
     stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     return Path("var/backtests") / f"{stamp}-{pack_id}"
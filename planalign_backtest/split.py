@@ -33,3 +33,20 @@ def plan_split(snapshot_set: SnapshotSet, holdout_years: int) -> SnapshotSplit:
         boundary_year=fit_years[-1],
         all_years=years,
     )
+
+
+def plan_rolling_splits(
+    snapshot_set: SnapshotSet, holdout_years: int
+) -> tuple[SnapshotSplit, ...]:
+    """Every feasible origin: each boundary year with 2+ fit years before it.
+
+    Origin ``k`` fits on the snapshots up to its boundary and holds out the
+    next ``holdout_years``; later snapshots are simply not part of that
+    origin. The last origin is the split :func:`plan_split` would choose.
+    """
+    plan_split(snapshot_set, holdout_years)  # same input validation and messages
+    years = snapshot_set.years
+    return tuple(
+        plan_split(snapshot_set.subset(years[:end]), holdout_years)
+        for end in range(2 + holdout_years, len(years) + 1)
+    )
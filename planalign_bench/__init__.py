@@ -0,0 +1,72 @@
+"""Synthetic census generation and the scale benchmark suite.
+
+``planalign bench census --employees N`` samples a census of any size from a
+:class:`CensusProfile` -- fitted from a real census with ``planalign bench
+profile`` or built from the job-level seed -- so performance work is not tied
+to the 5k-row development census. ``planalign bench run`` runs the full
+pipeline across census sizes and horizons, records wall time, CPU, peak RSS
+and dbt invocation counts as a JSON baseline, and flags super-linear scaling
+and regressions against a previous baseline.
+"""
+
+from __future__ import annotations
+
+from planalign_bench.census import (
+    CensusSummary,
+    pack_deferral_defaults,
+    sample_chunk,
+    write_census,
+)
+from planalign_bench.profile import (
+    CensusProfile,
+    LevelProfile,
+    ProfileError,
+    default_profile,
+    fit_profile,
+    load_profile,
+    save_profile,
+    validate_profile,
+)
+from planalign_bench.suite import (
+    DEFAULT_HORIZONS,
+    DEFAULT_SIZES,
+    BenchmarkCase,
+    BenchmarkReport,
+    BenchmarkResult,
+    Regression,
+    ScalingFinding,
+    analyse_scaling,
+    build_cases,
+    compare_to_baseline,
+    load_report,
+    run_benchmark,
+    write_report,
+)
+
+__all__ = [
+    "BenchmarkCase",
+    "BenchmarkReport",
+    "BenchmarkResult",
+    "CensusProfile",
+    "CensusSummary",
+    "DEFAULT_HORIZONS",
+    "DEFAULT_SIZES",
+    "LevelProfile",
+    "ProfileError",
+    "Regression",
+    "ScalingFinding",
+    "analyse_scaling",
+    "build_cases",
+    "compare_to_baseline",
+    "default_profile",
+    "fit_profile",
+    "load_profile",
+    "load_report",
+    "pack_deferral_defaults",
+    "run_benchmark",
+    "sample_chunk",
+    "save_profile",
+    "validate_profile",
+    "write_census",
+    "write_report",
+]
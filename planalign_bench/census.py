@@ -0,0 +1,309 @@
+"""Synthetic census generation from a :class:`CensusProfile`.
+
+Rows are sampled in fixed-size chunks, each from its own generator seeded by
+``(seed, chunk index)``, and streamed into DuckDB before one parquet write, so
+memory stays flat from 10k to millions of employees and a given
+``(profile, employees, seed)`` always produces the same file.
+
+Identifiers, dates and contribution columns are derived in SQL from the
+sampled numbers; the output matches the census schema ``stg_census_data``
+reads. Employer contribution columns are written as zero because the
+simulator recomputes them from the plan design.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Tuple
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+from planalign_fit.bands import AGE_SEGMENT_EDGES, INCOME_SEGMENT_EDGES
+from planalign_fit.pack import ParameterPack
+from planalign_fit.priors import DEFERRAL_RATES_SEED
+
+from .profile import MIN_HIRE_AGE, QUANTILE_POINTS, CensusProfile, validate_profile
+
+CHUNK_ROWS = 250_000
+DAYS_PER_YEAR = 365.25
+# IRS 401(a)(17) limit applied to employee_capped_compensation when the seed
+# has no row for the census year.
+DEFAULT_COMPENSATION_LIMIT = 350_000.0
+
+# (age segment, income segment) -> plan default deferral rate
+DeferralDefaults = Mapping[Tuple[str, str], float]
+
+
+@dataclass(frozen=True)
+class CensusSummary:
+    """What was written, for the CLI and the benchmark record."""
+
+    path: Path
+    employees: int
+    active: int
+    participants: int
+    mean_age: float
+    mean_compensation: float
+    seconds: float
+
+
+def pack_deferral_defaults(
+    pack: ParameterPack,
+) -> Optional[Dict[Tuple[str, str], float]]:
+    """Plan default deferral rate by segment from a pack's deferral seed.
+
+    Returns None when the pack did not fit deferral rates.
+    """
+    text = pack.seed_files.get(DEFERRAL_RATES_SEED)
+    if not text:
+        return None
+    defaults: Dict[Tuple[str, str], float] = {}
+    for row in csv.DictReader(io.StringIO(text)):
+        if row.get("scenario_id", "default") != "default":
+            continue
+        # The seed spells the lowest income segment 'low_income'.
+        income = (
+            "low" if row["income_segment"] == "low_income" else row["income_segment"]
+        )
+        defaults[(row["age_segment"], income)] = float(row["default_rate"])
+    return defaults or None
+
+
+def compensation_limit(seeds_dir: Optional[Path], year: int) -> float:
+    """``compensation_limit`` for ``year`` from ``config_irs_limits.csv``."""
+    from planalign_fit.bands import DEFAULT_SEEDS_DIR
+
+    path = Path(seeds_dir or DEFAULT_SEEDS_DIR) / "config_irs_limits.csv"
+    if not path.is_file():
+        return DEFAULT_COMPENSATION_LIMIT
+    with path.open(newline="", encoding="utf-8") as handle:
+        for row in csv.DictReader(handle):
+            if int(row["limit_year"]) == year:
+                return float(row["compensation_limit"])
+    return DEFAULT_COMPENSATION_LIMIT
+
+
+def sample_chunk(
+    profile: CensusProfile,
+    rows: int,
+    rng: np.random.Generator,
+    deferral_defaults: Optional[DeferralDefaults] = None,
+) -> pd.DataFrame:
+    """Sample ``rows`` employees as day offsets back from the census date."""
+    from scipy.special import ndtr
+
+    points = np.asarray(QUANTILE_POINTS)
+    shares = np.asarray([level.share for level in profile.levels])
+    level_index = rng.choice(len(profile.levels), size=rows, p=shares / shares.sum())
+
+    # Gaussian copula: correlated normals -> uniforms -> per-level quantiles.
+    correlation = np.asarray(profile.correlation, dtype=float)
+    cholesky = np.linalg.cholesky(correlation + 1e-9 * np.eye(3))
+    uniforms = ndtr(rng.standard_normal((rows, 3)) @ cholesky.T)
+
+    age = np.empty(rows)
+    tenure = np.empty(rows)
+    compensation = np.empty(rows)
+    deferral = np.empty(rows)
+    participation = np.empty(rows)
+    deferral_draw = rng.random(rows)
+    for index, level in enumerate(profile.levels):
+        mask = level_index == index
+        age[mask] = np.interp(uniforms[mask, 0], points, level.age_quantiles)
+        tenure[mask] = np.interp(uniforms[mask, 1], points, level.tenure_quantiles)
+        compensation[mask] = np.interp(
+            uniforms[mask, 2], points, level.compensation_quantiles
+        )
+        deferral[mask] = np.interp(
+            deferral_draw[mask], points, level.deferral_quantiles
+        )
+        participation[mask] = level.participation_rate
+
+    age = np.maximum(age, MIN_HIRE_AGE)
+    tenure = np.clip(tenure, 0.0, age - MIN_HIRE_AGE)
+
+    at_default = rng.random(rows) < profile.default_rate_share
+    deferral = np.where(
+        at_default,
+        _default_rates(profile, age, compensation, deferral_defaults),
+        deferral,
+    )
+    participates = rng.random(rows) < participation
+    deferral = np.where(participates, np.round(deferral, 4), 0.0)
+
+    birth_days = np.floor(age * DAYS_PER_YEAR).astype(np.int64)
+    # A day of slack so no hire date lands before the 18th birthday however
+    # the leap days fall.
+    latest_hire_days = birth_days - math.ceil(MIN_HIRE_AGE * DAYS_PER_YEAR) - 1
+    tenure_days = np.clip(
+        np.floor(tenure * DAYS_PER_YEAR).astype(np.int64),
+        0,
+        np.maximum(latest_hire_days, 0),
+    )
+    terminated = rng.random(rows) < profile.terminated_share
+    # Terminations fall within the census year and never precede the hire.
+    termination_days = np.where(
+        terminated,
+        np.floor(rng.random(rows) * np.minimum(tenure_days, 364)).astype(np.int64),
+        -1,
+    )
+    return pd.DataFrame(
+        {
+            "birth_days": birth_days,
+            "tenure_days": tenure_days,
+            "termination_days": termination_days,
+            "compensation": np.round(compensation, 0),
+            "deferral_rate": deferral,
+        }
+    )
+
+
+def _default_rates(
+    profile: CensusProfile,
+    age: np.ndarray,
+    compensation: np.ndarray,
+    deferral_defaults: Optional[DeferralDefaults],
+) -> np.ndarray:
+    if not deferral_defaults:
+        return np.full(len(age), profile.default_deferral_rate)
+    age_segment = np.searchsorted(
+        [upper for _, upper in AGE_SEGMENT_EDGES], age, side="right"
+    )
+    income_segment = np.searchsorted(
+        [upper for _, upper in INCOME_SEGMENT_EDGES], compensation, side="right"
+    )
+    table = np.array(
+        [
+            [
+                deferral_defaults.get(
+                    (age_name, income_name), profile.default_deferral_rate
+                )
+                for income_name, _ in INCOME_SEGMENT_EDGES
+            ]
+            for age_name, _ in AGE_SEGMENT_EDGES
+        ]
+    )
+    return table[age_segment, income_segment]
+
+
+_INSERT_SQL = """
+INSERT INTO census
+SELECT
+    'SYN_' || lpad(CAST(employee_number AS VARCHAR), 8, '0') AS employee_id,
+    'SYN-' || lpad(CAST(employee_number AS VARCHAR), 9, '0') AS employee_ssn,
+    CAST(? AS DATE) - CAST(birth_days AS INTEGER) AS employee_birth_date,
+    CAST(? AS DATE) - CAST(tenure_days AS INTEGER) AS employee_hire_date,
+    CASE WHEN termination_days >= 0
+         THEN CAST(? AS DATE) - CAST(termination_days AS INTEGER) END
+        AS employee_termination_date,
+    CAST(compensation AS DECIMAL(12, 2)) AS employee_gross_compensation,
+    CAST(least(compensation, ?) AS DECIMAL(12, 2)) AS employee_capped_compensation,
+    termination_days < 0 AS active,
+    CAST(deferral_rate AS DECIMAL(7, 5)) AS employee_deferral_rate,
+    CAST(round(least(compensation, ?) * deferral_rate, 2) AS DECIMAL(12, 2))
+        AS employee_contribution,
+    CAST(round(least(compensation, ?) * deferral_rate, 2) AS DECIMAL(12, 2))
+        AS pre_tax_contribution,
+    CAST(0 AS DECIMAL(12, 2)) AS roth_contribution,
+    CAST(0 AS DECIMAL(12, 2)) AS after_tax_contribution,
+    CAST(0 AS DECIMAL(12, 2)) AS employer_core_contribution,
+    CAST(0 AS DECIMAL(12, 2)) AS employer_match_contribution,
+    CAST(? AS DATE) - CAST(tenure_days AS INTEGER) AS eligibility_entry_date,
+    CAST(40 AS DECIMAL(5, 2)) AS scheduled_hours_per_week,
+    FALSE AS auto_escalation_opt_out,
+    CAST(NULL AS BOOLEAN) AS eligibility_override
+FROM (SELECT *, ? + row_number() OVER () AS employee_number FROM chunk)
+"""
+
+_CREATE_SQL = """
+CREATE TABLE census (
+    employee_id VARCHAR,
+    employee_ssn VARCHAR,
+    employee_birth_date DATE,
+    employee_hire_date DATE,
+    employee_termination_date DATE,
+    employee_gross_compensation DECIMAL(12, 2),
+    employee_capped_compensation DECIMAL(12, 2),
+    active BOOLEAN,
+    employee_deferral_rate DECIMAL(7, 5),
+    employee_contribution DECIMAL(12, 2),
+    pre_tax_contribution DECIMAL(12, 2),
+    roth_contribution DECIMAL(12, 2),
+    after_tax_contribution DECIMAL(12, 2),
+    employer_core_contribution DECIMAL(12, 2),
+    employer_match_contribution DECIMAL(12, 2),
+    eligibility_entry_date DATE,
+    scheduled_hours_per_week DECIMAL(5, 2),
+    auto_escalation_opt_out BOOLEAN,
+    eligibility_override BOOLEAN
+)
+"""
+
+
+def write_census(
+    profile: CensusProfile,
+    employees: int,
+    output_path: Path | str,
+    *,
+    seed: int = 42,
+    deferral_defaults: Optional[DeferralDefaults] = None,
+    seeds_dir: Optional[Path] = None,
+) -> CensusSummary:
+    """Sample ``employees`` rows from ``profile`` and write them as parquet."""
+    import time
+
+    if employees < 1:
+        raise ValueError("employees must be at least 1")
+    validate_profile(profile)
+    started = time.perf_counter()
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    as_of = profile.as_of
+    limit = compensation_limit(seeds_dir, profile.as_of_date.year)
+
+    with duckdb.connect(":memory:") as conn:
+        conn.execute(_CREATE_SQL)
+        for index in range(math.ceil(employees / CHUNK_ROWS)):
+            offset = index * CHUNK_ROWS
+            rows = min(CHUNK_ROWS, employees - offset)
+            chunk = sample_chunk(
+                profile, rows, np.random.default_rng([seed, index]), deferral_defaults
+            )
+            conn.register("chunk", chunk)
+            try:
+                conn.execute(
+                    _INSERT_SQL,
+                    [as_of, as_of, as_of, limit, limit, limit, as_of, offset],
+                )
+            finally:
+                conn.unregister("chunk")
+        target = str(output_path.resolve()).replace("'", "''")
+        temporary = target + ".tmp"
+        conn.execute(f"COPY census TO '{temporary}' (FORMAT PARQUET)")
+        Path(temporary).replace(output_path)
+        row = conn.execute(
+            """
+            SELECT count(*),
+                   count(*) FILTER (WHERE active),
+                   count(*) FILTER (WHERE employee_deferral_rate > 0),
+                   avg(date_diff('day', employee_birth_date, CAST(? AS DATE))) / 365.25,
+                   avg(employee_gross_compensation)
+            FROM census
+            """,
+            [as_of],
+        ).fetchone()
+    return CensusSummary(
+        path=output_path,
+        employees=int(row[0]),
+        active=int(row[1]),
+        participants=int(row[2]),
+        mean_age=float(row[3]),
+        mean_compensation=float(row[4]),
+        seconds=time.perf_counter() - started,
+    )
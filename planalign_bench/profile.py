@@ -0,0 +1,428 @@
+"""Census profiles: the distributions a synthetic census is sampled from.
+
+A profile holds, per job level, the level's share of the workforce and
+quantile tables for age, tenure and compensation, plus the participation rate
+and the deferral-rate quantiles of participants. Age, tenure and compensation
+are drawn jointly through a Gaussian copula whose correlation matrix is part of
+the profile, so older employees still tend to have longer service and higher
+pay within a level.
+
+Profiles come from two places:
+
+- :func:`fit_profile` measures them from a real census (CSV or parquet) using
+  the simulator's own level edges from ``config_job_levels.csv``.
+- :func:`default_profile` builds a plausible shape from the level seed alone,
+  for when no client census is at hand.
+
+Levels are assigned exactly as ``int_baseline_workforce`` does (lowest level
+whose compensation range contains the salary), so a census generated from a
+fitted profile reproduces the source's level mix once staged.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+import duckdb
+import numpy as np
+
+from planalign_fit.bands import BandDefinitions, load_band_definitions
+
+PROFILE_VERSION = 1
+
+# Quantile grid every table is stored on: 0%, 5%, ..., 100%.
+QUANTILE_POINTS: tuple[float, ...] = tuple(i / 20 for i in range(21))
+
+MIN_HIRE_AGE = 18.0
+
+# Pairs of (age, tenure, compensation) in the copula correlation matrix.
+COPULA_DIMENSIONS = ("age", "tenure", "compensation")
+
+# Fitting needs enough employees per level for 21 quantiles to mean anything.
+MIN_LEVEL_EMPLOYEES = 20
+
+
+class ProfileError(ValueError):
+    """A census profile could not be fitted, read or written."""
+
+
+@dataclass(frozen=True)
+class LevelProfile:
+    """Distributions for one job level."""
+
+    level_id: int
+    share: float
+    age_quantiles: tuple[float, ...]
+    tenure_quantiles: tuple[float, ...]
+    compensation_quantiles: tuple[float, ...]
+    participation_rate: float
+    deferral_quantiles: tuple[float, ...]
+
+
+@dataclass(frozen=True)
+class CensusProfile:
+    """Everything the generator samples from, serialisable as JSON."""
+
+    as_of: str
+    levels: tuple[LevelProfile, ...]
+    # Correlation of normal scores for COPULA_DIMENSIONS, row-major 3x3.
+    correlation: tuple[tuple[float, ...], ...]
+    # Share of participants deferring exactly at the plan default rate
+    # (auto-enrolled and never changed). The rest draw from the quantiles.
+    default_rate_share: float
+    default_deferral_rate: float
+    # Census rows that terminated during the census year.
+    terminated_share: float
+    source: str = "default"
+    version: int = PROFILE_VERSION
+    notes: list[str] = field(default_factory=list)
+
+    @property
+    def as_of_date(self) -> date:
+        return date.fromisoformat(self.as_of)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> "CensusProfile":
+        data = dict(payload)
+        if data.get("version") != PROFILE_VERSION:
+            raise ProfileError(
+                f"Unsupported profile version {data.get('version')!r}; "
+                f"expected {PROFILE_VERSION}"
+            )
+        try:
+            levels = tuple(
+                LevelProfile(
+                    **{
+                        **level,
+                        **{
+                            key: tuple(float(v) for v in level[key])
+                            for key in (
+                                "age_quantiles",
+                                "tenure_quantiles",
+                                "compensation_quantiles",
+                                "deferral_quantiles",
+                            )
+                        },
+                    }
+                )
+                for level in data.pop("levels")
+            )
+            correlation = tuple(
+                tuple(float(v) for v in row) for row in data.pop("correlation")
+            )
+            known = set(cls.__dataclass_fields__)
+            profile = cls(
+                levels=levels,
+                correlation=correlation,
+                **{k: v for k, v in data.items() if k in known},
+            )
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ProfileError(f"Malformed census profile: {exc}") from exc
+        validate_profile(profile)
+        return profile
+
+
+def validate_profile(profile: CensusProfile) -> None:
+    """Raise ProfileError unless the profile can be sampled."""
+    if not profile.levels:
+        raise ProfileError("Profile defines no job levels")
+    total = sum(level.share for level in profile.levels)
+    if not math.isclose(total, 1.0, abs_tol=1e-6):
+        raise ProfileError(f"Level shares sum to {total:.6f}, not 1")
+    for level in profile.levels:
+        for name in (
+            "age_quantiles",
+            "tenure_quantiles",
+            "compensation_quantiles",
+            "deferral_quantiles",
+        ):
+            values = getattr(level, name)
+            if len(values) != len(QUANTILE_POINTS):
+                raise ProfileError(
+                    f"Level {level.level_id} {name} has {len(values)} points, "
+                    f"expected {len(QUANTILE_POINTS)}"
+                )
+            if any(b < a for a, b in zip(values, values[1:])):
+                raise ProfileError(f"Level {level.level_id} {name} is not monotone")
+        if not 0.0 <= level.participation_rate <= 1.0:
+            raise ProfileError(
+                f"Level {level.level_id} participation_rate out of [0, 1]"
+            )
+    for name in ("default_rate_share", "default_deferral_rate", "terminated_share"):
+        if not 0.0 <= getattr(profile, name) <= 1.0:
+            raise ProfileError(f"{name} out of [0, 1]")
+    matrix = np.asarray(profile.correlation, dtype=float)
+    if matrix.shape != (3, 3) or not np.allclose(matrix, matrix.T):
+        raise ProfileError("Correlation must be a symmetric 3x3 matrix")
+    if np.linalg.eigvalsh(matrix).min() < -1e-9:
+        raise ProfileError("Correlation matrix is not positive semi-definite")
+
+
+def save_profile(profile: CensusProfile, path: Path | str) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(profile.to_dict(), indent=2), encoding="utf-8")
+    return path
+
+
+def load_profile(path: Path | str) -> CensusProfile:
+    path = Path(path)
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        raise ProfileError(f"Cannot read census profile {path}: {exc}") from exc
+    return CensusProfile.from_dict(payload)
+
+
+# ---------------------------------------------------------------------------
+# Default profile
+# ---------------------------------------------------------------------------
+
+# Workforce pyramid for the first levels of the seed; further levels continue
+# the taper.
+_DEFAULT_SHARES = (0.55, 0.25, 0.12, 0.06, 0.02)
+_DEFAULT_CORRELATION = ((1.0, 0.55, 0.30), (0.55, 1.0, 0.35), (0.30, 0.35, 1.0))
+_DEFAULT_DEFERRAL_QUANTILES = (
+    0.01,
+    0.02,
+    0.03,
+    0.03,
+    0.04,
+    0.04,
+    0.05,
+    0.05,
+    0.06,
+    0.06,
+    0.06,
+    0.07,
+    0.08,
+    0.08,
+    0.09,
+    0.10,
+    0.10,
+    0.12,
+    0.13,
+    0.15,
+    0.20,
+)
+
+
+def _normal_quantiles(
+    mean: float, sd: float, low: float, high: float
+) -> tuple[float, ...]:
+    from scipy.special import ndtri
+
+    # Trim the unbounded tails at 0.5% / 99.5% before clipping to the range.
+    points = np.clip(np.asarray(QUANTILE_POINTS), 0.005, 0.995)
+    return tuple(float(v) for v in np.clip(mean + sd * ndtri(points), low, high))
+
+
+def default_profile(
+    seeds_dir: Path | str | None = None, *, as_of: str = "2024-12-31"
+) -> CensusProfile:
+    """A plausible workforce shaped by the job-level seed alone."""
+    bands = load_band_definitions(seeds_dir)
+    count = len(bands.levels)
+    raw = [
+        _DEFAULT_SHARES[i]
+        if i < len(_DEFAULT_SHARES)
+        else _DEFAULT_SHARES[-1] / 2 ** (i - 4)
+        for i in range(count)
+    ]
+    shares = [share / sum(raw) for share in raw]
+    levels = []
+    for index, (level, share) in enumerate(zip(bands.levels, shares)):
+        top = level.max_compensation
+        if not math.isfinite(top):
+            top = level.min_compensation * 1.6
+        levels.append(
+            LevelProfile(
+                level_id=level.level_id,
+                share=share,
+                age_quantiles=_normal_quantiles(34 + 5 * index, 9, 21, 66),
+                tenure_quantiles=_normal_quantiles(3 + 2.5 * index, 3 + index, 0, 40),
+                compensation_quantiles=tuple(
+                    float(level.min_compensation + (top - level.min_compensation) * p)
+                    for p in QUANTILE_POINTS
+                ),
+                participation_rate=min(0.95, 0.65 + 0.07 * index),
+                deferral_quantiles=_DEFAULT_DEFERRAL_QUANTILES,
+            )
+        )
+    return CensusProfile(
+        as_of=as_of,
+        levels=tuple(levels),
+        correlation=_DEFAULT_CORRELATION,
+        default_rate_share=0.35,
+        default_deferral_rate=0.03,
+        terminated_share=0.08,
+        source="default",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Fitting
+# ---------------------------------------------------------------------------
+
+
+def _reader(path: Path) -> str:
+    quoted = str(path.resolve()).replace("'", "''")
+    if path.suffix.lower() == ".parquet":
+        return f"read_parquet('{quoted}')"
+    return f"read_csv_auto('{quoted}', header=true, sample_size=-1)"
+
+
+def _quantiles(values: np.ndarray) -> tuple[float, ...]:
+    return tuple(float(v) for v in np.quantile(values, QUANTILE_POINTS))
+
+
+def _normal_scores(values: np.ndarray) -> np.ndarray:
+    from scipy.special import ndtri
+    from scipy.stats import rankdata
+
+    return ndtri((rankdata(values) - 0.5) / len(values))
+
+
+def fit_profile(
+    census_path: Path | str,
+    *,
+    seeds_dir: Path | str | None = None,
+    as_of: Optional[str] = None,
+) -> CensusProfile:
+    """Measure a profile from a census file.
+
+    Args:
+        census_path: Census in the simulator's schema (.parquet or .csv)
+        seeds_dir: Seed directory supplying the job levels (default: dbt/seeds)
+        as_of: Census date ages and tenure are measured at (default: the
+            December 31st before the latest hire date in the file)
+
+    Raises:
+        ProfileError: If the file cannot be read or has too few employees
+    """
+    path = Path(census_path)
+    bands = load_band_definitions(seeds_dir)
+    try:
+        with duckdb.connect(":memory:") as conn:
+            if as_of is None:
+                latest = conn.execute(
+                    f"SELECT max(TRY_CAST(employee_hire_date AS DATE)) FROM {_reader(path)}"
+                ).fetchone()[0]
+                if latest is None:
+                    raise ProfileError(f"{path} has no employee_hire_date values")
+                as_of = f"{latest.year}-12-31"
+            frame = conn.execute(
+                _FIT_SQL.format(
+                    source=_reader(path),
+                    level_case=bands.level_case("compensation"),
+                ),
+                [as_of, as_of, as_of],
+            ).fetchnumpy()
+    except duckdb.Error as exc:
+        raise ProfileError(f"Cannot read census {path}: {exc}") from exc
+    return _profile_from_arrays(frame, bands, as_of=as_of, source=f"fitted:{path.name}")
+
+
+_FIT_SQL = """
+WITH census AS (
+    SELECT
+        TRY_CAST(employee_birth_date AS DATE) AS birth_date,
+        TRY_CAST(employee_hire_date AS DATE) AS hire_date,
+        TRY_CAST(employee_termination_date AS DATE) AS termination_date,
+        CAST(employee_gross_compensation AS DOUBLE) AS compensation,
+        COALESCE(CAST(employee_deferral_rate AS DOUBLE), 0) AS deferral_rate
+    FROM {source}
+)
+SELECT
+    date_diff('day', birth_date, CAST(? AS DATE)) / 365.25 AS age,
+    greatest(date_diff('day', hire_date, CAST(? AS DATE)) / 365.25, 0) AS tenure,
+    compensation,
+    deferral_rate,
+    termination_date IS NOT NULL
+        AND termination_date <= CAST(? AS DATE) AS terminated,
+    {level_case} AS level_id
+FROM census
+WHERE birth_date IS NOT NULL AND hire_date IS NOT NULL
+  AND compensation IS NOT NULL AND compensation > 0
+"""
+
+
+def _profile_from_arrays(
+    frame: Mapping[str, np.ndarray],
+    bands: BandDefinitions,
+    *,
+    as_of: str,
+    source: str,
+) -> CensusProfile:
+    age = np.asarray(frame["age"], dtype=float)
+    tenure = np.asarray(frame["tenure"], dtype=float)
+    compensation = np.asarray(frame["compensation"], dtype=float)
+    deferral = np.asarray(frame["deferral_rate"], dtype=float)
+    terminated = np.asarray(frame["terminated"], dtype=bool)
+    level_ids = np.asarray(frame["level_id"], dtype=int)
+    total = len(age)
+    if total < MIN_LEVEL_EMPLOYEES:
+        raise ProfileError(
+            f"Census has {total} usable employees; at least {MIN_LEVEL_EMPLOYEES} are needed"
+        )
+
+    notes: list[str] = []
+    levels = []
+    for level in bands.levels:
+        mask = level_ids == level.level_id
+        count = int(mask.sum())
+        if count == 0:
+            notes.append(
+                f"Level {level.level_id} has no employees; it is not generated"
+            )
+            continue
+        if count < MIN_LEVEL_EMPLOYEES:
+            notes.append(
+                f"Level {level.level_id} has only {count} employees; its quantiles are coarse"
+            )
+        participants = deferral[mask] > 0
+        levels.append(
+            LevelProfile(
+                level_id=level.level_id,
+                share=count / total,
+                age_quantiles=_quantiles(age[mask]),
+                tenure_quantiles=_quantiles(tenure[mask]),
+                compensation_quantiles=_quantiles(compensation[mask]),
+                participation_rate=float(participants.mean()),
+                deferral_quantiles=(
+                    _quantiles(deferral[mask][participants])
+                    if participants.any()
+                    else _DEFAULT_DEFERRAL_QUANTILES
+                ),
+            )
+        )
+
+    scores = np.vstack([_normal_scores(v) for v in (age, tenure, compensation)])
+    correlation = np.corrcoef(scores)
+    positive = deferral[deferral > 0]
+    if positive.size:
+        rates, counts = np.unique(np.round(positive, 4), return_counts=True)
+        default_rate = float(rates[counts.argmax()])
+        default_share = float(counts.max() / positive.size)
+    else:
+        default_rate, default_share = 0.03, 0.0
+    return CensusProfile(
+        as_of=as_of,
+        levels=tuple(levels),
+        correlation=tuple(
+            tuple(round(float(v), 6) for v in row) for row in correlation
+        ),
+        default_rate_share=default_share,
+        default_deferral_rate=default_rate,
+        terminated_share=float(terminated.mean()),
+        source=source,
+        notes=notes,
+    )
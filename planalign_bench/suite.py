@@ -0,0 +1,485 @@
+"""Scale benchmark suite: the full pipeline across census sizes and horizons.
+
+Each case generates (or reuses) a synthetic census of the requested size,
+writes an effective config pointing at it, and runs ``planalign simulate
+--trace`` in a fresh subprocess and database, so every case starts cold and
+its memory is its own. Wall time is measured here. CPU, peak RSS of the
+simulation's process tree, dbt invocation and node counts, and time per stage
+come from the run's trace file (see ``planalign_orchestrator.monitoring.tracing``).
+
+The report is a JSON baseline. :func:`analyse_scaling` fits the log-log
+slope of each metric between neighbouring sizes (and horizons), and flags any
+slope above ``1 + tolerance`` as super-linear. Fixed start-up costs pull the
+slopes between small cases below 1, so a flag is never a false alarm from
+overhead. Each case also lists the dbt models whose per-year execute time
+rises with the year index (see ``planalign_orchestrator.monitoring.horizon``).
+:func:`compare_to_baseline` reports cases that got slower or larger than a
+previous report.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+import yaml
+
+from .census import DeferralDefaults, write_census
+from .profile import CensusProfile
+
+DEFAULT_SIZES = (10_000, 100_000, 500_000, 1_000_000)
+DEFAULT_HORIZONS = (1, 5, 10)
+SUPERLINEAR_TOLERANCE = 0.15
+REGRESSION_TOLERANCE = 0.15
+REPORT_VERSION = 1
+
+SCALED_METRICS = ("wall_seconds", "cpu_seconds", "peak_rss_mb")
+
+# (command, environment, log path, timeout) -> return code
+CommandExecutor = Callable[[List[str], Dict[str, str], Path, Optional[float]], int]
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """One point of the matrix: a census size simulated over a horizon."""
+
+    employees: int
+    years: int
+
+    @property
+    def case_id(self) -> str:
+        return f"{self.employees}x{self.years}y"
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of one case; metrics are None unless status is ``ok``."""
+
+    employees: int
+    years: int
+    status: str
+    wall_seconds: Optional[float] = None
+    cpu_seconds: Optional[float] = None
+    peak_rss_mb: Optional[float] = None
+    dbt_invocations: Optional[int] = None
+    dbt_nodes: Optional[int] = None
+    census_seconds: Optional[float] = None
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+    # Models whose per-year execute time grows with the year index -> exponent.
+    horizon_growth: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def case_id(self) -> str:
+        return BenchmarkCase(self.employees, self.years).case_id
+
+
+@dataclass(frozen=True)
+class ScalingFinding:
+    """Log-log slope of ``metric`` between two neighbouring cases."""
+
+    metric: str
+    dimension: str  # "employees" or "years"
+    held: int  # the other dimension's value
+    lower: int
+    upper: int
+    exponent: float
+    superlinear: bool
+
+
+@dataclass(frozen=True)
+class Regression:
+    case_id: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+@dataclass
+class BenchmarkReport:
+    """A benchmark run, written as the JSON baseline later runs compare to."""
+
+    generated_at: str
+    planalign_version: str
+    environment: Dict[str, Any]
+    profile_source: str
+    start_year: int
+    seed: int
+    results: List[BenchmarkResult]
+    scaling: List[ScalingFinding] = field(default_factory=list)
+    regressions: List[Regression] = field(default_factory=list)
+    version: int = REPORT_VERSION
+
+    @property
+    def flagged(self) -> bool:
+        return (
+            bool(self.regressions)
+            or any(f.superlinear for f in self.scaling)
+            or any(r.horizon_growth for r in self.results)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> "BenchmarkReport":
+        data = dict(payload)
+        if data.get("version") != REPORT_VERSION:
+            raise ValueError(
+                f"Unsupported benchmark report version {data.get('version')!r}"
+            )
+        data["results"] = [BenchmarkResult(**r) for r in data.get("results", [])]
+        data["scaling"] = [ScalingFinding(**s) for s in data.get("scaling", [])]
+        data["regressions"] = [Regression(**r) for r in data.get("regressions", [])]
+        return cls(**data)
+
+
+def write_report(report: BenchmarkReport, path: Path | str) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
+    return path
+
+
+def load_report(path: Path | str) -> BenchmarkReport:
+    return BenchmarkReport.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+def build_cases(
+    sizes: Sequence[int] = DEFAULT_SIZES, horizons: Sequence[int] = DEFAULT_HORIZONS
+) -> List[BenchmarkCase]:
+    """Cases ordered by horizon, then size, so each horizon grows in turn."""
+    return [
+        BenchmarkCase(employees, years)
+        for years in sorted(set(horizons))
+        for employees in sorted(set(sizes))
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Running
+# ---------------------------------------------------------------------------
+
+
+def _run_subprocess(
+    command: List[str], env: Dict[str, str], log_path: Path, timeout: Optional[float]
+) -> int:
+    with open(log_path, "w", encoding="utf-8") as log:
+        return subprocess.run(
+            command, env=env, stdout=log, stderr=subprocess.STDOUT, timeout=timeout
+        ).returncode
+
+
+def _profile_digest(profile: CensusProfile) -> str:
+    payload = json.dumps(profile.to_dict(), sort_keys=True).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:12]
+
+
+def _write_case_config(
+    base_config: Path,
+    census: Path,
+    case: BenchmarkCase,
+    start_year: int,
+    seed: int,
+    case_dir: Path,
+) -> Path:
+    raw = yaml.safe_load(base_config.read_text(encoding="utf-8")) or {}
+    setup = raw.setdefault("setup", {})
+    setup["census_parquet_path"] = str(census.resolve())
+    setup["plan_year_start_date"] = f"{start_year - 1}-01-01"
+    setup["plan_year_end_date"] = f"{start_year - 1}-12-31"
+    raw.setdefault("simulation", {}).update(
+        {
+            "start_year": start_year,
+            "end_year": start_year + case.years - 1,
+            "random_seed": seed,
+        }
+    )
+    path = case_dir / "config.yaml"
+    path.write_text(
+        yaml.safe_dump(raw, default_flow_style=False, sort_keys=False), encoding="utf-8"
+    )
+    return path
+
+
+def read_trace_metrics(trace_path: Path) -> Dict[str, Any]:
+    """CPU, peak RSS, dbt counts and per-stage seconds from a run trace."""
+    from planalign_orchestrator.monitoring.horizon import (
+        fit_horizon_growth,
+        timings_from_trace_spans,
+    )
+    from planalign_orchestrator.monitoring.tracing import load_trace_spans
+
+    spans = load_trace_spans(trace_path)
+    run = next((s for s in spans if s["category"] == "run"), None)
+    stage_seconds: Dict[str, float] = {}
+    for span in spans:
+        if span["category"] == "stage":
+            stage_seconds[span["name"]] = round(
+                stage_seconds.get(span["name"], 0.0) + span["duration_seconds"], 3
+            )
+    return {
+        "cpu_seconds": run.get("tree_cpu_seconds") if run else None,
+        "peak_rss_mb": run.get("peak_tree_rss_mb") if run else None,
+        "dbt_invocations": sum(1 for s in spans if s["category"] == "dbt_invocation"),
+        "dbt_nodes": sum(1 for s in spans if s["category"] == "dbt_node"),
+        "stage_seconds": stage_seconds,
+        "horizon_growth": {
+            finding.model: finding.exponent
+            for finding in fit_horizon_growth(timings_from_trace_spans(spans))
+            if finding.flagged
+        },
+    }
+
+
+def run_benchmark(
+    cases: Sequence[BenchmarkCase],
+    *,
+    profile: CensusProfile,
+    config_path: Path,
+    workdir: Path,
+    start_year: int,
+    seed: int = 42,
+    dbt_project_dir: Optional[Path] = None,
+    threads: Optional[int] = None,
+    params_dir: Optional[Path] = None,
+    deferral_defaults: Optional[DeferralDefaults] = None,
+    timeout_seconds: Optional[float] = None,
+    executor: Optional[CommandExecutor] = None,
+    on_result: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> BenchmarkReport:
+    """Run ``cases`` and return the report (without scaling analysis).
+
+    Once a case fails or times out, larger sizes at the same horizon are
+    recorded as ``skipped`` rather than attempted.
+    """
+    from planalign_orchestrator.monitoring.tracing import trace_path_for
+
+    executor = executor or _run_subprocess
+    workdir.mkdir(parents=True, exist_ok=True)
+    census_profile = replace(profile, as_of=f"{start_year - 1}-12-31")
+    digest = _profile_digest(census_profile)
+    censuses: Dict[int, tuple[Path, float]] = {}
+    blocked_horizons: Dict[int, int] = {}
+    results: List[BenchmarkResult] = []
+
+    for case in cases:
+        if case.employees > blocked_horizons.get(case.years, math.inf):
+            result = BenchmarkResult(
+                case.employees,
+                case.years,
+                "skipped",
+                error=f"a smaller case failed at {case.years} years",
+            )
+        else:
+            if case.employees not in censuses:
+                census = workdir / f"census_{case.employees}_{seed}_{digest}.parquet"
+                census_seconds = 0.0
+                if not census.exists():
+                    census_seconds = write_census(
+                        census_profile,
+                        case.employees,
+                        census,
+                        seed=seed,
+                        deferral_defaults=deferral_defaults,
+                    ).seconds
+                censuses[case.employees] = (census, census_seconds)
+            census, census_seconds = censuses[case.employees]
+            result = _run_case(
+                case,
+                census,
+                census_seconds,
+                config_path=config_path,
+                workdir=workdir,
+                start_year=start_year,
+                seed=seed,
+                dbt_project_dir=dbt_project_dir,
+                threads=threads,
+                params_dir=params_dir,
+                timeout_seconds=timeout_seconds,
+                executor=executor,
+                trace_path_for=trace_path_for,
+            )
+            if result.status != "ok":
+                blocked_horizons[case.years] = min(
+                    case.employees, blocked_horizons.get(case.years, math.inf)
+                )
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+
+    return BenchmarkReport(
+        generated_at=datetime.now(timezone.utc).isoformat(),
+        planalign_version=_planalign_version(),
+        environment=_environment(),
+        profile_source=profile.source,
+        start_year=start_year,
+        seed=seed,
+        results=results,
+    )
+
+
+def _run_case(
+    case: BenchmarkCase,
+    census: Path,
+    census_seconds: float,
+    *,
+    config_path: Path,
+    workdir: Path,
+    start_year: int,
+    seed: int,
+    dbt_project_dir: Optional[Path],
+    threads: Optional[int],
+    params_dir: Optional[Path],
+    timeout_seconds: Optional[float],
+    executor: CommandExecutor,
+    trace_path_for: Callable[[Path], Path],
+) -> BenchmarkResult:
+    case_dir = workdir / case.case_id
+    case_dir.mkdir(parents=True, exist_ok=True)
+    database = case_dir / "simulation.duckdb"
+    for stale in (database, trace_path_for(database)):
+        stale.unlink(missing_ok=True)
+    config = _write_case_config(config_path, census, case, start_year, seed, case_dir)
+    end_year = start_year + case.years - 1
+    years = f"{start_year}-{end_year}" if end_year != start_year else str(start_year)
+    command = [
+        sys.executable,
+        "-m",
+        "planalign_cli.main",
+        "simulate",
+        years,
+        "--config",
+        str(config),
+        "--database",
+        str(database),
+        "--trace",
+    ]
+    if dbt_project_dir is not None:
+        command += ["--dbt-project-dir", str(dbt_project_dir)]
+    if threads is not None:
+        command += ["--threads", str(threads)]
+    if params_dir is not None:
+        command += ["--params", str(params_dir)]
+    env = {**os.environ, "PLANALIGN_ENTRY_POINT": "perf_harness"}
+
+    started = time.perf_counter()
+    try:
+        code = executor(command, env, case_dir / "simulate.log", timeout_seconds)
+    except subprocess.TimeoutExpired:
+        return BenchmarkResult(
+            case.employees,
+            case.years,
+            "timeout",
+            census_seconds=census_seconds,
+            error=f"exceeded {timeout_seconds:g}s",
+        )
+    wall = time.perf_counter() - started
+    trace = trace_path_for(database)
+    if code != 0 or not trace.exists():
+        return BenchmarkResult(
+            case.employees,
+            case.years,
+            "failed",
+            wall_seconds=wall,
+            census_seconds=census_seconds,
+            error=f"exit code {code}; see {case_dir / 'simulate.log'}",
+        )
+    return BenchmarkResult(
+        case.employees,
+        case.years,
+        "ok",
+        wall_seconds=round(wall, 3),
+        census_seconds=round(census_seconds, 3),
+        **read_trace_metrics(trace),
+    )
+
+
+def _planalign_version() -> str:
+    from _version import __version__
+
+    return __version__
+
+
+def _environment() -> Dict[str, Any]:
+    import duckdb
+    import psutil
+
+    return {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "duckdb": duckdb.__version__,
+        "cpu_count": os.cpu_count(),
+        "memory_gb": round(psutil.virtual_memory().total / 1024**3, 1),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Analysis
+# ---------------------------------------------------------------------------
+
+
+def analyse_scaling(
+    results: Sequence[BenchmarkResult], tolerance: float = SUPERLINEAR_TOLERANCE
+) -> List[ScalingFinding]:
+    """Log-log slopes between neighbouring sizes (per horizon) and horizons (per size)."""
+    findings: List[ScalingFinding] = []
+    ok = [r for r in results if r.status == "ok"]
+    for dimension, held_key in (("employees", "years"), ("years", "employees")):
+        groups: Dict[int, List[BenchmarkResult]] = {}
+        for result in ok:
+            groups.setdefault(getattr(result, held_key), []).append(result)
+        for held, group in sorted(groups.items()):
+            group.sort(key=lambda r: getattr(r, dimension))
+            for low, high in zip(group, group[1:]):
+                x_low, x_high = getattr(low, dimension), getattr(high, dimension)
+                for metric in SCALED_METRICS:
+                    y_low, y_high = getattr(low, metric), getattr(high, metric)
+                    if not y_low or not y_high or x_high <= x_low:
+                        continue
+                    exponent = math.log(y_high / y_low) / math.log(x_high / x_low)
+                    findings.append(
+                        ScalingFinding(
+                            metric=metric,
+                            dimension=dimension,
+                            held=held,
+                            lower=x_low,
+                            upper=x_high,
+                            exponent=round(exponent, 3),
+                            superlinear=exponent > 1 + tolerance,
+                        )
+                    )
+    return findings
+
+
+def compare_to_baseline(
+    report: BenchmarkReport,
+    baseline: BenchmarkReport,
+    tolerance: float = REGRESSION_TOLERANCE,
+) -> List[Regression]:
+    """Metrics of cases both reports ran that grew by more than ``tolerance``."""
+    previous = {r.case_id: r for r in baseline.results if r.status == "ok"}
+    regressions: List[Regression] = []
+    for result in report.results:
+        before = previous.get(result.case_id)
+        if result.status != "ok" or before is None:
+            continue
+        for metric in SCALED_METRICS:
+            old, new = getattr(before, metric), getattr(result, metric)
+            if old and new and new > old * (1 + tolerance):
+                regressions.append(Regression(result.case_id, metric, old, new))
+    return regressions
@@ -15,8 +15,8 @@ from rich.table import Table
 from planalign_backtest import BacktestError, BacktestOptions, MetricThresholds
 from planalign_backtest.errors import SimulationFailure
 from planalign_backtest.models import Threshold
-from planalign_backtest.report import write_scorecard
-from planalign_backtest.runner import run_backtest
+from planalign_backtest.report import write_rolling_scorecard, write_scorecard
+from planalign_backtest.runner import run_backtest, run_rolling_backtest
 from planalign_fit import FitOptions, PackError, SnapshotError, write_pack
 from planalign_fit.promotion import (
     DEFAULT_LEVEL_COVERAGE_THRESHOLD,
@@ -82,6 +82,29 @@ def _render(run, destination: Path) -> None:
     )
 
 
+def _render_rolling(rolling, destination: Path) -> None:
+    boundaries = [origin.split.boundary_year for origin in rolling.scorecard.origins]
+    table = Table("Metric", *(str(year) for year in boundaries), "Trend")
+    for trend in rolling.scorecard.trends:
+        table.add_row(
+            trend.metric,
+            *(
+                "—" if error is None else f"{error:+.2%}"
+                for error in trend.percent_errors
+            ),
+            "—" if trend.slope is None else f"{trend.slope:+.2%}/yr",
+        )
+    console.print(table)
+    console.print(
+        f"[bold]Rolling verdict: {rolling.scorecard.verdict.upper()}[/bold] — "
+        f"{rolling.scorecard.verdict_summary}"
+    )
+    console.print(
+        "[green]Rolling scorecard:[/green] "
+        f"{destination / 'backtest' / 'rolling_scorecard.md'}"
+    )
+
+
 def run_backtest_command(
     ctx: typer.Context,
     snapshots_dir: Path = typer.Argument(
@@ -112,6 +135,18 @@ def run_backtest_command(
     separation_exposure_gate: float = typer.Option(
         DEFAULT_SEPARATION_EXPOSURE_GATE, "--separation-exposure-gate"
     ),
+    rolling: bool = typer.Option(
+        False,
+        "--rolling",
+        help="Backtest every feasible boundary year and report per-origin error trends",
+    ),
+    parallel: Optional[int] = typer.Option(
+        None,
+        "--parallel",
+        "-p",
+        min=1,
+        help="Concurrent fits/seed simulations (default: sized from CPU and memory)",
+    ),
 ) -> None:
     """Fit on early snapshots and score simulations against held-out history."""
     try:
@@ -164,6 +199,7 @@ def run_backtest_command(
             overridden_thresholds=moved,
             notes=notes,
             verbose=verbose,
+            parallel=parallel,
         )
     except (ValueError, ValidationError) as exc:
         console.print(f"[red]{exc}[/red]")
@@ -184,10 +220,17 @@ def run_backtest_command(
             f"[blue]Backtesting {snapshots_dir} across seeds "
             f"{', '.join(str(seed) for seed in options.seeds)}[/blue]"
         )
-        run = run_backtest(snapshots_dir, options)
+        rolling_run = None
+        if rolling:
+            rolling_run = run_rolling_backtest(snapshots_dir, options)
+            run = rolling_run.origins[-1]
+        else:
+            run = run_backtest(snapshots_dir, options)
         destination = output or Path("var/param_packs") / run.pack.manifest.pack_id
         write_pack(run.pack, destination, force=force)
         write_scorecard(run.scorecard, destination, force=force)
+        if rolling_run is not None:
+            write_rolling_scorecard(rolling_run.scorecard, destination, force=force)
     except SimulationFailure as exc:
         console.print(f"[red]{exc}[/red]")
         raise typer.Exit(EXIT_SIMULATION) from exc
@@ -195,3 +238,5 @@ def run_backtest_command(
         console.print(f"[red]{exc}[/red]")
         raise typer.Exit(EXIT_REJECTED) from exc
     _render(run, destination)
+    if rolling_run is not None:
+        _render_rolling(rolling_run, destination)
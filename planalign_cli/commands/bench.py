@@ -0,0 +1,348 @@
+"""``planalign bench`` -- synthetic censuses and the scale benchmark suite.
+
+``census`` writes a census of any size sampled from a profile, ``profile``
+fits that profile from a real census, and ``run`` runs the full pipeline over
+a matrix of census sizes and horizons and records the results as a JSON
+baseline.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from planalign_bench import (
+    DEFAULT_HORIZONS,
+    DEFAULT_SIZES,
+    BenchmarkResult,
+    CensusProfile,
+    ProfileError,
+    analyse_scaling,
+    build_cases,
+    compare_to_baseline,
+    default_profile,
+    fit_profile,
+    load_profile,
+    load_report,
+    pack_deferral_defaults,
+    run_benchmark,
+    save_profile,
+    write_census,
+    write_report,
+)
+from planalign_fit.apply import REPO_ROOT
+from planalign_fit.pack import PackError, load_pack
+
+console = Console()
+
+EXIT_BAD_INPUT = 2
+EXIT_FLAGGED = 3
+
+DEFAULT_BENCH_DIR = REPO_ROOT / "var" / "bench"
+DEFAULT_CONFIG = REPO_ROOT / "config" / "simulation_config.yaml"
+
+bench_app = typer.Typer(
+    help="Synthetic censuses and the scale benchmark suite.",
+    no_args_is_help=True,
+    rich_markup_mode="rich",
+)
+
+
+def _parse_counts(value: str, option: str) -> List[int]:
+    try:
+        counts = [
+            int(part.replace("_", "")) for part in value.split(",") if part.strip()
+        ]
+    except ValueError:
+        counts = []
+    if not counts or any(count < 1 for count in counts):
+        console.print(
+            f"[red]{option} must be a comma-separated list of positive integers[/red]"
+        )
+        raise typer.Exit(EXIT_BAD_INPUT)
+    return counts
+
+
+def _resolve_profile(
+    profile_path: Optional[Path], from_census: Optional[Path], seeds_dir: Optional[Path]
+) -> CensusProfile:
+    if profile_path is not None and from_census is not None:
+        console.print("[red]Use either --profile or --from-census, not both[/red]")
+        raise typer.Exit(EXIT_BAD_INPUT)
+    try:
+        if profile_path is not None:
+            return load_profile(profile_path)
+        if from_census is not None:
+            return fit_profile(from_census, seeds_dir=seeds_dir)
+        return default_profile(seeds_dir)
+    except ProfileError as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise typer.Exit(EXIT_BAD_INPUT) from exc
+
+
+def _pack_defaults(params: Optional[Path]):
+    if params is None:
+        return None
+    try:
+        return pack_deferral_defaults(load_pack(params))
+    except PackError as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise typer.Exit(EXIT_BAD_INPUT) from exc
+
+
+@bench_app.command("census")
+def census(
+    employees: int = typer.Option(
+        ..., "--employees", "-n", min=1, help="Rows to generate"
+    ),
+    output: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Parquet path (default: var/bench/census_<N>.parquet)",
+    ),
+    profile: Optional[Path] = typer.Option(
+        None,
+        "--profile",
+        exists=True,
+        readable=True,
+        help="Profile JSON from `bench profile`",
+    ),
+    from_census: Optional[Path] = typer.Option(
+        None,
+        "--from-census",
+        exists=True,
+        readable=True,
+        help="Fit the profile from this census",
+    ),
+    params: Optional[Path] = typer.Option(
+        None,
+        "--params",
+        exists=True,
+        help="Parameter pack supplying default deferral rates",
+    ),
+    seed: int = typer.Option(42, "--seed", help="Sampling seed"),
+    seeds_dir: Optional[Path] = typer.Option(
+        None, "--seeds-dir", help="dbt seed directory (default: dbt/seeds)"
+    ),
+) -> None:
+    """Write a synthetic census of any size sampled from a profile."""
+    resolved = _resolve_profile(profile, from_census, seeds_dir)
+    destination = output or DEFAULT_BENCH_DIR / f"census_{employees}.parquet"
+    summary = write_census(
+        resolved,
+        employees,
+        destination,
+        seed=seed,
+        deferral_defaults=_pack_defaults(params),
+        seeds_dir=seeds_dir,
+    )
+    table = Table(show_header=False, box=None, padding=(0, 2, 0, 0))
+    table.add_row("Profile", resolved.source)
+    table.add_row("Census date", resolved.as_of)
+    table.add_row("Employees", f"{summary.employees:,}")
+    table.add_row("Active", f"{summary.active:,}")
+    table.add_row("Participants", f"{summary.participants:,}")
+    table.add_row("Mean age", f"{summary.mean_age:.1f}")
+    table.add_row("Mean compensation", f"${summary.mean_compensation:,.0f}")
+    table.add_row("Seconds", f"{summary.seconds:.1f}")
+    console.print(table)
+    console.print(f"[green]Wrote {summary.path}[/green]")
+
+
+@bench_app.command("profile")
+def profile(
+    census_path: Path = typer.Argument(..., exists=True, readable=True),
+    output: Path = typer.Option(..., "--output", "-o", help="Profile JSON to write"),
+    as_of: Optional[str] = typer.Option(
+        None, "--as-of", help="Census date (default: Dec 31 of the latest hire year)"
+    ),
+    seeds_dir: Optional[Path] = typer.Option(
+        None, "--seeds-dir", help="dbt seed directory (default: dbt/seeds)"
+    ),
+) -> None:
+    """Fit a census profile from a real census; it holds no employee rows."""
+    try:
+        fitted = fit_profile(census_path, seeds_dir=seeds_dir, as_of=as_of)
+    except ProfileError as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise typer.Exit(EXIT_BAD_INPUT) from exc
+    save_profile(fitted, output)
+    for note in fitted.notes:
+        console.print(f"[yellow]{note}[/yellow]")
+    console.print(
+        f"[green]Wrote {output}[/green] ({len(fitted.levels)} levels, as of {fitted.as_of})"
+    )
+
+
+@bench_app.command("run")
+def run(
+    sizes: str = typer.Option(
+        ",".join(str(s) for s in DEFAULT_SIZES), "--sizes", help="Census sizes"
+    ),
+    horizons: str = typer.Option(
+        ",".join(str(h) for h in DEFAULT_HORIZONS), "--horizons", help="Simulated years"
+    ),
+    config: Path = typer.Option(
+        DEFAULT_CONFIG,
+        "--config",
+        "-c",
+        exists=True,
+        readable=True,
+        help="Base config YAML",
+    ),
+    output: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Report JSON (default: var/bench/benchmark_<stamp>.json)",
+    ),
+    baseline: Optional[Path] = typer.Option(
+        None,
+        "--baseline",
+        exists=True,
+        readable=True,
+        help="Previous report to compare to",
+    ),
+    workdir: Path = typer.Option(
+        DEFAULT_BENCH_DIR, "--workdir", help="Censuses, case configs and databases"
+    ),
+    profile_path: Optional[Path] = typer.Option(
+        None,
+        "--profile",
+        exists=True,
+        readable=True,
+        help="Profile JSON from `bench profile`",
+    ),
+    from_census: Optional[Path] = typer.Option(
+        None,
+        "--from-census",
+        exists=True,
+        readable=True,
+        help="Fit the profile from this census",
+    ),
+    params: Optional[Path] = typer.Option(
+        None, "--params", exists=True, help="Parameter pack applied to every run"
+    ),
+    start_year: Optional[int] = typer.Option(
+        None, "--start-year", help="First simulated year (default: the config's)"
+    ),
+    seed: int = typer.Option(42, "--seed", help="Census and simulation seed"),
+    dbt_project_dir: Optional[Path] = typer.Option(
+        None, "--dbt-project-dir", help="Isolated dbt project directory"
+    ),
+    threads: Optional[int] = typer.Option(
+        None, "--threads", help="Number of dbt threads"
+    ),
+    timeout: Optional[float] = typer.Option(
+        None, "--timeout", min=1, help="Seconds allowed per case"
+    ),
+    strict: bool = typer.Option(
+        False, "--strict", help="Exit non-zero on super-linear scaling or regressions"
+    ),
+) -> None:
+    """Run the full pipeline across census sizes and horizons."""
+    import yaml
+
+    cases = build_cases(
+        _parse_counts(sizes, "--sizes"), _parse_counts(horizons, "--horizons")
+    )
+    resolved = _resolve_profile(profile_path, from_census, None)
+    if start_year is None:
+        raw = yaml.safe_load(config.read_text(encoding="utf-8")) or {}
+        start_year = int(raw.get("simulation", {}).get("start_year", 2025))
+    previous = load_report(baseline) if baseline is not None else None
+
+    console.print(f"Running {len(cases)} cases in {workdir}")
+    report = run_benchmark(
+        cases,
+        profile=resolved,
+        config_path=config,
+        workdir=workdir,
+        start_year=start_year,
+        seed=seed,
+        dbt_project_dir=dbt_project_dir,
+        threads=threads,
+        params_dir=params,
+        deferral_defaults=_pack_defaults(params),
+        timeout_seconds=timeout,
+        on_result=_print_result,
+    )
+    report.scaling = analyse_scaling(report.results)
+    if previous is not None:
+        report.regressions = compare_to_baseline(report, previous)
+
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    destination = write_report(
+        report, output or DEFAULT_BENCH_DIR / f"benchmark_{stamp}.json"
+    )
+    _render_report(report.results)
+    for finding in report.scaling:
+        if finding.superlinear:
+            console.print(
+                f"[yellow]Super-linear {finding.metric}: {finding.dimension} "
+                f"{finding.lower:,} -> {finding.upper:,} (at {finding.held:,}) "
+                f"scales as ^{finding.exponent:.2f}[/yellow]"
+            )
+    for result in report.results:
+        for model, exponent in result.horizon_growth.items():
+            console.print(
+                f"[yellow]Horizon scaling {result.case_id}: {model} per-year time "
+                f"grows ~ year^{exponent:.2f}[/yellow]"
+            )
+    for regression in report.regressions:
+        console.print(
+            f"[yellow]Regression {regression.case_id} {regression.metric}: "
+            f"{regression.baseline:,.1f} -> {regression.current:,.1f} "
+            f"({regression.ratio:.2f}x)[/yellow]"
+        )
+    console.print(f"[green]Wrote {destination}[/green]")
+    if strict and report.flagged:
+        raise typer.Exit(EXIT_FLAGGED)
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    if result.status == "ok":
+        console.print(
+            f"  {result.case_id}: {result.wall_seconds:,.1f}s wall, "
+            f"{result.peak_rss_mb or 0:,.0f} MB peak"
+        )
+    else:
+        console.print(
+            f"  {result.case_id}: [red]{result.status}[/red] {result.error or ''}"
+        )
+
+
+def _render_report(results: List[BenchmarkResult]) -> None:
+    table = Table(title="Benchmark")
+    for column in (
+        "Employees",
+        "Years",
+        "Status",
+        "Wall s",
+        "CPU s",
+        "Peak MB",
+        "dbt runs",
+    ):
+        table.add_column(column, justify="right" if column != "Status" else "left")
+    for result in results:
+        table.add_row(
+            f"{result.employees:,}",
+            str(result.years),
+            result.status,
+            *(
+                "—" if value is None else f"{value:,.1f}"
+                for value in (
+                    result.wall_seconds,
+                    result.cpu_seconds,
+                    result.peak_rss_mb,
+                )
+            ),
+            "—" if result.dbt_invocations is None else str(result.dbt_invocations),
+        )
+    console.print(table)
@@ -27,6 +27,7 @@ from planalign_fit import (
     write_pack,
 )
 from planalign_fit.bands import BandDefinitionError
+from planalign_fit.bootstrap import DEFAULT_BOOTSTRAP_LEVEL
 from planalign_fit.priors import PriorsError
 from planalign_fit.promotion import (
     DEFAULT_LEVEL_COVERAGE_THRESHOLD,
@@ -100,6 +101,27 @@ def run_fit(
     force: bool = typer.Option(
         False, "--force", help="Replace an existing pack directory"
     ),
+    bootstrap: int = typer.Option(
+        0,
+        "--bootstrap",
+        help="Refit this many employee resamples and publish percentile "
+        "intervals for every fitted value (0 = point estimates only)",
+    ),
+    bootstrap_seed: int = typer.Option(
+        0, "--bootstrap-seed", help="Seed for the bootstrap resamples"
+    ),
+    bootstrap_level: float = typer.Option(
+        DEFAULT_BOOTSTRAP_LEVEL,
+        "--bootstrap-level",
+        help="Coverage of the published percentile intervals",
+    ),
+    parallel: Optional[int] = typer.Option(
+        None,
+        "--parallel",
+        "-p",
+        help="Worker processes for bootstrap replicates (default: sized from "
+        "available CPU and memory)",
+    ),
 ) -> None:
     """📐 Fit simulation parameters from historical census snapshots."""
     options = FitOptions(
@@ -111,11 +133,24 @@ def run_fit(
         config_path=config,
         pack_id=pack_id,
         notes=notes,
+        bootstrap_replicates=bootstrap,
+        bootstrap_seed=bootstrap_seed,
+        bootstrap_level=bootstrap_level,
+        parallel=parallel,
     )
 
     if credibility_k < 0 or min_exposure < 0:
         console.print("[red]--credibility-k and --min-exposure must be >= 0[/red]")
         raise typer.Exit(EXIT_BAD_INPUT)
+    if bootstrap < 0 or not 0 < bootstrap_level < 1:
+        console.print(
+            "[red]--bootstrap must be >= 0 and --bootstrap-level strictly "
+            "between 0 and 1[/red]"
+        )
+        raise typer.Exit(EXIT_BAD_INPUT)
+    if parallel is not None and parallel < 1:
+        console.print("[red]--parallel must be >= 1[/red]")
+        raise typer.Exit(EXIT_BAD_INPUT)
 
     # Never silently clamped: a clamped threshold produces a fit that looks
     # legitimate but answers a different question than the one asked.
@@ -183,6 +218,12 @@ def _render_summary(run: FitRun, destination: Path) -> None:
         "Could not be fitted",
         f"[yellow]{len(result.unfittable)}[/yellow]" if result.unfittable else "0",
     )
+    if result.bootstrap is not None:
+        table.add_row(
+            "Bootstrap",
+            f"{result.bootstrap.replicates:,} replicates, "
+            f"{result.bootstrap.level:.0%} intervals",
+        )
     table.add_row("Pack fingerprint", run.pack.manifest.fingerprint[:16] + "…")
 
     console.print(
@@ -114,7 +114,7 @@ def _render_dry_run(spec: OptimizerSpec, max_runs: int, seed: int) -> None:
     if remaining > 0:
         console.print(
             f"[dim]Up to {remaining} additional refinement candidate(s) will be "
-            "chosen after evaluating the seed phase and are not previewable here.[/dim]"
+            "chosen as seed-phase results arrive and are not previewable here.[/dim]"
         )
 
 
@@ -0,0 +1,94 @@
+"""Build, summarize and export the on-demand payroll ledger of a run database."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Optional
+
+import duckdb
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from planalign_orchestrator.payroll_ledger import (
+    PayrollLedger,
+    PayrollLedgerError,
+    ledger_directory,
+)
+from planalign_orchestrator.resources.duckdb_profile import read_connection_config
+
+console = Console()
+
+EXPORT_FORMATS = (".csv", ".parquet")
+
+
+def export_payroll_ledger(
+    database: Path,
+    years: Optional[List[int]] = None,
+    employee_ids: Optional[List[str]] = None,
+    output: Optional[Path] = None,
+    rebuild: bool = False,
+) -> None:
+    """Summarize the ledger per year, or write its rows to ``output``.
+
+    Whole years are cached beside the database as they are built; a request
+    for specific employees computes only their rows.
+    """
+    if not database.is_file():
+        console.print(f"[red]Database not found: {database}[/red]")
+        raise typer.Exit(1)
+    if output is not None and output.suffix.lower() not in EXPORT_FORMATS:
+        console.print(
+            f"[red]--output must end in {' or '.join(EXPORT_FORMATS)}: {output}[/red]"
+        )
+        raise typer.Exit(2)
+
+    with duckdb.connect(
+        str(database), read_only=True, config=read_connection_config()
+    ) as connection:
+        ledger = PayrollLedger(connection, ledger_directory(database))
+        try:
+            if rebuild:
+                ledger.materialize(years, force=True)
+            relation = ledger.query(years, employee_ids or None)
+            if output is not None:
+                output.parent.mkdir(parents=True, exist_ok=True)
+                if output.suffix.lower() == ".csv":
+                    relation.write_csv(str(output))
+                else:
+                    relation.write_parquet(str(output), compression="zstd")
+                rows = relation.aggregate("count(*)").fetchone()[0]
+                console.print(f"Wrote {rows:,} payroll ledger rows to {output}")
+                return
+            summary = (
+                relation.aggregate(
+                    "simulation_year, any_value(total_periods_in_year), "
+                    "count(DISTINCT employee_id), count(*), sum(period_earnings)",
+                    "simulation_year",
+                )
+                .order("simulation_year")
+                .fetchall()
+            )
+            cached = set(ledger.cached_years())
+        except PayrollLedgerError as exc:
+            console.print(f"[red]{exc}[/red]")
+            raise typer.Exit(1) from exc
+
+    table = Table(title=f"Payroll ledger — {database}")
+    table.add_column("Year", justify="right")
+    table.add_column("Pay periods", justify="right")
+    table.add_column("Employees", justify="right")
+    table.add_column("Rows", justify="right")
+    table.add_column("Total earnings", justify="right")
+    table.add_column("Cached", justify="center")
+    for year, periods, employees, rows, earnings in summary:
+        table.add_row(
+            str(year),
+            str(periods),
+            f"{employees:,}",
+            f"{rows:,}",
+            f"${float(earnings or 0):,.2f}",
+            "✓" if year in cached else "",
+        )
+    console.print(table)
+    console.print(f"[dim]Cache: {ledger.directory}[/dim]")
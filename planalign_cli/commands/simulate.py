@@ -39,7 +39,7 @@ from planalign_core.constants import DATABASE_FILENAME
 console = Console()
 simulate_command = typer.Typer()
 
-_ALLOWED_SUBPROCESS_ENTRY_POINTS = {"studio"}
+_ALLOWED_SUBPROCESS_ENTRY_POINTS = {"studio", "perf_harness"}
 
 
 def _resolve_entry_point() -> str:
@@ -75,6 +75,11 @@ def run_simulation(
         False, "--fail-on-validation-error", help="Fail simulation on validation errors"
     ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed output"),
+    trace: bool = typer.Option(
+        False,
+        "--trace",
+        help="Write a span trace (simulation.trace.json) beside the database",
+    ),
     growth: Optional[str] = typer.Option(
         None, "--growth", help="Target growth rate (e.g., '3.5%' or '0.035')"
     ),
@@ -223,6 +228,7 @@ def run_simulation(
             dry_run=dry_run,
             verbose=verbose,
             progress_callback=progress_tracker,
+            trace=trace,
         )
 
         try:
@@ -488,6 +494,8 @@ def _show_simulation_summary(summary, start_year: int, end_year: int, verbose: b
         summary_info.append(f"📊 Net growth: {summary.growth_analysis}")
 
     console.print(Panel("\n".join(summary_info), title="Results", border_style="green"))
+    _show_horizon_growth(summary)
+    _show_spill(summary)
 
     if verbose:
         # Show additional details if available
@@ -502,6 +510,26 @@ def _show_simulation_summary(summary, start_year: int, end_year: int, verbose: b
                 console.print(f"   {key}: {value}")
 
 
+def _show_horizon_growth(summary) -> None:
+    """Warn about models whose per-year cost grows with the horizon."""
+    flagged = [f for f in getattr(summary, "horizon_growth", None) or [] if f.flagged]
+    if not flagged:
+        return
+    console.print(
+        "\n⚠️  [bold yellow]Horizon scaling[/bold yellow] "
+        "[dim](cost per year rising with the year index)[/dim]"
+    )
+    for finding in flagged:
+        console.print(f"  • [yellow]{finding.describe()}[/yellow]")
+
+
+def _show_spill(summary) -> None:
+    """Report DuckDB spill when the run used a resource profile."""
+    spill = getattr(summary, "spill", None)
+    if spill is not None and spill.spilled:
+        console.print(f"\n💾 [dim]{spill.describe()}[/dim]")
+
+
 # Default command (required for `planwise simulate 2025` syntax)
 @simulate_command.command(name="", hidden=True)
 def default(
@@ -513,6 +541,7 @@ def default(
     dry_run: bool = typer.Option(False, "--dry-run"),
     fail_on_validation_error: bool = typer.Option(False, "--fail-on-validation-error"),
     verbose: bool = typer.Option(False, "--verbose", "-v"),
+    trace: bool = typer.Option(False, "--trace"),
     growth: Optional[str] = typer.Option(
         None, "--growth", help="Target growth rate (e.g., '3.5%' or '0.035')"
     ),
@@ -537,6 +566,7 @@ def default(
         dry_run=dry_run,
         fail_on_validation_error=fail_on_validation_error,
         verbose=verbose,
+        trace=trace,
         growth=growth,
         seeds=seeds,
         seed_list=seed_list,
@@ -1072,6 +1102,8 @@ def _show_enhanced_simulation_summary(
         )
 
     console.print(summary_table)
+    _show_horizon_growth(summary)
+    _show_spill(summary)
 
     # Recommendations and next steps
     recommendations = [
@@ -18,6 +18,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from planalign_orchestrator.baseline_cache import CACHE_DIRNAME, BaselineCache
 from planalign_orchestrator.change_validation import (
     ChangeValidationError,
     FrozenValidationResult,
@@ -96,7 +97,8 @@ def _render_scale(result: ScaleResult) -> Table:
     )
     t.add_row(
         "wall time",
-        f"{result.baseline.wall_s:.1f}s",
+        f"{result.baseline.wall_s:.1f}s"
+        + (" [dim](cached)[/dim]" if result.baseline.cached else ""),
         f"{result.candidate.wall_s:.1f}s",
         _delta_pct(result.baseline.wall_s, result.candidate.wall_s),
     )
@@ -189,6 +191,9 @@ def run_validate_change(
     exclusions: Optional[Path] = None,
     phase: Optional[str] = None,
     checkpoint: Optional[str] = None,
+    baseline_cache: bool = True,
+    cache_dir: Optional[Path] = None,
+    cache_baseline_db: bool = False,
 ) -> None:
     """Validate the current uncommitted change is output-neutral (see module doc)."""
     repo_root = _repo_root()
@@ -248,6 +253,15 @@ def run_validate_change(
     def log(msg: str) -> None:
         console.print(f"[dim]  {msg}[/dim]")
 
+    cache = (
+        BaselineCache(
+            (cache_dir or repo_root / CACHE_DIRNAME).resolve(),
+            store_database=cache_baseline_db,
+        )
+        if baseline_cache
+        else None
+    )
+
     try:
         result = run_validation_campaign(
             repo_root=repo_root,
@@ -257,6 +271,7 @@ def run_validate_change(
             workdir=work,
             keep_dbs=keep_dbs,
             log=log,
+            cache=cache,
         )
     except ChangeValidationError as exc:
         console.print(f"[red]validate-change: {exc}[/red]")
@@ -200,6 +200,7 @@ class OrchestratorWrapper:
         dry_run: bool = False,
         verbose: Optional[bool] = None,
         progress_callback=None,
+        trace: bool = False,
     ) -> Union[PipelineOrchestrator, "ProgressAwareOrchestrator"]:
         """Create a configured PipelineOrchestrator instance."""
         if verbose is None:
@@ -218,6 +219,7 @@ class OrchestratorWrapper:
                 entry_point=self.entry_point,
                 verbose=verbose,
                 dry_run=dry_run,
+                trace=trace,
             )
         )
         orchestrator = result.orchestrator
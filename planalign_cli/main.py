@@ -14,21 +14,48 @@ from typing import List, Optional
 
 import typer
 from rich.console import Console
-from planalign_ensemble.models import METRIC_REGISTRY
-
-from .commands.studio import launch_studio
-from .commands.sync import (
-    sync_init,
-    sync_push,
-    sync_pull,
-    sync_status as sync_status_cmd,
-    sync_log,
-    sync_disconnect,
-)
+
+from .utils.lazy_commands import LazyCommand, LazyTyperGroup
 
 # Initialize Rich console
 console = Console()
 
+
+class PlanalignGroup(LazyTyperGroup):
+    """Top-level group; command modules load only when their command runs.
+
+    Wrapper commands below keep their implementation imports inside the function
+    body for the same reason. ``tests/performance/test_cli_startup.py`` holds the
+    import-time budget.
+    """
+
+    # Fast compensation calibration (Feature 105), evidence loop I (issue #458),
+    # backtests, the optimizer and the benchmark suite carry their full typer
+    # signatures in their own modules, so they are registered by import path.
+    lazy_commands = {
+        "calibrate": LazyCommand(
+            "planalign_cli.commands.calibrate:run_calibration",
+            "⚡ Fast compensation calibration -- tune comp growth without a full sim.",
+        ),
+        "fit": LazyCommand(
+            "planalign_cli.commands.fit:run_fit",
+            "📐 Fit simulation parameters from historical census snapshots.",
+        ),
+        "backtest": LazyCommand(
+            "planalign_cli.commands.backtest:run_backtest_command",
+            "Fit on early snapshots and score simulations against held-out history.",
+        ),
+        "optimize": LazyCommand(
+            "planalign_cli.commands.optimize:run_optimize",
+            "Search a bounded plan-design space and retain every candidate result.",
+        ),
+        "bench": LazyCommand(
+            "planalign_cli.commands.bench:bench_app",
+            "Synthetic censuses of any size and the scale benchmark suite.",
+        ),
+    }
+
+
 # Main app
 app = typer.Typer(
     name="planalign",
@@ -36,6 +63,7 @@ app = typer.Typer(
     rich_markup_mode="rich",
     no_args_is_help=True,
     add_completion=True,
+    cls=PlanalignGroup,
 )
 
 
@@ -73,29 +101,6 @@ def main(
     pass
 
 
-# Register commands directly instead of as command groups
-from .commands.simulate import run_simulation  # noqa: E402
-from .commands.status import show_status, health_check  # noqa: E402
-from .commands.batch import run_batch  # noqa: E402
-from .commands.validate import validate_config  # noqa: E402
-from .commands.calibrate import run_calibration  # noqa: E402
-from .commands.fit import run_fit  # noqa: E402
-from .commands.backtest import run_backtest_command  # noqa: E402
-from .commands.optimize import run_optimize  # noqa: E402
-from .commands.provenance import generate_provenance_report  # noqa: E402
-from .commands.validate_change import run_validate_change  # noqa: E402
-
-# Fast compensation calibration (Feature 105) -- run_calibration already carries
-# its full typer signature, so register it directly.
-app.command("calibrate")(run_calibration)
-
-# Evidence loop I (issue #458): fit parameters from census history. run_fit
-# carries its full typer signature too.
-app.command("fit")(run_fit)
-app.command("backtest")(run_backtest_command)
-app.command("optimize")(run_optimize)
-
-
 @app.command("evidence-pack")
 def evidence_pack(
     scenario_path: Path = typer.Argument(
@@ -112,6 +117,8 @@ def evidence_pack(
     ),
 ):
     """Generate a cited driver decomposition from an existing scenario result."""
+    from planalign_ensemble.models import METRIC_REGISTRY
+
     if metric not in METRIC_REGISTRY:
         choices = ", ".join(METRIC_REGISTRY)
         raise typer.BadParameter(
@@ -136,9 +143,35 @@ def provenance(
     ),
 ):
     """Generate a tamper-evident audit report without rerunning a simulation."""
+    from .commands.provenance import generate_provenance_report
+
     generate_provenance_report(run_id, output_dir, workspaces_root, force)
 
 
+@app.command("payroll-ledger")
+def payroll_ledger(
+    database: Path = typer.Option(
+        Path("dbt/simulation.duckdb"), "--database", help="Path to a run's DuckDB file"
+    ),
+    year: List[int] = typer.Option(
+        [], "--year", help="Simulation year; repeat for several (default: all)"
+    ),
+    employee: List[str] = typer.Option(
+        [], "--employee", help="Employee ID; repeat for several (default: everyone)"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Write rows to a .csv or .parquet file"
+    ),
+    rebuild: bool = typer.Option(
+        False, "--rebuild", help="Rebuild cached years even if they are current"
+    ),
+):
+    """Build the per-pay-period payroll ledger on demand and summarize or export it."""
+    from .commands.payroll_ledger import export_payroll_ledger
+
+    export_payroll_ledger(database, year or None, employee or None, output, rebuild)
+
+
 # Main simulate command - direct access
 @app.command("simulate")
 def simulate(
@@ -162,6 +195,11 @@ def simulate(
         False, "--fail-on-validation-error", help="Fail simulation on validation errors"
     ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed output"),
+    trace: bool = typer.Option(
+        False,
+        "--trace",
+        help="Write a span trace (simulation.trace.json) beside the database",
+    ),
     growth: Optional[str] = typer.Option(
         None, "--growth", help="Target growth rate (e.g., '3.5%' or '0.035')"
     ),
@@ -203,6 +241,8 @@ def simulate(
     ),
 ):
     """🎯 Run multi-year workforce simulation with Rich progress tracking."""
+    from .commands.simulate import run_simulation
+
     run_simulation(
         years=years,
         config=config,
@@ -212,6 +252,7 @@ def simulate(
         dry_run=dry_run,
         fail_on_validation_error=fail_on_validation_error,
         verbose=verbose,
+        trace=trace,
         growth=growth,
         params=params,
         seeds=seeds,
@@ -269,13 +310,31 @@ def validate_change(
     checkpoint: Optional[str] = typer.Option(
         None, "--checkpoint", help="Optional phase checkpoint identifier"
     ),
+    baseline_cache: bool = typer.Option(
+        True,
+        "--baseline-cache/--no-baseline-cache",
+        help="Reuse cached HEAD baselines keyed by commit, config, census and horizon",
+    ),
+    cache_dir: Optional[Path] = typer.Option(
+        None,
+        "--cache-dir",
+        help="Baseline cache directory (default: <repo>/.planalign_baseline_cache)",
+    ),
+    cache_baseline_db: bool = typer.Option(
+        False,
+        "--cache-baseline-db",
+        help="Also cache the baseline DuckDB so mismatches report exact row diffs",
+    ),
 ):
     """✅ Validate an uncommitted change is output-neutral (isolated-DB parity gate).
 
     Builds HEAD (baseline, your change stashed) and the working tree (candidate) into
     isolated DBs and compares mart parity, dbt invocation count, and peak RSS. Never
-    touches the shared dev DB. Exits non-zero on any mismatch.
+    touches the shared dev DB. Exits non-zero on any mismatch. Baselines are cached,
+    so repeat validations of the same change only build the candidate.
     """
+    from .commands.validate_change import run_validate_change
+
     run_validate_change(
         census=census,
         config=config,
@@ -288,6 +347,9 @@ def validate_change(
         exclusions=exclusions,
         phase=phase,
         checkpoint=checkpoint,
+        baseline_cache=baseline_cache,
+        cache_dir=cache_dir,
+        cache_baseline_db=cache_baseline_db,
     )
 
 
@@ -305,6 +367,8 @@ def status(
     ),
 ):
     """🔍 Show comprehensive system status and health."""
+    from .commands.status import show_status
+
     show_status(config=config, database=database, detailed=detailed)
 
 
@@ -315,6 +379,8 @@ def health(
     ),
 ):
     """🏥 Quick health check for system readiness."""
+    from .commands.status import health_check
+
     health_check(config=config)
 
 
@@ -384,6 +450,8 @@ def batch(
     ),
 ):
     """📊 Run multiple scenarios with Excel export."""
+    from .commands.batch import run_batch
+
     # Handle comma-separated scenario names for user convenience
     if scenarios and len(scenarios) == 1 and "," in scenarios[0]:
         scenarios = [s.strip() for s in scenarios[0].split(",")]
@@ -421,6 +489,8 @@ def validate(
     ),
 ):
     """✅ Validate simulation configuration."""
+    from .commands.validate import validate_config
+
     validate_config(config=config, enforce_identifiers=enforce_identifiers)
 
 
@@ -628,6 +698,8 @@ def studio(
     ),
 ):
     """🚀 Launch PlanAlign Studio (API + Frontend)."""
+    from .commands.studio import launch_studio
+
     launch_studio(
         api_port=api_port,
         frontend_port=frontend_port,
@@ -658,6 +730,8 @@ def sync_init_cmd(
     ),
 ):
     """Initialize workspace sync with a Git remote."""
+    from .commands.sync import sync_init
+
     sync_init(remote_url=remote_url, branch=branch, auto_sync=auto_sync)
 
 
@@ -668,19 +742,25 @@ def sync_push_cmd(
     ),
 ):
     """Push local workspace changes to remote."""
+    from .commands.sync import sync_push
+
     sync_push(message=message)
 
 
 @sync_app.command("pull")
 def sync_pull_cmd():
     """Pull remote changes to local workspaces."""
+    from .commands.sync import sync_pull
+
     sync_pull()
 
 
 @sync_app.command("status")
 def sync_status_command():
     """Show current sync status."""
-    sync_status_cmd()
+    from .commands.sync import sync_status
+
+    sync_status()
 
 
 @sync_app.command("log")
@@ -690,12 +770,16 @@ def sync_log_cmd(
     ),
 ):
     """Show sync operation history."""
+    from .commands.sync import sync_log
+
     sync_log(limit=limit)
 
 
 @sync_app.command("disconnect")
 def sync_disconnect_cmd():
     """Disconnect sync from remote."""
+    from .commands.sync import sync_disconnect
+
     sync_disconnect()
 
 
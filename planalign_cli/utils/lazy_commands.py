@@ -0,0 +1,68 @@
+"""
+Lazy command registration for Fidelity PlanAlign Engine CLI
+
+Commands whose typer signature lives in a heavy module (the fit, backtest,
+optimizer and calibration stacks pull in pandas, scipy and the orchestrator) are
+registered by import path. ``planalign --help`` lists them from their recorded
+help text, and the module is imported only when the command actually runs, so
+every other invocation -- including the ``planalign simulate`` subprocess Studio
+starts per run -- skips that import cost.
+"""
+
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+
+@dataclass(frozen=True)
+class LazyCommand:
+    """A subcommand resolved from ``"package.module:attribute"`` on first use."""
+
+    target: str
+    help: str
+
+    def load(self, name: str) -> Any:
+        """Import the target and convert it into a click command named ``name``."""
+        module_name, _, attribute = self.target.partition(":")
+        obj = getattr(importlib.import_module(module_name), attribute)
+        if isinstance(obj, typer.Typer):
+            return typer.main.get_group(obj)
+        single = typer.Typer(rich_markup_mode="rich")
+        single.command(name)(obj)
+        return typer.main.get_command(single)
+
+    def placeholder(self, name: str) -> TyperCommand:
+        """Help-only stand-in used when listing commands without importing them."""
+        return TyperCommand(name=name, help=self.help, short_help=self.help)
+
+
+class LazyTyperGroup(TyperGroup):
+    """``TyperGroup`` that imports ``lazy_commands`` only when they are invoked.
+
+    Subclass and set ``lazy_commands``; pass the subclass as ``typer.Typer(cls=...)``.
+    """
+
+    lazy_commands: ClassVar[Dict[str, LazyCommand]] = {}
+
+    def list_commands(self, ctx: Any) -> List[str]:
+        eager = super().list_commands(ctx)
+        return [*(n for n in self.lazy_commands if n not in eager), *eager]
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Optional[Any]:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            return self.lazy_commands[cmd_name].placeholder(cmd_name)
+        return command
+
+    def resolve_command(
+        self, ctx: Any, args: List[str]
+    ) -> Tuple[Optional[str], Optional[Any], List[str]]:
+        name = args[0] if args else None
+        if name in self.lazy_commands and name not in self.commands:
+            self.add_command(self.lazy_commands[name].load(name), name)
+        return super().resolve_command(ctx, args)
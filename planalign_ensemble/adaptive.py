@@ -0,0 +1,155 @@
+"""Sequential convergence checks for adaptive (early-stopping) ensembles."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+
+from .aggregate import aggregate_ensemble
+from .models import (
+    AdaptiveStopping,
+    MetricDistribution,
+    MetricSeedValue,
+    StoppingDecision,
+    Threshold,
+)
+from .risk import evaluate_thresholds
+
+
+_Z_95 = 1.959963984540054
+
+_BandKey = tuple[str, int]
+_RiskKey = tuple[str, float, int | None]
+
+
+def wave_sizes(rule: AdaptiveStopping, *, budget: int, min_seeds: int, workers: int):
+    """Yield seed counts per wave: a first wave of ``min_seeds``, then steady waves.
+
+    Nothing can be judged before ``min_seeds`` succeed, so the first wave is at
+    least that large. Later waves default to the worker count so every wave
+    keeps the pool busy.
+    """
+    step = rule.wave_size or max(workers, 1)
+    submitted = 0
+    first = max(step, min_seeds)
+    while submitted < budget:
+        size = min(first if submitted == 0 else step, budget - submitted)
+        submitted += size
+        yield size
+
+
+class ConvergenceMonitor:
+    """Track band and threshold stability across successive waves of seeds."""
+
+    def __init__(
+        self,
+        rule: AdaptiveStopping,
+        *,
+        min_seeds: int,
+        seed_budget: int,
+        thresholds: Sequence[Threshold] = (),
+    ) -> None:
+        self.rule = rule
+        self.min_seeds = min_seeds
+        self.seed_budget = seed_budget
+        self.thresholds = tuple(thresholds)
+        self.waves = 0
+        self.stable_waves = 0
+        self._bands: dict[_BandKey, tuple[float, float, float]] | None = None
+        self._risks: dict[_RiskKey, float] | None = None
+
+    def update(
+        self, seed_values: Sequence[MetricSeedValue], *, seeds_run: int
+    ) -> StoppingDecision:
+        """Fold in one completed wave and decide whether to keep running."""
+        self.waves += 1
+        distributions = aggregate_ensemble(
+            seed_values,
+            min_seeds=self.min_seeds,
+            n_seeds_requested=max(seeds_run, 1),
+        )
+        bands = {
+            (d.metric, d.simulation_year): (d.p10, d.p50, d.p90)
+            for d in distributions
+            if d.is_sufficient
+        }
+        risks = {
+            (s.metric, s.threshold_value, s.simulation_year): s.exceedance_probability
+            for s in evaluate_thresholds(distributions, seed_values, self.thresholds)
+            if s.is_evaluable and s.exceedance_probability is not None
+        }
+        reason = self._instability(distributions, bands, risks)
+        self._bands, self._risks = bands, risks
+        self.stable_waves = 0 if reason else self.stable_waves + 1
+        converged = self.stable_waves >= self.rule.stable_waves
+        if converged:
+            reason = (
+                f"bands and threshold probabilities stable for "
+                f"{self.stable_waves} consecutive wave(s)"
+            )
+        elif seeds_run >= self.seed_budget:
+            reason = (
+                f"seed budget exhausted before convergence ({reason or 'stabilizing'})"
+            )
+        return StoppingDecision(
+            rule=self.rule,
+            converged=converged,
+            seeds_run=seeds_run,
+            seed_budget=self.seed_budget,
+            waves=self.waves,
+            stable_waves=self.stable_waves,
+            reason=reason or "stabilizing",
+        )
+
+    def _instability(
+        self,
+        distributions: Sequence[MetricDistribution],
+        bands: dict[_BandKey, tuple[float, float, float]],
+        risks: dict[_RiskKey, float],
+    ) -> str | None:
+        """Return why this wave is not yet stable, or ``None`` when it is."""
+        if not bands:
+            return "no metric evidence yet"
+        # A metric with no values in any seed is unavailable, not unconverged.
+        insufficient = [
+            d for d in distributions if not d.is_sufficient and d.n_seeds > 0
+        ]
+        if insufficient:
+            return f"{insufficient[0].metric} has fewer than {self.min_seeds} seeds"
+        if self.rule.max_relative_ci_width is not None:
+            for d in distributions:
+                if not d.is_sufficient:
+                    continue
+                width = _relative_ci_width(d)
+                if width > self.rule.max_relative_ci_width:
+                    return (
+                        f"{d.metric} {d.simulation_year} mean CI width "
+                        f"{width:.4f} exceeds {self.rule.max_relative_ci_width}"
+                    )
+        if self._bands is None or self._risks is None:
+            return "first wave"
+        for key, band in bands.items():
+            previous = self._bands.get(key)
+            if previous is None:
+                return f"{key[0]} {key[1]} has no previous estimate"
+            scale = abs(band[1]) or 1.0
+            movement = max(abs(a - b) for a, b in zip(band, previous)) / scale
+            if movement > self.rule.band_tolerance:
+                return f"{key[0]} {key[1]} band moved {movement:.4f}"
+        if risks.keys() != self._risks.keys():
+            return "threshold verdicts changed shape"
+        for key, probability in risks.items():
+            if abs(probability - self._risks[key]) > self.rule.probability_tolerance:
+                return f"{key[0]} > {key[1]} probability moved"
+        return None
+
+
+def _relative_ci_width(distribution: MetricDistribution) -> float:
+    """Width of the normal 95% interval of the mean, relative to the mean."""
+    if distribution.mean is None or distribution.stddev is None:
+        return math.inf
+    width = 2 * _Z_95 * distribution.stddev / math.sqrt(distribution.n_seeds)
+    return width / (abs(distribution.mean) or 1.0)
+
+
+__all__ = ["ConvergenceMonitor", "wave_sizes"]
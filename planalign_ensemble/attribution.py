@@ -25,6 +25,12 @@ BaselineExecutor = Callable[[SeedPlan], Sequence[SeedRunOutcome]]
 
 _BOOTSTRAP_ITERATIONS = 2000
 _MIN_BOOTSTRAP_REPLICATES = 100
+# Resampled values held at once by the batched bootstrap (~32 MiB of float64
+# per array); keys are processed in chunks that stay under it.
+_BOOTSTRAP_CHUNK_ELEMENTS = 1 << 22
+
+_BootstrapItem = tuple[tuple[str, int], Subsystem, Sequence["_AnchorObservation"]]
+_Interval = tuple[float | None, float | None, int]
 
 
 @dataclass(frozen=True)
@@ -257,8 +263,13 @@ def _combine_anchor_observations(
     observations: Sequence[_AnchorObservation],
     reused: int,
     executed: int,
+    interval: _Interval | None = None,
 ) -> AttributionShare:
-    """Average conditional variance across anchors and bootstrap its interval."""
+    """Average conditional variance across anchors and bootstrap its interval.
+
+    ``interval`` is this key's precomputed :func:`_bootstrap_cis` result, so a
+    caller combining many keys can bootstrap them in one batch.
+    """
     common = {
         "metric": key[0],
         "simulation_year": key[1],
@@ -284,7 +295,9 @@ def _combine_anchor_observations(
             per_anchor_shares.append(1.0 - frozen_variance / baseline_variance)
     if not per_anchor_shares:
         return AttributionShare(**common, n_seeds=n_seeds)
-    ci_low, ci_high, iterations = _bootstrap_ci(key, subsystem, observations)
+    ci_low, ci_high, iterations = interval or _bootstrap_ci(
+        key, subsystem, observations
+    )
     return AttributionShare(
         **common,
         n_seeds=n_seeds,
@@ -301,7 +314,7 @@ def _bootstrap_ci(
     key: tuple[str, int],
     subsystem: Subsystem,
     observations: Sequence[_AnchorObservation],
-) -> tuple[float | None, float | None, int]:
+) -> _Interval:
     """Paired-bootstrap the anchor-averaged share by resampling within anchors.
 
     Each replicate resamples every anchor's paired seed values with
@@ -312,26 +325,84 @@ def _bootstrap_ci(
     metric/year/subsystem key so re-running the same evidence reproduces the
     same interval.
     """
-    rng = np.random.default_rng(_stable_seed(key, subsystem))
-    replicate_means: list[float] = []
-    for _ in range(_BOOTSTRAP_ITERATIONS):
-        replicate_shares: list[float] = []
-        for observation in observations:
-            n = len(observation.baseline_values)
-            indices = rng.integers(0, n, size=n)
-            baseline_sample = np.asarray(observation.baseline_values)[indices]
-            frozen_sample = np.asarray(observation.frozen_values)[indices]
-            baseline_variance = float(np.var(baseline_sample, ddof=1))
-            if baseline_variance == 0.0:
-                continue
-            frozen_variance = float(np.var(frozen_sample, ddof=1))
-            replicate_shares.append(1.0 - frozen_variance / baseline_variance)
-        if replicate_shares:
-            replicate_means.append(float(np.mean(replicate_shares)))
-    if len(replicate_means) < _MIN_BOOTSTRAP_REPLICATES:
-        return None, None, 0
-    ci_low, ci_high = np.percentile(replicate_means, [2.5, 97.5])
-    return float(ci_low), float(ci_high), _BOOTSTRAP_ITERATIONS
+    return _bootstrap_cis([(key, subsystem, observations)])[0]
+
+
+def _bootstrap_cis(items: Sequence[_BootstrapItem]) -> list[_Interval]:
+    """:func:`_bootstrap_ci` for many (metric, year, subsystem) keys at once.
+
+    Keys whose anchors hold the same number of paired seeds share one set of
+    array operations. Every key still draws from its own ``_stable_seed``
+    stream, in the order the one-replicate-at-a-time loop consumed it, so a
+    key's interval does not depend on which other keys it was batched with.
+    """
+    intervals: list[_Interval | None] = [None] * len(items)
+    groups: dict[tuple[int, ...], list[int]] = defaultdict(list)
+    for position, (_, _, observations) in enumerate(items):
+        groups[tuple(len(item.baseline_values) for item in observations)].append(
+            position
+        )
+    for sizes, positions in groups.items():
+        if not sizes:
+            for position in positions:
+                intervals[position] = (None, None, 0)
+            continue
+        step = max(1, _BOOTSTRAP_CHUNK_ELEMENTS // (_BOOTSTRAP_ITERATIONS * sum(sizes)))
+        for start in range(0, len(positions), step):
+            chunk = positions[start : start + step]
+            batch = _bootstrap_batch(sizes, [items[position] for position in chunk])
+            for position, interval in zip(chunk, batch):
+                intervals[position] = interval
+    return [interval or (None, None, 0) for interval in intervals]
+
+
+def _bootstrap_batch(
+    sizes: tuple[int, ...], items: Sequence[_BootstrapItem]
+) -> list[_Interval]:
+    """Bootstrap keys whose anchors have ``sizes`` paired seeds each."""
+    # Replicate r draws anchor 0's n0 indices, then anchor 1's n1, and so on;
+    # one bounded draw per element reproduces that stream exactly.
+    highs = np.tile(np.repeat(sizes, sizes), _BOOTSTRAP_ITERATIONS)
+    draws = np.stack(
+        [
+            np.random.default_rng(_stable_seed(key, subsystem)).integers(0, highs)
+            for key, subsystem, _ in items
+        ]
+    ).reshape(len(items), _BOOTSTRAP_ITERATIONS, sum(sizes))
+
+    shares = np.empty((len(items), _BOOTSTRAP_ITERATIONS, len(sizes)))
+    offset = 0
+    for anchor, size in enumerate(sizes):
+        indices = draws[:, :, offset : offset + size]
+        offset += size
+        baseline = _resampled_variance(items, anchor, "baseline_values", indices)
+        frozen = _resampled_variance(items, anchor, "frozen_values", indices)
+        varies = baseline != 0.0
+        shares[:, :, anchor] = np.where(
+            varies, 1.0 - frozen / np.where(varies, baseline, 1.0), np.nan
+        )
+
+    counted = (~np.isnan(shares)).sum(axis=2)
+    means = np.nansum(shares, axis=2) / np.maximum(counted, 1)
+    intervals: list[_Interval] = []
+    for replicate_means, replicate_counts in zip(means, counted):
+        usable = replicate_means[replicate_counts > 0]
+        if len(usable) < _MIN_BOOTSTRAP_REPLICATES:
+            intervals.append((None, None, 0))
+            continue
+        ci_low, ci_high = np.percentile(usable, [2.5, 97.5])
+        intervals.append((float(ci_low), float(ci_high), _BOOTSTRAP_ITERATIONS))
+    return intervals
+
+
+def _resampled_variance(
+    items: Sequence[_BootstrapItem], anchor: int, field: str, indices: np.ndarray
+) -> np.ndarray:
+    """Sample variance of one anchor's resampled values: ``(keys, replicates)``."""
+    values = np.array([getattr(item[2][anchor], field) for item in items])
+    return np.var(
+        np.take_along_axis(values[:, None, :], indices, axis=2), axis=2, ddof=1
+    )
 
 
 def _stable_seed(key: tuple[str, int], subsystem: Subsystem) -> int:
@@ -548,6 +619,7 @@ def _frozen_shares(
     anchors = resolve_attribution_anchor_seeds(plan.spec)
     baseline_index = _values_by_metric_and_seed(baseline_values)
     eligible_keys = sorted(baseline_index)
+    combined: list[_BootstrapItem] = []
     for subsystem in (item for item in subsystems if item.is_seed_variant):
         observations_by_key: dict[
             tuple[str, int], list[_AnchorObservation]
@@ -586,19 +658,39 @@ def _frozen_shares(
                         ),
                     )
                 )
-        for key in eligible_keys:
-            share = _combine_anchor_observations(
-                key,
-                subsystem,
-                observations_by_key.get(key, []),
-                resolution.reused_count,
-                resolution.executed_count,
-            )
-            if share.n_seeds >= plan.spec.min_seeds:
-                shares.append(share)
+        combined.extend(
+            (key, subsystem, observations_by_key.get(key, [])) for key in eligible_keys
+        )
+
+    # Every key's interval in one batched bootstrap, after the frozen arms.
+    bootstrapped = [item for item in combined if _has_variance(item[2])]
+    intervals = dict(
+        zip(
+            ((key, subsystem) for key, subsystem, _ in bootstrapped),
+            _bootstrap_cis(bootstrapped),
+        )
+    )
+    for key, subsystem, observations in combined:
+        share = _combine_anchor_observations(
+            key,
+            subsystem,
+            observations,
+            resolution.reused_count,
+            resolution.executed_count,
+            interval=intervals.get((key, subsystem)),
+        )
+        if share.n_seeds >= plan.spec.min_seeds:
+            shares.append(share)
     return shares
 
 
+def _has_variance(observations: Sequence[_AnchorObservation]) -> bool:
+    """Whether any anchor has a baseline variance, i.e. a share to bootstrap."""
+    return any(
+        float(np.var(item.baseline_values, ddof=1)) != 0.0 for item in observations
+    )
+
+
 def _frozen_config(config: Any, subsystem: Subsystem, frozen_seed: int) -> Any:
     """Copy the typed config with exactly one attribution stream pinned."""
     if not hasattr(config, "ensemble") or not hasattr(config, "model_copy"):
@@ -1,8 +1,15 @@
-"""Read-only extraction of per-seed headline metrics from snapshot marts."""
+"""Read-only extraction of per-seed headline metrics from snapshot marts.
+
+Ensemble extraction is batched: completed seed databases are attached read-only
+to one in-memory DuckDB session, their snapshot marts are combined with
+``UNION ALL BY NAME``, and every metric for every seed and year is computed in a
+single ``GROUP BY``. The batch size follows the process open-file limit.
+"""
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
 from typing import SupportsFloat, cast
 
 import duckdb
@@ -17,6 +24,11 @@ from .models import (
 
 
 _SNAPSHOT_TABLE = "fct_workforce_snapshot"
+# Each attached database holds a data file and possibly a WAL open, so the open-file
+# limit is split two ways after reserving descriptors for the process itself.
+_RESERVED_FILE_DESCRIPTORS = 64
+_MAX_ATTACH_BATCH = 64
+_DEFAULT_ATTACH_BATCH = 32
 
 
 def extract_seed_metrics(
@@ -40,19 +52,122 @@ def extract_seed_metrics(
 
 
 def extract_completed_outcomes(
-    outcomes: Iterable[SeedRunOutcome], *, ensemble_id: str, scenario_id: str
+    outcomes: Iterable[SeedRunOutcome],
+    *,
+    ensemble_id: str,
+    scenario_id: str,
+    batch_size: int | None = None,
 ) -> list[MetricSeedValue]:
-    """Extract metrics in seed order from every successful terminal outcome."""
+    """Extract metrics in seed order from every successful terminal outcome.
+
+    Seeds are read in attach batches (see module docstring); the result is
+    identical to calling ``extract_seed_metrics`` per seed in seed order.
+    """
+    completed = sorted(
+        (outcome for outcome in outcomes if outcome.succeeded),
+        key=lambda item: item.seed,
+    )
+    size = batch_size or attach_batch_size()
     values: list[MetricSeedValue] = []
-    for outcome in sorted(outcomes, key=lambda item: item.seed):
+    for start in range(0, len(completed), size):
         values.extend(
-            extract_seed_metrics(
-                outcome, ensemble_id=ensemble_id, scenario_id=scenario_id
+            _extract_batch(
+                completed[start : start + size],
+                ensemble_id=ensemble_id,
+                scenario_id=scenario_id,
             )
         )
     return values
 
 
+def attach_batch_size() -> int:
+    """Number of seed databases to attach at once under the open-file limit."""
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - not available on Windows
+        return _DEFAULT_ATTACH_BATCH
+    soft, _hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft == resource.RLIM_INFINITY:
+        return _MAX_ATTACH_BATCH
+    return max(1, min(_MAX_ATTACH_BATCH, (soft - _RESERVED_FILE_DESCRIPTORS) // 2))
+
+
+def _extract_batch(
+    outcomes: Sequence[SeedRunOutcome], *, ensemble_id: str, scenario_id: str
+) -> list[MetricSeedValue]:
+    """Attach one batch of seed databases and aggregate them in one pass.
+
+    Seeds whose snapshot schema differs are aggregated in separate passes so a
+    column absent from one seed stays ``None`` for that seed only.
+    """
+    if not outcomes:
+        return []
+    aliases = {f"seed_{index}": outcome for index, outcome in enumerate(outcomes)}
+    with duckdb.connect(":memory:") as conn:
+        for alias, outcome in aliases.items():
+            path = str(outcome.db_path).replace("'", "''")
+            conn.execute(f"ATTACH '{path}' AS {alias} (READ_ONLY)")
+        schemas = _attached_snapshot_columns(conn, list(aliases))
+        by_schema: dict[frozenset[str], list[str]] = defaultdict(list)
+        for alias in aliases:
+            columns = schemas.get(alias, frozenset())
+            if "simulation_year" in columns:
+                by_schema[columns].append(alias)
+        rows: list[tuple[object, ...]] = []
+        for columns, members in by_schema.items():
+            rows.extend(
+                conn.execute(
+                    _batch_metric_query(
+                        set(columns),
+                        {alias: aliases[alias].seed for alias in members},
+                    )
+                ).fetchall()
+            )
+    values: list[MetricSeedValue] = []
+    rows.sort(key=lambda row: (cast(int, row[0]), cast(int, row[1])))
+    for seed, seed_rows in _group_by_seed(rows):
+        values.extend(_to_metric_values(seed_rows, seed, ensemble_id, scenario_id))
+    return values
+
+
+def _attached_snapshot_columns(
+    conn: duckdb.DuckDBPyConnection, aliases: list[str]
+) -> dict[str, frozenset[str]]:
+    """Snapshot columns per attached catalog, read with one catalog query."""
+    columns: dict[str, set[str]] = defaultdict(set)
+    for catalog, column in conn.execute(
+        "SELECT table_catalog, column_name FROM information_schema.columns "
+        "WHERE table_schema = 'main' AND table_name = ? "
+        "AND list_contains(?, table_catalog)",
+        [_SNAPSHOT_TABLE, aliases],
+    ).fetchall():
+        columns[str(catalog)].add(str(column))
+    return {alias: frozenset(names) for alias, names in columns.items()}
+
+
+def _batch_metric_query(columns: set[str], seeds: dict[str, int]) -> str:
+    """Union the attached snapshots of one schema and group by seed and year."""
+    union = "\n            UNION ALL BY NAME\n            ".join(
+        f"SELECT {int(seed)}::BIGINT AS seed, * FROM {alias}.main.{_SNAPSHOT_TABLE}"
+        for alias, seed in seeds.items()
+    )
+    return _metric_query(
+        columns,
+        source=f"(\n            {union}\n        ) AS snapshots",
+        group_by=("seed", "simulation_year"),
+    )
+
+
+def _group_by_seed(
+    rows: list[tuple[object, ...]],
+) -> Iterable[tuple[int, list[tuple[object, ...]]]]:
+    """Split seed-sorted ``(seed, year, *metrics)`` rows into per-seed year rows."""
+    grouped: dict[int, list[tuple[object, ...]]] = {}
+    for row in rows:
+        grouped.setdefault(int(cast(int, row[0])), []).append(row[1:])
+    return grouped.items()
+
+
 def _table_exists(conn: duckdb.DuckDBPyConnection, table_name: str) -> bool:
     """Check table presence without attempting to bind an absent relation."""
     row = conn.execute(
@@ -75,19 +190,25 @@ def _table_columns(conn: duckdb.DuckDBPyConnection, table_name: str) -> set[str]
     }
 
 
-def _metric_query(columns: set[str]) -> str:
+def _metric_query(
+    columns: set[str],
+    *,
+    source: str = _SNAPSHOT_TABLE,
+    group_by: tuple[str, ...] = ("simulation_year",),
+) -> str:
     """Build a projection only from verified, fixed snapshot identifiers."""
     projection = ",\n                ".join(
         f"{_metric_expression(METRIC_REGISTRY[metric], columns)} AS {metric}"
         for metric in CANONICAL_METRICS
     )
+    keys = ", ".join(group_by)
     return f"""
         SELECT
-            simulation_year,
+            {keys},
             {projection}
-        FROM {_SNAPSHOT_TABLE}
-        GROUP BY simulation_year
-        ORDER BY simulation_year
+        FROM {source}
+        GROUP BY {keys}
+        ORDER BY {keys}
     """
 
 
@@ -163,4 +284,4 @@ def _to_metric_values(
     return values
 
 
-__all__ = ["extract_completed_outcomes", "extract_seed_metrics"]
+__all__ = ["attach_batch_size", "extract_completed_outcomes", "extract_seed_metrics"]
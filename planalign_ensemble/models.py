@@ -156,6 +156,24 @@ class Threshold(BaseModel):
     label: str | None = None
 
 
+class AdaptiveStopping(BaseModel):
+    """Sequential stopping rule for an ensemble that runs seeds in waves.
+
+    ``EnsembleSpec.seed_count`` becomes the seed budget and ``min_seeds`` the
+    floor. After each wave the bands and threshold probabilities are recomputed;
+    the ensemble stops once they have moved less than the tolerances for
+    ``stable_waves`` consecutive waves.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    wave_size: int | None = Field(default=None, ge=1)
+    band_tolerance: float = Field(default=0.01, gt=0)
+    probability_tolerance: float = Field(default=0.02, ge=0)
+    max_relative_ci_width: float | None = Field(default=None, gt=0)
+    stable_waves: int = Field(default=2, ge=1)
+
+
 class EnsembleSpec(BaseModel):
     """User request for a deterministic set of isolated seed runs."""
 
@@ -175,6 +193,7 @@ class EnsembleSpec(BaseModel):
     discard_seed_dbs: bool = False
     config_path: Path | None = None
     dbt_project_dir: Path | None = None
+    adaptive: AdaptiveStopping | None = None
 
     @model_validator(mode="after")
     def validate_request(self) -> "EnsembleSpec":
@@ -383,6 +402,20 @@ class AttributionShare(BaseModel):
         return self
 
 
+class StoppingDecision(BaseModel):
+    """Why an adaptive ensemble stopped, and after how many seeds."""
+
+    model_config = ConfigDict(frozen=True)
+
+    rule: AdaptiveStopping
+    converged: bool
+    seeds_run: int = Field(ge=0)
+    seed_budget: int = Field(ge=1)
+    waves: int = Field(ge=0)
+    stable_waves: int = Field(default=0, ge=0)
+    reason: str
+
+
 class EnsembleResult(BaseModel):
     """Complete aggregate result returned by an ensemble execution."""
 
@@ -393,9 +426,11 @@ class EnsembleResult(BaseModel):
     distributions: tuple[MetricDistribution, ...] = Field(default_factory=tuple)
     risk_statements: tuple[RiskStatement, ...] = Field(default_factory=tuple)
     attribution: tuple[AttributionShare, ...] = Field(default_factory=tuple)
+    stopping: StoppingDecision | None = None
 
 
 __all__ = [
+    "AdaptiveStopping",
     "AttributionShare",
     "CANONICAL_METRICS",
     "EnsembleResult",
@@ -405,6 +440,7 @@ __all__ = [
     "RiskStatement",
     "SeedPlan",
     "SeedRunOutcome",
+    "StoppingDecision",
     "Subsystem",
     "Threshold",
 ]
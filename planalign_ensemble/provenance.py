@@ -16,7 +16,7 @@ from planalign_orchestrator.run_metadata import (
     _evolve_provenance_schema,
 )
 
-from .models import SeedPlan, Subsystem
+from .models import SeedPlan, StoppingDecision, Subsystem
 
 
 EnsembleRole = Literal["headline", "attribution_frozen", "attribution_baseline"]
@@ -28,8 +28,13 @@ def write_ensemble_provenance(
     role: EnsembleRole = "headline",
     frozen_subsystem: Subsystem | None = None,
     anchor_seed: int | None = None,
+    stopping: StoppingDecision | None = None,
 ) -> None:
-    """Append the aggregate's seed lineage to its dedicated ensemble database."""
+    """Append the aggregate's seed lineage to its dedicated ensemble database.
+
+    For an adaptive ensemble ``plan.seeds`` is the prefix actually run and
+    ``stopping`` records the rule and why it stopped.
+    """
     if role == "attribution_frozen" and frozen_subsystem is None:
         raise ValueError(
             "frozen_subsystem is required for attribution_frozen provenance"
@@ -49,8 +54,9 @@ def write_ensemble_provenance(
                 start_year, end_year, scenario_id, plan_design_id,
                 planalign_version, full_reset, ensemble_id, ensemble_seed_list,
                 ensemble_seed_count, ensemble_role, ensemble_frozen_subsystem,
-                ensemble_frozen_anchor_seed, ensemble_member_paths
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ensemble_frozen_anchor_seed, ensemble_member_paths,
+                ensemble_stopping_rule
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             [
                 str(uuid.uuid4()),
@@ -74,6 +80,7 @@ def write_ensemble_provenance(
                     [str(path) for path in plan.seed_db_paths.values()],
                     separators=(",", ":"),
                 ),
+                stopping.model_dump_json() if stopping is not None else None,
             ],
         )
 
@@ -23,9 +23,17 @@ from planalign_orchestrator.run_pool import (
     resolve_worker_count,
 )
 
+from .adaptive import ConvergenceMonitor, wave_sizes
 from .aggregate import aggregate_ensemble, write_ensemble_results
 from .extract import extract_completed_outcomes
-from .models import AttributionShare, EnsembleResult, SeedPlan, SeedRunOutcome
+from .models import (
+    AttributionShare,
+    EnsembleResult,
+    MetricSeedValue,
+    SeedPlan,
+    SeedRunOutcome,
+    StoppingDecision,
+)
 from .provenance import write_ensemble_provenance
 from .risk import evaluate_thresholds
 
@@ -45,24 +53,42 @@ def run_ensemble(
     Every job is fully resolved before entering ``ScenarioRunPool``. A
     KeyboardInterrupt propagates from the pool before aggregation, so an
     interrupted ensemble cannot leave a complete-looking aggregate behind.
+
+    With ``spec.adaptive`` set, seeds run in waves and stop early once the
+    bands converge; the returned plan then lists only the seeds actually run.
     """
     resolved_config = _resolve_config(plan, config)
     effective_plan = _with_config_fingerprint(plan, resolved_config)
-    outcomes = execute_seed_runs(
-        effective_plan,
-        resolved_config,
-        parallel=parallel,
-        on_event=on_event,
-    )
+    stopping: StoppingDecision | None = None
+    if effective_plan.spec.adaptive is not None:
+        outcomes, adaptive_values, stopping = execute_adaptive_seed_runs(
+            effective_plan,
+            resolved_config,
+            parallel=parallel,
+            on_event=on_event,
+        )
+        effective_plan = _truncate_plan(effective_plan, len(outcomes))
+    else:
+        outcomes = execute_seed_runs(
+            effective_plan,
+            resolved_config,
+            parallel=parallel,
+            on_event=on_event,
+        )
     successful = [outcome for outcome in outcomes if outcome.succeeded]
     if not successful:
-        return EnsembleResult(plan=effective_plan, outcomes=tuple(outcomes))
+        return EnsembleResult(
+            plan=effective_plan, outcomes=tuple(outcomes), stopping=stopping
+        )
 
-    seed_values = extract_completed_outcomes(
-        successful,
-        ensemble_id=effective_plan.ensemble_id,
-        scenario_id=effective_plan.scenario_id,
-    )
+    if stopping is not None:
+        seed_values = adaptive_values
+    else:
+        seed_values = extract_completed_outcomes(
+            successful,
+            ensemble_id=effective_plan.ensemble_id,
+            scenario_id=effective_plan.scenario_id,
+        )
     distributions = aggregate_ensemble(
         seed_values,
         min_seeds=effective_plan.spec.min_seeds,
@@ -74,7 +100,7 @@ def run_ensemble(
         effective_plan.spec.thresholds,
     )
     write_ensemble_results(effective_plan.ensemble_db_path, distributions, seed_values)
-    write_ensemble_provenance(effective_plan)
+    write_ensemble_provenance(effective_plan, stopping=stopping)
     attribution: tuple[AttributionShare, ...] = ()
     if effective_plan.spec.attribution:
         from .attribution import attribute_variance
@@ -95,6 +121,7 @@ def run_ensemble(
         distributions=tuple(distributions),
         risk_statements=tuple(risk_statements),
         attribution=attribution,
+        stopping=stopping,
     )
 
 
@@ -115,6 +142,68 @@ def execute_seed_runs(
     return tuple(_to_outcomes(plan, results, job_prefix=job_prefix))
 
 
+def execute_adaptive_seed_runs(
+    plan: SeedPlan,
+    config: Any,
+    *,
+    parallel: int | None = None,
+    on_event: Callable[[PoolEvent], None] | None = None,
+) -> tuple[tuple[SeedRunOutcome, ...], list[MetricSeedValue], StoppingDecision]:
+    """Run planned seeds in waves until ``spec.adaptive`` reports convergence.
+
+    Seeds are taken in plan order, so an early stop always runs a prefix of the
+    deterministic seed list. Only each new wave's seed databases are read; the
+    accumulated values are returned for the final aggregate.
+    """
+    rule = plan.spec.adaptive
+    if rule is None:
+        raise ValueError("execute_adaptive_seed_runs requires spec.adaptive")
+    budget = resolve_worker_count(parallel, len(plan.seeds))
+    pool = ScenarioRunPool(budget.workers)
+    monitor = ConvergenceMonitor(
+        rule,
+        min_seeds=plan.spec.min_seeds,
+        seed_budget=len(plan.seeds),
+        thresholds=plan.spec.thresholds,
+    )
+    outcomes: list[SeedRunOutcome] = []
+    seed_values: list[MetricSeedValue] = []
+    decision: StoppingDecision | None = None
+    for size in wave_sizes(
+        rule,
+        budget=len(plan.seeds),
+        min_seeds=plan.spec.min_seeds,
+        workers=budget.workers,
+    ):
+        wave = _truncate_plan(plan, len(outcomes) + size, start=len(outcomes))
+        jobs = _build_seed_jobs(wave, config)
+        wave_outcomes = _to_outcomes(
+            wave, pool.run(run_seed_worker, jobs, on_event=on_event)
+        )
+        outcomes.extend(wave_outcomes)
+        completed = [outcome for outcome in wave_outcomes if outcome.succeeded]
+        if completed:
+            seed_values.extend(
+                extract_completed_outcomes(
+                    completed,
+                    ensemble_id=plan.ensemble_id,
+                    scenario_id=plan.scenario_id,
+                )
+            )
+        decision = monitor.update(seed_values, seeds_run=len(outcomes))
+        logger.info(
+            "Adaptive ensemble wave %d: %d/%d seeds, %s",
+            decision.waves,
+            decision.seeds_run,
+            decision.seed_budget,
+            decision.reason,
+        )
+        if decision.converged:
+            break
+    assert decision is not None  # a SeedPlan always has at least one seed
+    return tuple(outcomes), seed_values, decision
+
+
 def run_seed_worker(job: ScenarioJob) -> dict[str, Any]:
     """Execute one fully-resolved seed job in a process-pool worker.
 
@@ -178,6 +267,19 @@ def _with_config_fingerprint(plan: SeedPlan, config: Any) -> SeedPlan:
     )
 
 
+def _truncate_plan(plan: SeedPlan, stop: int, *, start: int = 0) -> SeedPlan:
+    """Restrict a plan to ``seeds[start:stop]``, keeping paths aligned."""
+    seeds = plan.seeds[start:stop]
+    if seeds == plan.seeds:
+        return plan
+    return plan.model_copy(
+        update={
+            "seeds": seeds,
+            "seed_db_paths": {seed: plan.seed_db_paths[seed] for seed in seeds},
+        }
+    )
+
+
 def _build_seed_jobs(
     plan: SeedPlan, config: Any, *, job_prefix: str = "seed"
 ) -> list[ScenarioJob]:
@@ -255,4 +357,9 @@ def _discard_seed_databases(plan: SeedPlan) -> None:
     )
 
 
-__all__ = ["execute_seed_runs", "run_ensemble", "run_seed_worker"]
+__all__ = [
+    "execute_adaptive_seed_runs",
+    "execute_seed_runs",
+    "run_ensemble",
+    "run_seed_worker",
+]
@@ -14,6 +14,7 @@ from planalign_ensemble.models import METRIC_REGISTRY
 from .decompose import build_executive_summary, decompose_row
 from .models import EvidencePack, PackProvenance, PackWarning
 from .queries import build_metric_query
+from .summary import load_evidence_summary
 
 
 SNAPSHOT_TABLE = "fct_workforce_snapshot"
@@ -148,7 +149,12 @@ def build_evidence_pack(
     if base_year >= target_year:
         raise UnsupportedEvidenceError("base_year must be earlier than target_year")
     before = target.signature()
-    support = target.inspect()
+    summary = load_evidence_summary(target)
+    support = (
+        TargetSupport(summary.columns, summary.available_years)
+        if summary is not None
+        else target.inspect()
+    )
     missing = tuple(
         column
         for column in METRIC_REGISTRY[metric].required_columns
@@ -168,13 +174,17 @@ def build_evidence_pack(
             available_years=support.available_years,
         )
     query = build_metric_query(metric, base_year, target_year, support.columns)
+    # A published run's precomputed row is the same aggregate; citations still
+    # name the live query that reproduces it.
+    row = summary.row(metric, base_year, target_year) if summary is not None else None
     with target.connect() as connection:
-        cursor = connection.execute(query)
-        values = cursor.fetchone()
-        assert values is not None
-        description = cursor.description
-        assert description is not None
-        row = dict(zip((item[0] for item in description), values, strict=True))
+        if row is None:
+            cursor = connection.execute(query)
+            values = cursor.fetchone()
+            assert values is not None
+            description = cursor.description
+            assert description is not None
+            row = dict(zip((item[0] for item in description), values, strict=True))
         resolved_provenance = provenance or _read_provenance(connection, target)
     if row["base_value"] is None or row["target_value"] is None:
         raise UnsupportedEvidenceError(
@@ -0,0 +1,218 @@
+"""Publish-time evidence summary for immutable managed runs.
+
+``build_metric_query`` scans the workforce snapshot twice per request, which is
+what an interactive evidence pack pays for every metric and year pair. A
+published run never changes, so ``precompute_evidence_summary`` answers every
+canonical metric for every pair of simulated years once, in a single statement
+over a narrow copy of the snapshot, and stores the aggregate rows as a small
+long-format Parquet file in the run directory::
+
+    metric, base_year, target_year, field, value DECIMAL(38,12)
+
+``EvidenceSummary.row`` returns exactly the row the live query would, so packs,
+citations included, are identical whichever path produced them. The manifest
+also records the snapshot's columns and years, which spares a pack the
+inspection scan. A summary that is missing, from another format version or
+another run is ignored and callers fall back to the live query.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from itertools import combinations
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import duckdb
+
+from planalign_ensemble.models import METRIC_REGISTRY
+
+from .queries import DRIVER_REGISTRY, build_metric_query
+
+if TYPE_CHECKING:
+    from .service import EvidenceTarget
+
+
+SUMMARY_FILENAME = "evidence_summary.parquet"
+SUMMARY_MANIFEST_FILENAME = "evidence_summary.json"
+SUMMARY_FORMAT_VERSION = 1
+
+# Snapshot columns any canonical metric query reads.
+_SOURCE_COLUMNS = (
+    "employee_id",
+    "simulation_year",
+    "employment_status",
+    "prorated_annual_compensation",
+    "employer_match_amount",
+    "total_employer_contributions",
+    "participation_status",
+    "current_deferral_rate",
+)
+
+
+def summary_fields(metric: str) -> tuple[str, ...]:
+    """Columns ``build_metric_query`` returns for ``metric``, in order."""
+    drivers = DRIVER_REGISTRY[metric]
+    return (
+        "base_value",
+        "target_value",
+        "total_change",
+        "base_population",
+        "target_population",
+        "base_effective_rate",
+        "target_effective_rate",
+        *(f"{driver.id}_contribution" for driver in drivers),
+        *(f"{driver.id}_share" for driver in drivers),
+        *(f"{driver.id}_population" for driver in drivers),
+        "residual_contribution",
+        "residual_share",
+    )
+
+
+def precompute_evidence_summary(target: EvidenceTarget) -> dict[str, Any] | None:
+    """Write the summary for ``target``'s run and return its manifest.
+
+    Legacy results have no run directory and return None, as does a run with
+    fewer than two simulated years. The result store is only read.
+    """
+    if target.run_dir is None:
+        return None
+    support = target.inspect()
+    pairs = list(combinations(support.available_years, 2))
+    metrics = [
+        metric
+        for metric, definition in METRIC_REGISTRY.items()
+        if all(column in support.columns for column in definition.required_columns)
+    ]
+    if not pairs or not metrics:
+        return None
+
+    run_dir = Path(target.run_dir)
+    destination = run_dir / SUMMARY_FILENAME
+    staging = run_dir / f".{SUMMARY_FILENAME}.tmp"
+    staging.unlink(missing_ok=True)
+    projected = ", ".join(
+        column for column in _SOURCE_COLUMNS if column in support.columns
+    )
+    selects = [
+        _long_select(
+            metric,
+            base_year,
+            target_year,
+            build_metric_query(metric, base_year, target_year, support.columns),
+        )
+        for metric in metrics
+        for base_year, target_year in pairs
+    ]
+    with target.connect() as connection:
+        # One narrow in-memory copy shadows the snapshot for every query below.
+        connection.execute(
+            "CREATE TEMP TABLE fct_workforce_snapshot AS "
+            f"SELECT {projected} FROM main.fct_workforce_snapshot"
+        )
+        connection.execute(
+            f"COPY ({' UNION ALL '.join(selects)} "
+            "ORDER BY metric, base_year, target_year) "
+            f"TO '{_quote(staging)}' (FORMAT PARQUET, COMPRESSION ZSTD)"
+        )
+        rows = connection.execute(
+            f"SELECT count(*) FROM read_parquet('{_quote(staging)}')"
+        ).fetchone()[0]
+    os.replace(staging, destination)
+    manifest = {
+        "format_version": SUMMARY_FORMAT_VERSION,
+        "run_id": target.run_id,
+        "columns": sorted(support.columns),
+        "years": list(support.available_years),
+        "metrics": metrics,
+        "rows": int(rows),
+    }
+    manifest_path = run_dir / SUMMARY_MANIFEST_FILENAME
+    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
+
+
+@dataclass(frozen=True)
+class EvidenceSummary:
+    """A run's precomputed rows and the snapshot schema they were built from."""
+
+    path: Path
+    columns: frozenset[str]
+    available_years: tuple[int, ...]
+    metrics: tuple[str, ...]
+
+    def row(
+        self, metric: str, base_year: int, target_year: int
+    ) -> dict[str, object] | None:
+        """Return the precomputed query row, or None if the live query must run."""
+        if metric not in self.metrics:
+            return None
+        try:
+            with duckdb.connect() as connection:
+                values = dict(
+                    connection.execute(
+                        f"SELECT field, value FROM read_parquet('{_quote(self.path)}') "
+                        "WHERE metric = ? AND base_year = ? AND target_year = ?",
+                        [metric, base_year, target_year],
+                    ).fetchall()
+                )
+        except duckdb.Error:
+            return None
+        if not values:
+            return None
+        return {field: values.get(field) for field in summary_fields(metric)}
+
+
+def load_evidence_summary(target: EvidenceTarget) -> EvidenceSummary | None:
+    """Return ``target``'s summary if one was precomputed for this run."""
+    if target.run_dir is None or target.run_id == "legacy":
+        return None
+    run_dir = Path(target.run_dir)
+    path = run_dir / SUMMARY_FILENAME
+    try:
+        manifest = json.loads(
+            (run_dir / SUMMARY_MANIFEST_FILENAME).read_text(encoding="utf-8")
+        )
+    except (OSError, json.JSONDecodeError):
+        return None
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("format_version") != SUMMARY_FORMAT_VERSION
+        or manifest.get("run_id") != target.run_id
+        or not path.is_file()
+    ):
+        return None
+    return EvidenceSummary(
+        path=path,
+        columns=frozenset(manifest["columns"]),
+        available_years=tuple(manifest["years"]),
+        metrics=tuple(manifest["metrics"]),
+    )
+
+
+def _long_select(metric: str, base_year: int, target_year: int, query: str) -> str:
+    fields = summary_fields(metric)
+    names = ", ".join(f"'{field}'" for field in fields)
+    values = ", ".join(fields)
+    return (
+        f"SELECT '{metric}' AS metric, {base_year} AS base_year, "
+        f"{target_year} AS target_year, unnest([{names}]) AS field, "
+        f"unnest([{values}]) AS value FROM ({query})"
+    )
+
+
+def _quote(path: Path) -> str:
+    return str(path).replace("'", "''")
+
+
+__all__ = [
+    "SUMMARY_FILENAME",
+    "SUMMARY_FORMAT_VERSION",
+    "SUMMARY_MANIFEST_FILENAME",
+    "EvidenceSummary",
+    "load_evidence_summary",
+    "precompute_evidence_summary",
+    "summary_fields",
+]
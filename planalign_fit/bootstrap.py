@@ -0,0 +1,283 @@
+"""Bootstrap sampling intervals for a fitted parameter pack.
+
+Credibility shrinkage says how far each number leans on its prior; it says
+nothing about how much the number would move on a different draw of the same
+workforce. The bootstrap answers that directly: resample *employees* with
+replacement, rebuild the linked tables from the resampled population, rerun
+every estimator, and report percentile intervals across the replicates.
+
+Employees, not rows, are the resampling unit — one employee contributes a row
+per snapshot pair plus, possibly, a new-hire row, and those rows are not
+independent. Each drawn copy gets its own suffixed ``employee_id`` so copies
+stay distinct through every join the estimators make.
+
+The linked tables are exported once to a read-only DuckDB file that every pool
+worker attaches, so workers share the OS page cache instead of each receiving a
+pickled copy of the transition table. Replicate ``r`` draws from a generator
+seeded by ``(seed, r)``, so intervals do not depend on the worker count or on
+how replicates are chunked.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Mapping, Sequence
+
+import duckdb
+import numpy as np
+
+from planalign_fit.models import BootstrapSummary, FitResult, FittedValue
+from planalign_fit.transitions import (
+    NEW_HIRES_TABLE,
+    TRANSITIONS_TABLE,
+    TransitionError,
+    TransitionSet,
+    _level_coverage,
+)
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from planalign_fit.priors import Priors
+    from planalign_fit.runner import FitOptions
+
+DEFAULT_BOOTSTRAP_LEVEL = 0.90
+SOURCE_DATABASE = "bootstrap_source.duckdb"
+EMPLOYEES_TABLE = "fit_employees"
+# Jobs per worker: enough to even out slow replicates without paying the
+# attach-and-setup cost once per replicate.
+CHUNKS_PER_WORKER = 4
+
+
+def export_source(transitions: TransitionSet, directory: Path) -> Path:
+    """Write the linked tables, keyed by an integer employee key, for workers.
+
+    Must run before any estimator: promotion classification rewrites
+    ``promotion_weight`` in place, and every replicate reclassifies from the
+    observed weights.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / SOURCE_DATABASE
+    path.unlink(missing_ok=True)
+    conn = transitions.conn
+    years = transitions.snapshot_set.years
+    everyone = "\nUNION\n".join(f"SELECT employee_id FROM banded_{y}" for y in years)
+    conn.execute(f"ATTACH '{path}' AS bootstrap_source")
+    try:
+        conn.execute(
+            f"""
+            CREATE TABLE bootstrap_source.{EMPLOYEES_TABLE} AS
+            SELECT CAST(ROW_NUMBER() OVER (ORDER BY employee_id) - 1 AS INTEGER)
+                     AS employee_key,
+                   employee_id
+            FROM ({everyone})
+            """
+        )
+        for table in (
+            TRANSITIONS_TABLE,
+            NEW_HIRES_TABLE,
+            *(f"banded_{y}" for y in years),
+        ):
+            conn.execute(
+                f"""
+                CREATE TABLE bootstrap_source.{table} AS
+                SELECT e.employee_key, t.*
+                FROM {table} t
+                JOIN bootstrap_source.{EMPLOYEES_TABLE} e USING (employee_id)
+                ORDER BY e.employee_key
+                """
+            )
+    finally:
+        conn.execute("DETACH bootstrap_source")
+    return path
+
+
+def bootstrap_intervals(
+    transitions: TransitionSet,
+    source: Path,
+    priors: "Priors",
+    options: "FitOptions",
+) -> BootstrapSummary:
+    """Refit ``options.bootstrap_replicates`` resamples across the run pool."""
+    from planalign_orchestrator.run_pool import (
+        ScenarioJob,
+        ScenarioRunPool,
+        resolve_worker_count,
+    )
+
+    replicates = range(options.bootstrap_replicates)
+    budget = resolve_worker_count(options.parallel, len(replicates))
+    chunk = max(1, math.ceil(len(replicates) / (budget.workers * CHUNKS_PER_WORKER)))
+    context = {
+        "source": source,
+        "snapshot_set": transitions.snapshot_set,
+        "bands": transitions.bands,
+        "observability": transitions.observability,
+        "unmatched_reappearances": transitions.unmatched_reappearances,
+        "priors": priors,
+        "options": options,
+    }
+    jobs = [
+        ScenarioJob(
+            name=f"bootstrap_{start}",
+            config=None,
+            db_path=source,
+            seed=options.bootstrap_seed,
+            payload={**context, "replicates": tuple(replicates[start : start + chunk])},
+        )
+        for start in range(0, len(replicates), chunk)
+    ]
+    results = ScenarioRunPool(budget.workers).run(run_replicates_worker, jobs)
+
+    samples: dict[str, list[float]] = {}
+    for job in jobs:
+        result = results[job.name]
+        if not result.succeeded or result.value is None:
+            raise TransitionError(
+                f"Bootstrap replicates {job.payload['replicates'][0]}+ failed: "
+                f"{result.error}"
+            )
+        for values in result.value["replicates"]:
+            for name, value in values.items():
+                samples.setdefault(name, []).append(value)
+    return summarize(
+        samples,
+        replicates=options.bootstrap_replicates,
+        seed=options.bootstrap_seed,
+        level=options.bootstrap_level,
+    )
+
+
+def run_replicates_worker(job: Any) -> dict[str, Any]:
+    """Refit one chunk of replicates against the shared source (pool worker).
+
+    Module-level so it pickles across the pool's process boundary.
+    """
+    from planalign_fit.runner import _run_estimators
+
+    payload = job.payload
+    with duckdb.connect(":memory:") as conn:
+        conn.execute(f"ATTACH '{payload['source']}' AS source (READ_ONLY)")
+        row = conn.execute(f"SELECT COUNT(*) FROM source.{EMPLOYEES_TABLE}").fetchone()
+        population = int(row[0]) if row is not None else 0
+        values = [
+            fitted_values(
+                _run_estimators(
+                    resample(conn, payload, population, job.seed, replicate),
+                    payload["priors"],
+                    payload["options"],
+                )
+            )
+            for replicate in payload["replicates"]
+        ]
+    return {"replicates": values}
+
+
+def resample(
+    conn: duckdb.DuckDBPyConnection,
+    payload: Mapping[str, Any],
+    population: int,
+    seed: int,
+    replicate: int,
+) -> TransitionSet:
+    """Rebuild the linked tables in ``conn`` from one employee resample."""
+    rng = np.random.default_rng([seed, replicate])
+    counts = np.bincount(rng.integers(0, population, population), minlength=population)
+    drawn = np.flatnonzero(counts)
+    copies = counts[drawn]
+    keys = np.repeat(drawn, copies)
+    # 0..n-1 within each employee's run of copies.
+    copy = np.arange(len(keys)) - np.repeat(np.cumsum(copies) - copies, copies)
+    draws = {"employee_key": keys.astype(np.int32), "copy": copy.astype(np.int32)}
+    conn.register("bootstrap_draws", _frame(draws))
+    snapshot_set = payload["snapshot_set"]
+    try:
+        for table in (
+            TRANSITIONS_TABLE,
+            NEW_HIRES_TABLE,
+            *(f"banded_{y}" for y in snapshot_set.years),
+        ):
+            conn.execute(
+                f"""
+                CREATE OR REPLACE TABLE {table} AS
+                SELECT t.* EXCLUDE (employee_key)
+                       REPLACE (t.employee_id || '#' || d.copy AS employee_id)
+                FROM source.{table} t
+                JOIN bootstrap_draws d USING (employee_key)
+                """
+            )
+    finally:
+        conn.unregister("bootstrap_draws")
+
+    row = conn.execute(f"SELECT COUNT(*) FROM {TRANSITIONS_TABLE}").fetchone()
+    linked_pairs = int(row[0]) if row is not None else 0
+    return TransitionSet(
+        conn=conn,
+        snapshot_set=snapshot_set,
+        bands=payload["bands"],
+        observability=replace(
+            payload["observability"],
+            level_coverage=_level_coverage(conn, linked_pairs),
+        ),
+        unmatched_reappearances=payload["unmatched_reappearances"],
+        linked_pairs=linked_pairs,
+    )
+
+
+def _frame(columns: Mapping[str, np.ndarray]) -> Any:
+    import pandas as pd
+
+    return pd.DataFrame(columns)
+
+
+def fitted_values(result: FitResult) -> dict[str, float]:
+    return {value.name: value.value for value in result.all_fitted()}
+
+
+def summarize(
+    samples: Mapping[str, Sequence[float]],
+    *,
+    replicates: int,
+    seed: int,
+    level: float,
+) -> BootstrapSummary:
+    """Equal-tailed percentile intervals at ``level`` for every sampled value."""
+    tails = [50.0 * (1.0 - level), 50.0 * (1.0 + level)]
+    intervals: dict[str, tuple[float, float, int]] = {}
+    for name, values in samples.items():
+        lower, upper = np.percentile(np.asarray(values, dtype=np.float64), tails)
+        intervals[name] = (float(lower), float(upper), len(values))
+    return BootstrapSummary(
+        replicates=replicates, seed=seed, level=level, intervals=intervals
+    )
+
+
+def attach_intervals(result: FitResult, summary: BootstrapSummary) -> None:
+    """Record ``summary`` on ``result`` and stamp each value's interval."""
+
+    def stamped(value: FittedValue) -> FittedValue:
+        interval = summary.intervals.get(value.name)
+        if interval is None:
+            return value
+        return replace(value, interval=(interval[0], interval[1]))
+
+    def restamp(values: dict[Any, FittedValue]) -> dict[Any, FittedValue]:
+        return {key: stamped(value) for key, value in values.items()}
+
+    for attribute in ("termination", "promotion"):
+        hazard = getattr(result, attribute)
+        if hazard is not None:
+            setattr(
+                result,
+                attribute,
+                replace(
+                    hazard,
+                    base_rate=stamped(hazard.base_rate),
+                    age_multipliers=restamp(hazard.age_multipliers),
+                    tenure_multipliers=restamp(hazard.tenure_multipliers),
+                ),
+            )
+    result.merit_by_level = restamp(result.merit_by_level)
+    result.deferral_rates = restamp(result.deferral_rates)
+    result.config_overrides = restamp(result.config_overrides)
+    result.bootstrap = summary
@@ -12,10 +12,14 @@ termination, ``level_dampener_factor`` for promotion — because a short census
 history cannot separate a level effect from the compensation banding that
 assigns the level in the first place. The fit report lists those constants
 under "not fitted".
+
+:func:`fit_hazards` solves several hazards in one batched IPF call; the
+per-hazard helpers are thin wrappers over it.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Callable, Optional, Sequence
 
 from planalign_fit import ipf
@@ -44,19 +48,27 @@ def promotion_level_factor(level_id: int, constants: dict[str, float]) -> float:
     return max(0.0, 1.0 - dampener * (level_id - 1))
 
 
-def _to_factor_cells(
-    cells: Sequence[CellObservation], offset: Callable[[int], float]
-) -> list[ipf.FactorCell]:
-    return [
-        ipf.FactorCell(
-            row=cell.age_band,
-            col=cell.tenure_band,
-            exposure=cell.exposure,
-            events=cell.events,
-            offset=offset(cell.level_id),
-        )
-        for cell in cells
-    ]
+@dataclass(frozen=True)
+class HazardInputs:
+    """One hazard to fit: its cells, its priors, and its fixed level factor."""
+
+    kind: str
+    cells: Sequence[CellObservation]
+    priors: HazardPriors
+    level_factor: LevelFactor
+
+
+def _factor_table(inputs: HazardInputs, bands: BandDefinitions) -> ipf.FactorTable:
+    constants = inputs.priors.level_constants
+    return ipf.FactorTable.from_columns(
+        [cell.age_band for cell in inputs.cells],
+        [cell.tenure_band for cell in inputs.cells],
+        [cell.exposure for cell in inputs.cells],
+        [cell.events for cell in inputs.cells],
+        [inputs.level_factor(cell.level_id, constants) for cell in inputs.cells],
+        row_labels=bands.age_band_labels,
+        col_labels=bands.tenure_band_labels,
+    )
 
 
 def fit_hazard(
@@ -70,20 +82,57 @@ def fit_hazard(
     min_exposure: float,
 ) -> HazardFit:
     """Fit one hazard and credibility-smooth every fitted number."""
+    (fit,) = fit_hazards(
+        [HazardInputs(kind, cells, priors, level_factor)],
+        bands,
+        credibility_k=credibility_k,
+        min_exposure=min_exposure,
+    )
+    return fit
+
+
+def fit_hazards(
+    hazards: Sequence[HazardInputs],
+    bands: BandDefinitions,
+    *,
+    credibility_k: float,
+    min_exposure: float,
+) -> list[HazardFit]:
+    """Fit every hazard in one batched solve, in the order given."""
+    tables = [_factor_table(inputs, bands) for inputs in hazards]
+    solutions = ipf.solve_batch(tables, normalize="row")
+    return [
+        _smoothed_fit(
+            inputs,
+            table,
+            solution,
+            bands,
+            credibility_k=credibility_k,
+            min_exposure=min_exposure,
+        )
+        for inputs, table, solution in zip(hazards, tables, solutions)
+    ]
+
+
+def _smoothed_fit(
+    inputs: HazardInputs,
+    table: ipf.FactorTable,
+    solution: ipf.FactorSolution,
+    bands: BandDefinitions,
+    *,
+    credibility_k: float,
+    min_exposure: float,
+) -> HazardFit:
+    kind, cells, priors = inputs.kind, inputs.cells, inputs.priors
     age_labels = bands.age_band_labels
     tenure_labels = bands.tenure_band_labels
     age_priors = prior_for_bands(priors.age_multipliers, age_labels)
     tenure_priors = prior_for_bands(priors.tenure_multipliers, tenure_labels)
 
-    factor_cells = _to_factor_cells(
-        cells, lambda level_id: level_factor(level_id, priors.level_constants)
-    )
-    solution = ipf.solve(factor_cells, age_labels, tenure_labels, normalize="row")
-
     total_events = sum(cell.events for cell in cells)
     total_exposure = sum(cell.exposure for cell in cells)
-    age_exposure = ipf.exposure_by(factor_cells, "row")
-    tenure_exposure = ipf.exposure_by(factor_cells, "col")
+    age_exposure = table.exposure_by("row")
+    tenure_exposure = table.exposure_by("col")
 
     base = FittedValue.from_credibility(
         f"{kind}_base_rate",
@@ -186,14 +235,10 @@ def load_cells(
     ]
 
 
-def fit_termination_hazard(
-    transitions: TransitionSet,
-    priors: HazardPriors,
-    *,
-    credibility_k: float,
-    min_exposure: float,
-) -> tuple[HazardFit, list[CellObservation]]:
-    """Fit the experienced-cohort termination hazard.
+def termination_inputs(
+    transitions: TransitionSet, priors: HazardPriors
+) -> HazardInputs:
+    """Cells for the experienced-cohort termination hazard.
 
     New hires are excluded by construction: the exposure is the population
     active at the end of the prior year, matching the E077 cohort split.
@@ -201,27 +246,16 @@ def fit_termination_hazard(
     cells = load_cells(
         transitions.conn, transitions.table, "CASE WHEN terminated THEN 1 ELSE 0 END"
     )
-    fit = fit_hazard(
-        "termination",
-        cells,
-        priors,
-        transitions.bands,
-        level_factor=termination_level_factor,
-        credibility_k=credibility_k,
-        min_exposure=min_exposure,
-    )
-    return fit, cells
+    return HazardInputs("termination", cells, priors, termination_level_factor)
 
 
-def fit_promotion_hazard(
+def promotion_inputs(
     transitions: TransitionSet,
     priors: HazardPriors,
     *,
-    credibility_k: float,
-    min_exposure: float,
     exposure_filter: str = "TRUE",
-) -> tuple[HazardFit, list[CellObservation]]:
-    """Fit the promotion hazard over employees who survived the year.
+) -> HazardInputs:
+    """Cells for the promotion hazard over employees who survived the year.
 
     Events are the sum of ``promotion_weight``, so this is one code path whether
     promotions were observed from job levels (weights of 0 and 1, an exact
@@ -240,16 +274,44 @@ def fit_promotion_hazard(
         f"WHERE continued AND ({exposure_filter}))",
         "promotion_weight",
     )
-    fit = fit_hazard(
-        "promotion",
-        cells,
-        priors,
+    return HazardInputs("promotion", cells, priors, promotion_level_factor)
+
+
+def fit_termination_hazard(
+    transitions: TransitionSet,
+    priors: HazardPriors,
+    *,
+    credibility_k: float,
+    min_exposure: float,
+) -> tuple[HazardFit, list[CellObservation]]:
+    """Fit the experienced-cohort termination hazard."""
+    inputs = termination_inputs(transitions, priors)
+    (fit,) = fit_hazards(
+        [inputs],
+        transitions.bands,
+        credibility_k=credibility_k,
+        min_exposure=min_exposure,
+    )
+    return fit, list(inputs.cells)
+
+
+def fit_promotion_hazard(
+    transitions: TransitionSet,
+    priors: HazardPriors,
+    *,
+    credibility_k: float,
+    min_exposure: float,
+    exposure_filter: str = "TRUE",
+) -> tuple[HazardFit, list[CellObservation]]:
+    """Fit the promotion hazard; see :func:`promotion_inputs` for the cells."""
+    inputs = promotion_inputs(transitions, priors, exposure_filter=exposure_filter)
+    (fit,) = fit_hazards(
+        [inputs],
         transitions.bands,
-        level_factor=promotion_level_factor,
         credibility_k=credibility_k,
         min_exposure=min_exposure,
     )
-    return fit, cells
+    return fit, list(inputs.cells)
 
 
 def fit_scalar_rate(
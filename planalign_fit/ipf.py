@@ -7,8 +7,14 @@ multiplier per demographic axis, optionally times a fixed offset::
 
 Each sweep sets a factor to observed events over expected events under the
 other factor, which is the closed-form Poisson/IRLS update for a log-linear
-model with the offset held fixed. It converges monotonically and needs nothing
-beyond the standard library.
+model with the offset held fixed. It converges monotonically.
+
+Cells are held as a :class:`FactorTable` — integer-coded row and column labels
+plus NumPy exposure, event and offset arrays — so a sweep is one ``bincount``
+per axis rather than a Python loop over cells. :func:`solve_batch` stacks many
+tables (several hazards, or bootstrap replicates of one) into a single set of
+arrays and iterates them together; each problem stops updating once it has
+converged, so a batched fit returns exactly what fitting it alone would.
 
 Base and multipliers are identified only up to a common scale, so the caller
 picks one axis to normalize to an exposure-weighted mean of 1.0; the scale is
@@ -17,8 +23,10 @@ folded into the base.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Literal, Sequence
+from dataclasses import dataclass, replace
+from typing import Literal, Optional, Sequence
+
+import numpy as np
 
 MAX_ITERATIONS = 200
 CONVERGENCE_TOLERANCE = 1e-10
@@ -50,135 +58,309 @@ class FactorSolution:
     iterations: int
 
 
+@dataclass(frozen=True, eq=False)
+class FactorTable:
+    """Array-backed cells with integer-coded row and column labels.
+
+    ``rows`` and ``cols`` list the labels being fitted first, followed by any
+    label that only appears in the cells; codes at or beyond ``fitted_rows`` /
+    ``fitted_cols`` keep a multiplier of 1.0 throughout the fit.
+    """
+
+    rows: tuple[str, ...]
+    cols: tuple[str, ...]
+    fitted_rows: int
+    fitted_cols: int
+    row_codes: np.ndarray
+    col_codes: np.ndarray
+    exposure: np.ndarray
+    events: np.ndarray
+    offset: np.ndarray
+
+    @classmethod
+    def from_columns(
+        cls,
+        rows: Sequence[str],
+        cols: Sequence[str],
+        exposure: Sequence[float],
+        events: Sequence[float],
+        offset: Optional[Sequence[float]] = None,
+        *,
+        row_labels: Sequence[str],
+        col_labels: Sequence[str],
+    ) -> "FactorTable":
+        """Encode parallel per-cell columns against the labels being fitted."""
+        row_names, row_codes = _encode(rows, row_labels)
+        col_names, col_codes = _encode(cols, col_labels)
+        exposure_array = np.asarray(exposure, dtype=np.float64)
+        return cls(
+            rows=row_names,
+            cols=col_names,
+            fitted_rows=len(row_labels),
+            fitted_cols=len(col_labels),
+            row_codes=row_codes,
+            col_codes=col_codes,
+            exposure=exposure_array,
+            events=np.asarray(events, dtype=np.float64),
+            offset=(
+                np.ones_like(exposure_array)
+                if offset is None
+                else np.asarray(offset, dtype=np.float64)
+            ),
+        )
+
+    @classmethod
+    def from_cells(
+        cls,
+        cells: Sequence[FactorCell],
+        row_labels: Sequence[str],
+        col_labels: Sequence[str],
+    ) -> "FactorTable":
+        return cls.from_columns(
+            [cell.row for cell in cells],
+            [cell.col for cell in cells],
+            [cell.exposure for cell in cells],
+            [cell.events for cell in cells],
+            [cell.offset for cell in cells],
+            row_labels=row_labels,
+            col_labels=col_labels,
+        )
+
+    def __len__(self) -> int:
+        return len(self.exposure)
+
+    def with_counts(
+        self, exposure: Sequence[float], events: Sequence[float]
+    ) -> "FactorTable":
+        """The same cells with new exposure and events, e.g. a bootstrap replicate."""
+        exposure_array = np.asarray(exposure, dtype=np.float64)
+        events_array = np.asarray(events, dtype=np.float64)
+        if exposure_array.shape != self.exposure.shape or (
+            events_array.shape != self.events.shape
+        ):
+            raise ValueError(
+                f"expected {len(self)} cells, got exposure {exposure_array.shape} "
+                f"and events {events_array.shape}"
+            )
+        return replace(self, exposure=exposure_array, events=events_array)
+
+    def exposure_by(self, axis: Literal["row", "col"]) -> dict[str, float]:
+        """Total exposure per label present in the cells along one axis."""
+        labels, codes = (
+            (self.rows, self.row_codes)
+            if axis == "row"
+            else (self.cols, self.col_codes)
+        )
+        present = np.bincount(codes, minlength=len(labels))
+        totals = np.bincount(codes, weights=self.exposure, minlength=len(labels))
+        return {
+            label: float(total)
+            for label, total, count in zip(labels, totals, present)
+            if count
+        }
+
+
+def _encode(
+    values: Sequence[str], labels: Sequence[str]
+) -> tuple[tuple[str, ...], np.ndarray]:
+    index = {label: code for code, label in enumerate(labels)}
+    codes = np.empty(len(values), dtype=np.intp)
+    for position, value in enumerate(values):
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(index)
+        codes[position] = code
+    return tuple(index), codes
+
+
 def solve(
-    cells: Sequence[FactorCell],
-    row_labels: Sequence[str],
-    col_labels: Sequence[str],
+    cells: Sequence[FactorCell] | FactorTable,
+    row_labels: Sequence[str] = (),
+    col_labels: Sequence[str] = (),
     *,
     normalize: NormalizeAxis = "row",
 ) -> FactorSolution:
-    """Fit ``base``, ``row_multipliers``, and ``col_multipliers`` to ``cells``."""
-    row_multipliers = {label: 1.0 for label in row_labels}
-    col_multipliers = {label: 1.0 for label in col_labels}
-
-    total_events = sum(cell.events for cell in cells)
-    neutral_expected = sum(cell.exposure * cell.offset for cell in cells)
-    if total_events <= 0 or neutral_expected <= 0:
-        return FactorSolution(0.0, row_multipliers, col_multipliers, True, 0)
-
-    base = total_events / neutral_expected
-    converged = False
-    iterations = 0
+    """Fit ``base``, ``row_multipliers``, and ``col_multipliers`` to ``cells``.
+
+    A :class:`FactorTable` carries its own labels, so ``row_labels`` and
+    ``col_labels`` are only read for a sequence of :class:`FactorCell`.
+    """
+    table = (
+        cells
+        if isinstance(cells, FactorTable)
+        else FactorTable.from_cells(cells, row_labels, col_labels)
+    )
+    return solve_batch([table], normalize=normalize)[0]
+
+
+def solve_batch(
+    tables: Sequence[FactorTable], *, normalize: NormalizeAxis = "row"
+) -> list[FactorSolution]:
+    """Fit every table in one vectorized iteration; one solution per table.
+
+    Problem ``b``'s label codes are offset by ``b`` times the widest label set,
+    so a single ``bincount`` per axis produces every problem's marginals.
+    """
+    if not tables:
+        return []
+    n_problems = len(tables)
+    n_rows = max(len(table.rows) for table in tables) or 1
+    n_cols = max(len(table.cols) for table in tables) or 1
+    problem = np.repeat(np.arange(n_problems), [len(table) for table in tables])
+    row_index = _stack(tables, "row_codes", np.intp) + problem * n_rows
+    col_index = _stack(tables, "col_codes", np.intp) + problem * n_cols
+    exposure = _stack(tables, "exposure", np.float64)
+    events = _stack(tables, "events", np.float64)
+    weight = exposure * _stack(tables, "offset", np.float64)
+
+    fitted_rows = np.arange(n_rows) < np.array([[t.fitted_rows] for t in tables])
+    fitted_cols = np.arange(n_cols) < np.array([[t.fitted_cols] for t in tables])
+    row_multipliers = np.ones((n_problems, n_rows))
+    col_multipliers = np.ones((n_problems, n_cols))
+
+    total_events = np.bincount(problem, weights=events, minlength=n_problems)
+    neutral_expected = np.bincount(problem, weights=weight, minlength=n_problems)
+    trivial = (total_events <= 0) | (neutral_expected <= 0)
+    base = np.where(
+        trivial, 0.0, total_events / np.where(trivial, 1.0, neutral_expected)
+    )
+    row_events = _marginal(row_index, events, n_problems, n_rows)
+    col_events = _marginal(col_index, events, n_problems, n_cols)
 
-    for iterations in range(1, MAX_ITERATIONS + 1):
-        previous = (base, dict(row_multipliers), dict(col_multipliers))
+    active = ~trivial
+    converged = trivial.copy()
+    iterations = np.zeros(n_problems, dtype=int)
 
-        _sweep(cells, row_multipliers, col_multipliers, base, axis="row")
-        _sweep(cells, col_multipliers, row_multipliers, base, axis="col")
+    for iteration in range(1, MAX_ITERATIONS + 1):
+        if not active.any():
+            break
+        iterations[active] = iteration
+        previous = (base, row_multipliers, col_multipliers)
+
+        expected = _marginal(
+            row_index,
+            weight * base[problem] * col_multipliers.ravel()[col_index],
+            n_problems,
+            n_rows,
+        )
+        row_multipliers = _updated(
+            row_multipliers, row_events, expected, fitted_rows & active[:, None]
+        )
+        expected = _marginal(
+            col_index,
+            weight * base[problem] * row_multipliers.ravel()[row_index],
+            n_problems,
+            n_cols,
+        )
+        col_multipliers = _updated(
+            col_multipliers, col_events, expected, fitted_cols & active[:, None]
+        )
 
         # Rescale the base so total expected events match total observed. The
         # denominator excludes the base itself — it is what is being solved for.
-        unscaled = _expected_without_base(cells, row_multipliers, col_multipliers)
-        if unscaled > 0:
-            base = total_events / unscaled
-
-        if _converged(previous, base, row_multipliers, col_multipliers):
-            converged = True
-            break
+        unscaled = np.bincount(
+            problem,
+            weights=weight
+            * row_multipliers.ravel()[row_index]
+            * col_multipliers.ravel()[col_index],
+            minlength=n_problems,
+        )
+        rescale = active & (unscaled > 0)
+        base = np.where(rescale, total_events / np.where(rescale, unscaled, 1.0), base)
+
+        delta = np.maximum(
+            np.abs(base - previous[0]),
+            np.maximum(
+                np.abs(row_multipliers - previous[1]).max(axis=1),
+                np.abs(col_multipliers - previous[2]).max(axis=1),
+            ),
+        )
+        settled = active & (delta < CONVERGENCE_TOLERANCE)
+        converged |= settled
+        active &= ~settled
 
     if normalize == "row":
-        base, row_multipliers = _normalize(cells, base, row_multipliers, axis="row")
+        base, row_multipliers = _normalize(
+            base, row_multipliers, row_index, exposure, fitted_rows, ~trivial
+        )
     elif normalize == "col":
-        base, col_multipliers = _normalize(cells, base, col_multipliers, axis="col")
+        base, col_multipliers = _normalize(
+            base, col_multipliers, col_index, exposure, fitted_cols, ~trivial
+        )
 
-    return FactorSolution(base, row_multipliers, col_multipliers, converged, iterations)
+    return [
+        FactorSolution(
+            float(base[b]),
+            _labelled(table.rows[: table.fitted_rows], row_multipliers[b]),
+            _labelled(table.cols[: table.fitted_cols], col_multipliers[b]),
+            bool(converged[b]),
+            int(iterations[b]),
+        )
+        for b, table in enumerate(tables)
+    ]
 
 
-def _sweep(
-    cells: Sequence[FactorCell],
-    target: dict[str, float],
-    other: dict[str, float],
-    base: float,
-    *,
-    axis: Literal["row", "col"],
-) -> None:
-    events = {label: 0.0 for label in target}
-    expected = {label: 0.0 for label in target}
-    for cell in cells:
-        label = cell.row if axis == "row" else cell.col
-        if label not in target:
-            continue
-        other_label = cell.col if axis == "row" else cell.row
-        events[label] += cell.events
-        expected[label] += (
-            cell.exposure * cell.offset * base * other.get(other_label, 1.0)
-        )
+def _stack(tables: Sequence[FactorTable], field: str, dtype: type) -> np.ndarray:
+    return np.concatenate(
+        [np.asarray(getattr(table, field), dtype=dtype) for table in tables]
+    )
+
 
-    for label in target:
-        if expected[label] <= 0:
-            continue
-        raw = events[label] / expected[label]
-        target[label] = min(MAX_MULTIPLIER, max(MIN_MULTIPLIER, raw))
-
-
-def _expected_without_base(
-    cells: Sequence[FactorCell],
-    row_multipliers: dict[str, float],
-    col_multipliers: dict[str, float],
-) -> float:
-    """Total expected events at ``base = 1``."""
-    return sum(
-        cell.exposure
-        * cell.offset
-        * row_multipliers.get(cell.row, 1.0)
-        * col_multipliers.get(cell.col, 1.0)
-        for cell in cells
+def _marginal(
+    index: np.ndarray, weights: np.ndarray, n_problems: int, width: int
+) -> np.ndarray:
+    """Per-problem, per-label sums of ``weights`` as an ``(n_problems, width)`` array."""
+    return np.bincount(index, weights=weights, minlength=n_problems * width).reshape(
+        n_problems, width
     )
 
 
-def _converged(
-    previous: tuple[float, dict[str, float], dict[str, float]],
-    base: float,
-    row_multipliers: dict[str, float],
-    col_multipliers: dict[str, float],
-) -> bool:
-    prior_base, prior_rows, prior_cols = previous
-    deltas = [abs(base - prior_base)]
-    deltas.extend(abs(row_multipliers[k] - prior_rows[k]) for k in row_multipliers)
-    deltas.extend(abs(col_multipliers[k] - prior_cols[k]) for k in col_multipliers)
-    return max(deltas) < CONVERGENCE_TOLERANCE
+def _updated(
+    multipliers: np.ndarray,
+    events: np.ndarray,
+    expected: np.ndarray,
+    mask: np.ndarray,
+) -> np.ndarray:
+    """Observed over expected where ``mask`` has any expectation; unchanged elsewhere."""
+    update = mask & (expected > 0)
+    raw = events / np.where(update, expected, 1.0)
+    return np.where(update, np.clip(raw, MIN_MULTIPLIER, MAX_MULTIPLIER), multipliers)
 
 
 def _normalize(
-    cells: Sequence[FactorCell],
-    base: float,
-    multipliers: dict[str, float],
-    *,
-    axis: Literal["row", "col"],
-) -> tuple[float, dict[str, float]]:
-    exposure: dict[str, float] = {}
-    for cell in cells:
-        label = cell.row if axis == "row" else cell.col
-        exposure[label] = exposure.get(label, 0.0) + cell.exposure
+    base: np.ndarray,
+    multipliers: np.ndarray,
+    index: np.ndarray,
+    exposure: np.ndarray,
+    fitted: np.ndarray,
+    solved: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Scale one axis to an exposure-weighted mean of 1.0, folding the scale into base.
+
+    Labels outside the fit keep their 1.0 in the mean but are not rescaled.
+    """
+    weights = _marginal(index, exposure, *multipliers.shape)
+    total = weights.sum(axis=1)
+    weighted_mean = (multipliers * weights).sum(axis=1) / np.where(
+        total > 0, total, 1.0
+    )
+    scale = solved & (total > 0) & (weighted_mean > 0)
+    divisor = np.where(scale, weighted_mean, 1.0)
+    return base * divisor, np.where(
+        fitted & scale[:, None], multipliers / divisor[:, None], multipliers
+    )
 
-    total = sum(exposure.values())
-    if total <= 0:
-        return base, multipliers
 
-    weighted_mean = (
-        sum(multipliers.get(label, 1.0) * value for label, value in exposure.items())
-        / total
-    )
-    if weighted_mean <= 0:
-        return base, multipliers
-    scaled = {label: value / weighted_mean for label, value in multipliers.items()}
-    return base * weighted_mean, scaled
+def _labelled(labels: Sequence[str], values: np.ndarray) -> dict[str, float]:
+    return {label: float(value) for label, value in zip(labels, values)}
 
 
 def exposure_by(
-    cells: Sequence[FactorCell], axis: Literal["row", "col"]
+    cells: Sequence[FactorCell] | FactorTable, axis: Literal["row", "col"]
 ) -> dict[str, float]:
     """Total exposure per label along one axis."""
+    if isinstance(cells, FactorTable):
+        return cells.exposure_by(axis)
     totals: dict[str, float] = {}
     for cell in cells:
         label = cell.row if axis == "row" else cell.col
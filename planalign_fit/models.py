@@ -106,6 +106,8 @@ class FittedValue:
     credibility: float
     basis: str
     note: str
+    # Bootstrap percentile interval, when the fit was run with replicates.
+    interval: Optional[tuple[float, float]] = None
 
     @classmethod
     def from_credibility(cls, name: str, result: CredibilityResult) -> "FittedValue":
@@ -138,6 +140,7 @@ class FittedValue:
             "credibility": self.credibility,
             "basis": self.basis,
             "note": self.note,
+            **({"interval": list(self.interval)} if self.interval else {}),
         }
 
 
@@ -185,6 +188,34 @@ class HazardFit:
         ]
 
 
+@dataclass(frozen=True)
+class BootstrapSummary:
+    """Percentile intervals from ``replicates`` employee-resampled refits.
+
+    ``intervals`` maps a :class:`FittedValue` name to ``(lower, upper, n)``,
+    where ``n`` counts the replicates that produced the value at all — a
+    replicate can lose a parameter, e.g. when its resample leaves promotions
+    inseparable from raises.
+    """
+
+    replicates: int
+    seed: int
+    level: float
+    intervals: dict[str, tuple[float, float, int]]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "method": "percentile bootstrap, employees resampled with replacement",
+            "replicates": self.replicates,
+            "seed": self.seed,
+            "level": self.level,
+            "intervals": {
+                name: {"lower": lower, "upper": upper, "replicates": count}
+                for name, (lower, upper, count) in sorted(self.intervals.items())
+            },
+        }
+
+
 @dataclass(frozen=True)
 class CellObservation:
     """One age x tenure x level cell's raw counts, for the report's evidence table."""
@@ -223,6 +254,7 @@ class FitResult:
     deferral_rates: dict[tuple[str, str], FittedValue] = field(default_factory=dict)
     config_overrides: dict[str, FittedValue] = field(default_factory=dict)
     diagnostics: dict[str, Any] = field(default_factory=dict)
+    bootstrap: Optional[BootstrapSummary] = None
     unfittable: list[Unfittable] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
 
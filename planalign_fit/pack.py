@@ -95,6 +95,10 @@ class PackManifest:
     notes: str = ""
     unfittable: list[dict[str, Any]] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
+    # Bootstrap percentile intervals per fitted value; empty for a point-only
+    # fit. Not part of the fingerprint: intervals describe the values, they do
+    # not change what a run using the pack simulates.
+    uncertainty: dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         payload = asdict(self)
@@ -368,6 +372,7 @@ def build_pack(
         notes=notes,
         unfittable=[u.to_dict() for u in result.unfittable],
         warnings=list(result.warnings),
+        uncertainty=result.bootstrap.to_dict() if result.bootstrap else {},
     )
     return ParameterPack(
         manifest=manifest, config_fragment=config_fragment, seed_files=seed_files
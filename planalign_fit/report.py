@@ -87,6 +87,15 @@ def _summary(run: "FitRun") -> str:
     moved = _moved_thresholds(run)
     if moved:
         rows.append(("Non-default thresholds", moved))
+    if result.bootstrap is not None:
+        rows.append(
+            (
+                "Bootstrap",
+                f"{result.bootstrap.replicates:,} replicates, "
+                f"{result.bootstrap.level:.0%} percentile intervals "
+                f"(seed {result.bootstrap.seed})",
+            )
+        )
     body = "\n".join(f"| {label} | {value} |" for label, value in rows)
     return f"""## Summary
 
@@ -149,23 +158,39 @@ def _event_count(events: float) -> str:
 
 
 def _fitted_table(values: Iterable[FittedValue]) -> str:
+    values = list(values)
+    # The interval column appears only for a bootstrapped fit, so a point-only
+    # report reads exactly as it always has.
+    intervals = any(value.interval is not None for value in values)
     header = (
-        "| Parameter | Fitted | Prior | Change | Exposure | Credibility | Basis |\n"
-        "|---|---:|---:|---:|---:|---:|---|"
+        "| Parameter | Fitted | Prior | Change | Exposure | Credibility | Basis |"
+        + (" Bootstrap interval |" if intervals else "")
+        + "\n|---|---:|---:|---:|---:|---:|---|"
+        + ("---:|" if intervals else "")
     )
     rows = []
     for value in values:
         moved = value.moved_pct
         moved_text = "n/a" if moved is None else f"{moved:+.1%}"
         flag = " ⚠️" if value.basis in THIN_BASES else ""
-        rows.append(
+        row = (
             f"| `{value.name}` | {value.value:.4f} | {value.prior:.4f} | "
             f"{moved_text} | {value.exposure:,.0f} | {value.credibility:.0%} | "
             f"{value.basis}{flag} |"
         )
+        if intervals:
+            row += f" {_interval(value)} |"
+        rows.append(row)
     return "\n".join([header, *rows])
 
 
+def _interval(value: FittedValue) -> str:
+    if value.interval is None:
+        return "n/a"
+    lower, upper = value.interval
+    return f"{lower:.4f} – {upper:.4f}"
+
+
 def _cell_table(cells: Sequence[CellObservation], limit: int = 40) -> str:
     populated = sorted(
         (cell for cell in cells if cell.exposure > 0),
@@ -316,7 +341,7 @@ current seed or config value — with weight `Z = exposure / (exposure + k)`, at
 {run.options.min_exposure:,.0f} exposure are labelled `pooled` and flagged, so a
 handful of observations can never become a parameter on their own.
 
-**Base config.** `{run.pack.manifest.base_config}`
+{_bootstrap_method(run)}**Base config.** `{run.pack.manifest.base_config}`
 **Base seeds.** `{run.pack.manifest.base_seeds}`
 
 ## Applying this pack
@@ -331,6 +356,20 @@ The run stamps `{run.pack.manifest.pack_id}` and fingerprint
 """
 
 
+def _bootstrap_method(run: "FitRun") -> str:
+    summary = run.result.bootstrap
+    if summary is None:
+        return ""
+    return f"""**Sampling uncertainty.** Employees were resampled with replacement
+{summary.replicates:,} times (seed {summary.seed}); each resample rebuilt the
+linked tables and reran every estimator above, smoothing included. The interval
+column is the central {summary.level:.0%} of those refits. It measures how much
+a value would move on another draw of the same workforce, not whether the
+model's functional form is right.
+
+"""
+
+
 def _basis_label(classification: Optional[PromotionClassification]) -> str:
     """One line an analyst can read without opening the rest of the report."""
     if classification is None:
@@ -9,13 +9,14 @@ that, so a fit can be inspected before it is materialized.
 from __future__ import annotations
 
 import logging
+import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 import duckdb
 
-from planalign_fit import behavior, compensation, hazards, promotion
+from planalign_fit import behavior, bootstrap, compensation, hazards, promotion
 from planalign_fit.bands import BandDefinitions, load_band_definitions
 from planalign_fit.models import FitResult, PromotionBasis, Unfittable
 from planalign_fit.pack import ParameterPack, build_pack
@@ -49,6 +50,13 @@ class FitOptions:
     pack_id: Optional[str] = None
     notes: str = ""
     only_years: Optional[tuple[int, ...]] = None
+    # Employee-resampled refits behind each value's percentile interval; 0
+    # publishes point estimates only.
+    bootstrap_replicates: int = 0
+    bootstrap_seed: int = 0
+    bootstrap_level: float = bootstrap.DEFAULT_BOOTSTRAP_LEVEL
+    # Pool workers for the bootstrap (None sizes the pool from CPU and memory).
+    parallel: Optional[int] = None
 
 
 @dataclass
@@ -80,7 +88,16 @@ def fit_parameter_pack(
         if options.only_years is not None:
             snapshot_set = snapshot_set.subset(options.only_years)
         transitions = build_transitions(conn, snapshot_set, bands)
-        result = _run_estimators(transitions, priors, options)
+        if options.bootstrap_replicates > 0:
+            with tempfile.TemporaryDirectory(prefix="planalign_fit_") as scratch:
+                source = bootstrap.export_source(transitions, Path(scratch))
+                result = _run_estimators(transitions, priors, options)
+                bootstrap.attach_intervals(
+                    result,
+                    bootstrap.bootstrap_intervals(transitions, source, priors, options),
+                )
+        else:
+            result = _run_estimators(transitions, priors, options)
 
     pack = build_pack(
         result=result,
@@ -124,10 +141,6 @@ def _run_estimators(
         "min_exposure": options.min_exposure,
     }
 
-    result.termination, result.termination_cells = hazards.fit_termination_hazard(
-        transitions, priors.termination, **smoothing
-    )
-
     # Decide how promotions can be known *before* fitting them: the answer sets
     # every row's promotion weight, which both the promotion hazard and the
     # merit median then read (#511).
@@ -138,6 +151,7 @@ def _run_estimators(
         separation_exposure_gate=options.separation_exposure_gate,
         min_exposure=options.min_exposure,
     )
+    hazard_inputs = [hazards.termination_inputs(transitions, priors.termination)]
     if result.promotion_classification.basis is PromotionBasis.NOT_FITTED:
         result.unfittable.append(
             Unfittable(
@@ -148,13 +162,22 @@ def _run_estimators(
             )
         )
     else:
-        result.promotion, result.promotion_cells = hazards.fit_promotion_hazard(
-            transitions,
-            priors.promotion,
-            exposure_filter=promotion.exposure_filter(result.promotion_classification),
-            **smoothing,
+        hazard_inputs.append(
+            hazards.promotion_inputs(
+                transitions,
+                priors.promotion,
+                exposure_filter=promotion.exposure_filter(
+                    result.promotion_classification
+                ),
+            )
         )
 
+    # Both hazards share the age x tenure bands, so they solve as one batch.
+    fits = hazards.fit_hazards(hazard_inputs, transitions.bands, **smoothing)
+    result.termination, result.termination_cells = fits[0], list(hazard_inputs[0].cells)
+    if len(fits) > 1:
+        result.promotion, result.promotion_cells = fits[1], list(hazard_inputs[1].cells)
+
     result.merit_by_level = compensation.fit_merit_by_level(
         transitions, priors, **smoothing
     )
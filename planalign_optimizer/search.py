@@ -38,6 +38,14 @@ from .pareto import pareto_frontier
 
 SEED_PHASE_FRACTION = 0.6
 
+# How many candidates may be outstanding when the next refinement is chosen.
+# Refinement ``n`` is derived from the first ``n - SEARCH_WINDOW + 1``
+# candidates, whatever order results arrive in, so a fixed window (rather than
+# the machine's worker count) keeps a search reproducible across hosts.
+SEARCH_WINDOW = 8
+
+_CandidateMeta = tuple[str, dict[str, LeverValue], Path, str | None, bool]
+
 
 def seed_phase_count(max_runs: int) -> int:
     """Return how many candidates the deterministic seed phase requests.
@@ -58,53 +66,162 @@ def run_optimizer(
     parallel: int | None = None,
     on_event: Callable[[PoolEvent], None] | None = None,
     pool_factory: Callable[[int], ScenarioRunPool] = ScenarioRunPool,
+    search_window: int = SEARCH_WINDOW,
 ) -> tuple[OptimizerRun, WorkerBudget]:
-    """Evaluate at most ``max_runs`` exact-unique designs and summarize them."""
+    """Evaluate at most ``max_runs`` exact-unique designs and summarize them.
+
+    The seed phase and refinements share one pool run: each finished job may
+    release the next refinement, so no phase waits on its slowest candidate.
+    """
     if max_runs < 1:
         raise ValueError("max_runs must be >= 1")
+    if search_window < 1:
+        raise ValueError("search_window must be >= 1")
     database_dir.mkdir(parents=True, exist_ok=True)
     budget = resolve_worker_count(parallel, max_runs)
-    seed_count = seed_phase_count(max_runs)
-    seed_values = sample_candidates(spec.design_space, seed_count, seed=search_seed)
-    candidates = _evaluate_values(
-        seed_values,
-        spec,
-        baseline,
-        database_dir,
-        max_runs,
-        budget,
-        pool_factory,
-        on_event,
+    search = _IncrementalSearch(
+        spec, baseline, database_dir, max_runs, search_seed, search_window
     )
-    evaluated = sum(candidate.is_duplicate_of is None for candidate in candidates)
-    remaining = max_runs - evaluated
-    if remaining > 0 and candidates:
-        anchor = _refinement_anchor(candidates, spec.objective)
-        excluded = {
-            candidate_identity(candidate.lever_values) for candidate in candidates
-        }
-        refinement_values = refine_candidates(
-            spec.design_space,
-            anchor.lever_values,
-            remaining,
-            seed=search_seed + 1,
-            exclude=excluded,
-        )
-        candidates += _evaluate_values(
-            refinement_values,
-            spec,
-            baseline,
-            database_dir,
-            remaining,
-            budget,
-            pool_factory,
-            on_event,
-            start_index=len(candidates),
+    seed_values = sample_candidates(
+        spec.design_space, seed_phase_count(max_runs), seed=search_seed
+    )
+    jobs = search.start(seed_values)
+    pool = pool_factory(budget.workers)
+    if hasattr(pool, "run_incremental"):
+        results = pool.run_incremental(
+            run_seed_worker, jobs, search.on_result, on_event=on_event
         )
+    else:
+        # Batch-only pools (test doubles) run each released wave to completion.
+        results = {}
+        while jobs:
+            wave = pool.run(run_seed_worker, jobs, on_event=on_event)
+            results.update(wave)
+            jobs = [
+                follow_up
+                for job in jobs
+                for follow_up in search.on_result(wave[job.name])
+            ]
+    candidates = search.finish(results)
     run = _build_run(spec, baseline, max_runs, search_seed, candidates)
     return run, budget
 
 
+class _IncrementalSearch:
+    """Candidate bookkeeping for one search, fed results in any order.
+
+    Candidates are numbered as they are released. Results are folded in index
+    order (a completed prefix), and refinement ``n`` only ever sees the prefix
+    of length ``n - window + 1``, so the candidates chosen depend on
+    ``search_seed`` and ``window`` but never on which job happened to finish
+    first.
+    """
+
+    def __init__(
+        self,
+        spec: OptimizerSpec,
+        baseline: SimulationConfig,
+        database_dir: Path,
+        max_runs: int,
+        search_seed: int,
+        window: int,
+    ) -> None:
+        self.spec = spec
+        self.baseline = baseline
+        self.database_dir = database_dir
+        self.max_runs = max_runs
+        self.search_seed = search_seed
+        self.window = window
+        self.metadata: list[_CandidateMeta] = []
+        self.results: dict[str, JobResult] = {}
+        self.completed: list[Candidate] = []
+        self.by_id: dict[str, Candidate] = {}
+        self.identities: set[object] = set()
+        self.refinements = 0
+        self.exhausted = False
+
+    @property
+    def evaluated(self) -> int:
+        return sum(entry[3] is None for entry in self.metadata)
+
+    def start(self, seed_values: Sequence[dict[str, LeverValue]]) -> list[ScenarioJob]:
+        """Release the seed phase plus any refinements it already allows."""
+        jobs = self._release(seed_values, self.max_runs)
+        return jobs + self._pump()
+
+    def on_result(self, result: JobResult) -> list[ScenarioJob]:
+        """Record one finished job and return the refinements it releases."""
+        self.results[result.name] = result
+        return self._pump()
+
+    def finish(self, results: dict[str, JobResult]) -> tuple[Candidate, ...]:
+        """Fold in anything still outstanding and return every candidate."""
+        for name, result in results.items():
+            self.results.setdefault(name, result)
+        self._advance()
+        return tuple(self.completed)
+
+    def _release(
+        self, values: Sequence[dict[str, LeverValue]], limit: int
+    ) -> list[ScenarioJob]:
+        jobs, metadata = _build_jobs(
+            values,
+            self.baseline,
+            self.database_dir,
+            limit,
+            start_index=len(self.metadata),
+        )
+        self.metadata.extend(metadata)
+        self.identities.update(candidate_identity(entry[1]) for entry in metadata)
+        return jobs
+
+    def _pump(self) -> list[ScenarioJob]:
+        jobs: list[ScenarioJob] = []
+        while True:
+            self._advance()
+            if not self._can_refine():
+                return jobs
+            jobs += self._refine()
+
+    def _advance(self) -> None:
+        while len(self.completed) < len(self.metadata):
+            entry = self.metadata[len(self.completed)]
+            candidate_id, _, _, duplicate_of, resolution_failed = entry
+            if (
+                duplicate_of is None
+                and not resolution_failed
+                and candidate_id not in self.results
+            ):
+                return
+            candidate = _collect_candidate(entry, self.results, self.spec, self.by_id)
+            self.completed.append(candidate)
+            self.by_id[candidate_id] = candidate
+
+    def _can_refine(self) -> bool:
+        next_index = len(self.metadata)
+        return (
+            not self.exhausted
+            and self.evaluated < self.max_runs
+            and len(self.completed) >= max(1, next_index - self.window + 1)
+        )
+
+    def _refine(self) -> list[ScenarioJob]:
+        visible = self.completed[: max(1, len(self.metadata) - self.window + 1)]
+        anchor = _refinement_anchor(visible, self.spec.objective, self.refinements)
+        values = refine_candidates(
+            self.spec.design_space,
+            anchor.lever_values,
+            self.max_runs - self.evaluated,
+            seed=self.search_seed + 1,
+            exclude=self.identities,
+        )
+        if not values:
+            self.exhausted = True
+            return []
+        self.refinements += 1
+        return self._release(values[:1], 1)
+
+
 def rank_feasible(
     candidates: Sequence[Candidate], spec: ObjectiveConstraintSpec
 ) -> tuple[str, ...]:
@@ -157,40 +274,17 @@ def binding_constraints(candidates: Sequence[Candidate]) -> tuple[str, ...]:
     )
 
 
-def _evaluate_values(
-    values: Sequence[dict[str, LeverValue]],
-    spec: OptimizerSpec,
-    baseline: SimulationConfig,
-    database_dir: Path,
-    budget_limit: int,
-    worker_budget: WorkerBudget,
-    pool_factory: Callable[[int], ScenarioRunPool],
-    on_event: Callable[[PoolEvent], None] | None,
-    *,
-    start_index: int = 0,
-) -> tuple[Candidate, ...]:
-    jobs, metadata = _build_jobs(
-        values, baseline, database_dir, budget_limit, start_index=start_index
-    )
-    results = (
-        pool_factory(worker_budget.workers).run(
-            run_seed_worker, jobs, on_event=on_event
-        )
-        if jobs
-        else {}
-    )
-    return _collect_candidates(metadata, results, spec)
-
-
 def _refinement_anchor(
-    candidates: Sequence[Candidate], spec: ObjectiveConstraintSpec
+    candidates: Sequence[Candidate], spec: ObjectiveConstraintSpec, turn: int = 0
 ) -> Candidate:
+    """Pick the design to refine around; ``turn`` rotates along a frontier."""
     ranked = rank_feasible(candidates, spec)
     if ranked:
         return next(item for item in candidates if item.candidate_id == ranked[0])
     frontier = pareto_frontier(candidates, spec.objectives)
     if frontier:
-        return next(item for item in candidates if item.candidate_id == frontier[0])
+        chosen = frontier[turn % len(frontier)]
+        return next(item for item in candidates if item.candidate_id == chosen)
     return min(candidates, key=_constraint_penalty)
 
 
@@ -208,10 +302,7 @@ def _build_jobs(
     max_runs: int,
     *,
     start_index: int = 0,
-) -> tuple[
-    list[ScenarioJob],
-    list[tuple[str, dict[str, LeverValue], Path, str | None, bool]],
-]:
+) -> tuple[list[ScenarioJob], list[_CandidateMeta]]:
     """Resolve each candidate's config, isolating resolution failures.
 
     A candidate whose declared-lever overlay cannot resolve against the
@@ -221,7 +312,7 @@ def _build_jobs(
     (FR-016's "failed" status exists for exactly this).
     """
     jobs: list[ScenarioJob] = []
-    metadata: list[tuple[str, dict[str, LeverValue], Path, str | None, bool]] = []
+    metadata: list[_CandidateMeta] = []
     seen: dict[object, str] = {}
     evaluated = 0
     for offset, lever_values in enumerate(values):
@@ -264,41 +355,34 @@ def _scenario_job(
     )
 
 
-def _collect_candidates(
-    metadata: Sequence[tuple[str, dict[str, LeverValue], Path, str | None, bool]],
+def _collect_candidate(
+    entry: _CandidateMeta,
     results: dict[str, JobResult],
     spec: OptimizerSpec,
-) -> tuple[Candidate, ...]:
-    collected: list[Candidate] = []
-    by_id: dict[str, Candidate] = {}
-    for candidate_id, values, db_path, duplicate_of, resolution_failed in metadata:
-        if duplicate_of is not None:
-            original = by_id[duplicate_of]
-            candidate = original.model_copy(
-                update={
-                    "candidate_id": candidate_id,
-                    "lever_values": values,
-                    "is_duplicate_of": duplicate_of,
-                    "duration_seconds": 0.0,
-                }
-            )
-        elif resolution_failed:
-            candidate = classify_candidate(
-                candidate_id, values, None, spec.objective, {}, failed=True
-            )
-        else:
-            result = results[candidate_id]
-            candidate = candidate_from_job_result(
-                candidate_id,
-                values,
-                db_path,
-                spec.objective,
-                result,
-                ensemble_database=spec.baseline.ensemble_database,
-            )
-        collected.append(candidate)
-        by_id[candidate_id] = candidate
-    return tuple(collected)
+    by_id: dict[str, Candidate],
+) -> Candidate:
+    candidate_id, values, db_path, duplicate_of, resolution_failed = entry
+    if duplicate_of is not None:
+        return by_id[duplicate_of].model_copy(
+            update={
+                "candidate_id": candidate_id,
+                "lever_values": values,
+                "is_duplicate_of": duplicate_of,
+                "duration_seconds": 0.0,
+            }
+        )
+    if resolution_failed:
+        return classify_candidate(
+            candidate_id, values, None, spec.objective, {}, failed=True
+        )
+    return candidate_from_job_result(
+        candidate_id,
+        values,
+        db_path,
+        spec.objective,
+        results[candidate_id],
+        ensemble_database=spec.baseline.ensemble_database,
+    )
 
 
 def _build_run(
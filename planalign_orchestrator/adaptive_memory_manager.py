@@ -21,8 +21,6 @@ from __future__ import annotations
 
 import gc
 import json
-import threading
-import time
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -33,6 +31,7 @@ from typing import Any, Callable, Dict, List, Optional
 import psutil
 
 from .logger import ProductionLogger
+from .monitoring.sampler import get_resource_sampler
 
 
 class MemoryPressureLevel(Enum):
@@ -178,7 +177,7 @@ class AdaptiveMemoryManager:
         # Memory monitoring state
         self._process = psutil.Process()
         self._monitoring_active = False
-        self._monitoring_thread: Optional[threading.Thread] = None
+        self._subscription: Optional[int] = None
         self._history: deque[MemorySnapshot] = deque(maxlen=config.history_size)
 
         # Adaptive state
@@ -217,30 +216,26 @@ class AdaptiveMemoryManager:
             return
 
         self._monitoring_active = True
-        self._monitoring_thread = threading.Thread(
-            target=self._monitoring_loop, daemon=True, name="AdaptiveMemoryMonitor"
+        self._subscription = get_resource_sampler().subscribe(
+            self._monitoring_tick, self.config.monitoring_interval_seconds
         )
-        self._monitoring_thread.start()
         self.logger.info("Started adaptive memory monitoring")
 
     def stop_monitoring(self) -> None:
         """Stop background memory monitoring"""
         self._monitoring_active = False
-        if self._monitoring_thread:
-            self._monitoring_thread.join(timeout=2.0)
-            self._monitoring_thread = None
+        if self._subscription is not None:
+            get_resource_sampler().unsubscribe(self._subscription)
+            self._subscription = None
         self.logger.info("Stopped adaptive memory monitoring")
 
-    def _monitoring_loop(self) -> None:
-        """Background monitoring loop"""
-        while self._monitoring_active:
-            try:
-                snapshot = self._take_memory_snapshot()
-                self._process_snapshot(snapshot)
-                time.sleep(self.config.monitoring_interval_seconds)
-            except Exception as e:
-                self.logger.warning(f"Memory monitoring error: {e}")
-                time.sleep(self.config.monitoring_interval_seconds * 2)
+    def _monitoring_tick(self) -> None:
+        """Shared-sampler callback: take and act on one snapshot"""
+        try:
+            snapshot = self._take_memory_snapshot()
+            self._process_snapshot(snapshot)
+        except Exception as e:
+            self.logger.warning(f"Memory monitoring error: {e}")
 
     def _take_memory_snapshot(self, operation: Optional[str] = None) -> MemorySnapshot:
         """Take a memory usage snapshot"""
@@ -0,0 +1,349 @@
+"""Baseline artifact cache for ``planalign validate-change``.
+
+Every validation rebuilds the committed ``HEAD`` baseline before building the
+candidate, and while iterating on one change that baseline is identical every time.
+This cache keys a finished baseline build by everything that can change its output:
+
+- ``HEAD`` commit SHA (the code the stashed baseline runs);
+- effective-config fingerprint (census path and horizon stripped — they are keyed
+  separately);
+- census content hash (bytes, not path, so a moved/renamed parquet still hits);
+- simulation horizon;
+- DuckDB version (mart fingerprints use DuckDB's ``hash()``, which is only stable
+  within one engine version).
+
+An entry always stores per-mart **fingerprints** (schema + row count + an
+order-independent, duplicate-preserving content hash) plus the build metrics, which
+is enough to prove parity against a fresh candidate. Optionally it also stores the
+baseline ``.duckdb`` so a mismatch can be diagnosed with exact ``EXCEPT ALL`` row
+counts. Entries are evicted by age and by total size (least-recently-used first).
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import duckdb
+
+from planalign_orchestrator.state_pipeline_validation import (
+    canonical_fingerprint,
+    file_fingerprint,
+)
+
+CACHE_DIRNAME = ".planalign_baseline_cache"
+ENTRY_FILE = "entry.json"
+DATABASE_FILE = "baseline.duckdb"
+DEFAULT_MAX_AGE_DAYS = 14.0
+DEFAULT_MAX_BYTES = 20 * 1024**3  # cached baseline DBs at 60k census are ~1-2 GiB
+CACHE_FORMAT_VERSION = 1
+
+
+# --------------------------------------------------------------------------- #
+# Mart fingerprints
+# --------------------------------------------------------------------------- #
+@dataclass(frozen=True)
+class MartFingerprint:
+    """Schema + content digest of one mart, comparable without the source DB."""
+
+    schema: Tuple[Tuple[str, str, bool], ...]
+    row_count: int
+    content_hash: str
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "schema": [list(column) for column in self.schema],
+            "row_count": self.row_count,
+            "content_hash": self.content_hash,
+        }
+
+    @classmethod
+    def from_json(cls, payload: Dict[str, Any]) -> "MartFingerprint":
+        return cls(
+            schema=tuple(
+                (str(name), str(data_type), bool(nullable))
+                for name, data_type, nullable in payload["schema"]
+            ),
+            row_count=int(payload["row_count"]),
+            content_hash=str(payload["content_hash"]),
+        )
+
+
+def fingerprint_marts(
+    db_path: str | Path,
+    marts: Sequence[str],
+    excluded: Sequence[str] = (),
+) -> Dict[str, Optional[MartFingerprint]]:
+    """Fingerprint every mart in ``db_path`` (``None`` when the mart is absent).
+
+    The content hash is ``SUM(hash(row))`` over the compared columns: order
+    independent (matching ``EXCEPT ALL`` semantics) and duplicate-preserving (a
+    repeated row adds its hash twice). Excluded audit columns are dropped exactly as
+    ``compare_marts`` drops them.
+    """
+    from planalign_orchestrator.change_validation import _quoted_columns, _schema
+
+    results: Dict[str, Optional[MartFingerprint]] = {}
+    con = duckdb.connect(database=":memory:")
+    try:
+        con.execute(f"ATTACH '{db_path}' AS base (READ_ONLY)")
+        for relation in marts:
+            schema = [
+                c for c in _schema(con, "base", relation) if c.name not in excluded
+            ]
+            if not schema:
+                results[relation] = None
+                continue
+            row_hash = f"hash({_quoted_columns(schema)})::HUGEINT"
+            row = con.execute(
+                f"SELECT COUNT(*), COALESCE(SUM({row_hash}), 0) "
+                f'FROM base."{relation}"'
+            ).fetchone()
+            if row is None:
+                raise RuntimeError("aggregate query returned no row")
+            results[relation] = MartFingerprint(
+                schema=tuple((c.name, c.data_type, c.nullable) for c in schema),
+                row_count=int(row[0]),
+                content_hash=f"{int(row[1]):x}",
+            )
+    finally:
+        con.close()
+    return results
+
+
+def compare_fingerprints(
+    baseline: Dict[str, Optional[MartFingerprint]],
+    candidate: Dict[str, Optional[MartFingerprint]],
+) -> Dict[str, Tuple[object, object]]:
+    """Return ``compare_marts``-shaped diffs from fingerprints alone.
+
+    Identical marts report ``(0, 0)``; a content difference reports the
+    ``("fingerprint-mismatch", ...)`` sentinel because exact row-diff counts need the
+    baseline database (cache with ``store_database=True`` to keep it).
+    """
+    results: Dict[str, Tuple[object, object]] = {}
+    for relation in sorted(set(baseline) | set(candidate)):
+        base, cand = baseline.get(relation), candidate.get(relation)
+        if base is None and cand is None:
+            results[relation] = ("absent", "absent")
+        elif base is None:
+            results[relation] = ("absent", "present")
+        elif cand is None:
+            results[relation] = ("present", "absent")
+        elif base.schema != cand.schema:
+            results[relation] = ("schema-mismatch", "schema-mismatch")
+        elif (base.row_count, base.content_hash) != (cand.row_count, cand.content_hash):
+            results[relation] = ("fingerprint-mismatch", "fingerprint-mismatch")
+        else:
+            results[relation] = (0, 0)
+    return results
+
+
+# --------------------------------------------------------------------------- #
+# Cache key
+# --------------------------------------------------------------------------- #
+@dataclass(frozen=True)
+class BaselineCacheKey:
+    head_sha: str
+    config_fingerprint: str
+    census_sha: Optional[str]
+    horizon: str
+    duckdb_version: str = duckdb.__version__
+
+    @property
+    def digest(self) -> str:
+        payload = {"format": CACHE_FORMAT_VERSION, **asdict(self)}
+        return canonical_fingerprint(payload)[:32]
+
+
+def baseline_cache_key(
+    *,
+    head_sha: str,
+    effective_config: Path,
+    horizon: Tuple[int, int],
+    repo_root: Path,
+) -> BaselineCacheKey:
+    """Build the cache key for one baseline build from its materialized config.
+
+    The census is keyed by content, so the path is removed from the config
+    fingerprint; so are ``start_year``/``end_year``, which the horizon covers.
+    """
+    import yaml
+
+    data = yaml.safe_load(effective_config.read_text()) or {}
+    setup = data.get("setup") or {}
+    census_path = setup.pop("census_parquet_path", None)
+    simulation = data.get("simulation") or {}
+    simulation.pop("start_year", None)
+    simulation.pop("end_year", None)
+
+    census_sha: Optional[str] = None
+    if census_path:
+        census = Path(census_path)
+        if not census.is_absolute():
+            census = repo_root / census
+        census_sha = file_fingerprint(census)
+    return BaselineCacheKey(
+        head_sha=head_sha,
+        config_fingerprint=canonical_fingerprint(data),
+        census_sha=census_sha,
+        horizon=f"{horizon[0]}-{horizon[1]}",
+    )
+
+
+# --------------------------------------------------------------------------- #
+# Cache store
+# --------------------------------------------------------------------------- #
+@dataclass
+class CachedBaseline:
+    key: BaselineCacheKey
+    created_at: float
+    wall_s: float
+    peak_rss_mb: Optional[float]
+    invocation_count: Optional[int]
+    fingerprints: Dict[str, Optional[MartFingerprint]] = field(default_factory=dict)
+    db_path: Optional[Path] = None
+
+
+class BaselineCache:
+    """Directory-backed store of baseline builds: ``<root>/<key digest>/entry.json``."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        store_database: bool = False,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.root = Path(root)
+        self.store_database = store_database
+        self.max_age_days = max_age_days
+        self.max_bytes = max_bytes
+
+    def _entry_dir(self, key: BaselineCacheKey) -> Path:
+        return self.root / key.digest
+
+    def get(self, key: BaselineCacheKey) -> Optional[CachedBaseline]:
+        """Return the cached baseline for ``key``, or ``None`` on a miss.
+
+        A hit refreshes the entry's mtime so size eviction is least-recently-used.
+        Unreadable or mismatched entries are treated as misses.
+        """
+        entry_file = self._entry_dir(key) / ENTRY_FILE
+        try:
+            payload = json.loads(entry_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if payload.get("format") != CACHE_FORMAT_VERSION or payload.get(
+            "key"
+        ) != asdict(key):
+            return None
+        db_path = entry_file.parent / DATABASE_FILE
+        entry_file.touch()
+        return CachedBaseline(
+            key=key,
+            created_at=float(payload["created_at"]),
+            wall_s=float(payload["wall_s"]),
+            peak_rss_mb=payload.get("peak_rss_mb"),
+            invocation_count=payload.get("invocation_count"),
+            fingerprints={
+                relation: MartFingerprint.from_json(fp) if fp is not None else None
+                for relation, fp in payload["fingerprints"].items()
+            },
+            db_path=db_path if db_path.is_file() else None,
+        )
+
+    def put(
+        self,
+        key: BaselineCacheKey,
+        *,
+        db_path: Path,
+        marts: Sequence[str],
+        excluded: Sequence[str],
+        wall_s: float,
+        peak_rss_mb: Optional[float],
+        invocation_count: Optional[int],
+    ) -> CachedBaseline:
+        """Fingerprint a finished baseline build and store it (atomic rename)."""
+        fingerprints = fingerprint_marts(db_path, marts, excluded)
+        final = self._entry_dir(key)
+        staging = final.with_name(f".{final.name}.{time.time_ns()}.tmp")
+        staging.mkdir(parents=True)
+        created_at = time.time()
+        try:
+            if self.store_database:
+                shutil.copy2(db_path, staging / DATABASE_FILE)
+            (staging / ENTRY_FILE).write_text(
+                json.dumps(
+                    {
+                        "format": CACHE_FORMAT_VERSION,
+                        "key": asdict(key),
+                        "created_at": created_at,
+                        "wall_s": wall_s,
+                        "peak_rss_mb": peak_rss_mb,
+                        "invocation_count": invocation_count,
+                        "fingerprints": {
+                            relation: fp.to_json() if fp is not None else None
+                            for relation, fp in fingerprints.items()
+                        },
+                    },
+                    indent=2,
+                    sort_keys=True,
+                ),
+                encoding="utf-8",
+            )
+            if final.exists():
+                shutil.rmtree(final)
+            staging.rename(final)
+        finally:
+            if staging.exists():
+                shutil.rmtree(staging, ignore_errors=True)
+        return CachedBaseline(
+            key=key,
+            created_at=created_at,
+            wall_s=wall_s,
+            peak_rss_mb=peak_rss_mb,
+            invocation_count=invocation_count,
+            fingerprints=fingerprints,
+            db_path=(final / DATABASE_FILE) if self.store_database else None,
+        )
+
+    def evict(self, *, now: Optional[float] = None) -> List[str]:
+        """Drop entries older than ``max_age_days``, then LRU entries over ``max_bytes``.
+
+        Returns the evicted entry digests.
+        """
+        if not self.root.is_dir():
+            return []
+        now = time.time() if now is None else now
+        entries: List[Tuple[float, int, Path]] = []
+        for entry in self.root.iterdir():
+            entry_file = entry / ENTRY_FILE
+            if not entry.is_dir() or not entry_file.is_file():
+                continue
+            size = sum(p.stat().st_size for p in entry.rglob("*") if p.is_file())
+            entries.append((entry_file.stat().st_mtime, size, entry))
+
+        evicted: List[str] = []
+        max_age_s = self.max_age_days * 86400
+        survivors = []
+        for last_used, size, entry in entries:
+            if now - last_used > max_age_s:
+                shutil.rmtree(entry, ignore_errors=True)
+                evicted.append(entry.name)
+            else:
+                survivors.append((last_used, size, entry))
+
+        total = sum(size for _, size, _ in survivors)
+        for last_used, size, entry in sorted(survivors, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            evicted.append(entry.name)
+            total -= size
+        return evicted
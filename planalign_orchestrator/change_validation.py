@@ -12,6 +12,10 @@ proven safe *before* it ships:
 - **peak RSS + wall time** — single-run, directional;
 - **shared-DB guard** — asserts ``dbt/simulation.duckdb`` is byte-unchanged.
 
+Baseline builds are cached (``planalign_orchestrator.baseline_cache``) keyed by
+``HEAD`` SHA, config fingerprint, census content hash and horizon, so repeat
+validations of one change only build the candidate.
+
 Design notes:
 - Baseline is built by ``git stash``-ing the tracked working-tree change, so the
   subprocess ``planalign simulate`` re-imports the committed code (this is why an
@@ -38,6 +42,14 @@ from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 import duckdb
 
+from planalign_orchestrator.baseline_cache import (
+    BaselineCache,
+    BaselineCacheKey,
+    CachedBaseline,
+    baseline_cache_key,
+    compare_fingerprints,
+    fingerprint_marts,
+)
 from planalign_orchestrator.state_pipeline_validation import (
     CharacterizationRecord,
     ExclusionEntry,
@@ -451,6 +463,7 @@ class BuildMetrics:
     invocation_count: Optional[int]
     db_path: Path
     error: Optional[str] = None
+    cached: bool = False
 
 
 @dataclass
@@ -795,9 +808,15 @@ def run_validation_campaign(
     workdir: Path,
     keep_dbs: bool = False,
     log: Optional[Logger] = None,
+    cache: Optional[BaselineCache] = None,
 ) -> ValidationResult:
     """Stash the working-tree change, build baseline+candidate per census, compare.
 
+    With a ``cache``, baselines whose key (HEAD SHA, config, census, horizon) was
+    already built are reused: the stash and baseline build are skipped, and parity is
+    checked against the cached database or, failing that, the cached mart
+    fingerprints. Fresh baselines are stored back into the cache.
+
     Raises ``ChangeValidationError`` on setup problems (not a git repo, clean tree,
     failed stash/pop). Build failures are captured in the result, not raised.
     """
@@ -844,32 +863,86 @@ def run_validation_campaign(
             )
         )
 
-    # ---- Baseline: stash the change, build, always restore ----
-    stash_res = _git(repo_root, "stash", "push", "-m", "planalign-validate-change")
-    if "No local changes" in (stash_res.stdout + stash_res.stderr):
-        raise ChangeValidationError("git stash saved nothing; aborting.")
-    if stash_res.returncode != 0:
-        raise ChangeValidationError(f"git stash failed: {stash_res.stderr.strip()}")
-
+    # ---- Baseline cache: reuse identical HEAD builds ----
     baselines: Dict[str, BuildMetrics] = {}
-    try:
+    cache_keys: Dict[str, BaselineCacheKey] = {}
+    cached: Dict[str, CachedBaseline] = {}
+    if cache is not None:
+        head = _git(repo_root, "rev-parse", "HEAD")
+        if head.returncode != 0:
+            raise ChangeValidationError(f"git rev-parse failed: {head.stderr.strip()}")
+        for evicted in cache.evict():
+            log(f"[cache] evicted baseline {evicted}")
         for label, _census, _rows, eff, base_db, _cand_db in scale_dbs:
-            log(f"[baseline] building {label} -> {base_db.name}")
-            baselines[label] = _run_build(
-                years=years,
-                config_path=eff,
-                db_path=base_db,
+            key = baseline_cache_key(
+                head_sha=head.stdout.strip(),
+                effective_config=eff,
+                horizon=horizon,
                 repo_root=repo_root,
-                log=log,
             )
-    finally:
-        pop = _git(repo_root, "stash", "pop")
-        if pop.returncode != 0:
-            raise ChangeValidationError(
-                "CRITICAL: 'git stash pop' failed after building the baseline; your "
-                f"change is still stashed. Recover with 'git stash pop'. Detail: {pop.stderr.strip()}"
+            cache_keys[label] = key
+            hit = cache.get(key)
+            if hit is None:
+                continue
+            cached[label] = hit
+            log(
+                f"[baseline] cache hit for {label} ({key.digest[:12]}"
+                f"{', with database' if hit.db_path else ', fingerprints only'})"
+            )
+            baselines[label] = BuildMetrics(
+                True,
+                hit.wall_s,
+                hit.peak_rss_mb,
+                hit.invocation_count,
+                hit.db_path or base_db,
+                cached=True,
             )
 
+    # ---- Baseline: stash the change, build, always restore ----
+    pending = [entry for entry in scale_dbs if entry[0] not in baselines]
+    if pending:
+        stash_res = _git(repo_root, "stash", "push", "-m", "planalign-validate-change")
+        if "No local changes" in (stash_res.stdout + stash_res.stderr):
+            raise ChangeValidationError("git stash saved nothing; aborting.")
+        if stash_res.returncode != 0:
+            raise ChangeValidationError(f"git stash failed: {stash_res.stderr.strip()}")
+
+        try:
+            for label, _census, _rows, eff, base_db, _cand_db in pending:
+                log(f"[baseline] building {label} -> {base_db.name}")
+                baselines[label] = _run_build(
+                    years=years,
+                    config_path=eff,
+                    db_path=base_db,
+                    repo_root=repo_root,
+                    log=log,
+                )
+        finally:
+            pop = _git(repo_root, "stash", "pop")
+            if pop.returncode != 0:
+                raise ChangeValidationError(
+                    "CRITICAL: 'git stash pop' failed after building the baseline; your "
+                    f"change is still stashed. Recover with 'git stash pop'. Detail: {pop.stderr.strip()}"
+                )
+
+        if cache is not None:
+            for label, _census, _rows, _eff, base_db, _cand_db in pending:
+                base = baselines[label]
+                if not base.ok:
+                    continue
+                log(
+                    f"[cache] storing baseline {label} ({cache_keys[label].digest[:12]})"
+                )
+                cache.put(
+                    cache_keys[label],
+                    db_path=base_db,
+                    marts=marts,
+                    excluded=DEFAULT_EXCLUDED,
+                    wall_s=base.wall_s,
+                    peak_rss_mb=base.peak_rss_mb,
+                    invocation_count=base.invocation_count,
+                )
+
     # ---- Candidate: working tree restored, build + compare ----
     scales: List[ScaleResult] = []
     for label, _census, rows, eff, base_db, cand_db in scale_dbs:
@@ -880,7 +953,14 @@ def run_validation_campaign(
         base = baselines[label]
         diffs: Dict[str, Tuple[object, object]] = {}
         if base.ok and cand.ok:
-            diffs = compare_marts(base_db, cand_db, marts)
+            hit = cached.get(label)
+            if hit is not None and hit.db_path is None:
+                diffs = compare_fingerprints(
+                    hit.fingerprints,
+                    fingerprint_marts(cand_db, marts, DEFAULT_EXCLUDED),
+                )
+            else:
+                diffs = compare_marts(base.db_path, cand_db, marts)
         scales.append(
             ScaleResult(
                 census_label=label,
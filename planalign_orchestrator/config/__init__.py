@@ -56,6 +56,7 @@ from .performance import (
     PolarsEventSettings,
     EventGenerationSettings,
     E068CThreadingSettings,
+    DuckDBResourceSettings,
     OptimizationSettings,
 )
 
@@ -117,6 +118,7 @@ __all__ = [
     "PolarsEventSettings",
     "EventGenerationSettings",
     "E068CThreadingSettings",
+    "DuckDBResourceSettings",
     "OptimizationSettings",
     # Ensemble
     "EnsembleSettings",
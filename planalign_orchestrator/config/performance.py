@@ -425,6 +425,42 @@ class E068CThreadingSettings(BaseModel):
             )
 
 
+# =============================================================================
+# DuckDB Resource Profile Settings
+# =============================================================================
+
+
+class DuckDBResourceSettings(BaseModel):
+    """DuckDB memory, thread and spill budget for one run.
+
+    Applied alike to dbt, the orchestrator's connections and API reads (see
+    ``planalign_orchestrator.resources.duckdb_profile``). With nothing set,
+    ``PLANALIGN_DUCKDB_PROFILE`` decides, and without that DuckDB keeps the
+    settings each connection used before profiles existed.
+    """
+
+    profile: Optional[Literal["standard", "worker"]] = Field(
+        default=None,
+        description="Preset: 'standard' (4 GiB, all cores) or 'worker' "
+        "(derived from the scenario pool's per-worker budget)",
+    )
+    memory_limit_mib: Optional[int] = Field(
+        default=None, ge=64, description="DuckDB memory_limit in MiB"
+    )
+    threads: Optional[int] = Field(
+        default=None, ge=1, le=64, description="DuckDB worker threads"
+    )
+    spill_directory: Optional[str] = Field(
+        default=None,
+        description="Root for per-run spill directories (default: beside the database)",
+    )
+    max_spill_mib: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Cap on spilled data in MiB (default: 90% of free disk)",
+    )
+
+
 # =============================================================================
 # Optimization Settings
 # =============================================================================
@@ -473,3 +509,7 @@ class OptimizationSettings(BaseModel):
         default_factory=AdaptiveMemorySettings,
         description="Adaptive memory management settings",
     )
+    duckdb: DuckDBResourceSettings = Field(
+        default_factory=DuckDBResourceSettings,
+        description="DuckDB memory, thread and spill budget",
+    )
@@ -13,8 +13,12 @@ from planalign_orchestrator.exceptions import (
     InitializationError,
     ResolutionHint,
 )
+from planalign_orchestrator.monitoring.horizon import ModelYearTimings
+from planalign_orchestrator.monitoring.spill import SpillMonitor
+from planalign_orchestrator.monitoring.tracing import RunTracer, trace_path_for
 from planalign_orchestrator.pipeline_orchestrator import PipelineOrchestrator
 from planalign_orchestrator.registries import RegistryManager
+from planalign_orchestrator.resources.duckdb_profile import resolve_resource_profile
 from planalign_orchestrator.self_healing import AutoInitializer
 from planalign_orchestrator.utils import DatabaseConnectionManager
 from planalign_orchestrator.validation import (
@@ -201,6 +205,27 @@ def build_orchestrator(spec: ConstructionSpec) -> ConstructionResult:
     )
     orchestrator.construction_signature = signature
     orchestrator.work_schedule = work_schedule
+    model_timings = ModelYearTimings()
+    if hasattr(runner, "configure_model_timings"):
+        runner.configure_model_timings(model_timings)
+        orchestrator.model_timings = model_timings
+    resource_profile = resolve_resource_profile(
+        spec.config.optimization.duckdb, db_manager.db_path
+    )
+    if resource_profile is not None:
+        # Same DuckDB budget and spill directory for dbt and our connections.
+        if hasattr(db_manager, "apply_resource_profile"):
+            db_manager.apply_resource_profile(resource_profile)
+        if hasattr(runner, "configure_resource_profile"):
+            runner.configure_resource_profile(resource_profile)
+        orchestrator.resource_profile = resource_profile
+        orchestrator.spill_monitor = SpillMonitor(resource_profile.temp_directory)
+    if spec.trace:
+        # Attached after the signature: tracing is observation, not behavior.
+        tracer = RunTracer(output_path=trace_path_for(db_manager.db_path))
+        if hasattr(runner, "configure_tracer"):
+            runner.configure_tracer(tracer)
+        orchestrator.tracer = tracer
     return ConstructionResult(
         orchestrator=orchestrator,
         signature=signature,
@@ -71,6 +71,8 @@ class ConstructionSpec(BaseModel):
     validation_mode: bool = False
     verbose: bool = False
     dry_run: bool = False
+    # Record a span trace of the run beside the database (see monitoring.tracing).
+    trace: bool = False
     dbt_executable: str = "dbt"
     runner_override: Any | None = None
     db_manager_override: DatabaseConnectionManager | None = None
@@ -31,6 +31,9 @@ from typing import (
 
 if TYPE_CHECKING:
     from .construction.signature import WorkSchedule
+    from .monitoring.horizon import ModelYearTimings
+    from .monitoring.tracing import RunTracer
+    from .resources.duckdb_profile import DuckDBResourceProfile
 
 logger = logging.getLogger(__name__)
 
@@ -213,6 +216,9 @@ class DbtRunner:
         self._schedule_runner_kind = "dbt"
         self._schedule_stage: Optional[str] = None
         self._schedule_year: Optional[int] = None
+        self._tracer: Optional["RunTracer"] = None
+        self._model_timings: Optional["ModelYearTimings"] = None
+        self._resource_profile: Optional["DuckDBResourceProfile"] = None
 
         # Model-level parallelization settings
         self.enable_model_parallelization = enable_model_parallelization
@@ -377,17 +383,51 @@ class DbtRunner:
         log_performance: bool = True,
     ) -> DbtResult:
         """Execute a dbt command with enhanced error handling and optional retry."""
+        attributed_year = (
+            simulation_year if simulation_year is not None else self._schedule_year
+        )
         if self._work_schedule is not None:
             self._work_schedule.record(
                 command=" ".join(str(part) for part in command_args),
                 stage=self._schedule_stage,
-                year=(
-                    simulation_year
-                    if simulation_year is not None
-                    else self._schedule_year
-                ),
+                year=attributed_year,
                 runner_kind=self._schedule_runner_kind,
             )
+        started_wall = time.time()
+        try:
+            return self._execute_traced(
+                command_args,
+                description=description,
+                simulation_year=simulation_year,
+                dbt_vars=dbt_vars,
+                threads=threads,
+                stream_output=stream_output,
+                on_line=on_line,
+                retry=retry,
+                max_attempts=max_attempts,
+            )
+        finally:
+            if self._model_timings is not None:
+                self._model_timings.record_run_results(
+                    self.target_path / "run_results.json",
+                    year=attributed_year,
+                    since=started_wall,
+                )
+
+    def _execute_traced(
+        self,
+        command_args: Sequence[str],
+        *,
+        description: str,
+        simulation_year: Optional[int],
+        dbt_vars: Optional[Dict[str, Any]],
+        threads: Optional[int],
+        stream_output: bool,
+        on_line: Optional[Callable[[str], None]],
+        retry: bool,
+        max_attempts: int,
+    ) -> DbtResult:
+        """Run the command, inside an invocation span when a tracer is set."""
 
         def _run_once() -> DbtResult:
             return self._execute_once(
@@ -400,9 +440,40 @@ class DbtRunner:
                 on_line=on_line,
             )
 
-        return self._execute_with_retry(
-            _run_once, retry=retry, max_attempts=max_attempts
-        )
+        if self._tracer is None:
+            return self._execute_with_retry(
+                _run_once, retry=retry, max_attempts=max_attempts
+            )
+
+        command = " ".join(str(part) for part in command_args)
+        with self._tracer.span(
+            f"dbt {command}"[:120],
+            "dbt_invocation",
+            command=command,
+            year=simulation_year,
+        ) as span:
+            try:
+                result = self._execute_with_retry(
+                    _run_once, retry=retry, max_attempts=max_attempts
+                )
+                span.attributes["status"] = "success" if result.success else "failed"
+                return result
+            finally:
+                self._tracer.add_dbt_results(
+                    span, self.target_path / "run_results.json"
+                )
+
+    def configure_tracer(self, tracer: "RunTracer") -> None:
+        """Record a span per invocation, with its nodes, on ``tracer``."""
+        self._tracer = tracer
+
+    def configure_model_timings(self, timings: "ModelYearTimings") -> None:
+        """Record each model's execute time per simulation year on ``timings``."""
+        self._model_timings = timings
+
+    def configure_resource_profile(self, profile: "DuckDBResourceProfile") -> None:
+        """Run dbt's DuckDB under ``profile`` (a bound profile, see ``bind``)."""
+        self._resource_profile = profile
 
     def configure_work_schedule(
         self, schedule: "WorkSchedule", *, runner_kind: str = "dbt"
@@ -481,8 +552,9 @@ class DbtRunner:
     def _build_subprocess_env(self) -> Optional[Dict[str, str]]:
         """Build environment variables for subprocess execution.
 
-        Sets DATABASE_PATH (relative to working dir) and corporate network
-        proxy/certificate settings when available.
+        Sets DATABASE_PATH (relative to working dir), the DuckDB resource
+        profile's target and settings, and corporate network proxy/certificate
+        settings when available.
         """
         import os
 
@@ -509,6 +581,11 @@ class DbtRunner:
                 # Fallback to absolute path if relative calculation fails
                 env["DATABASE_PATH"] = str(abs_db_path)
 
+        if self._resource_profile is not None:
+            if env is None:
+                env = os.environ.copy()
+            env.update(self._resource_profile.dbt_env())
+
         # Add corporate network environment variables if available
         try:
             from .network_utils import load_network_config
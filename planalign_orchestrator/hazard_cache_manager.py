@@ -11,17 +11,14 @@ Epic E068D: Hazard Caches with Automatic Change Detection
 
 from __future__ import annotations
 
-import hashlib
-import json
 import logging
-import yaml
 from pathlib import Path
-from typing import Dict, Optional, Any
-import pandas as pd
+from typing import Any, Dict, List, Optional
 from threading import Lock
 
 from .config import SimulationConfig
 from .dbt_runner import DbtRunner, extract_dbt_failure_detail
+from .hazard_store import HazardStore, hazard_inputs
 
 
 class HazardCacheError(Exception):
@@ -52,12 +49,16 @@ class HazardCacheManager:
     # Metadata model to track cache state
     METADATA_MODEL = "hazard_cache_metadata"
 
+    # FOUNDATION table every cache model refs; built first on a fresh database
+    DEPENDENCY_MODEL = "int_effective_parameters"
+
     def __init__(
         self,
         config: SimulationConfig,
         dbt_runner: DbtRunner,
         *,
         logger: Optional[logging.Logger] = None,
+        store: Optional[HazardStore] = None,
     ):
         """
         Initialize hazard cache manager.
@@ -66,9 +67,12 @@ class HazardCacheManager:
             config: Simulation configuration containing hazard parameters
             dbt_runner: DbtRunner instance for executing dbt commands
             logger: Optional logger instance (creates new one if not provided)
+            store: Optional workspace-level store shared across databases; a
+                miss here is served from the store before rebuilding with dbt
         """
         self.config = config
         self.dbt_runner = dbt_runner
+        self.store = store
         self.logger = logger or logging.getLogger(__name__)
         self._cache_lock = Lock()  # Thread safety for cache operations
 
@@ -92,16 +96,26 @@ class HazardCacheManager:
         runner_db = getattr(self.dbt_runner, "database_path", None)
         return str(runner_db) if runner_db else str(get_database_path())
 
+    def _project_dir(self) -> Path:
+        """The dbt project the rebuild runs against (``--project-dir`` or cwd)."""
+        project_dir = getattr(self.dbt_runner, "project_dir", None)
+        return Path(project_dir or getattr(self.dbt_runner, "working_dir", "dbt"))
+
     def compute_hazard_params_hash(self) -> str:
         """
         Compute SHA256 hash of all parameters affecting hazard calculations.
 
-        This method collects parameters from multiple sources and creates a
-        deterministic hash to detect parameter changes:
+        The inputs are derived from the dbt project instead of a hand-picked
+        list of config fields: ``hazard_inputs`` walks ``ref()`` from the cache
+        models down to seeds and fingerprints:
 
-        - Simulation config (target_growth_rate, termination_rates, etc.)
-        - comp_levers.csv file content if exists
-        - hazard_parameters.yaml file content if exists (optional)
+        - the SQL of every model in that closure, and all macros
+        - the content of every seed file the closure reads
+        - the effective value of every ``var()`` the closure or a macro reads
+        - the ``models``/``seeds`` configuration in ``dbt_project.yml``
+
+        A new var, seed or upstream model is picked up automatically, and
+        config fields the rebuild never reads no longer invalidate the cache.
 
         Returns:
             SHA256 hash string of all hazard-affecting parameters
@@ -110,115 +124,10 @@ class HazardCacheManager:
             return self._current_hash_cache
 
         try:
-            # Collect parameters from simulation config
-            params: Dict[str, Any] = {"simulation_config": {}}
-
-            # Core simulation parameters
-            if hasattr(self.config, "simulation"):
-                params["simulation_config"]["target_growth_rate"] = getattr(
-                    self.config.simulation, "target_growth_rate", None
-                )
-                params["simulation_config"]["random_seed"] = getattr(
-                    self.config.simulation, "random_seed", None
-                )
-
-            # Workforce parameters (termination rates)
-            if hasattr(self.config, "workforce"):
-                params["simulation_config"]["total_termination_rate"] = getattr(
-                    self.config.workforce, "total_termination_rate", None
-                )
-                params["simulation_config"]["new_hire_termination_rate"] = getattr(
-                    self.config.workforce, "new_hire_termination_rate", None
-                )
-
-            # Compensation parameters
-            if hasattr(self.config, "compensation"):
-                params["simulation_config"]["compensation"] = {
-                    "cola_rate": getattr(self.config.compensation, "cola_rate", None),
-                    "merit_budget": getattr(
-                        self.config.compensation, "merit_budget", None
-                    ),
-                }
-
-                # Promotion compensation settings
-                if hasattr(self.config.compensation, "promotion_compensation"):
-                    promo_comp = self.config.compensation.promotion_compensation
-                    params["simulation_config"]["promotion_compensation"] = {
-                        "base_increase_pct": getattr(
-                            promo_comp, "base_increase_pct", None
-                        ),
-                        "distribution_range": getattr(
-                            promo_comp, "distribution_range", None
-                        ),
-                        "max_cap_pct": getattr(promo_comp, "max_cap_pct", None),
-                        "max_cap_amount": getattr(promo_comp, "max_cap_amount", None),
-                        "distribution_type": getattr(
-                            promo_comp, "distribution_type", None
-                        ),
-                        "level_overrides": getattr(promo_comp, "level_overrides", None),
-                    }
-
-            # Enrollment parameters
-            if hasattr(self.config, "enrollment"):
-                enrollment = self.config.enrollment
-                params["simulation_config"]["enrollment"] = {}
-
-                if hasattr(enrollment, "auto_enrollment"):
-                    auto = enrollment.auto_enrollment
-                    params["simulation_config"]["enrollment"]["auto_enrollment"] = {
-                        "enabled": getattr(auto, "enabled", None),
-                        "default_deferral_rate": getattr(
-                            auto, "default_deferral_rate", None
-                        ),
-                        "window_days": getattr(auto, "window_days", None),
-                        "opt_out_grace_period": getattr(
-                            auto, "opt_out_grace_period", None
-                        ),
-                    }
-
-                    # Opt-out rates
-                    if hasattr(auto, "opt_out_rates"):
-                        opt_out = auto.opt_out_rates
-                        params["simulation_config"]["enrollment"]["opt_out_rates"] = {
-                            "by_age": getattr(opt_out, "by_age", {}).dict()  # type: ignore[union-attr]
-                            if hasattr(getattr(opt_out, "by_age", {}), "dict")
-                            else getattr(opt_out, "by_age", {}),
-                            "by_income": getattr(opt_out, "by_income", {}).dict()  # type: ignore[union-attr]
-                            if hasattr(getattr(opt_out, "by_income", {}), "dict")
-                            else getattr(opt_out, "by_income", {}),
-                        }
-
-            # Include comp_levers.csv if exists
-            comp_levers_path = Path("dbt/seeds/comp_levers.csv")
-            if comp_levers_path.exists():
-                try:
-                    comp_levers_df = pd.read_csv(comp_levers_path)
-                    # Convert to dict and ensure deterministic ordering
-                    params["comp_levers"] = comp_levers_df.sort_values(
-                        by=list(comp_levers_df.columns)
-                    ).to_dict("records")
-                except Exception as e:
-                    self.logger.warning(f"Could not read comp_levers.csv: {e}")
-                    params["comp_levers"] = None
-            else:
-                params["comp_levers"] = None
-
-            # Include hazard-specific configuration files if they exist
-            hazard_config_path = Path("config/hazard_parameters.yaml")
-            if hazard_config_path.exists():
-                try:
-                    with open(hazard_config_path, "r", encoding="utf-8") as f:
-                        hazard_config = yaml.safe_load(f)
-                        params["hazard_config"] = hazard_config
-                except Exception as e:
-                    self.logger.warning(f"Could not read hazard_parameters.yaml: {e}")
-                    params["hazard_config"] = None
-            else:
-                params["hazard_config"] = None
-
-            # Create deterministic hash using sorted keys and compact JSON
-            params_json = json.dumps(params, sort_keys=True, separators=(",", ":"))
-            hash_value = hashlib.sha256(params_json.encode("utf-8")).hexdigest()
+            inputs = hazard_inputs(self._project_dir(), self.store_tables())
+            # The rebuild passes no vars besides the hash itself, so the
+            # dbt_project.yml defaults are the effective values.
+            hash_value = inputs.fingerprint({})
 
             # Cache the computed hash
             self._current_hash_cache = hash_value
@@ -230,6 +139,11 @@ class HazardCacheManager:
             self.logger.error(f"Failed to compute hazard params hash: {e}")
             raise HazardCacheError(f"Failed to compute parameters hash: {e}") from e
 
+    @classmethod
+    def store_tables(cls) -> List[str]:
+        """Tables a rebuild produces, in build order."""
+        return [cls.DEPENDENCY_MODEL, *cls.CACHE_MODELS, cls.METADATA_MODEL]
+
     def get_cached_params_hash(self) -> Optional[str]:
         """
         Get the parameters hash from the most recent cache build.
@@ -398,7 +312,7 @@ class HazardCacheManager:
                 # materialize it first or the cache rebuild fails with a catalog error.
                 # Use `run` (not `build`) to match how the pipeline builds int_* models
                 # — we only need the table to exist, not to run its schema tests here.
-                dep = "int_effective_parameters"
+                dep = self.DEPENDENCY_MODEL
                 self.logger.info(f"Materializing {dep} (hazard cache dependency)...")
                 result = self.dbt_runner.execute_command(
                     ["run", "--select", dep, "--full-refresh"],
@@ -443,6 +357,7 @@ class HazardCacheManager:
                     raise HazardCacheError(error_msg)
 
                 self.logger.info("Successfully rebuilt hazard caches + metadata")
+                self._publish_to_store(current_hash)
 
                 # Clear cached hash values to force refresh
                 self._current_hash_cache = None
@@ -470,7 +385,8 @@ class HazardCacheManager:
         """
         try:
             if self.should_rebuild_caches():
-                self.rebuild_hazard_caches()
+                if not self._install_from_store():
+                    self.rebuild_hazard_caches()
             else:
                 self.logger.info("Hazard caches are current, skipping rebuild")
                 # Still log cache statistics for monitoring
@@ -484,6 +400,54 @@ class HazardCacheManager:
             self.logger.error(error_msg)
             raise HazardCacheError(error_msg) from e
 
+    def _install_from_store(self) -> bool:
+        """Copy a previously published build of the current hash into this DB.
+
+        Returns:
+            True if the caches were installed from the store, False if the
+            caller must rebuild them with dbt
+        """
+        if self.store is None:
+            return False
+        with self._cache_lock:
+            current_hash = self.compute_hazard_params_hash()
+            # Never materialize a database just to install caches into it.
+            db_path = Path(self._metadata_db_path())
+            if not db_path.exists():
+                return False
+            try:
+                installed = self.store.install(db_path, current_hash)
+            except Exception as e:
+                self.logger.warning(f"Could not install hazard caches from store: {e}")
+                return False
+            if installed is None:
+                self.logger.info(
+                    f"Hazard store has no build for {current_hash[:16]}..., "
+                    "rebuilding with dbt"
+                )
+                return False
+            self._cached_hash_cache = None
+            self.logger.info(
+                f"Installed {len(installed)} hazard cache tables from store "
+                f"{self.store.path(current_hash)}"
+            )
+            self._log_cache_statistics()
+            return True
+
+    def _publish_to_store(self, params_hash: str) -> None:
+        """Publish a fresh rebuild so other databases can reuse it (best effort)."""
+        if self.store is None:
+            return
+        try:
+            if self.store.publish(
+                Path(self._metadata_db_path()), params_hash, self.store_tables()
+            ):
+                self.logger.info(
+                    f"Published hazard caches to store {self.store.path(params_hash)}"
+                )
+        except Exception as e:
+            self.logger.warning(f"Could not publish hazard caches to store: {e}")
+
     def force_cache_rebuild(self) -> None:
         """
         Force a complete rebuild of all hazard caches regardless of hash status.
@@ -517,6 +481,8 @@ class HazardCacheManager:
                 "cache_models": self.CACHE_MODELS,
                 "metadata_model": self.METADATA_MODEL,
                 "thread_safe": True,
+                "store_root": str(self.store.root) if self.store else None,
+                "stored": self.store.contains(current_hash) if self.store else False,
             }
 
         except Exception as e:
@@ -0,0 +1,285 @@
+"""
+Workspace-level, content-addressed store for built hazard cache tables.
+
+Every scenario, ensemble seed and Studio attempt runs in its own DuckDB file,
+so the per-database ``hazard_cache_metadata`` check misses on every fresh
+database and each one paid for a full ``int_effective_parameters`` +
+``dim_*_hazards`` dbt rebuild -- even when the hazard inputs were identical.
+
+The store keeps one Parquet copy of those tables per hazard params hash under
+``<root>/<hash>/``. The first database to build a given hash publishes it; every
+later database with the same hash copies the tables in instead of invoking dbt.
+
+The hash is only sound if it covers everything the rebuild reads, so it is
+derived from the dbt project rather than from a hand-maintained field list:
+``hazard_inputs`` walks ``ref()`` from the cache models down to seeds and
+fingerprints the SQL, seed files, macros and every ``var()`` the closure reads.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+HAZARD_STORE_ENV = "PLANALIGN_HAZARD_STORE"
+DEFAULT_STORE_ROOT = Path("var/hazard_store")
+MANIFEST_FILE = "manifest.json"
+
+_SET_RE = re.compile(r"{%-?\s*set\s+([A-Za-z_]\w*)\s*=\s*['\"]([\w.]+)['\"]\s*-?%}")
+_REF_RE = re.compile(r"\bref\(\s*(['\"]?)([A-Za-z_]\w*)\1\s*\)")
+_VAR_RE = re.compile(r"\bvar\(\s*(['\"]?)([A-Za-z_]\w*)\1")
+_SEED_SUFFIXES = (".csv",)
+
+
+def default_store_root() -> Path:
+    """Store location: ``$PLANALIGN_HAZARD_STORE`` or ``var/hazard_store``."""
+    override = os.environ.get(HAZARD_STORE_ENV)
+    return Path(override) if override else DEFAULT_STORE_ROOT
+
+
+@dataclass(frozen=True)
+class HazardInputs:
+    """Everything in the dbt project a hazard cache rebuild can read.
+
+    Attributes:
+        models: SHA256 of each model's SQL, by model name
+        seeds: SHA256 of each seed file, by seed name
+        var_names: Every ``var()`` read by the models or by a macro
+        macros: SHA256 over all macro files
+        project_config: SHA256 of the ``models``/``seeds`` sections of
+            ``dbt_project.yml`` plus any seed property files (column types)
+        project_vars: ``vars`` defaults declared in ``dbt_project.yml``
+    """
+
+    models: Dict[str, str]
+    seeds: Dict[str, str]
+    var_names: frozenset
+    macros: str
+    project_config: str
+    project_vars: Dict[str, Any]
+
+    def fingerprint(self, invocation_vars: Mapping[str, Any]) -> str:
+        """Hash the inputs under the vars the rebuild invocation will pass.
+
+        ``invocation_vars`` overlay the ``dbt_project.yml`` defaults exactly as
+        dbt applies ``--vars``; only the vars the closure reads are hashed, so an
+        unrelated config change never invalidates the store.
+        """
+        effective = {**self.project_vars, **invocation_vars}
+        payload = {
+            "models": self.models,
+            "seeds": self.seeds,
+            "vars": {name: effective.get(name) for name in sorted(self.var_names)},
+            "macros": self.macros,
+            "project_config": self.project_config,
+        }
+        params_json = json.dumps(
+            payload, sort_keys=True, separators=(",", ":"), default=str
+        )
+        return hashlib.sha256(params_json.encode("utf-8")).hexdigest()
+
+
+def hazard_inputs(project_dir: Path, roots: Sequence[str]) -> HazardInputs:
+    """Collect the ``ref()`` closure of ``roots`` in the dbt project.
+
+    ``ref``/``var`` arguments bound through ``{% set name = '...' %}`` are
+    resolved. An argument that cannot be resolved statically makes the closure
+    fall back to every seed, so the hash over-invalidates rather than missing
+    an input.
+    """
+    project_dir = Path(project_dir)
+    model_files = _index(project_dir / "models", (".sql",))
+    seed_files = _index(project_dir / "seeds", _SEED_SUFFIXES)
+
+    models: Dict[str, str] = {}
+    seeds: Dict[str, str] = {}
+    var_names: set = set()
+    unresolved = False
+    pending = list(roots)
+    while pending:
+        name = pending.pop()
+        if name in models or name in seeds:
+            continue
+        if name in model_files:
+            text = model_files[name].read_text(encoding="utf-8")
+            models[name] = _digest(text.encode("utf-8"))
+            refs, names, dynamic = _references(text)
+            pending.extend(refs)
+            var_names.update(names)
+            unresolved = unresolved or dynamic
+        elif name in seed_files:
+            seeds[name] = _digest(seed_files[name].read_bytes())
+        else:
+            raise FileNotFoundError(
+                f"Hazard cache input '{name}' is neither a model nor a seed "
+                f"under {project_dir}"
+            )
+    if unresolved:
+        seeds = {name: _digest(path.read_bytes()) for name, path in seed_files.items()}
+
+    macro_digest = hashlib.sha256()
+    for path in sorted((project_dir / "macros").rglob("*.sql")):
+        text = path.read_text(encoding="utf-8")
+        macro_digest.update(path.relative_to(project_dir).as_posix().encode("utf-8"))
+        macro_digest.update(text.encode("utf-8"))
+        var_names.update(_references(text)[1])
+
+    project = _load_project(project_dir)
+    config_digest = hashlib.sha256(
+        json.dumps(
+            {key: project.get(key) for key in ("models", "seeds")},
+            sort_keys=True,
+            default=str,
+        ).encode("utf-8")
+    )
+    for path in sorted((project_dir / "seeds").rglob("*.yml")):
+        config_digest.update(path.read_bytes())
+
+    return HazardInputs(
+        models=models,
+        seeds=seeds,
+        var_names=frozenset(var_names),
+        macros=macro_digest.hexdigest(),
+        project_config=config_digest.hexdigest(),
+        project_vars=dict(project.get("vars") or {}),
+    )
+
+
+def _index(directory: Path, suffixes: Sequence[str]) -> Dict[str, Path]:
+    if not directory.exists():
+        return {}
+    return {
+        path.stem: path
+        for path in sorted(directory.rglob("*"))
+        if path.suffix in suffixes and path.is_file()
+    }
+
+
+def _references(text: str) -> tuple:
+    """Return ``(refs, vars, has_unresolved_argument)`` for one SQL file."""
+    bindings = dict(_SET_RE.findall(text))
+    unresolved = False
+
+    def resolve(matches: List[tuple]) -> List[str]:
+        nonlocal unresolved
+        names = []
+        for quote, name in matches:
+            if quote:
+                names.append(name)
+            elif name in bindings:
+                names.append(bindings[name])
+            else:
+                unresolved = True
+        return names
+
+    refs = resolve(_REF_RE.findall(text))
+    names = resolve(_VAR_RE.findall(text))
+    return refs, names, unresolved
+
+
+def _load_project(project_dir: Path) -> Dict[str, Any]:
+    path = project_dir / "dbt_project.yml"
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class HazardStore:
+    """Parquet copies of built hazard cache tables, one directory per hash."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def path(self, params_hash: str) -> Path:
+        return self.root / params_hash
+
+    def contains(self, params_hash: str) -> bool:
+        return (self.path(params_hash) / MANIFEST_FILE).exists()
+
+    def tables(self, params_hash: str) -> List[str]:
+        """Tables published for ``params_hash``, in publication order."""
+        with open(self.path(params_hash) / MANIFEST_FILE, "r", encoding="utf-8") as f:
+            return list(json.load(f)["tables"])
+
+    def publish(self, db_path: Path, params_hash: str, tables: Sequence[str]) -> bool:
+        """Export ``tables`` from ``db_path`` into the store under ``params_hash``.
+
+        Tables are written to a private directory and renamed into place, so a
+        concurrent reader sees either nothing or the complete set. When another
+        process published the same hash first, its copy is kept.
+
+        Returns:
+            True if this call published the entry, False if it already existed
+        """
+        if self.contains(params_hash):
+            return False
+        import duckdb
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{params_hash[:16]}-", dir=self.root))
+        try:
+            with duckdb.connect(str(db_path)) as conn:
+                for table in tables:
+                    target = staging / f"{table}.parquet"
+                    conn.execute(f"COPY {table} TO '{target}' (FORMAT PARQUET)")
+            manifest = {"params_hash": params_hash, "tables": list(tables)}
+            (staging / MANIFEST_FILE).write_text(
+                json.dumps(manifest, indent=2), encoding="utf-8"
+            )
+            try:
+                os.replace(staging, self.path(params_hash))
+            except OSError:
+                # Lost the race to a concurrent publisher of the same hash.
+                if not self.contains(params_hash):
+                    raise
+                return False
+            return True
+        finally:
+            if staging.exists():
+                shutil.rmtree(staging, ignore_errors=True)
+
+    def install(self, db_path: Path, params_hash: str) -> Optional[List[str]]:
+        """Copy the stored tables for ``params_hash`` into ``db_path``.
+
+        All tables are replaced in one transaction, so a failed install leaves
+        the database as it was.
+
+        Returns:
+            The installed table names, or None when the store has no entry
+        """
+        if not self.contains(params_hash):
+            return None
+        import duckdb
+
+        tables = self.tables(params_hash)
+        with duckdb.connect(str(db_path)) as conn:
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                for table in tables:
+                    source = self.path(params_hash) / f"{table}.parquet"
+                    conn.execute(
+                        f"CREATE OR REPLACE TABLE {table} AS "
+                        f"SELECT * FROM read_parquet('{source}')"
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return tables
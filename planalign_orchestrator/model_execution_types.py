@@ -121,7 +121,6 @@ class ModelClassifier:
             "dq_compliance_monitoring": "Compliance checking",
             # Reporting models
             "dim_hazard_table": "Reference dimension table",
-            "dim_payroll_calendar": "Calendar dimension table",
         }
 
         # CONDITIONAL: Models with complex dependencies that may or may not be parallel-safe
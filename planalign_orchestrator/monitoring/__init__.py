@@ -15,6 +15,20 @@ from .data_models import (
 )
 from .base import PerformanceMonitor
 from .duckdb_monitor import DuckDBPerformanceMonitor
+from .horizon import (
+    HorizonGrowth,
+    ModelYearTimings,
+    fit_horizon_growth,
+    timings_from_trace_spans,
+)
+from .sampler import (
+    ResourceSampler,
+    ResourceWindow,
+    SamplerMark,
+    get_resource_sampler,
+)
+from .spill import SpillMonitor, SpillReport
+from .tracing import RunTracer, TraceSpan, load_trace_spans, trace_path_for
 
 __all__ = [
     # Data models
@@ -25,4 +39,22 @@ __all__ = [
     # Monitor classes
     "PerformanceMonitor",
     "DuckDBPerformanceMonitor",
+    # Shared resource sampler
+    "ResourceSampler",
+    "ResourceWindow",
+    "SamplerMark",
+    "get_resource_sampler",
+    # Run tracing
+    "RunTracer",
+    "TraceSpan",
+    "load_trace_spans",
+    "trace_path_for",
+    # Horizon scaling guard
+    "HorizonGrowth",
+    "ModelYearTimings",
+    "fit_horizon_growth",
+    "timings_from_trace_spans",
+    # DuckDB spill accounting
+    "SpillMonitor",
+    "SpillReport",
 ]
@@ -5,7 +5,6 @@ Provides basic operation timing and resource monitoring through
 a context manager interface integrated with structured logging.
 """
 
-import threading
 import time
 from contextlib import contextmanager
 from typing import Any, Dict, Generator, Optional
@@ -14,6 +13,7 @@ import psutil
 
 from ..logger import ProductionLogger
 from .data_models import PerformanceMetrics
+from .sampler import ResourceWindow, get_resource_sampler
 
 
 class PerformanceMonitor:
@@ -23,7 +23,7 @@ class PerformanceMonitor:
     Features:
     - Context manager for automatic operation timing
     - Memory usage tracking with peak detection
-    - CPU utilization monitoring
+    - CPU utilization monitoring, including dbt child processes
     - Integration with structured logging
     - Comprehensive metrics collection
     """
@@ -38,11 +38,7 @@ class PerformanceMonitor:
         self.logger = logger
         self.metrics: Dict[str, PerformanceMetrics] = {}
         self._monitoring_active = False
-        self._monitoring_thread: Optional[threading.Thread] = None
-        self._monitoring_lock = threading.Lock()
-        self._active_metrics: Dict[int, PerformanceMetrics] = {}
-        self._stop_event = threading.Event()
-        self._idle_timeout_seconds = 0.5
+        self._sampler = get_resource_sampler()
         self._process = psutil.Process()
 
     @contextmanager
@@ -85,10 +81,12 @@ class PerformanceMonitor:
         # Log operation start
         self.logger.info(f"Starting operation: {operation_name}", **context)
 
-        try:
-            # Start background monitoring for long operations
-            self._start_monitoring(metrics)
+        # Peak memory and CPU come from the shared sampler's ring buffer;
+        # the operation itself only records where it started.
+        self._start_monitoring()
+        start_mark = self._sampler.mark()
 
+        try:
             yield metrics
 
             # Operation completed successfully
@@ -106,9 +104,7 @@ class PerformanceMonitor:
             raise
 
         finally:
-            # Stop monitoring and finalize metrics
-            self._stop_monitoring(metrics)
-            self._finalize_metrics(metrics)
+            self._finalize_metrics(metrics, self._sampler.window(start_mark))
 
             # Store metrics and log completion
             self.metrics[operation_name] = metrics
@@ -116,80 +112,17 @@ class PerformanceMonitor:
                 f"Completed operation: {operation_name}", **metrics.to_dict()
             )
 
-    def _start_monitoring(self, metrics: PerformanceMetrics) -> None:
-        """Register metrics and lazily start one reusable sampler thread."""
-        with self._monitoring_lock:
-            self._active_metrics[id(metrics)] = metrics
-            if self._monitoring_thread and self._monitoring_thread.is_alive():
-                return
-
-            self._stop_event.clear()
+    def _start_monitoring(self) -> None:
+        """Hold the shared sampler for this monitor's lifetime."""
+        if not self._monitoring_active:
+            self._sampler.acquire()
             self._monitoring_active = True
-            self._monitoring_thread = threading.Thread(
-                target=self._monitor_resources,
-                daemon=True,
-                name="planalign-resource-monitor",
-            )
-            self._monitoring_thread.start()
-
-    def _stop_monitoring(self, metrics: PerformanceMetrics) -> None:
-        """Unregister metrics without joining the shared sampler on every exit."""
-        with self._monitoring_lock:
-            self._active_metrics.pop(id(metrics), None)
-
-    def _monitor_resources(self) -> None:
-        """Sample all active operations until the monitor has been idle briefly."""
-        idle_since: Optional[float] = None
-        while not self._stop_event.is_set():
-            with self._monitoring_lock:
-                active_metrics = list(self._active_metrics.values())
-
-            if active_metrics:
-                idle_since = None
-                self._sample_metrics(active_metrics)
-            elif idle_since is None:
-                idle_since = time.monotonic()
-            elif time.monotonic() - idle_since >= self._idle_timeout_seconds:
-                with self._monitoring_lock:
-                    if self._active_metrics:
-                        idle_since = None
-                        continue
-                    break
-
-            self._stop_event.wait(0.5)
-
-        with self._monitoring_lock:
-            if threading.current_thread() is self._monitoring_thread:
-                self._monitoring_thread = None
-                self._monitoring_active = False
-
-    def _sample_metrics(self, metrics_list: list[PerformanceMetrics]) -> None:
-        """Update peak memory for the currently active operations."""
-        try:
-            memory_info = self._process.memory_info()
-            current_memory_mb = memory_info.rss / 1024 / 1024
-            for metrics in metrics_list:
-                if (
-                    metrics.peak_memory_mb is None
-                    or current_memory_mb > metrics.peak_memory_mb
-                ):
-                    metrics.peak_memory_mb = current_memory_mb
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            return
-        except Exception:
-            # Ignore monitoring errors to avoid disrupting the main operation.
-            return
 
     def close(self) -> None:
-        """Stop the reusable sampler and release monitoring resources."""
-        self._stop_event.set()
-        thread = self._monitoring_thread
-        if thread and thread is not threading.current_thread():
-            thread.join(timeout=1.0)
-        with self._monitoring_lock:
-            self._active_metrics.clear()
-            self._monitoring_thread = None
+        """Release this monitor's hold on the shared sampler."""
+        if self._monitoring_active:
             self._monitoring_active = False
+            self._sampler.release()
 
     def __del__(self) -> None:
         """Best-effort cleanup for monitors not owned by an observability session."""
@@ -198,7 +131,9 @@ class PerformanceMonitor:
         except Exception:
             pass
 
-    def _finalize_metrics(self, metrics: PerformanceMetrics) -> None:
+    def _finalize_metrics(
+        self, metrics: PerformanceMetrics, window: Optional[ResourceWindow] = None
+    ) -> None:
         """Finalize metrics calculation"""
         metrics.end_time = time.time()
         metrics.duration_seconds = metrics.end_time - metrics.start_time
@@ -215,12 +150,21 @@ class PerformanceMonitor:
             # Get CPU usage (averaged over the operation duration)
             metrics.cpu_percent = self._process.cpu_percent()
 
+            peaks = [metrics.peak_memory_mb, end_memory_mb]
+            if window is not None:
+                peaks.append(window.peak_rss_mb)
+            metrics.peak_memory_mb = max(p for p in peaks if p is not None)
+
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             self.logger.log_event(
                 "WARNING",
                 f"Could not get final resource usage for {metrics.operation_name}",
             )
 
+        if window is not None:
+            metrics.peak_tree_memory_mb = window.peak_tree_rss_mb
+            metrics.tree_cpu_seconds = window.tree_cpu_seconds
+
     def get_metrics(self, operation_name: Optional[str] = None) -> Dict[str, Any]:
         """
         Get performance metrics
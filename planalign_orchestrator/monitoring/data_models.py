@@ -24,6 +24,8 @@ class PerformanceMetrics:
     memory_delta_mb: Optional[float] = None
     peak_memory_mb: Optional[float] = None
     cpu_percent: Optional[float] = None
+    peak_tree_memory_mb: Optional[float] = None
+    tree_cpu_seconds: Optional[float] = None
     status: str = "running"
     error_message: Optional[str] = None
     context: Dict[str, Any] = field(default_factory=dict)
@@ -42,6 +44,12 @@ class PerformanceMetrics:
             if self.peak_memory_mb
             else None,
             "cpu_percent": round(self.cpu_percent, 1) if self.cpu_percent else None,
+            "peak_tree_memory_mb": round(self.peak_tree_memory_mb, 2)
+            if self.peak_tree_memory_mb
+            else None,
+            "tree_cpu_seconds": round(self.tree_cpu_seconds, 2)
+            if self.tree_cpu_seconds
+            else None,
             "status": self.status,
             "error": self.error_message,
             **self.context,
@@ -0,0 +1,194 @@
+"""
+Horizon scaling guard: per-model cost growth across simulation years.
+
+A model that reads every prior year (an accumulator over
+``fct_yearly_events``, a full ledger replay, an unpruned delete) costs a
+little more each year, so the run as a whole grows quadratically. Over a
+5-year benchmark that is noise; over a 20-30 year projection it dominates.
+
+``ModelYearTimings`` collects each model's ``execute`` time per simulation
+year from dbt's ``run_results.json`` after every invocation.
+:func:`fit_horizon_growth` then fits ``seconds ~ year_index ** exponent`` per
+model with a Theil-Sen (median of pairwise slopes) estimate on log-log
+scale, which shrugs off the odd slow year. Constant per-year cost has an
+exponent near 0 and linear growth one near 1. A model is flagged when its
+exponent exceeds ``HORIZON_EXPONENT_TOLERANCE``, i.e. when its cumulative
+cost grows faster than linearly with the horizon.
+
+The first simulated year is left out of the fit: it builds the baseline and
+runs with cold caches, so it is not comparable to the years after it.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+import numpy as np
+
+from .tracing import _phase_bounds
+
+# Exponent of per-year cost against the year index above which a model is
+# flagged; at 0.25 year 20 costs ~1.8x year 2.
+HORIZON_EXPONENT_TOLERANCE = 0.25
+# Fitted years needed (after the first simulated year) before fitting.
+MIN_HORIZON_YEARS = 4
+# Models below this total execute time are too small to fit reliably.
+MIN_MODEL_SECONDS = 0.5
+# Floor for sub-millisecond timings before taking logs.
+_SECONDS_FLOOR = 1e-3
+
+
+@dataclass
+class ModelYearTimings:
+    """Execute seconds per model per simulation year, summed over invocations."""
+
+    seconds: Dict[str, Dict[int, float]] = field(default_factory=dict)
+
+    def add(self, model: str, year: int, seconds: float) -> None:
+        by_year = self.seconds.setdefault(model, {})
+        by_year[year] = by_year.get(year, 0.0) + seconds
+
+    def record_run_results(
+        self, run_results_path: Path, *, year: Optional[int], since: float
+    ) -> int:
+        """Add the models of one invocation's ``run_results.json``.
+
+        A results file older than ``since`` (epoch seconds at invocation
+        start) belongs to an earlier command and is ignored, as are
+        invocations not attributed to a simulation year.
+
+        Returns:
+            Number of models recorded
+        """
+        if year is None:
+            return 0
+        try:
+            if run_results_path.stat().st_mtime < since:
+                return 0
+            payload = json.loads(run_results_path.read_text())
+        except (OSError, ValueError):
+            return 0
+
+        recorded = 0
+        for result in payload.get("results", []):
+            unique_id = result.get("unique_id", "")
+            if not unique_id.startswith("model."):
+                continue
+            seconds = _execute_seconds(result)
+            if seconds is None:
+                continue
+            self.add(unique_id, year, seconds)
+            recorded += 1
+        return recorded
+
+
+def _execute_seconds(result: Mapping[str, Any]) -> Optional[float]:
+    for phase in result.get("timing", []):
+        if phase.get("name") == "execute":
+            started, completed = _phase_bounds(phase)
+            if started is not None and completed is not None:
+                return max(0.0, completed - started)
+    execution_time = result.get("execution_time")
+    return float(execution_time) if isinstance(execution_time, (int, float)) else None
+
+
+def timings_from_trace_spans(spans: Iterable[Mapping[str, Any]]) -> ModelYearTimings:
+    """Rebuild per-year model timings from ``load_trace_spans`` output."""
+    spans = list(spans)
+    nodes = {
+        span["span_id"]: span["name"]
+        for span in spans
+        if span["category"] == "dbt_node" and span["name"].startswith("model.")
+    }
+    timings = ModelYearTimings()
+    for span in spans:
+        if (
+            span["category"] == "dbt_phase"
+            and span["name"] == "execute"
+            and span.get("parent_id") in nodes
+            and span.get("year") is not None
+        ):
+            timings.add(
+                nodes[span["parent_id"]], int(span["year"]), span["duration_seconds"]
+            )
+    return timings
+
+
+@dataclass(frozen=True)
+class HorizonGrowth:
+    """Fitted per-year cost growth of one model."""
+
+    model: str
+    first_year: int
+    last_year: int
+    first_seconds: float
+    last_seconds: float
+    total_seconds: float
+    exponent: float
+    flagged: bool
+
+    def describe(self) -> str:
+        return (
+            f"{self.model}: per-year time grows ~ year^{self.exponent:.2f} "
+            f"({self.first_seconds:.2f}s in {self.first_year} -> "
+            f"{self.last_seconds:.2f}s in {self.last_year})"
+        )
+
+
+def _theil_sen_slope(x: np.ndarray, y: np.ndarray) -> float:
+    i, j = np.triu_indices(len(x), k=1)
+    dx = x[j] - x[i]
+    keep = dx > 0
+    return float(np.median((y[j] - y[i])[keep] / dx[keep]))
+
+
+def fit_horizon_growth(
+    timings: ModelYearTimings | Mapping[str, Mapping[int, float]],
+    *,
+    start_year: Optional[int] = None,
+    tolerance: float = HORIZON_EXPONENT_TOLERANCE,
+    min_years: int = MIN_HORIZON_YEARS,
+    min_seconds: float = MIN_MODEL_SECONDS,
+) -> List[HorizonGrowth]:
+    """Fit each model's per-year cost growth, steepest first.
+
+    Args:
+        timings: Per-model, per-year execute seconds
+        start_year: First simulated year (default: each model's first year);
+            it anchors the year index and is itself excluded from the fit
+        tolerance: Exponent above which a model is flagged
+        min_years: Fitted years a model needs to be reported at all
+        min_seconds: Total seconds a model needs to be reported at all
+    """
+    by_model = timings.seconds if isinstance(timings, ModelYearTimings) else timings
+    findings: List[HorizonGrowth] = []
+    for model, by_year in by_model.items():
+        first = start_year if start_year is not None else min(by_year)
+        years = sorted(year for year in by_year if year > first)
+        if len(years) < min_years:
+            continue
+        seconds = np.array([by_year[year] for year in years])
+        total = float(seconds.sum())
+        if total < min_seconds:
+            continue
+        exponent = _theil_sen_slope(
+            np.log(np.array(years, dtype=float) - first + 1),
+            np.log(np.maximum(seconds, _SECONDS_FLOOR)),
+        )
+        findings.append(
+            HorizonGrowth(
+                model=model,
+                first_year=years[0],
+                last_year=years[-1],
+                first_seconds=round(float(seconds[0]), 4),
+                last_seconds=round(float(seconds[-1]), 4),
+                total_seconds=round(total, 4),
+                exponent=round(exponent, 3) if math.isfinite(exponent) else 0.0,
+                flagged=math.isfinite(exponent) and exponent > tolerance,
+            )
+        )
+    return sorted(findings, key=lambda finding: finding.exponent, reverse=True)
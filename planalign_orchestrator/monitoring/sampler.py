@@ -0,0 +1,258 @@
+"""
+Process-wide resource sampler shared by every orchestrator monitor.
+
+One daemon thread samples ``psutil`` for the whole process tree (the
+orchestrator plus its dbt children) into a fixed-size ring buffer. Timed
+operations only record start/end marks against the buffer; peak RSS and CPU
+attribution for an operation are computed from the samples between its marks
+after it finishes. Monitors that need periodic callbacks (memory pressure,
+CPU history) subscribe to the same thread instead of starting their own.
+
+The buffer is lock-free for readers: each slot holds one immutable tuple
+tagged with its sequence number, so a reader racing the writer simply skips
+a slot that was overwritten under it.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import psutil
+
+DEFAULT_INTERVAL_SECONDS = 0.25
+DEFAULT_CAPACITY = 16384  # ~68 minutes at the default interval
+
+_MB = 1024 * 1024
+
+# (sequence, monotonic time, process RSS MB, tree RSS MB, cumulative tree CPU seconds)
+_Slot = Tuple[int, float, float, float, float]
+
+
+@dataclass(frozen=True)
+class SamplerMark:
+    """Position in the sample stream at the start or end of an operation."""
+
+    sequence: int
+    time: float
+
+
+@dataclass(frozen=True)
+class ResourceWindow:
+    """Resource usage attributed to the interval between two marks."""
+
+    duration_seconds: float
+    sample_count: int
+    peak_rss_mb: Optional[float] = None
+    peak_tree_rss_mb: Optional[float] = None
+    tree_cpu_seconds: Optional[float] = None
+    tree_cpu_percent: Optional[float] = None
+
+
+@dataclass
+class _Subscription:
+    callback: Callable[[], None]
+    interval: float
+    next_due: float
+
+
+class ResourceSampler:
+    """
+    Shared low-overhead sampler for process-tree memory and CPU.
+
+    The sampling thread runs while at least one user holds it (see
+    ``acquire``/``release``); releasing never joins the thread, so stopping
+    costs the caller nothing.
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+        capacity: int = DEFAULT_CAPACITY,
+    ):
+        self.interval = interval
+        self.capacity = capacity
+        self._slots: List[Optional[_Slot]] = [None] * capacity
+        self._written = 0
+        self._cpu_floor = 0.0
+        self._process = psutil.Process()
+
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._users = 0
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event: Optional[threading.Event] = None
+        self._subscriptions: Dict[int, _Subscription] = {}
+        self._subscription_ids = itertools.count(1)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def acquire(self) -> None:
+        """Register a user, starting the sampling thread if none is running."""
+        with self._lock:
+            self._users += 1
+            if self._thread is not None:
+                return
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(self._stop_event,),
+                daemon=True,
+                name="planalign-resource-sampler",
+            )
+            self._thread.start()
+
+    def release(self) -> None:
+        """Drop a user; the last one signals the thread to exit on its own."""
+        with self._lock:
+            self._users = max(0, self._users - 1)
+            if self._users == 0 and self._stop_event is not None:
+                self._stop_event.set()
+                self._stop_event = None
+                self._thread = None
+
+    def subscribe(self, callback: Callable[[], None], interval: float) -> int:
+        """Call ``callback`` on the sampler thread every ``interval`` seconds.
+
+        Returns:
+            Handle to pass to ``unsubscribe``
+        """
+        handle = next(self._subscription_ids)
+        with self._lock:
+            self._subscriptions[handle] = _Subscription(
+                callback=callback, interval=interval, next_due=time.monotonic()
+            )
+        self.acquire()
+        return handle
+
+    def unsubscribe(self, handle: int) -> None:
+        with self._lock:
+            removed = self._subscriptions.pop(handle, None)
+        if removed is not None:
+            self.release()
+
+    def mark(self) -> SamplerMark:
+        """Record the current position in the sample stream (no psutil call)."""
+        return SamplerMark(sequence=self._written, time=time.monotonic())
+
+    def window(
+        self, start: SamplerMark, end: Optional[SamplerMark] = None
+    ) -> ResourceWindow:
+        """Attribute the samples taken between ``start`` and ``end``.
+
+        CPU is the growth of cumulative tree CPU time from the last sample
+        before ``start`` (or the first sample inside, if none survives) to the
+        last sample inside the window.
+        """
+        end = end or self.mark()
+        duration = end.time - start.time
+        first = max(start.sequence - 1, end.sequence - self.capacity, 0)
+        baseline: Optional[_Slot] = None
+        inside: List[_Slot] = []
+        for sequence in range(first, end.sequence):
+            slot = self._slots[sequence % self.capacity]
+            if slot is None or slot[0] != sequence:
+                continue
+            if sequence < start.sequence:
+                baseline = slot
+            else:
+                inside.append(slot)
+
+        if not inside:
+            return ResourceWindow(duration_seconds=duration, sample_count=0)
+
+        reference = baseline or inside[0]
+        cpu_seconds = max(0.0, inside[-1][4] - reference[4])
+        span = inside[-1][1] - reference[1]
+        return ResourceWindow(
+            duration_seconds=duration,
+            sample_count=len(inside),
+            peak_rss_mb=max(slot[2] for slot in inside),
+            peak_tree_rss_mb=max(slot[3] for slot in inside),
+            tree_cpu_seconds=cpu_seconds,
+            tree_cpu_percent=cpu_seconds / span * 100 if span > 0 else None,
+        )
+
+    def sample_now(self) -> None:
+        """Take one sample on the calling thread."""
+        self._record(self._read_tree())
+
+    def _run(self, stop_event: threading.Event) -> None:
+        while not stop_event.is_set():
+            try:
+                self._record(self._read_tree(), stop_event)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+            except Exception:
+                # Never let sampling failures reach the simulation.
+                pass
+            self._run_due_subscriptions()
+            stop_event.wait(self.interval)
+
+    def _run_due_subscriptions(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            due = [s for s in self._subscriptions.values() if s.next_due <= now]
+            for subscription in due:
+                subscription.next_due = now + subscription.interval
+        for subscription in due:
+            try:
+                subscription.callback()
+            except Exception:
+                pass
+
+    def _read_tree(self) -> Tuple[float, float, float]:
+        """Return (process RSS MB, tree RSS MB, cumulative tree CPU seconds)."""
+        own_rss = self._process.memory_info().rss
+        times = self._process.cpu_times()
+        # children_* covers children that already exited and were reaped.
+        cpu = times.user + times.system + times.children_user + times.children_system
+        tree_rss = own_rss
+        for child in self._process.children(recursive=True):
+            try:
+                tree_rss += child.memory_info().rss
+                child_times = child.cpu_times()
+                cpu += child_times.user + child_times.system
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+        return own_rss / _MB, tree_rss / _MB, cpu
+
+    def _record(
+        self,
+        reading: Tuple[float, float, float],
+        stop_event: Optional[threading.Event] = None,
+    ) -> None:
+        with self._write_lock:
+            if stop_event is not None and stop_event.is_set():
+                return
+            # A child that exited but is not yet reaped briefly drops out of
+            # the tree total; keep the cumulative series monotonic.
+            self._cpu_floor = max(self._cpu_floor, reading[2])
+            sequence = self._written
+            self._slots[sequence % self.capacity] = (
+                sequence,
+                time.monotonic(),
+                reading[0],
+                reading[1],
+                self._cpu_floor,
+            )
+            self._written = sequence + 1
+
+
+_shared_sampler: Optional[ResourceSampler] = None
+_shared_lock = threading.Lock()
+
+
+def get_resource_sampler() -> ResourceSampler:
+    """Return the process-wide sampler, creating it on first use."""
+    global _shared_sampler
+    if _shared_sampler is None:
+        with _shared_lock:
+            if _shared_sampler is None:
+                _shared_sampler = ResourceSampler()
+    return _shared_sampler
@@ -0,0 +1,113 @@
+"""
+Spill accounting for one run's DuckDB temp directory.
+
+DuckDB writes operator state that outgrows ``memory_limit`` to block files
+in ``temp_directory`` and deletes them as soon as the operator finishes, and
+it removes the directory itself on close. Nothing in DuckDB reports the total
+afterwards, so ``SpillMonitor`` polls the directory from the shared resource
+sampler while the run is live.
+
+Two figures come out of it:
+
+- ``peak_mib``: the most spill on disk at once, the number to size
+  ``max_temp_directory_size`` and the spill disk against;
+- ``written_mib``: the sum of each spill file's largest observed size, a
+  lower bound on the volume written (files created and removed between two
+  polls are missed).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from .sampler import ResourceSampler, get_resource_sampler
+
+DEFAULT_POLL_SECONDS = 0.5
+
+_MIB = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class SpillReport:
+    """Spill observed in one temp directory over a run."""
+
+    directory: str
+    peak_mib: float
+    written_mib: float
+    files: int
+
+    @property
+    def spilled(self) -> bool:
+        return self.files > 0
+
+    def describe(self) -> str:
+        return (
+            f"DuckDB spilled ≥{self.written_mib:,.1f} MiB to disk "
+            f"(peak {self.peak_mib:,.1f} MiB in {self.files} file(s))"
+        )
+
+
+class SpillMonitor:
+    """Track the spill files DuckDB writes into ``directory`` while started."""
+
+    def __init__(
+        self,
+        directory: Path | str,
+        *,
+        interval: float = DEFAULT_POLL_SECONDS,
+        sampler: Optional[ResourceSampler] = None,
+    ):
+        self.directory = Path(directory)
+        self.interval = interval
+        self._sampler = sampler
+        self._subscription: Optional[int] = None
+        self._largest: Dict[str, int] = {}
+        self._peak_bytes = 0
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        if self._subscription is not None:
+            return
+        sampler = self._sampler or get_resource_sampler()
+        self._sampler = sampler
+        self._subscription = sampler.subscribe(self.poll, self.interval)
+
+    def stop(self) -> SpillReport:
+        """Stop polling after one final scan; returns the run's report."""
+        if self._subscription is not None and self._sampler is not None:
+            self._sampler.unsubscribe(self._subscription)
+            self._subscription = None
+        self.poll()
+        return self.report()
+
+    def poll(self) -> None:
+        """Scan the directory once; a missing directory means no spill yet."""
+        sizes: Dict[str, int] = {}
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            sizes[entry.name] = entry.stat().st_size
+                    except OSError:
+                        continue
+        except OSError:
+            return
+        with self._lock:
+            self._peak_bytes = max(self._peak_bytes, sum(sizes.values()))
+            for name, size in sizes.items():
+                if size > self._largest.get(name, -1):
+                    self._largest[name] = size
+
+    def report(self) -> SpillReport:
+        with self._lock:
+            return SpillReport(
+                directory=str(self.directory),
+                peak_mib=round(self._peak_bytes / _MIB, 2),
+                written_mib=round(sum(self._largest.values()) / _MIB, 2),
+                files=len(self._largest),
+            )
@@ -0,0 +1,491 @@
+"""
+Run tracing: a span tree of run -> year -> stage -> dbt invocation -> model.
+
+The orchestrator opens spans for the run, each year, year setup phases and
+each workflow stage; ``DbtRunner`` opens one per dbt invocation and, once the
+subprocess exits, adds a span per node from dbt's ``run_results.json`` with
+``compile`` and ``execute`` phase children. Every span records:
+
+- ``residue_seconds``: time inside the span not covered by any child, i.e.
+  Python (or dbt start-up) work between the traced units.
+- Peak process / process-tree RSS and tree CPU from the shared
+  ``ResourceSampler``; spans shorter than one sampling interval have none.
+
+Open spans are tracked per thread. The thread that opens the first span owns
+the run; a span opened on a worker thread (``ParallelExecutionEngine`` runs dbt
+invocations on a pool) nests under that worker's own open spans, or under the
+owner's innermost open span, and is labelled with the worker's thread name.
+
+A finished trace is written as Chrome-trace JSON (loadable in Perfetto or
+``chrome://tracing``) and as rows of ``run_trace_spans`` in the run database.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .sampler import ResourceSampler, SamplerMark, get_resource_sampler
+
+logger = logging.getLogger(__name__)
+
+TRACE_TABLE = "run_trace_spans"
+TRACE_FILE_SUFFIX = ".trace.json"
+ORCHESTRATOR_THREAD = "orchestrator"
+
+# Not an int_/fct_ table, so traces survive setup.clear_tables resets.
+_CREATE_TABLE_SQL = f"""
+CREATE TABLE IF NOT EXISTS {TRACE_TABLE} (
+    run_id            VARCHAR NOT NULL,
+    span_id           INTEGER NOT NULL,
+    parent_id         INTEGER,
+    name              VARCHAR NOT NULL,
+    category          VARCHAR NOT NULL,
+    simulation_year   INTEGER,
+    stage             VARCHAR,
+    thread            VARCHAR,
+    start_seconds     DOUBLE  NOT NULL,
+    duration_seconds  DOUBLE  NOT NULL,
+    residue_seconds   DOUBLE,
+    status            VARCHAR,
+    rows_affected     BIGINT,
+    peak_rss_mb       DOUBLE,
+    peak_tree_rss_mb  DOUBLE,
+    tree_cpu_seconds  DOUBLE,
+    attributes_json   VARCHAR
+)
+"""
+
+
+def trace_path_for(database_path: Path | str) -> Path:
+    """Trace file written beside a run database (``simulation.trace.json``)."""
+    database_path = Path(database_path)
+    return database_path.with_name(database_path.stem + TRACE_FILE_SUFFIX)
+
+
+@dataclass
+class TraceSpan:
+    """One timed unit of work; times are seconds since the trace started."""
+
+    span_id: int
+    parent_id: Optional[int]
+    name: str
+    category: str
+    start_seconds: float
+    end_seconds: Optional[float] = None
+    thread: str = ORCHESTRATOR_THREAD
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    residue_seconds: Optional[float] = None
+    peak_rss_mb: Optional[float] = None
+    peak_tree_rss_mb: Optional[float] = None
+    tree_cpu_seconds: Optional[float] = None
+
+    @property
+    def duration_seconds(self) -> float:
+        if self.end_seconds is None:
+            return 0.0
+        return max(0.0, self.end_seconds - self.start_seconds)
+
+
+class RunTracer:
+    """Collects the span tree of one simulation run."""
+
+    def __init__(
+        self,
+        output_path: Optional[Path] = None,
+        sampler: Optional[ResourceSampler] = None,
+    ):
+        self.output_path = Path(output_path) if output_path is not None else None
+        self.run_id: Optional[str] = None
+        self.spans: List[TraceSpan] = []
+        self._sampler = sampler or get_resource_sampler()
+        self._sampling = False
+        self._origin = time.monotonic()
+        self._origin_wall = time.time()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._owner: Optional[int] = None
+        self._owner_stack: List[TraceSpan] = []
+        self._local = threading.local()
+        self._open: Dict[int, TraceSpan] = {}
+        self._marks: Dict[int, SamplerMark] = {}
+        self._children: Dict[int, List[TraceSpan]] = {}
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    @property
+    def current_span(self) -> Optional[TraceSpan]:
+        """Innermost span open on this thread, else on the owning thread."""
+        with self._lock:
+            stack = self._thread_stack()
+            if stack:
+                return stack[-1]
+            return self._owner_stack[-1] if self._owner_stack else None
+
+    @contextmanager
+    def span(self, name: str, category: str, **attributes: Any) -> Iterator[TraceSpan]:
+        """Time the enclosed block as a child of the innermost open span."""
+        with self._lock:
+            if not self._sampling:
+                self._sampler.acquire()
+                self._sampling = True
+            if self._owner is None:
+                self._owner = threading.get_ident()
+        parent = self.current_span
+        span = self._new_span(
+            name,
+            category,
+            parent,
+            time.monotonic() - self._origin,
+            self._thread_label(),
+            attributes,
+        )
+        mark = self._sampler.mark()
+        with self._lock:
+            self._marks[span.span_id] = mark
+            self._thread_stack().append(span)
+            self._open[span.span_id] = span
+        try:
+            yield span
+        except BaseException:
+            span.attributes.setdefault("status", "error")
+            raise
+        finally:
+            with self._lock:
+                stack = self._thread_stack()
+                if span in stack:  # finish() may already have closed it
+                    stack.remove(span)
+                self._open.pop(span.span_id, None)
+            self._finish(span, time.monotonic() - self._origin)
+
+    def add_span(
+        self,
+        name: str,
+        category: str,
+        *,
+        parent: Optional[TraceSpan],
+        start_wall: float,
+        end_wall: float,
+        thread: str = ORCHESTRATOR_THREAD,
+        **attributes: Any,
+    ) -> TraceSpan:
+        """Record an already finished span timed by wall-clock epoch seconds."""
+        span = self._new_span(
+            name,
+            category,
+            parent,
+            start_wall - self._origin_wall,
+            thread,
+            attributes,
+        )
+        span.end_seconds = max(span.start_seconds, end_wall - self._origin_wall)
+        return span
+
+    def add_dbt_results(self, invocation: TraceSpan, run_results_path: Path) -> int:
+        """Add node and phase spans from an invocation's ``run_results.json``.
+
+        A results file older than the invocation belongs to an earlier
+        command (not every dbt command rewrites it) and is ignored.
+
+        Returns:
+            Number of node spans added
+        """
+        try:
+            if run_results_path.stat().st_mtime < (
+                self._origin_wall + invocation.start_seconds
+            ):
+                return 0
+            payload = json.loads(run_results_path.read_text())
+        except (OSError, ValueError):
+            return 0
+
+        added = 0
+        for result in payload.get("results", []):
+            phases = [
+                (phase.get("name"), *_phase_bounds(phase))
+                for phase in result.get("timing", [])
+            ]
+            phases = [p for p in phases if p[1] is not None and p[2] is not None]
+            if not phases:
+                continue
+            adapter_response = result.get("adapter_response") or {}
+            rows_affected = adapter_response.get("rows_affected")
+            node = self.add_span(
+                result.get("unique_id", "unknown"),
+                "dbt_node",
+                parent=invocation,
+                start_wall=min(p[1] for p in phases),
+                end_wall=max(p[2] for p in phases),
+                thread=result.get("thread_id") or "dbt",
+                status=str(result.get("status", "unknown")),
+                rows_affected=rows_affected if isinstance(rows_affected, int) else None,
+            )
+            for phase_name, started, completed in phases:
+                self.add_span(
+                    str(phase_name),
+                    "dbt_phase",
+                    parent=node,
+                    start_wall=started,
+                    end_wall=completed,
+                    thread=node.thread,
+                )
+            self._compute_residue(node)
+            added += 1
+        return added
+
+    def finish(self, *, status: Optional[str] = None) -> None:
+        """Close spans left open (e.g. by a failed run) and stop sampling."""
+        now = time.monotonic() - self._origin
+        with self._lock:
+            left_open = list(self._open.values())
+            self._open.clear()
+            self._owner_stack.clear()
+        for span in reversed(left_open):
+            span.attributes.setdefault("status", status or "incomplete")
+            self._finish(span, now)
+        with self._lock:
+            if self._sampling:
+                self._sampler.release()
+                self._sampling = False
+
+    def _thread_stack(self) -> List[TraceSpan]:
+        """Open spans of the calling thread; callers hold ``_lock``."""
+        if threading.get_ident() == self._owner:
+            return self._owner_stack
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _thread_label(self) -> str:
+        if threading.get_ident() == self._owner:
+            return ORCHESTRATOR_THREAD
+        return threading.current_thread().name
+
+    def _new_span(
+        self,
+        name: str,
+        category: str,
+        parent: Optional[TraceSpan],
+        start_seconds: float,
+        thread: str,
+        attributes: Dict[str, Any],
+    ) -> TraceSpan:
+        inherited = {
+            key: parent.attributes[key]
+            for key in ("year", "stage")
+            if parent is not None and key in parent.attributes
+        }
+        span = TraceSpan(
+            span_id=next(self._ids),
+            parent_id=parent.span_id if parent is not None else None,
+            name=name,
+            category=category,
+            start_seconds=start_seconds,
+            thread=thread,
+            attributes={
+                **inherited,
+                **{k: v for k, v in attributes.items() if v is not None},
+            },
+        )
+        with self._lock:
+            self.spans.append(span)
+            if parent is not None:
+                self._children.setdefault(parent.span_id, []).append(span)
+        return span
+
+    def _finish(self, span: TraceSpan, end_seconds: float) -> None:
+        if span.end_seconds is not None:
+            return
+        span.end_seconds = end_seconds
+        with self._lock:
+            mark = self._marks.pop(span.span_id, None)
+        if mark is not None:
+            window = self._sampler.window(mark)
+            span.peak_rss_mb = window.peak_rss_mb
+            span.peak_tree_rss_mb = window.peak_tree_rss_mb
+            span.tree_cpu_seconds = window.tree_cpu_seconds
+        self._compute_residue(span)
+
+    def _compute_residue(self, span: TraceSpan) -> None:
+        """Span time not covered by the union of its children's intervals."""
+        with self._lock:
+            children = list(self._children.get(span.span_id, []))
+        intervals = sorted(
+            (
+                max(child.start_seconds, span.start_seconds),
+                min(child.end_seconds, span.end_seconds or child.end_seconds),
+            )
+            for child in children
+            if child.end_seconds is not None
+        )
+        covered = 0.0
+        cursor = span.start_seconds
+        for start, end in intervals:
+            start = max(start, cursor)
+            if end > start:
+                covered += end - start
+                cursor = end
+        span.residue_seconds = max(0.0, span.duration_seconds - covered)
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Chrome-trace / Perfetto JSON: one complete ("X") event per span."""
+        threads: Dict[str, int] = {ORCHESTRATOR_THREAD: 0}
+        events: List[Dict[str, Any]] = []
+        for span in self.spans:
+            if span.end_seconds is None:
+                continue
+            tid = threads.setdefault(span.thread, len(threads))
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": round(span.start_seconds * 1e6, 1),
+                    "dur": round(span.duration_seconds * 1e6, 1),
+                    "pid": 1,
+                    "tid": tid,
+                    "args": _span_args(span),
+                }
+            )
+        for thread, tid in threads.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {"name": thread},
+                }
+            )
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "run_id": self.run_id,
+                "started_at": datetime.fromtimestamp(self._origin_wall).isoformat(),
+            },
+        }
+
+    def write_chrome_trace(self, path: Optional[Path] = None) -> Path:
+        path = Path(path or self.output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f".{path.name}.tmp")
+        with open(temporary, "w") as f:
+            json.dump(self.chrome_trace(), f, separators=(",", ":"))
+        os.replace(temporary, path)
+        return path
+
+    def persist(self, conn, run_id: str) -> int:
+        """Replace ``run_id``'s rows in ``run_trace_spans``; returns the row count."""
+        rows = [
+            (
+                run_id,
+                span.span_id,
+                span.parent_id,
+                span.name,
+                span.category,
+                span.attributes.get("year"),
+                span.attributes.get("stage"),
+                span.thread,
+                span.start_seconds,
+                span.duration_seconds,
+                span.residue_seconds,
+                span.attributes.get("status"),
+                span.attributes.get("rows_affected"),
+                span.peak_rss_mb,
+                span.peak_tree_rss_mb,
+                span.tree_cpu_seconds,
+                json.dumps(span.attributes, default=str),
+            )
+            for span in self.spans
+            if span.end_seconds is not None
+        ]
+        conn.execute(_CREATE_TABLE_SQL)
+        conn.execute(f"DELETE FROM {TRACE_TABLE} WHERE run_id = ?", [run_id])
+        if rows:
+            placeholders = ", ".join("?" * len(rows[0]))
+            conn.executemany(f"INSERT INTO {TRACE_TABLE} VALUES ({placeholders})", rows)
+        return len(rows)
+
+
+def _span_args(span: TraceSpan) -> Dict[str, Any]:
+    args: Dict[str, Any] = {
+        "span_id": span.span_id,
+        "parent_id": span.parent_id,
+        **span.attributes,
+    }
+    for key in (
+        "residue_seconds",
+        "peak_rss_mb",
+        "peak_tree_rss_mb",
+        "tree_cpu_seconds",
+    ):
+        value = getattr(span, key)
+        if value is not None:
+            args[key] = round(value, 6)
+    return args
+
+
+def _phase_bounds(phase: Dict[str, Any]) -> Tuple[Optional[float], Optional[float]]:
+    """Epoch seconds of a run_results timing entry's start and end."""
+
+    def _parse(value: Any) -> Optional[float]:
+        if not value:
+            return None
+        try:
+            parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            # dbt writes naive UTC timestamps.
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+
+    return _parse(phase.get("started_at")), _parse(phase.get("completed_at"))
+
+
+def load_trace_spans(path: Path) -> List[Dict[str, Any]]:
+    """Read the spans of a Chrome-trace file written by ``RunTracer``.
+
+    Returns:
+        One dict per span in start order, with name, category, start and
+        duration in seconds, and the recorded span arguments
+    """
+    payload = json.loads(Path(path).read_text())
+    threads = {
+        event["tid"]: event.get("args", {}).get("name")
+        for event in payload.get("traceEvents", [])
+        if event.get("ph") == "M" and event.get("name") == "thread_name"
+    }
+    spans = []
+    for event in payload.get("traceEvents", []):
+        if event.get("ph") != "X":
+            continue
+        spans.append(
+            {
+                **event.get("args", {}),
+                "name": event["name"],
+                "category": event.get("cat"),
+                "thread": threads.get(event.get("tid")),
+                "start_seconds": event["ts"] / 1e6,
+                "duration_seconds": event["dur"] / 1e6,
+            }
+        )
+    spans.sort(key=lambda span: (span["start_seconds"], span.get("span_id", 0)))
+    return spans
@@ -336,10 +336,12 @@ def setup_hazard_cache(
     """
     try:
         from .hazard_cache_manager import HazardCacheManager
+        from .hazard_store import HazardStore, default_store_root
 
         hazard_cache_manager = HazardCacheManager(
             config=config,
             dbt_runner=dbt_runner,
+            store=HazardStore(default_store_root()),
         )
 
         logger.debug(
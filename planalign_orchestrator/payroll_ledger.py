@@ -0,0 +1,399 @@
+"""
+On-demand payroll ledger: one row per employee per pay period.
+
+The ledger used to be the ``fct_payroll_ledger`` dbt table, a cross join of
+every employee with every bi-weekly pay period (26-27 rows per employee per
+year, ~16M rows for 60k employees over 10 years) that few readers ever open.
+It is now derived from the published marts only when asked for:
+
+- ``fct_workforce_snapshot`` gives each year's roster, hire and termination
+  dates, and the prior year-end rate each employee starts the year on;
+- ``fct_yearly_events`` gives the hire, raise and promotion rates that change
+  an employee's salary during the year.
+
+Both survive columnar archival, so published runs can build a ledger long
+after their intermediate tables are gone.
+
+A year is cached as one Parquet file in ``<database stem>.payroll_ledger/``
+next to the database, with a sidecar fingerprint of the rows it was built
+from. A re-simulated year no longer matches its fingerprint and is rebuilt
+on the next read. Reads go through a ``fct_payroll_ledger`` temporary view
+over the cached files, so read-only connections can serve them too.
+Requests for a few employees in a year that is not cached are computed for
+those employees alone rather than building the whole year.
+
+``storage.payroll_ledger: eager`` in the simulation config builds every
+simulated year when a run completes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence
+
+import duckdb
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+LEDGER_FORMAT_VERSION = 1
+PAYROLL_LEDGER_VIEW = "fct_payroll_ledger"
+# ``storage.payroll_ledger`` values.
+LEDGER_ON_DEMAND = "on_demand"
+LEDGER_EAGER = "eager"
+
+# Events whose compensation_amount is the employee's new annual rate.
+COMPENSATION_EVENT_TYPES = ("hire", "raise", "promotion")
+
+LEDGER_COLUMNS = (
+    "employee_id",
+    "simulation_year",
+    "pay_period_number",
+    "pay_period_start_date",
+    "pay_period_end_date",
+    "total_periods_in_year",
+    "annual_salary_rate_on_pay_date",
+    "period_earnings",
+    "is_first_period_after_hire",
+    "is_last_period_before_termination",
+)
+
+_EMPLOYEE_FILTER_TABLE = "_payroll_ledger_employees"
+_PAY_PERIOD_DAYS = 14
+
+
+class PayrollLedgerError(LookupError):
+    """Raised when a requested year has no simulated workforce to pay."""
+
+
+@dataclass(frozen=True)
+class PayPeriod:
+    """One bi-weekly pay period, paid on ``end_date``."""
+
+    number: int
+    start_date: date
+    end_date: date
+
+
+def pay_calendar(year: int) -> List[PayPeriod]:
+    """Bi-weekly pay periods paid from the first Friday of January.
+
+    A year has 27 periods when its 27th Friday payday still falls on or before
+    December 31, otherwise 26.
+    """
+    january_first = date(year, 1, 1)
+    payday = january_first + timedelta(days=(4 - january_first.weekday()) % 7)
+    periods: List[PayPeriod] = []
+    while payday.year == year:
+        periods.append(
+            PayPeriod(
+                number=len(periods) + 1,
+                start_date=payday - timedelta(days=_PAY_PERIOD_DAYS - 1),
+                end_date=payday,
+            )
+        )
+        payday += timedelta(days=_PAY_PERIOD_DAYS)
+    return periods
+
+
+def ledger_directory(database_path: Path | str) -> Path:
+    """Cache directory for ``database_path``'s ledger, beside the database."""
+    database = Path(database_path).absolute()
+    return database.with_name(f"{database.stem}.payroll_ledger")
+
+
+def ledger_mode(config: object) -> str:
+    """``storage.payroll_ledger`` from a config model or dict; on demand by default."""
+    if isinstance(config, dict):
+        storage = config.get("storage")
+    else:
+        storage = getattr(config, "storage", None)
+    if not isinstance(storage, dict):
+        return LEDGER_ON_DEMAND
+    return str(storage.get("payroll_ledger") or LEDGER_ON_DEMAND).lower()
+
+
+class PayrollLedger:
+    """The payroll ledger of one run database, cached per year as Parquet.
+
+    Args:
+        connection: Connection to the run database; read-only is enough.
+        directory: Cache directory, normally ``ledger_directory(database)``.
+    """
+
+    def __init__(self, connection: duckdb.DuckDBPyConnection, directory: Path | str):
+        self.connection = connection
+        self.directory = Path(directory)
+
+    def simulated_years(self) -> List[int]:
+        """Years with a workforce snapshot, oldest first."""
+        try:
+            rows = self.connection.execute(
+                "SELECT DISTINCT simulation_year FROM fct_workforce_snapshot "
+                "ORDER BY simulation_year"
+            ).fetchall()
+        except duckdb.CatalogException:
+            return []
+        return [int(row[0]) for row in rows]
+
+    def cached_years(self) -> List[int]:
+        """Years whose cached ledger still matches the run database."""
+        return [year for year in self.simulated_years() if self._is_fresh(year)]
+
+    def materialize(
+        self, years: Optional[Iterable[int]] = None, *, force: bool = False
+    ) -> List[int]:
+        """Build the cache for ``years`` (default: every simulated year).
+
+        Years already cached from the same inputs are skipped unless ``force``.
+
+        Returns:
+            Years that were (re)built
+        """
+        wanted = self._resolve_years(years)
+        built: List[int] = []
+        for year in wanted:
+            if not force and self._is_fresh(year):
+                continue
+            self._write_year(year)
+            built.append(year)
+        return built
+
+    def query(
+        self,
+        years: Optional[Iterable[int]] = None,
+        employee_ids: Optional[Sequence[str]] = None,
+    ) -> duckdb.DuckDBPyRelation:
+        """Ledger rows for ``years`` and, if given, only ``employee_ids``.
+
+        Whole-year requests materialize missing years first. With
+        ``employee_ids``, uncached years are computed for those employees only
+        and nothing is written.
+        """
+        wanted = self._resolve_years(years)
+        if not wanted:
+            raise PayrollLedgerError("No simulated years to build a payroll ledger for")
+        employees = list(dict.fromkeys(employee_ids)) if employee_ids else None
+        if employees is None:
+            self.materialize(wanted)
+            cached, direct = wanted, []
+        else:
+            cached = [year for year in wanted if self._is_fresh(year)]
+            direct = [year for year in wanted if year not in cached]
+            self.connection.execute(
+                f"CREATE OR REPLACE TEMP TABLE {_EMPLOYEE_FILTER_TABLE} AS "
+                "SELECT UNNEST(?::VARCHAR[]) AS employee_id",
+                [employees],
+            )
+
+        employee_filter = (
+            f" AND employee_id IN (SELECT employee_id FROM {_EMPLOYEE_FILTER_TABLE})"
+            if employees is not None
+            else ""
+        )
+        parts: List[str] = []
+        if cached:
+            self._register_view(cached)
+            parts.append(
+                f"SELECT {', '.join(LEDGER_COLUMNS)} FROM temp.{PAYROLL_LEDGER_VIEW} "
+                f"WHERE simulation_year IN ({', '.join(str(y) for y in cached)})"
+                f"{employee_filter}"
+            )
+        parts.extend(
+            _ledger_sql(year, employee_filter=employee_filter) for year in direct
+        )
+        union = " UNION ALL ".join(f"({part})" for part in parts)
+        return self.connection.sql(
+            f"SELECT * FROM ({union}) "
+            "ORDER BY simulation_year, employee_id, pay_period_number"
+        )
+
+    def read(
+        self,
+        years: Optional[Iterable[int]] = None,
+        employee_ids: Optional[Sequence[str]] = None,
+    ) -> "pd.DataFrame":
+        """:meth:`query` as a DataFrame."""
+        return self.query(years, employee_ids).df()
+
+    def _resolve_years(self, years: Optional[Iterable[int]]) -> List[int]:
+        simulated = self.simulated_years()
+        if years is None:
+            return simulated
+        wanted = sorted({int(year) for year in years})
+        missing = [year for year in wanted if year not in simulated]
+        if missing:
+            raise PayrollLedgerError(
+                f"No workforce snapshot for year(s) {', '.join(map(str, missing))}"
+            )
+        return wanted
+
+    def _register_view(self, years: Sequence[int]) -> None:
+        files = ", ".join(f"'{_quote(self._parquet_path(year))}'" for year in years)
+        self.connection.execute(
+            f"CREATE OR REPLACE TEMP VIEW {PAYROLL_LEDGER_VIEW} AS "
+            f"SELECT * FROM read_parquet([{files}])"
+        )
+
+    def _parquet_path(self, year: int) -> Path:
+        return self.directory / f"payroll_ledger_{year}.parquet"
+
+    def _sidecar_path(self, year: int) -> Path:
+        return self.directory / f"payroll_ledger_{year}.json"
+
+    def _is_fresh(self, year: int) -> bool:
+        try:
+            sidecar = json.loads(self._sidecar_path(year).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        return (
+            sidecar.get("format_version") == LEDGER_FORMAT_VERSION
+            and sidecar.get("fingerprint") == self._fingerprint(year)
+            and self._parquet_path(year).is_file()
+        )
+
+    def _fingerprint(self, year: int) -> str:
+        """Content hash of every input row the year's ledger depends on."""
+        roster = self.connection.execute(
+            "SELECT count(*), bit_xor(hash(simulation_year, employee_id, "
+            "employee_hire_date, termination_date, current_compensation)) "
+            "FROM fct_workforce_snapshot WHERE simulation_year IN (?, ?)",
+            [year - 1, year],
+        ).fetchone()
+        events = self.connection.execute(
+            "SELECT count(*), bit_xor(hash(employee_id, event_type, effective_date, "
+            "compensation_amount, previous_compensation, event_sequence)) "
+            "FROM fct_yearly_events "
+            "WHERE simulation_year = ? AND lower(event_type) IN "
+            f"({', '.join(repr(kind) for kind in COMPENSATION_EVENT_TYPES)})",
+            [year],
+        ).fetchone()
+        return f"{roster[0]}:{roster[1]}:{events[0]}:{events[1]}"
+
+    def _write_year(self, year: int) -> None:
+        """Write one year's Parquet and sidecar; replaced atomically."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fingerprint = self._fingerprint(year)
+        target = self._parquet_path(year)
+        staging = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        self.connection.execute(
+            f"COPY ({_ledger_sql(year)} "
+            "ORDER BY employee_id, pay_period_number) "
+            f"TO '{_quote(staging)}' (FORMAT PARQUET, COMPRESSION ZSTD)"
+        )
+        os.replace(staging, target)
+        sidecar = self._sidecar_path(year)
+        staged_sidecar = sidecar.with_name(f".{sidecar.name}.{os.getpid()}.tmp")
+        staged_sidecar.write_text(
+            json.dumps(
+                {"format_version": LEDGER_FORMAT_VERSION, "fingerprint": fingerprint}
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        os.replace(staged_sidecar, sidecar)
+
+
+def _ledger_sql(year: int, *, employee_filter: str = "") -> str:
+    """One year's ledger, as the retired ``fct_payroll_ledger`` model defined it.
+
+    An employee is paid for every period ending after their hire date and
+    before their termination date. The rate on a payday is the latest hire,
+    raise or promotion rate effective by then, else the rate the employee
+    started the year on: last year's closing rate, the rate before the year's
+    first change, or (with neither) the year's closing rate.
+    """
+    year = int(year)
+    calendar = pay_calendar(year)
+    periods = ", ".join(
+        f"({period.number}, DATE '{period.start_date}', DATE '{period.end_date}')"
+        for period in calendar
+    )
+    event_types = ", ".join(repr(kind) for kind in COMPENSATION_EVENT_TYPES)
+    return f"""
+        WITH calendar AS (
+            SELECT *, {len(calendar)} AS total_periods_in_year
+            FROM (VALUES {periods})
+                AS c(pay_period_number, pay_period_start_date, pay_period_end_date)
+        ),
+        roster AS (
+            SELECT employee_id, employee_hire_date, termination_date,
+                   current_compensation
+            FROM fct_workforce_snapshot
+            WHERE simulation_year = {year}{employee_filter}
+        ),
+        rate_changes AS (
+            SELECT employee_id, effective_date, compensation_amount,
+                   CASE WHEN lower(event_type) = 'hire'
+                        THEN compensation_amount
+                        ELSE previous_compensation END AS rate_before
+            FROM fct_yearly_events
+            WHERE simulation_year = {year}
+              AND lower(event_type) IN ({event_types})
+              AND compensation_amount IS NOT NULL{employee_filter}
+            QUALIFY row_number() OVER (
+                PARTITION BY employee_id, effective_date
+                ORDER BY event_sequence DESC
+            ) = 1
+        ),
+        opening AS (
+            SELECT employee_id, arg_min(rate_before, effective_date) AS rate
+            FROM rate_changes
+            GROUP BY employee_id
+        ),
+        prior_close AS (
+            SELECT employee_id, current_compensation AS rate
+            FROM fct_workforce_snapshot
+            WHERE simulation_year = {year - 1}{employee_filter}
+        ),
+        paid_periods AS (
+            SELECT
+                roster.employee_id,
+                roster.employee_hire_date,
+                roster.termination_date,
+                COALESCE(prior_close.rate, opening.rate, roster.current_compensation)
+                    AS starting_salary,
+                calendar.*
+            FROM roster
+            LEFT JOIN prior_close USING (employee_id)
+            LEFT JOIN opening USING (employee_id)
+            JOIN calendar
+              ON calendar.pay_period_end_date > roster.employee_hire_date
+             AND (roster.termination_date IS NULL
+                  OR calendar.pay_period_end_date < roster.termination_date)
+        ),
+        rated AS (
+            SELECT paid_periods.*,
+                   COALESCE(rate_changes.compensation_amount,
+                            paid_periods.starting_salary)
+                       AS annual_salary_rate_on_pay_date
+            FROM paid_periods
+            ASOF LEFT JOIN rate_changes
+              ON paid_periods.employee_id = rate_changes.employee_id
+             AND paid_periods.pay_period_end_date >= rate_changes.effective_date
+        )
+        SELECT
+            employee_id,
+            {year} AS simulation_year,
+            pay_period_number,
+            pay_period_start_date,
+            pay_period_end_date,
+            total_periods_in_year,
+            annual_salary_rate_on_pay_date,
+            ROUND(annual_salary_rate_on_pay_date / total_periods_in_year, 2)
+                AS period_earnings,
+            pay_period_end_date <= employee_hire_date + INTERVAL 14 DAY
+                AS is_first_period_after_hire,
+            COALESCE(
+                pay_period_end_date >= termination_date - INTERVAL 14 DAY, FALSE
+            ) AS is_last_period_before_termination
+        FROM rated
+    """
+
+
+def _quote(path: Path) -> str:
+    return str(path).replace("'", "''")
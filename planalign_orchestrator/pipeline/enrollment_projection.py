@@ -3,17 +3,81 @@
 The projection is deliberately disposable.  It translates the immutable event
 ledger into the compact decision state needed by enrollment models without
 making a dbt model depend on its own materialized history.
+
+A full rebuild ranks every prior enrollment event, so its cost grows with the
+horizon.  In incremental mode the projection for year N is instead folded
+forward from the year N-1 projection this instance published, reading only
+year N-1's events; every ``verify_every`` folds (and every fold when debug
+logging is on) the result is checked against a full rebuild.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 import logging
+from typing import Optional, Tuple
 
 from planalign_orchestrator.utils import DatabaseConnectionManager
 
 logger = logging.getLogger(__name__)
 
+_ProjectionKey = Tuple[int, str, str]
+
+_EVENT_COLUMNS = """
+    employee_id, event_type, effective_date, simulation_year,
+    event_sequence, event_id, employee_deferral_rate,
+    {change_type} AS enrollment_change_type"""
+
+# Rows published before fct_yearly_events gained enrollment_change_type (or
+# ledgers that predate the column entirely) only record opt-outs in the text.
+_LEGACY_CHANGE_TYPE = (
+    "CASE WHEN LOWER(event_details) LIKE '%opt-out%' THEN 'opt_out' END"
+)
+
+_NO_EVENTS = """
+    SELECT
+      CAST(NULL AS VARCHAR) AS employee_id,
+      CAST(NULL AS VARCHAR) AS event_type,
+      CAST(NULL AS DATE) AS effective_date,
+      CAST(NULL AS INTEGER) AS simulation_year,
+      CAST(NULL AS INTEGER) AS event_sequence,
+      CAST(NULL AS VARCHAR) AS event_id,
+      CAST(NULL AS DECIMAL(9, 6)) AS employee_deferral_rate,
+      CAST(NULL AS VARCHAR) AS enrollment_change_type,
+      CAST(NULL AS BIGINT) AS latest_rank
+    WHERE false"""
+
+_BASELINE = """
+    SELECT
+      employee_id,
+      employee_enrollment_date AS enrollment_date,
+      employee_deferral_rate AS current_deferral_rate,
+      COALESCE(is_enrolled_at_census, false) AS baseline_is_enrolled
+    FROM int_baseline_workforce
+    WHERE employee_id IS NOT NULL"""
+
+# Per-employee aggregates over a ranked ``events`` CTE (latest_rank = 1 is the
+# latest event in its scope). Opt-outs use the typed enrollment_change_type,
+# falling back to the legacy text, as the dbt enrollment accumulators do.
+_EVENT_STATE = """
+    SELECT
+      employee_id,
+      MIN(CASE WHEN event_type = 'enrollment' THEN effective_date END) AS first_enrollment_date,
+      MAX(CASE WHEN event_type = 'enrollment_change'
+                AND enrollment_change_type = 'opt_out'
+               THEN 1 ELSE 0 END) = 1 AS ever_opted_out,
+      MAX(CASE WHEN latest_rank = 1
+                AND event_type = 'enrollment_change'
+                AND enrollment_change_type = 'opt_out'
+               THEN 1 ELSE 0 END) = 1 AS latest_is_opt_out,
+      MAX(CASE WHEN latest_rank = 1 THEN 1 ELSE 0 END) = 1 AS has_event,
+      MAX(CASE WHEN latest_rank = 1 THEN employee_deferral_rate END) AS current_deferral_rate,
+      MAX(CASE WHEN latest_rank = 1 THEN event_id END) AS latest_event_id,
+      MAX(CASE WHEN latest_rank = 1 THEN simulation_year END) AS latest_event_year,
+      MAX(CASE WHEN latest_rank = 1 THEN effective_date END) AS latest_event_effective_date
+    FROM events
+    GROUP BY employee_id"""
+
 
 @dataclass(frozen=True)
 class EnrollmentProjectionResult:
@@ -23,6 +87,7 @@ class EnrollmentProjectionResult:
     scenario_id: str
     plan_design_id: str
     employee_count: int
+    incremental: bool = False
 
 
 class EnrollmentDecisionProjection:
@@ -43,12 +108,40 @@ class EnrollmentDecisionProjection:
         "latest_event_id": "VARCHAR",
         "latest_event_year": "INTEGER",
         "latest_event_effective_date": "DATE",
+        "first_enrollment_event_date": "DATE",
         "authoritative_enrollment_date": "DATE",
         "authoritative_is_enrolled": "BOOLEAN",
     }
 
-    def __init__(self, db_manager: DatabaseConnectionManager) -> None:
+    def __init__(
+        self,
+        db_manager: DatabaseConnectionManager,
+        *,
+        incremental: bool = False,
+        verify_every: int = 5,
+    ) -> None:
+        """
+        Args:
+            db_manager: Database connection manager
+            incremental: Fold each year forward from the previous year's
+                projection instead of replaying the whole event ledger
+            verify_every: Check every Nth fold against a full rebuild
+                (0 disables the periodic check)
+        """
         self.db_manager = db_manager
+        self.incremental = incremental
+        self.verify_every = verify_every
+        # (decision_year, scenario_id, plan_design_id) held by the published
+        # table and by the retained previous projection. Only projections
+        # this instance built are trusted as fold bases: another process or
+        # a full reset may have changed the ledger underneath older ones.
+        self._published: Optional[_ProjectionKey] = None
+        self._previous: Optional[_ProjectionKey] = None
+        self._folds_since_check = 0
+
+    @property
+    def previous_table_name(self) -> str:
+        return f"{self.table_name}_prev"
 
     def ensure_table(self) -> None:
         """Create the dbt source relation, recreating it on schema mismatch.
@@ -92,8 +185,11 @@ class EnrollmentDecisionProjection:
                 )
                 """
             )
+            conn.execute(f"DROP TABLE IF EXISTS {self.previous_table_name}")
 
         self.db_manager.execute_with_retry(_create, deterministic=True)
+        self._published = None
+        self._previous = None
 
     def rebuild(
         self,
@@ -102,114 +198,21 @@ class EnrollmentDecisionProjection:
         plan_design_id: str = "default",
     ) -> EnrollmentProjectionResult:
         """Atomically replace the projection for a single decision year and scope."""
+        key: _ProjectionKey = (decision_year, scenario_id, plan_design_id)
+        base = self._fold_base(key)
+        verify = base is not None and self._should_verify()
 
         def _rebuild(conn):
             temp_table = f"{self.table_name}_next"
             conn.execute(f"DROP TABLE IF EXISTS {temp_table}")
-            has_event_ledger = conn.execute(
-                """SELECT COUNT(*) > 0 FROM information_schema.tables
-                   WHERE table_schema = 'main' AND table_name = 'fct_yearly_events'"""
-            ).fetchone()[0]
-            prior_events = (
-                """
-                  SELECT
-                    employee_id, event_type, effective_date, simulation_year,
-                    event_sequence, event_id, event_details, employee_deferral_rate,
-                    ROW_NUMBER() OVER (
-                      PARTITION BY employee_id
-                      ORDER BY effective_date DESC, simulation_year DESC,
-                        event_sequence DESC, event_id DESC
-                    ) AS latest_rank
-                  FROM fct_yearly_events
-                  WHERE scenario_id = ?
-                    AND plan_design_id = ?
-                    AND simulation_year < ?
-                    AND event_type IN ('enrollment', 'enrollment_change')
-                    AND employee_id IS NOT NULL
-            """
-                if has_event_ledger
-                else """
-                  SELECT
-                    CAST(NULL AS VARCHAR) AS employee_id,
-                    CAST(NULL AS VARCHAR) AS event_type,
-                    CAST(NULL AS DATE) AS effective_date,
-                    CAST(NULL AS INTEGER) AS simulation_year,
-                    CAST(NULL AS INTEGER) AS event_sequence,
-                    CAST(NULL AS VARCHAR) AS event_id,
-                    CAST(NULL AS VARCHAR) AS event_details,
-                    CAST(NULL AS DECIMAL(9, 6)) AS employee_deferral_rate,
-                    CAST(NULL AS BIGINT) AS latest_rank
-                  WHERE false
-            """
-            )
-            parameters = [decision_year, scenario_id, plan_design_id]
-            if has_event_ledger:
-                parameters = [scenario_id, plan_design_id, decision_year, *parameters]
-            conn.execute(
-                f"""
-                CREATE TABLE {temp_table} AS
-                WITH baseline AS (
-                  SELECT
-                    employee_id,
-                    employee_enrollment_date AS enrollment_date,
-                    employee_deferral_rate AS current_deferral_rate,
-                    COALESCE(is_enrolled_at_census, false) AS baseline_is_enrolled
-                  FROM int_baseline_workforce
-                  WHERE employee_id IS NOT NULL
-                ),
-                prior_events AS (
-                  {prior_events}
-                ),
-                event_state AS (
-                  SELECT
-                    employee_id,
-                    MIN(CASE WHEN event_type = 'enrollment' THEN effective_date END) AS first_enrollment_date,
-                    MAX(CASE WHEN event_type = 'enrollment_change'
-                              AND LOWER(COALESCE(event_details, '')) LIKE '%opt-out%'
-                             THEN 1 ELSE 0 END) = 1 AS ever_opted_out,
-                    MAX(CASE WHEN latest_rank = 1
-                              AND event_type = 'enrollment_change'
-                              AND LOWER(COALESCE(event_details, '')) LIKE '%opt-out%'
-                             THEN 1 ELSE 0 END) = 1 AS latest_is_opt_out,
-                    MAX(CASE WHEN latest_rank = 1 THEN 1 ELSE 0 END) = 1 AS has_event,
-                    MAX(CASE WHEN latest_rank = 1 THEN employee_deferral_rate END) AS current_deferral_rate,
-                    MAX(CASE WHEN latest_rank = 1 THEN event_id END) AS latest_event_id,
-                    MAX(CASE WHEN latest_rank = 1 THEN simulation_year END) AS latest_event_year,
-                    MAX(CASE WHEN latest_rank = 1 THEN effective_date END) AS latest_event_effective_date
-                  FROM prior_events
-                  GROUP BY employee_id
-                )
-                SELECT
-                  COALESCE(b.employee_id, e.employee_id) AS employee_id,
-                  ?::INTEGER AS decision_year,
-                  ?::VARCHAR AS scenario_id,
-                  ?::VARCHAR AS plan_design_id,
-                  COALESCE(e.first_enrollment_date, b.enrollment_date) AS enrollment_date,
-                  CASE
-                    WHEN COALESCE(e.latest_is_opt_out, false) THEN false
-                    WHEN COALESCE(e.has_event, false) THEN true
-                    ELSE COALESCE(b.baseline_is_enrolled, false)
-                  END AS is_enrolled,
-                  COALESCE(e.ever_opted_out, false) AS ever_opted_out,
-                  CASE WHEN COALESCE(e.has_event, false) THEN 'fct_yearly_events'
-                       ELSE 'baseline_census' END AS enrollment_source,
-                  COALESCE(e.current_deferral_rate, b.current_deferral_rate) AS current_deferral_rate,
-                  e.latest_event_id,
-                  e.latest_event_year,
-                  e.latest_event_effective_date,
-                  CAST(NULL AS DATE) AS authoritative_enrollment_date,
-                  CAST(NULL AS BOOLEAN) AS authoritative_is_enrolled
-                FROM baseline b
-                FULL OUTER JOIN event_state e ON b.employee_id = e.employee_id
-                """,
-                parameters,
-            )
-            has_enrollment_state = conn.execute(
-                "SELECT COUNT(*) > 0 FROM information_schema.tables "
-                "WHERE table_schema = 'main' "
-                "AND table_name = 'int_enrollment_state_accumulator'"
-            ).fetchone()[0]
-            if has_enrollment_state:
+            has_event_ledger = self._table_exists(conn, "fct_yearly_events")
+            if base is None:
+                self._create_full(conn, temp_table, key, has_event_ledger)
+            else:
+                self._create_folded(conn, temp_table, base, key, has_event_ledger)
+                if verify:
+                    self._verify_fold(conn, temp_table, key, has_event_ledger)
+            if self._table_exists(conn, "int_enrollment_state_accumulator"):
                 conn.execute(
                     f"""
                     UPDATE {temp_table} AS projection
@@ -229,18 +232,275 @@ class EnrollmentDecisionProjection:
                 raise RuntimeError(
                     "Enrollment projection contains duplicate employee state"
                 )
-            conn.execute(f"DROP TABLE IF EXISTS {self.table_name}")
+            # Keep the outgoing projection as the next fold's base when it is
+            # for another year; a repeated rebuild of the same year must not
+            # overwrite the N-1 base it folded from.
+            retain = self._published is not None and self._published != key
+            if retain:
+                conn.execute(f"DROP TABLE IF EXISTS {self.previous_table_name}")
+                conn.execute(
+                    f"ALTER TABLE {self.table_name} RENAME TO {self.previous_table_name}"
+                )
+            else:
+                conn.execute(f"DROP TABLE IF EXISTS {self.table_name}")
             conn.execute(f"ALTER TABLE {temp_table} RENAME TO {self.table_name}")
-            return conn.execute(f"SELECT COUNT(*) FROM {self.table_name}").fetchone()[0]
+            count = conn.execute(f"SELECT COUNT(*) FROM {self.table_name}").fetchone()[
+                0
+            ]
+            return count, retain
 
-        count = self.db_manager.execute_with_retry(_rebuild, deterministic=True)
+        count, retained = self.db_manager.execute_with_retry(
+            _rebuild, deterministic=True
+        )
+        if retained:
+            self._previous = self._published
+        self._published = key
+        if base is None:
+            self._folds_since_check = 0
+        else:
+            self._folds_since_check = 0 if verify else self._folds_since_check + 1
         logger.info(
-            "Rebuilt enrollment decision projection for year %d (%s/%s): %d employees",
+            "%s enrollment decision projection for year %d (%s/%s): %d employees",
+            "Folded" if base is not None else "Rebuilt",
             decision_year,
             scenario_id,
             plan_design_id,
             count,
         )
         return EnrollmentProjectionResult(
-            decision_year, scenario_id, plan_design_id, count
+            decision_year,
+            scenario_id,
+            plan_design_id,
+            count,
+            incremental=base is not None,
+        )
+
+    def _fold_base(self, key: _ProjectionKey) -> Optional[str]:
+        """Relation holding this instance's projection for the prior year, if any."""
+        if not self.incremental:
+            return None
+        prior = (key[0] - 1, key[1], key[2])
+        if self._published == prior:
+            return self.table_name
+        if self._previous == prior:
+            return self.previous_table_name
+        return None
+
+    def _should_verify(self) -> bool:
+        if logger.isEnabledFor(logging.DEBUG):
+            return True
+        return (
+            self.verify_every > 0 and self._folds_since_check + 1 >= self.verify_every
+        )
+
+    @staticmethod
+    def _table_exists(conn, table: str) -> bool:
+        return conn.execute(
+            "SELECT COUNT(*) > 0 FROM information_schema.tables "
+            "WHERE table_schema = 'main' AND table_name = ?",
+            [table],
+        ).fetchone()[0]
+
+    @staticmethod
+    def _event_columns(conn) -> str:
+        """Projected ``fct_yearly_events`` columns for this ledger's schema."""
+        has_change_type = conn.execute(
+            "SELECT COUNT(*) > 0 FROM information_schema.columns "
+            "WHERE table_schema = 'main' AND table_name = 'fct_yearly_events' "
+            "AND column_name = 'enrollment_change_type'"
+        ).fetchone()[0]
+        change_type = (
+            f"COALESCE(enrollment_change_type, {_LEGACY_CHANGE_TYPE})"
+            if has_change_type
+            else _LEGACY_CHANGE_TYPE
+        )
+        return _EVENT_COLUMNS.format(change_type=change_type)
+
+    def _create_full(
+        self, conn, target: str, key: _ProjectionKey, has_event_ledger: bool
+    ) -> None:
+        """Replay every prior enrollment event over the census baseline."""
+        decision_year, scenario_id, plan_design_id = key
+        events = (
+            f"""
+            SELECT {self._event_columns(conn)},
+              ROW_NUMBER() OVER (
+                PARTITION BY employee_id
+                ORDER BY effective_date DESC, simulation_year DESC,
+                  event_sequence DESC, event_id DESC
+              ) AS latest_rank
+            FROM fct_yearly_events
+            WHERE scenario_id = ?
+              AND plan_design_id = ?
+              AND simulation_year < ?
+              AND event_type IN ('enrollment', 'enrollment_change')
+              AND employee_id IS NOT NULL"""
+            if has_event_ledger
+            else _NO_EVENTS
         )
+        parameters = [decision_year, scenario_id, plan_design_id]
+        if has_event_ledger:
+            parameters = [scenario_id, plan_design_id, decision_year, *parameters]
+        conn.execute(
+            f"""
+            CREATE TABLE {target} AS
+            WITH baseline AS ({_BASELINE}),
+            events AS ({events}),
+            event_state AS ({_EVENT_STATE})
+            SELECT
+              COALESCE(b.employee_id, e.employee_id) AS employee_id,
+              ?::INTEGER AS decision_year,
+              ?::VARCHAR AS scenario_id,
+              ?::VARCHAR AS plan_design_id,
+              COALESCE(e.first_enrollment_date, b.enrollment_date) AS enrollment_date,
+              CASE
+                WHEN COALESCE(e.latest_is_opt_out, false) THEN false
+                WHEN COALESCE(e.has_event, false) THEN true
+                ELSE COALESCE(b.baseline_is_enrolled, false)
+              END AS is_enrolled,
+              COALESCE(e.ever_opted_out, false) AS ever_opted_out,
+              CASE WHEN COALESCE(e.has_event, false) THEN 'fct_yearly_events'
+                   ELSE 'baseline_census' END AS enrollment_source,
+              COALESCE(e.current_deferral_rate, b.current_deferral_rate) AS current_deferral_rate,
+              e.latest_event_id,
+              e.latest_event_year,
+              e.latest_event_effective_date,
+              e.first_enrollment_date AS first_enrollment_event_date,
+              CAST(NULL AS DATE) AS authoritative_enrollment_date,
+              CAST(NULL AS BOOLEAN) AS authoritative_is_enrolled
+            FROM baseline b
+            FULL OUTER JOIN event_state e ON b.employee_id = e.employee_id
+            """,
+            parameters,
+        )
+
+    def _create_folded(
+        self,
+        conn,
+        target: str,
+        base: str,
+        key: _ProjectionKey,
+        has_event_ledger: bool,
+    ) -> None:
+        """Fold year N-1's events into the year N-1 projection.
+
+        Every prior event predates year N-1, so a year N-1 event outranks the
+        prior latest event unless its effective date is strictly earlier (or
+        NULL against a dated one) -- the same order the full rebuild ranks by.
+        """
+        decision_year, scenario_id, plan_design_id = key
+        events = (
+            f"""
+            SELECT {self._event_columns(conn)},
+              ROW_NUMBER() OVER (
+                PARTITION BY employee_id
+                ORDER BY effective_date DESC, event_sequence DESC, event_id DESC
+              ) AS latest_rank
+            FROM fct_yearly_events
+            WHERE scenario_id = ?
+              AND plan_design_id = ?
+              AND simulation_year = ? - 1
+              AND event_type IN ('enrollment', 'enrollment_change')
+              AND employee_id IS NOT NULL"""
+            if has_event_ledger
+            else _NO_EVENTS
+        )
+        parameters = [decision_year, scenario_id, plan_design_id]
+        if has_event_ledger:
+            parameters = [scenario_id, plan_design_id, decision_year, *parameters]
+        conn.execute(
+            f"""
+            CREATE TABLE {target} AS
+            WITH baseline AS ({_BASELINE}),
+            events AS ({events}),
+            event_state AS ({_EVENT_STATE}),
+            merged AS (
+              SELECT
+                COALESCE(p.employee_id, e.employee_id) AS employee_id,
+                p.enrollment_source = 'fct_yearly_events' AS prior_has_event,
+                p.is_enrolled AS prior_is_enrolled,
+                p.current_deferral_rate AS prior_deferral_rate,
+                p.latest_event_id AS prior_event_id,
+                p.latest_event_year AS prior_event_year,
+                p.latest_event_effective_date AS prior_event_date,
+                COALESCE(
+                  e.has_event
+                  AND (
+                    COALESCE(p.enrollment_source, 'baseline_census') <> 'fct_yearly_events'
+                    OR p.latest_event_effective_date IS NULL
+                    OR e.latest_event_effective_date >= p.latest_event_effective_date
+                  ),
+                  false
+                ) AS year_event_wins,
+                COALESCE(p.ever_opted_out, false)
+                  OR COALESCE(e.ever_opted_out, false) AS ever_opted_out,
+                LEAST(p.first_enrollment_event_date, e.first_enrollment_date)
+                  AS first_enrollment_event_date,
+                e.latest_is_opt_out,
+                e.current_deferral_rate AS year_deferral_rate,
+                e.latest_event_id,
+                e.latest_event_year,
+                e.latest_event_effective_date
+              FROM {base} p
+              FULL OUTER JOIN event_state e ON p.employee_id = e.employee_id
+            )
+            SELECT
+              m.employee_id,
+              ?::INTEGER AS decision_year,
+              ?::VARCHAR AS scenario_id,
+              ?::VARCHAR AS plan_design_id,
+              COALESCE(m.first_enrollment_event_date, b.enrollment_date) AS enrollment_date,
+              CASE
+                WHEN m.year_event_wins THEN NOT m.latest_is_opt_out
+                ELSE m.prior_is_enrolled
+              END AS is_enrolled,
+              m.ever_opted_out,
+              CASE WHEN m.year_event_wins OR COALESCE(m.prior_has_event, false)
+                   THEN 'fct_yearly_events' ELSE 'baseline_census' END AS enrollment_source,
+              CASE
+                WHEN m.year_event_wins
+                  THEN COALESCE(m.year_deferral_rate, b.current_deferral_rate)
+                ELSE m.prior_deferral_rate
+              END AS current_deferral_rate,
+              CASE WHEN m.year_event_wins THEN m.latest_event_id
+                   ELSE m.prior_event_id END AS latest_event_id,
+              CASE WHEN m.year_event_wins THEN m.latest_event_year
+                   ELSE m.prior_event_year END AS latest_event_year,
+              CASE WHEN m.year_event_wins THEN m.latest_event_effective_date
+                   ELSE m.prior_event_date END AS latest_event_effective_date,
+              m.first_enrollment_event_date,
+              CAST(NULL AS DATE) AS authoritative_enrollment_date,
+              CAST(NULL AS BOOLEAN) AS authoritative_is_enrolled
+            FROM merged m
+            LEFT JOIN baseline b ON m.employee_id = b.employee_id
+            """,
+            parameters,
+        )
+
+    def _verify_fold(
+        self, conn, folded: str, key: _ProjectionKey, has_event_ledger: bool
+    ) -> None:
+        """Compare a fold with a full rebuild, keeping the full one on mismatch."""
+        check_table = f"{self.table_name}_check"
+        conn.execute(f"DROP TABLE IF EXISTS {check_table}")
+        self._create_full(conn, check_table, key, has_event_ledger)
+        mismatched = conn.execute(
+            f"""
+            SELECT COUNT(*) FROM (
+              (SELECT * FROM {folded} EXCEPT ALL SELECT * FROM {check_table})
+              UNION ALL
+              (SELECT * FROM {check_table} EXCEPT ALL SELECT * FROM {folded})
+            )
+            """
+        ).fetchone()[0]
+        if mismatched:
+            logger.warning(
+                "Folded enrollment projection for year %d differs from a full "
+                "rebuild in %d row(s); publishing the full rebuild",
+                key[0],
+                mismatched,
+            )
+            conn.execute(f"DROP TABLE {folded}")
+            conn.execute(f"ALTER TABLE {check_table} RENAME TO {folded}")
+        else:
+            conn.execute(f"DROP TABLE {check_table}")
@@ -9,7 +9,7 @@ Extracted from PipelineOrchestrator to improve modularity and maintainability.
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from typing import Dict, FrozenSet, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +54,32 @@ class StateManager:
         self.dbt_runner = dbt_runner
         self.config = config
         self.verbose = verbose
+        # Base-table name -> column names in schema 'main'. Loaded with one
+        # information_schema query and reused by every per-table helper;
+        # refreshed once per year purge because dbt creates tables mid-run.
+        self._table_columns: Optional[Dict[str, FrozenSet[str]]] = None
+
+    def _table_catalog(
+        self, conn, *, refresh: bool = False
+    ) -> Dict[str, FrozenSet[str]]:
+        """Return the cached table/column catalog, loading it if needed."""
+        if self._table_columns is None or refresh:
+            columns: Dict[str, set[str]] = {}
+            for table_name, column_name in conn.execute(
+                """
+                SELECT c.table_name, c.column_name
+                FROM information_schema.columns c
+                JOIN information_schema.tables t
+                  ON t.table_schema = c.table_schema
+                 AND t.table_name = c.table_name
+                WHERE c.table_schema = 'main' AND t.table_type = 'BASE TABLE'
+                """
+            ).fetchall():
+                columns.setdefault(table_name, set()).add(column_name)
+            self._table_columns = {
+                name: frozenset(cols) for name, cols in columns.items()
+            }
+        return self._table_columns
 
     def _year_scope(
         self, conn, table: str, year: int, *, critical: bool = False
@@ -68,17 +94,7 @@ class StateManager:
         with what was actually written to the table, instead of treating the
         common case as "identifiers unavailable".
         """
-        columns = {
-            row[0]
-            for row in conn.execute(
-                """
-                SELECT column_name
-                FROM information_schema.columns
-                WHERE table_schema = 'main' AND table_name = ?
-                """,
-                [table],
-            ).fetchall()
-        }
+        columns = self._table_catalog(conn).get(table, frozenset())
         scenario_id = self.config.scenario_id or "default"
         plan_design_id = self.config.plan_design_id or "default"
 
@@ -108,22 +124,38 @@ class StateManager:
     def _delete_year_rows(
         self, conn, table: str, year: int, *, critical: bool = False
     ) -> bool:
-        """Delete year rows when the target table exists."""
-        table_exists = conn.execute(
-            """
-            SELECT 1
-            FROM information_schema.tables
-            WHERE table_schema = 'main' AND table_name = ?
-            LIMIT 1
-            """,
-            [table],
-        ).fetchone()
-        if not table_exists:
-            return False
+        """Delete year rows when the target table exists and holds any.
+
+        A read probe runs first so that the common case -- a fresh run or a
+        year already purged earlier in this run -- never opens a write.
+        DuckDB prunes the probe by the simulation_year zonemaps, so it does
+        not scan other years' row groups.
+
+        A populated year is still removed with DELETE rather than a staging
+        swap: DuckDB records deletes as row masks on the year's own row
+        groups, so the cost follows the year's size, not the table's. Copying
+        the other years into a replacement table (measured ~4s against ~5ms
+        for one 100k-row year of a 2M-row table) would make every re-run
+        slower as the horizon grows.
+
+        Returns:
+            True when rows were deleted
+        """
+        if table not in self._table_catalog(conn):
+            # dbt may have created it since the catalog was loaded.
+            if table not in self._table_catalog(conn, refresh=True):
+                return False
 
         where_clause, parameters = self._year_scope(
             conn, table, year, critical=critical
         )
+        if (
+            conn.execute(
+                f"SELECT 1 FROM {table} WHERE {where_clause} LIMIT 1", parameters
+            ).fetchone()
+            is None
+        ):
+            return False
         conn.execute(f"DELETE FROM {table} WHERE {where_clause}", parameters)
         return True
 
@@ -168,31 +200,12 @@ class StateManager:
             return any(name.startswith(p) for p in patterns)
 
         def _run(conn):
-            tables = [
-                r[0]
-                for r in conn.execute(
-                    """
-                SELECT table_name
-                FROM information_schema.tables
-                WHERE table_schema = 'main'
-                ORDER BY table_name
-                """
-                ).fetchall()
-            ]
+            catalog = self._table_catalog(conn, refresh=True)
             cleared = 0
-            for t in tables:
-                if not _should_clear(t):
+            for t in sorted(catalog):
+                if not _should_clear(t) or "simulation_year" not in catalog[t]:
                     continue
-                # check if table has simulation_year column
-                has_col = conn.execute(
-                    """
-                    SELECT 1 FROM information_schema.columns
-                    WHERE table_schema='main' AND table_name = ? AND column_name = 'simulation_year'
-                    LIMIT 1
-                    """,
-                    [t],
-                ).fetchone()
-                if has_col and self._delete_year_rows(
+                if self._delete_year_rows(
                     conn,
                     t,
                     year,
@@ -239,19 +252,8 @@ class StateManager:
             return any(name.startswith(p) for p in patterns)
 
         def _run(conn):
-            tables = [
-                r[0]
-                for r in conn.execute(
-                    """
-                SELECT table_name
-                FROM information_schema.tables
-                WHERE table_schema = 'main' AND table_type = 'BASE TABLE'
-                ORDER BY table_name
-                """
-                ).fetchall()
-            ]
             cleared = 0
-            for t in tables:
+            for t in sorted(self._table_catalog(conn, refresh=True)):
                 if not _should_clear(t):
                     continue
                 conn.execute(f"DELETE FROM {t}")
@@ -281,16 +283,9 @@ class StateManager:
 
         def _stale_years(conn) -> list[int]:
             years: set[int] = set()
+            catalog = self._table_catalog(conn, refresh=True)
             for table in (TABLE_FCT_YEARLY_EVENTS, TABLE_FCT_WORKFORCE_SNAPSHOT):
-                table_exists = conn.execute(
-                    """
-                    SELECT 1 FROM information_schema.tables
-                    WHERE table_schema = 'main' AND table_name = ?
-                    LIMIT 1
-                    """,
-                    [table],
-                ).fetchone()
-                if not table_exists:
+                if table not in catalog:
                     continue
                 where_clause, parameters = self._year_scope(conn, table, end_year)
                 # _year_scope binds simulation_year = ?; widen it to > ?
@@ -338,6 +338,8 @@ class YearExecutor:
         """Clear fct_workforce_snapshot rows for the year before rebuild.
 
         This avoids dbt pre-hook concurrency issues when rebuilding the snapshot.
+        The year purge normally removed these rows already, so a read probe
+        skips the DELETE (and its write transaction) when none remain.
 
         Args:
             model: Model name to check
@@ -348,14 +350,22 @@ class YearExecutor:
         try:
 
             def _clear(conn):
+                if (
+                    conn.execute(
+                        f"SELECT 1 FROM {TABLE_FCT_WORKFORCE_SNAPSHOT} "
+                        "WHERE simulation_year = ? LIMIT 1",
+                        [year],
+                    ).fetchone()
+                    is None
+                ):
+                    return False
                 conn.execute(
                     f"DELETE FROM {TABLE_FCT_WORKFORCE_SNAPSHOT} WHERE simulation_year = ?",
                     [year],
                 )
                 return True
 
-            self.db_manager.execute_with_retry(_clear)
-            if self.verbose:
+            if self.db_manager.execute_with_retry(_clear) and self.verbose:
                 logger.debug(
                     "Cleared %s for simulation_year=%d before rebuild",
                     TABLE_FCT_WORKFORCE_SNAPSHOT,
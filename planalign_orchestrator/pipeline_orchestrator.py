@@ -14,6 +14,7 @@ import logging
 import os
 import uuid
 from collections.abc import Mapping
+from contextlib import contextmanager, nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
@@ -21,6 +22,10 @@ import time
 
 if TYPE_CHECKING:
     from .construction.signature import ConstructionSignature, WorkSchedule
+    from .monitoring.horizon import HorizonGrowth, ModelYearTimings
+    from .monitoring.spill import SpillMonitor, SpillReport
+    from .monitoring.tracing import RunTracer
+    from .resources.duckdb_profile import DuckDBResourceProfile
 
 from .config import SimulationConfig, to_dbt_vars
 from .orchestrator_setup import (
@@ -105,6 +110,11 @@ class PipelineOrchestrator:
         self._initialization_callback = initialization_callback
         self.construction_signature: Optional["ConstructionSignature"] = None
         self.work_schedule: Optional["WorkSchedule"] = None
+        self.tracer: Optional["RunTracer"] = None
+        self.model_timings: Optional["ModelYearTimings"] = None
+        self.resource_profile: Optional["DuckDBResourceProfile"] = None
+        self.spill_monitor: Optional["SpillMonitor"] = None
+        self.spill_report: Optional["SpillReport"] = None
         self._dbt_vars = to_dbt_vars(config)
 
         # E068C: Extract threading configuration from new structured config
@@ -213,7 +223,9 @@ class PipelineOrchestrator:
             event_shards=self.event_shards,
             verbose=verbose,
         )
-        self.enrollment_projection = EnrollmentDecisionProjection(db_manager)
+        self.enrollment_projection = EnrollmentDecisionProjection(
+            db_manager, incremental=True
+        )
         self.workforce_projection = WorkforceStateProjection(db_manager)
 
         # Initialize year executor with optional parallelization support
@@ -298,7 +310,7 @@ class PipelineOrchestrator:
         self._setup_monitoring()
         _run_ctx = self._create_observability_context(start, end)
 
-        with _run_ctx:
+        with _run_ctx, self._traced_run(start, end):
             db_path = getattr(self.db_manager, "db_path", "default")
             lock_name = f"planalign_{hash(str(db_path)) % 10**8}"
             logger.debug("Acquiring execution lock: %s (db: %s)", lock_name, db_path)
@@ -311,6 +323,8 @@ class PipelineOrchestrator:
                     authoritative_run_id = os.environ.get("PLANALIGN_RUN_ID") or str(
                         uuid.uuid4()
                     )
+                    if self.tracer is not None:
+                        self.tracer.run_id = authoritative_run_id
                     check_and_record_run(
                         self.db_manager,
                         self.config,
@@ -334,11 +348,12 @@ class PipelineOrchestrator:
                         self.hook_manager.execute_hooks(
                             HookType.PRE_YEAR, {"year": year}
                         )
-                        self._execute_year_with_monitoring(
-                            year,
-                            fail_on_validation_error=fail_on_validation_error,
-                            dry_run=dry_run,
-                        )
+                        with self._trace_span(f"year {year}", "year", year=year):
+                            self._execute_year_with_monitoring(
+                                year,
+                                fail_on_validation_error=fail_on_validation_error,
+                                dry_run=dry_run,
+                            )
                         completed_years.append(year)
                         self.hook_manager.execute_hooks(
                             HookType.POST_YEAR,
@@ -384,6 +399,10 @@ class PipelineOrchestrator:
             )
 
         summary = self._build_multi_year_summary(completed_years)
+        summary.horizon_growth = self._check_horizon_growth(start)
+        summary.spill = self.spill_report
+        if not dry_run:
+            self._materialize_payroll_ledger(completed_years)
         return self._finalize_simulation(summary, completed_years)
 
     def _full_reset_active(self) -> bool:
@@ -399,7 +418,11 @@ class PipelineOrchestrator:
         return str(setup.get("clear_mode", "year")).lower() == "all"
 
     def _setup_monitoring(self) -> None:
-        """Start adaptive memory and DuckDB performance monitoring."""
+        """Start adaptive memory, DuckDB performance and spill monitoring."""
+        if self.spill_monitor is not None:
+            logger.info("DuckDB resource profile %s", self.resource_profile.describe())
+            self.spill_monitor.start()
+
         if self.memory_manager:
             self.memory_manager.start_monitoring()
             initial_snapshot = self.memory_manager.force_memory_check(
@@ -424,10 +447,84 @@ class PipelineOrchestrator:
             return self.observability.track_operation(
                 "multi_year_run", start_year=start, end_year=end
             )
-        from contextlib import nullcontext
-
         return nullcontext()
 
+    def _trace_span(self, name: str, category: str, **attributes: Any):
+        """Open a span on the run tracer, or do nothing when tracing is off."""
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.span(name, category, **attributes)
+
+    @contextmanager
+    def _traced_run(self, start: int, end: int):
+        """Trace the run as the root span and export it however the run ends."""
+        if self.tracer is None:
+            yield
+            return
+        try:
+            with self.tracer.span("simulation", "run", start_year=start, end_year=end):
+                yield
+        finally:
+            self._export_trace()
+
+    def _export_trace(self) -> None:
+        """Write the trace file and, for recorded runs, ``run_trace_spans``."""
+        tracer = self.tracer
+        if tracer is None:
+            return
+        tracer.finish()
+        try:
+            if tracer.output_path is not None:
+                path = tracer.write_chrome_trace()
+                logger.info("Run trace written to %s", path)
+            if tracer.run_id is not None:
+                with self.db_manager.get_connection() as conn:
+                    tracer.persist(conn, tracer.run_id)
+        except Exception as e:
+            logger.warning("Failed to export run trace (non-fatal): %s", e)
+
+    def _check_horizon_growth(self, start: int) -> List["HorizonGrowth"]:
+        """Fit per-year model cost growth and warn about super-linear models."""
+        if self.model_timings is None:
+            return []
+        from .monitoring.horizon import fit_horizon_growth
+
+        findings = fit_horizon_growth(self.model_timings, start_year=start)
+        for finding in findings:
+            if finding.flagged:
+                logger.warning(
+                    "Horizon scaling: %s; cumulative cost grows faster than "
+                    "linearly with the number of simulated years",
+                    finding.describe(),
+                )
+        return findings
+
+    def _materialize_payroll_ledger(self, completed_years: List[int]) -> None:
+        """Build the payroll ledger now when ``storage.payroll_ledger`` is eager.
+
+        Otherwise it is built on first request (see ``payroll_ledger``).
+        """
+        from .payroll_ledger import (
+            LEDGER_EAGER,
+            PayrollLedger,
+            ledger_directory,
+            ledger_mode,
+        )
+
+        if not completed_years or ledger_mode(self.config) != LEDGER_EAGER:
+            return
+        try:
+            with self.db_manager.get_connection() as conn:
+                ledger = PayrollLedger(conn, ledger_directory(self.db_manager.db_path))
+                built = ledger.materialize(completed_years)
+            logger.info(
+                "Payroll ledger materialized for %d year(s) in %s",
+                len(built),
+                ledger.directory,
+            )
+        except Exception as e:
+            logger.warning("Failed to materialize payroll ledger (non-fatal): %s", e)
+
     def _initialize_registries(self, start: int) -> None:
         """Ensure orchestrator-managed registries start clean for a new run."""
         try:
@@ -481,6 +578,7 @@ class PipelineOrchestrator:
 
     def _finalize_monitoring(self) -> None:
         """Stop memory monitoring and generate final report."""
+        self._stop_spill_monitor()
         if not self.memory_manager:
             return
 
@@ -507,6 +605,14 @@ class PipelineOrchestrator:
         except Exception:
             pass
 
+    def _stop_spill_monitor(self) -> None:
+        """Record how much the run's DuckDB instances spilled to disk."""
+        if self.spill_monitor is None:
+            return
+        self.spill_report = self.spill_monitor.stop()
+        if self.spill_report.spilled:
+            logger.info("%s", self.spill_report.describe())
+
     def _build_multi_year_summary(self, completed_years: List[int]) -> MultiYearSummary:
         """Build the final multi-year summary from completed years."""
         reporter = MultiYearReporter(self.db_manager)
@@ -613,18 +719,20 @@ class PipelineOrchestrator:
         )
 
         self.dbt_runner.set_schedule_context(stage="INITIALIZATION", year=year)
-        self.state_manager.maybe_clear_year_data(year)
-        self.state_manager.clear_year_fact_rows(year)
+        with self._trace_span("clear_year_data", "phase"):
+            self.state_manager.maybe_clear_year_data(year)
+            self.state_manager.clear_year_fact_rows(year)
         self._ensure_seeds_loaded()
 
         if not dry_run and year > self.config.simulation.start_year:
             self._prepare_enrollment_decision_state(year)
         if not dry_run:
-            self.workforce_projection.rebuild(
-                year,
-                scenario_id=self.config.scenario_id or "default",
-                plan_design_id=self.config.plan_design_id or "default",
-            )
+            with self._trace_span("workforce_projection", "phase"):
+                self.workforce_projection.rebuild(
+                    year,
+                    scenario_id=self.config.scenario_id or "default",
+                    plan_design_id=self.config.plan_design_id or "default",
+                )
 
         # Start-year specific initialization
         if year == self.config.simulation.start_year:
@@ -639,48 +747,67 @@ class PipelineOrchestrator:
 
         for stage in workflow:
             self.dbt_runner.set_schedule_context(stage=stage.name.value, year=year)
-            logger.info("Executing stage: %s", stage.name.value)
-            stage_start_time = time.time()
-            self.hook_manager.execute_hooks(
-                HookType.PRE_STAGE, {"year": year, "stage": stage.name}
-            )
-            self._record_performance_checkpoint(stage.name.value, year, "start")
+            with self._trace_span(
+                stage.name.value, "stage", year=year, stage=stage.name.value
+            ):
+                self._execute_stage(
+                    stage,
+                    year,
+                    fail_on_validation_error=fail_on_validation_error,
+                    dry_run=dry_run,
+                )
 
-            # Specialized stage handlers that skip generic execution
-            if not self._execute_specialized_stage(stage, year, dry_run=dry_run):
-                # Generic stage execution with resource/memory management
-                self._execute_stage_with_monitoring(stage, year)
+        self.dbt_runner.set_schedule_context(stage=None, year=None)
 
-                self._record_performance_checkpoint(stage.name.value, year, "complete")
+    def _execute_stage(
+        self,
+        stage: "StageDefinition",
+        year: int,
+        *,
+        fail_on_validation_error: bool,
+        dry_run: bool,
+    ) -> None:
+        """Run one workflow stage with its hooks, checkpoints and validation."""
+        logger.info("Executing stage: %s", stage.name.value)
+        stage_start_time = time.time()
+        self.hook_manager.execute_hooks(
+            HookType.PRE_STAGE, {"year": year, "stage": stage.name}
+        )
+        self._record_performance_checkpoint(stage.name.value, year, "start")
 
-                if not dry_run:
-                    self.stage_validator.validate_stage(
-                        stage, year, fail_on_validation_error
-                    )
+        # Specialized stage handlers that skip generic execution
+        if not self._execute_specialized_stage(stage, year, dry_run=dry_run):
+            # Generic stage execution with resource/memory management
+            self._execute_stage_with_monitoring(stage, year)
 
-            validation_evidence = None
-            if stage.name == WorkflowStage.VALIDATION and not dry_run:
-                validation_results = self.validator.validate_year_results(year)
-                validation_evidence = self.validator.to_safe_results(validation_results)
-                if (
-                    fail_on_validation_error
-                    and validation_evidence["disposition"] == "failed"
-                ):
-                    raise PipelineStageError(
-                        f"Validation failed for simulation year {year}"
-                    )
+            self._record_performance_checkpoint(stage.name.value, year, "complete")
 
-            self.hook_manager.execute_hooks(
-                HookType.POST_STAGE,
-                {
-                    "year": year,
-                    "stage": stage.name,
-                    "duration_seconds": time.time() - stage_start_time,
-                    "validation_evidence": validation_evidence,
-                },
-            )
+            if not dry_run:
+                self.stage_validator.validate_stage(
+                    stage, year, fail_on_validation_error
+                )
 
-        self.dbt_runner.set_schedule_context(stage=None, year=None)
+        validation_evidence = None
+        if stage.name == WorkflowStage.VALIDATION and not dry_run:
+            validation_results = self.validator.validate_year_results(year)
+            validation_evidence = self.validator.to_safe_results(validation_results)
+            if (
+                fail_on_validation_error
+                and validation_evidence["disposition"] == "failed"
+            ):
+                raise PipelineStageError(
+                    f"Validation failed for simulation year {year}"
+                )
+
+        self.hook_manager.execute_hooks(
+            HookType.POST_STAGE,
+            {
+                "year": year,
+                "stage": stage.name,
+                "duration_seconds": time.time() - stage_start_time,
+                "validation_evidence": validation_evidence,
+            },
+        )
 
     def _ensure_hazard_caches_current(self) -> None:
         """E068D: Ensure hazard caches are current before workflow execution."""
@@ -9,12 +9,14 @@ from __future__ import annotations
 
 import csv
 import json
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from ..monitoring.horizon import HorizonGrowth
+    from ..monitoring.spill import SpillReport
     from ..validation import ValidationResult
 
 
@@ -82,6 +84,11 @@ class MultiYearSummary:
     event_trends: Dict[str, List[int]]
     participation_trends: List[float]
     generated_at: datetime
+    # Per-model growth of dbt execute time across the years (run-time guard);
+    # empty when model timings were not recorded.
+    horizon_growth: List["HorizonGrowth"] = field(default_factory=list)
+    # Spill to the run's DuckDB temp directory; None without a resource profile.
+    spill: Optional["SpillReport"] = None
 
     def export_csv(self, path: Path | str) -> None:
         """Export workforce progression to CSV file."""
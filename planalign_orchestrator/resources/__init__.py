@@ -18,6 +18,13 @@ from .cpu_monitor import CPUMonitor
 from .adaptive_scaling import AdaptiveThreadAdjuster
 from .benchmarker import PerformanceBenchmarker
 from .manager import ResourceManager
+from .duckdb_profile import (
+    DuckDBResourceProfile,
+    ResourceProfileError,
+    read_connection_config,
+    resolve_resource_profile,
+    worker_profile,
+)
 
 __all__ = [
     # Data models
@@ -33,4 +40,10 @@ __all__ = [
     "PerformanceBenchmarker",
     # Facade
     "ResourceManager",
+    # DuckDB resource profiles
+    "DuckDBResourceProfile",
+    "ResourceProfileError",
+    "read_connection_config",
+    "resolve_resource_profile",
+    "worker_profile",
 ]
@@ -19,6 +19,7 @@ from typing import Any, Dict, Optional
 
 import psutil
 
+from ..monitoring.sampler import get_resource_sampler
 from .data_models import CPUUsageSnapshot
 
 
@@ -55,7 +56,7 @@ class CPUMonitor:
 
         # Monitoring state
         self._monitoring_active = False
-        self._monitoring_thread: Optional[threading.Thread] = None
+        self._subscription: Optional[int] = None
         self._lock = threading.RLock()
 
         # System information
@@ -63,7 +64,7 @@ class CPUMonitor:
         self.logical_cpu_count = psutil.cpu_count(logical=True)
 
     def start_monitoring(self) -> None:
-        """Start background CPU monitoring."""
+        """Start background CPU monitoring on the shared resource sampler."""
         with self._lock:
             if self._monitoring_active:
                 return
@@ -72,33 +73,23 @@ class CPUMonitor:
             psutil.cpu_percent(interval=None)
 
             self._monitoring_active = True
-            self._monitoring_thread = threading.Thread(
-                target=self._monitor_loop, daemon=True, name="CPUMonitor"
+            self._subscription = get_resource_sampler().subscribe(
+                self._record_snapshot, self.monitoring_interval
             )
-            self._monitoring_thread.start()
 
     def stop_monitoring(self) -> None:
         """Stop background CPU monitoring."""
         with self._lock:
             self._monitoring_active = False
-            if self._monitoring_thread and self._monitoring_thread.is_alive():
-                self._monitoring_thread.join(timeout=2.0)
-            self._monitoring_thread = None
+            if self._subscription is not None:
+                get_resource_sampler().unsubscribe(self._subscription)
+            self._subscription = None
 
-    def _monitor_loop(self) -> None:
-        """Background monitoring loop."""
-        while self._monitoring_active:
-            try:
-                snapshot = self._capture_cpu_snapshot()
-
-                with self._lock:
-                    self.cpu_history.append(snapshot)
-
-                time.sleep(self.monitoring_interval)
-
-            except Exception:
-                # Silently continue monitoring on errors
-                time.sleep(self.monitoring_interval)
+    def _record_snapshot(self) -> None:
+        """Sampler callback: append one CPU snapshot to the history."""
+        snapshot = self._capture_cpu_snapshot()
+        with self._lock:
+            self.cpu_history.append(snapshot)
 
     def _capture_cpu_snapshot(self) -> CPUUsageSnapshot:
         """Capture current CPU usage snapshot."""
@@ -0,0 +1,256 @@
+"""
+DuckDB resource profiles: one memory, thread and spill budget per run.
+
+``run_pool`` sizes concurrency from ``WORKER_MEMORY_BUDGET_MIB``, but DuckDB
+only honors a budget it is told about. A ``DuckDBResourceProfile`` carries
+that budget to every DuckDB instance a run opens:
+
+- dbt, through the ``resource_profile`` target in ``dbt/profiles.yml``
+  (selected and filled in by the environment from :meth:`dbt_env`);
+- the orchestrator's ``DatabaseConnectionManager`` (``connect_config``);
+- Studio API read connections (:func:`read_connection_config`).
+
+Operators that outgrow ``memory_limit`` (the payroll ledger's join of every
+employee to every payday in ``payroll_ledger``, wide ORDER BYs) spill to
+``temp_directory`` instead of failing or swapping. Each run gets its own spill directory, so concurrent workers never
+share one and its size is attributable to the run (see
+``monitoring.spill``).
+
+Profiles are chosen, in order, from ``optimization.duckdb`` in the run's
+config, then ``PLANALIGN_DUCKDB_PROFILE`` (``standard``, ``worker`` or
+``worker:<N>`` for N concurrent workers; pool workers set this themselves).
+Without either, nothing changes: connections keep their previous settings.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
+
+from ..run_pool import RESERVED_CPUS, WORKER_MEMORY_BUDGET_MIB
+
+if TYPE_CHECKING:
+    from ..config import DuckDBResourceSettings
+
+PROFILE_ENV_VAR = "PLANALIGN_DUCKDB_PROFILE"
+# dbt/profiles.yml target whose DuckDB settings come from ``dbt_env``.
+DBT_TARGET = "resource_profile"
+
+# Share of the per-worker budget given to DuckDB; the rest covers the Python
+# process, the dbt parser and allocator slack outside DuckDB's accounting.
+DUCKDB_MEMORY_SHARE = 0.625
+# memory_limit dbt/profiles.yml has always used for the dev target.
+STANDARD_MEMORY_LIMIT_MIB = 4096
+# DuckDB's own default spill cap: 90% of the free space on the spill disk.
+_DEFAULT_SPILL_DISK_SHARE = 0.9
+
+_MIB = 1024 * 1024
+
+
+class ResourceProfileError(ValueError):
+    """Raised for an unknown or malformed resource profile name."""
+
+
+@dataclass(frozen=True)
+class DuckDBResourceProfile:
+    """DuckDB settings shared by every connection of one run.
+
+    ``None`` leaves a setting at DuckDB's default. :meth:`bind` fills every
+    field for a specific database so dbt and the orchestrator agree exactly.
+    """
+
+    name: str
+    memory_limit_mib: Optional[int] = None
+    threads: Optional[int] = None
+    temp_directory: Optional[Path] = None
+    max_spill_mib: Optional[int] = None
+
+    def settings(self) -> Dict[str, Any]:
+        """``memory_limit``/``threads`` as DuckDB config values."""
+        values: Dict[str, Any] = {}
+        if self.memory_limit_mib is not None:
+            values["memory_limit"] = f"{self.memory_limit_mib}MiB"
+        if self.threads is not None:
+            values["threads"] = self.threads
+        return values
+
+    def connect_config(self) -> Dict[str, Any]:
+        """``duckdb.connect(config=...)`` for a read-write run connection."""
+        values = self.settings()
+        if self.temp_directory is not None:
+            values["temp_directory"] = str(self.temp_directory)
+        if self.max_spill_mib is not None:
+            values["max_temp_directory_size"] = f"{self.max_spill_mib}MiB"
+        return values
+
+    def bind(
+        self, database_path: Path | str, *, spill_root: Optional[Path | str] = None
+    ) -> "DuckDBResourceProfile":
+        """Resolve every setting for one run against ``database_path``.
+
+        The spill directory is ``<database>.tmp`` (DuckDB's own default
+        location) or, under ``spill_root``, one directory per database and
+        process. DuckDB creates it on first spill and removes it on close.
+        """
+        database = Path(database_path).absolute()
+        temp_directory = self.temp_directory
+        if temp_directory is None:
+            temp_directory = (
+                Path(spill_root).absolute() / f"{database.stem}-{os.getpid()}.tmp"
+                if spill_root is not None
+                else database.with_name(f"{database.name}.tmp")
+            )
+        return replace(
+            self,
+            memory_limit_mib=self.memory_limit_mib or STANDARD_MEMORY_LIMIT_MIB,
+            threads=self.threads or (os.cpu_count() or 1),
+            temp_directory=temp_directory,
+            max_spill_mib=self.max_spill_mib or _default_spill_cap_mib(temp_directory),
+        )
+
+    def dbt_env(self) -> Dict[str, str]:
+        """Environment selecting the ``resource_profile`` dbt target.
+
+        The target has no defaults, so the profile must be bound.
+        """
+        if not self.is_bound:
+            raise ResourceProfileError(
+                f"DuckDB resource profile {self.name!r} must be bound to a database"
+            )
+        return {
+            "PLANALIGN_DBT_TARGET": DBT_TARGET,
+            "PLANALIGN_DUCKDB_MEMORY_LIMIT": f"{self.memory_limit_mib}MiB",
+            "PLANALIGN_DUCKDB_THREADS": str(self.threads),
+            "PLANALIGN_DUCKDB_TEMP_DIRECTORY": str(self.temp_directory),
+            "PLANALIGN_DUCKDB_MAX_TEMP_SIZE": f"{self.max_spill_mib}MiB",
+        }
+
+    @property
+    def is_bound(self) -> bool:
+        return None not in (
+            self.memory_limit_mib,
+            self.threads,
+            self.temp_directory,
+            self.max_spill_mib,
+        )
+
+    def describe(self) -> str:
+        memory = (
+            f"{self.memory_limit_mib} MiB"
+            if self.memory_limit_mib
+            else "default memory"
+        )
+        threads = f"{self.threads} thread(s)" if self.threads else "default threads"
+        spill = f", spill to {self.temp_directory}" if self.temp_directory else ""
+        return f"{self.name}: {memory}, {threads}{spill}"
+
+
+def _default_spill_cap_mib(directory: Path) -> int:
+    probe = directory
+    while not probe.exists() and probe != probe.parent:
+        probe = probe.parent
+    try:
+        free = shutil.disk_usage(probe).free
+    except OSError:
+        free = 0
+    return max(1, int(free * _DEFAULT_SPILL_DISK_SHARE) // _MIB)
+
+
+def standard_profile() -> DuckDBResourceProfile:
+    """The dev target's 4 GiB limit with DuckDB's default threads."""
+    return DuckDBResourceProfile(
+        name="standard", memory_limit_mib=STANDARD_MEMORY_LIMIT_MIB
+    )
+
+
+def worker_profile(
+    workers: int = 1, *, cpu_count: Optional[int] = None
+) -> DuckDBResourceProfile:
+    """DuckDB's share of one pool worker's budget.
+
+    Memory is ``DUCKDB_MEMORY_SHARE`` of ``WORKER_MEMORY_BUDGET_MIB``; the
+    pool's CPUs are divided evenly between ``workers`` so concurrent runs do
+    not oversubscribe the host.
+    """
+    if workers < 1:
+        raise ResourceProfileError(f"workers must be >= 1, got {workers}")
+    cpus = cpu_count if cpu_count is not None else (os.cpu_count() or 1)
+    return DuckDBResourceProfile(
+        name="worker" if workers == 1 else f"worker:{workers}",
+        memory_limit_mib=int(WORKER_MEMORY_BUDGET_MIB * DUCKDB_MEMORY_SHARE),
+        threads=max(1, (cpus - RESERVED_CPUS) // workers),
+    )
+
+
+def profile_from_name(name: str) -> DuckDBResourceProfile:
+    """Parse ``standard``, ``worker`` or ``worker:<N>``."""
+    preset, _, workers = name.strip().partition(":")
+    if preset == "standard" and not workers:
+        return standard_profile()
+    if preset == "worker":
+        try:
+            return worker_profile(int(workers) if workers else 1)
+        except ValueError as exc:
+            raise ResourceProfileError(
+                f"Invalid worker count in DuckDB resource profile {name!r}"
+            ) from exc
+    raise ResourceProfileError(
+        f"Unknown DuckDB resource profile {name!r}; "
+        "expected 'standard', 'worker' or 'worker:<N>'"
+    )
+
+
+def profile_from_env(
+    environ: Optional[Mapping[str, str]] = None,
+) -> Optional[DuckDBResourceProfile]:
+    """The profile named by ``PLANALIGN_DUCKDB_PROFILE``, if any."""
+    name = (environ if environ is not None else os.environ).get(PROFILE_ENV_VAR, "")
+    return profile_from_name(name) if name.strip() else None
+
+
+def resolve_resource_profile(
+    settings: Optional["DuckDBResourceSettings"],
+    database_path: Path | str,
+    *,
+    environ: Optional[Mapping[str, str]] = None,
+) -> Optional[DuckDBResourceProfile]:
+    """Bound profile for one run, or None to keep DuckDB's previous settings.
+
+    Explicit ``settings`` fields override the chosen preset; fields without a
+    preset start from ``standard``.
+    """
+    overrides: Dict[str, Any] = {}
+    spill_root = None
+    profile: Optional[DuckDBResourceProfile] = None
+    if settings is not None:
+        if settings.profile is not None:
+            profile = profile_from_name(settings.profile)
+        if settings.memory_limit_mib is not None:
+            overrides["memory_limit_mib"] = settings.memory_limit_mib
+        if settings.threads is not None:
+            overrides["threads"] = settings.threads
+        if settings.max_spill_mib is not None:
+            overrides["max_spill_mib"] = settings.max_spill_mib
+        spill_root = settings.spill_directory
+    if profile is None:
+        profile = profile_from_env(environ)
+    if profile is None and (overrides or spill_root is not None):
+        profile = standard_profile()
+    if profile is None:
+        return None
+    return replace(profile, **overrides).bind(database_path, spill_root=spill_root)
+
+
+def read_connection_config(
+    environ: Optional[Mapping[str, str]] = None,
+) -> Dict[str, Any]:
+    """``duckdb.connect(config=...)`` for read-only API connections.
+
+    Reads share the environment's profile limits but spill to DuckDB's
+    default location: they belong to no run.
+    """
+    profile = profile_from_env(environ)
+    return profile.settings() if profile is not None else {}
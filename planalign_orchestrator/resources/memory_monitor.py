@@ -21,6 +21,7 @@ from typing import Any, Dict, Optional
 
 import psutil
 
+from ..monitoring.sampler import get_resource_sampler
 from .data_models import MemoryUsageSnapshot, ResourcePressure
 
 logger = logging.getLogger(__name__)
@@ -62,50 +63,41 @@ class MemoryMonitor:
 
         # Monitoring state
         self._monitoring_active = False
-        self._monitoring_thread: Optional[threading.Thread] = None
+        self._subscription: Optional[int] = None
         self._lock = threading.RLock()
 
         # Process handle for monitoring
         self._process = psutil.Process()
 
     def start_monitoring(self) -> None:
-        """Start background memory monitoring."""
+        """Start background memory monitoring on the shared resource sampler."""
         with self._lock:
             if self._monitoring_active:
                 return
 
             self._monitoring_active = True
-            self._monitoring_thread = threading.Thread(
-                target=self._monitor_loop, daemon=True, name="MemoryMonitor"
+            self._subscription = get_resource_sampler().subscribe(
+                self._record_snapshot, self.monitoring_interval
             )
-            self._monitoring_thread.start()
 
     def stop_monitoring(self) -> None:
         """Stop background memory monitoring."""
         with self._lock:
             self._monitoring_active = False
-            if self._monitoring_thread and self._monitoring_thread.is_alive():
-                self._monitoring_thread.join(timeout=2.0)
-            self._monitoring_thread = None
+            if self._subscription is not None:
+                get_resource_sampler().unsubscribe(self._subscription)
+            self._subscription = None
 
-    def _monitor_loop(self) -> None:
-        """Background monitoring loop."""
-        while self._monitoring_active:
-            try:
-                snapshot = self._capture_memory_snapshot()
-
-                with self._lock:
-                    self.memory_history.append(snapshot)
-
-                    # Check for pressure and trigger GC if needed
-                    if snapshot.rss_mb > self.thresholds["gc_trigger_mb"]:
-                        self._trigger_garbage_collection()
+    def _record_snapshot(self) -> None:
+        """Sampler callback: record a snapshot and collect garbage under pressure."""
+        snapshot = self._capture_memory_snapshot()
 
-                time.sleep(self.monitoring_interval)
+        with self._lock:
+            self.memory_history.append(snapshot)
 
-            except Exception:
-                # Silently continue monitoring on errors
-                time.sleep(self.monitoring_interval)
+            # Check for pressure and trigger GC if needed
+            if snapshot.rss_mb > self.thresholds["gc_trigger_mb"]:
+                self._trigger_garbage_collection()
 
     def _capture_memory_snapshot(
         self, thread_id: Optional[str] = None
@@ -413,6 +413,8 @@ def _evolve_provenance_schema(conn) -> None:
         # subsystem to. Multiple anchors are averaged per subsystem, so this
         # disambiguates one frozen run among several sharing a subsystem.
         ("ensemble_frozen_anchor_seed", "INTEGER"),
+        # Adaptive ensembles: JSON stopping rule, seeds run and stop reason.
+        ("ensemble_stopping_rule", "VARCHAR"),
     )
     for name, column_type in provenance_columns:
         conn.execute(
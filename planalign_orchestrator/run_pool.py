@@ -29,6 +29,7 @@ import queue
 import signal
 import time
 import traceback
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -229,14 +230,20 @@ def _worker_loop(
     job_queue: Any,
     event_queue: Any,
     worker: Callable[[ScenarioJob], Dict[str, Any]],
+    workers: int = 1,
 ) -> None:
     """Consume jobs until the sentinel; report every outcome as an event.
 
     Runs in a child process. The worker detaches into its own session so the
     parent can signal this process together with the dbt subprocesses it
     spawns, and ignores SIGINT so that a terminal Ctrl+C does not race the
-    parent's orchestrated shutdown.
+    parent's orchestrated shutdown. Unless the operator named a DuckDB
+    resource profile, each run's DuckDB is held to this worker's share of the
+    memory budget and of the CPUs.
     """
+    from .resources.duckdb_profile import PROFILE_ENV_VAR
+
+    os.environ.setdefault(PROFILE_ENV_VAR, f"worker:{workers}")
     if hasattr(os, "setsid"):
         try:
             os.setsid()
@@ -335,15 +342,40 @@ class ScenarioRunPool:
             return self._run_inline(worker, jobs, on_event)
         return self._run_parallel(worker, jobs, on_event)
 
+    def run_incremental(
+        self,
+        worker: Callable[[ScenarioJob], Dict[str, Any]],
+        jobs: Sequence[ScenarioJob],
+        next_jobs: Callable[[JobResult], Sequence[ScenarioJob]],
+        *,
+        on_event: Optional[Callable[[PoolEvent], None]] = None,
+    ) -> Dict[str, JobResult]:
+        """Like :meth:`run`, but jobs may be added while the pool is running.
+
+        ``next_jobs`` is called on the calling thread with each result as it
+        arrives, and the jobs it returns are queued behind those already
+        submitted. Workers stay up until nothing is queued or running, so a
+        caller that derives new work from finished work never waits on a
+        barrier while cores sit idle.
+        """
+        if not jobs:
+            return {}
+        if self.max_workers == 1:
+            return self._run_inline(worker, jobs, on_event, next_jobs)
+        return self._run_parallel(worker, jobs, on_event, next_jobs)
+
     def _run_inline(
         self,
         worker: Callable[[ScenarioJob], Dict[str, Any]],
         jobs: Sequence[ScenarioJob],
         on_event: Optional[Callable[[PoolEvent], None]],
+        next_jobs: Optional[Callable[[JobResult], Sequence[ScenarioJob]]] = None,
     ) -> Dict[str, JobResult]:
         results: Dict[str, JobResult] = {}
         pid = os.getpid()
-        for job in jobs:
+        pending = deque(jobs)
+        while pending:
+            job = pending.popleft()
             _emit(on_event, PoolEvent(EventKind.JOB_STARTED, job.name, worker_pid=pid))
             started = time.monotonic()
             try:
@@ -385,6 +417,8 @@ class ScenarioRunPool:
                         error=str(exc),
                     ),
                 )
+            if next_jobs is not None:
+                pending.extend(next_jobs(results[job.name]))
         return results
 
     def _run_parallel(
@@ -392,25 +426,41 @@ class ScenarioRunPool:
         worker: Callable[[ScenarioJob], Dict[str, Any]],
         jobs: Sequence[ScenarioJob],
         on_event: Optional[Callable[[PoolEvent], None]],
+        next_jobs: Optional[Callable[[JobResult], Sequence[ScenarioJob]]] = None,
     ) -> Dict[str, JobResult]:
         # 'spawn' rather than 'fork': the parent may already hold DuckDB
         # connections and threads, and forking those into a child that then
         # runs dbt is exactly the kind of shared-state hazard process
         # isolation is meant to remove.
         ctx = mp.get_context("spawn")
-        workers = min(self.max_workers, len(jobs))
+        # An incremental run cannot size the pool from its first jobs: more
+        # arrive as results come in.
+        workers = (
+            self.max_workers
+            if next_jobs is not None
+            else min(self.max_workers, len(jobs))
+        )
         job_queue = ctx.Queue()
         event_queue = ctx.Queue()
+        submitted = list(jobs)
 
         for job in jobs:
             job_queue.put(job)
-        for _ in range(workers):
-            job_queue.put(None)
+        if next_jobs is None:
+            for _ in range(workers):
+                job_queue.put(None)
+
+        def submit_followups(result: JobResult) -> None:
+            if next_jobs is None:
+                return
+            for job in next_jobs(result):
+                submitted.append(job)
+                job_queue.put(job)
 
         self._workers = [
             ctx.Process(
                 target=_worker_loop,
-                args=(job_queue, event_queue, worker),
+                args=(job_queue, event_queue, worker, workers),
                 name=f"planalign-worker-{i}",
                 daemon=False,
             )
@@ -421,13 +471,16 @@ class ScenarioRunPool:
 
         results: Dict[str, JobResult] = {}
         try:
-            self._collect(results, event_queue, len(jobs), on_event)
+            self._collect(results, event_queue, submitted, on_event, submit_followups)
+            if next_jobs is not None:
+                for _ in range(workers):
+                    job_queue.put(None)
             for process in self._workers:
                 process.join()
         except KeyboardInterrupt:
             logger.warning("Interrupted — terminating %d worker(s)", len(self._workers))
             self._terminate_workers()
-            self._record_interrupted(results, jobs)
+            self._record_interrupted(results, submitted)
             raise
         finally:
             _drain_queue(job_queue)
@@ -438,31 +491,55 @@ class ScenarioRunPool:
         # A worker that died mid-job (OOM kill, segfault) never published a
         # result. Surface that as a failure rather than silently returning a
         # short dict the caller would read as success.
-        self._record_missing(results, jobs)
+        self._record_missing(results, submitted)
         return results
 
     def _collect(
         self,
         results: Dict[str, JobResult],
         event_queue: Any,
-        expected: int,
+        submitted: Sequence[ScenarioJob],
         on_event: Optional[Callable[[PoolEvent], None]],
+        on_result: Callable[[JobResult], None],
     ) -> None:
-        """Drain events until every job reports, or every worker is gone."""
-        while len(results) < expected:
+        """Drain events until every submitted job reports, or every worker is gone.
+
+        ``submitted`` may grow while draining: ``on_result`` can queue follow-up
+        jobs for the result it is handed.
+        """
+        running: Dict[int, str] = {}
+        while len(results) < len(submitted):
             try:
                 item = event_queue.get(timeout=_EVENT_POLL_SECONDS)
             except queue.Empty:
                 if not any(p.is_alive() for p in self._workers):
                     return
+                # A worker that died mid-job never reports. Fail its job now
+                # so follow-up work is still derived from it and an
+                # incremental run, whose idle workers wait for more jobs,
+                # does not wait forever.
+                for process in self._workers:
+                    name = running.get(process.pid)
+                    if process.exitcode in (None, 0) or name is None:
+                        continue
+                    if name in results:
+                        continue
+                    del running[process.pid]
+                    results[name] = _missing_result(name)
+                    on_result(results[name])
                 continue
 
             if isinstance(item, PoolEvent):
+                if item.worker_pid is not None:
+                    running[item.worker_pid] = item.job_name
                 _emit(on_event, item)
                 continue
             event, result = item
+            if result.name in results:  # already failed as a dead worker's job
+                continue
             results[result.name] = result
             _emit(on_event, event)
+            on_result(result)
 
     def _terminate_workers(self) -> None:
         """Signal each worker's whole session so no dbt subprocess is orphaned.
@@ -507,17 +584,20 @@ class ScenarioRunPool:
         for job in jobs:
             if job.name in results:
                 continue
-            logger.error(
-                "Worker died without reporting a result for scenario %s", job.name
-            )
-            results[job.name] = JobResult(
-                name=job.name,
-                status="failed",
-                error=(
-                    "worker process died without reporting a result "
-                    "(most likely killed for memory use; lower --parallel)"
-                ),
-            )
+            results[job.name] = _missing_result(job.name)
+
+
+def _missing_result(name: str) -> JobResult:
+    """Failed result for a job whose worker died without reporting."""
+    logger.error("Worker died without reporting a result for scenario %s", name)
+    return JobResult(
+        name=name,
+        status="failed",
+        error=(
+            "worker process died without reporting a result "
+            "(most likely killed for memory use; lower --parallel)"
+        ),
+    )
 
 
 def _signal_session(process: Any, sig: int) -> None:
@@ -17,10 +17,13 @@ import time
 from contextlib import contextmanager
 from pathlib import Path
 from threading import Lock
-from typing import Callable, Dict, Generator, Optional, Set, TypeVar
+from typing import TYPE_CHECKING, Callable, Dict, Generator, Optional, Set, TypeVar
 
 import duckdb
 
+if TYPE_CHECKING:
+    from .resources.duckdb_profile import DuckDBResourceProfile
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -114,6 +117,7 @@ class DatabaseConnectionPool:
         pool_size: int = 1,
         deterministic: bool = True,
         read_only: bool = False,
+        resource_profile: Optional["DuckDBResourceProfile"] = None,
     ):
         """Initialize connection pool.
 
@@ -129,11 +133,15 @@ class DatabaseConnectionPool:
                 that blocks everything else (queries, promotion checks) for
                 as long as the pool stays open. Use for read-only workloads
                 (e.g. exporting results) that run alongside other access.
+            resource_profile: DuckDB memory/thread/spill budget shared with
+                the run's dbt invocations. Deterministic mode still pins
+                threads to 1; the profile replaces its 1GB memory limit.
         """
         self.db_path = db_path
         self.pool_size = pool_size
         self.deterministic = deterministic
         self.read_only = read_only
+        self.resource_profile = resource_profile
         self._pool: Dict[str, duckdb.DuckDBPyConnection] = {}
         self._lock = Lock()
         self._in_use: Set[str] = set()
@@ -147,7 +155,14 @@ class DatabaseConnectionPool:
         Returns:
             Configured DuckDB connection
         """
-        conn = duckdb.connect(str(self.db_path), read_only=self.read_only)
+        config = (
+            self.resource_profile.connect_config()
+            if self.resource_profile is not None
+            else {}
+        )
+        conn = duckdb.connect(
+            str(self.db_path), read_only=self.read_only, config=config
+        )
 
         if self.deterministic:
             # DETERMINISM FIX: Configure connection for reproducible results
@@ -158,7 +173,8 @@ class DatabaseConnectionPool:
                     "PRAGMA enable_external_access=false"
                 )  # Disable external access
                 conn.execute("PRAGMA preserve_insertion_order=true")  # Preserve order
-                conn.execute("PRAGMA memory_limit='1GB'")  # Conservative limit
+                if self.resource_profile is None:
+                    conn.execute("PRAGMA memory_limit='1GB'")  # Conservative limit
 
                 if thread_id:
                     # Set a deterministic seed based on thread ID for any internal RNG
@@ -258,6 +274,7 @@ class DatabaseConnectionManager:
         db_path: Optional[Path] = None,
         deterministic: bool = True,
         read_only: bool = False,
+        resource_profile: Optional["DuckDBResourceProfile"] = None,
     ):
         """Initialize DatabaseConnectionManager with connection pool.
 
@@ -267,6 +284,8 @@ class DatabaseConnectionManager:
             read_only: If True, open read-only connections that can coexist with
                 other processes' access to the same file instead of taking an
                 exclusive lock. See ``DatabaseConnectionPool``.
+            resource_profile: DuckDB resource profile applied to every
+                pooled connection (see ``resources.duckdb_profile``)
         """
         self.db_path = db_path or Path("dbt/simulation.duckdb")
         self.deterministic = deterministic
@@ -275,6 +294,7 @@ class DatabaseConnectionManager:
             pool_size=5,
             deterministic=deterministic,
             read_only=read_only,
+            resource_profile=resource_profile,
         )
         # Register cleanup at exit to ensure connections are closed
         atexit.register(self.close_all)
@@ -390,6 +410,19 @@ class DatabaseConnectionManager:
         """
         self._pool.close_all()
 
+    @property
+    def resource_profile(self) -> Optional["DuckDBResourceProfile"]:
+        return self._pool.resource_profile
+
+    def apply_resource_profile(self, profile: "DuckDBResourceProfile") -> None:
+        """Use ``profile`` for every connection from now on.
+
+        Open connections are closed so none keeps the previous settings;
+        the pool reopens them on next use.
+        """
+        self.close_all()
+        self._pool.resource_profile = profile
+
 
 @contextmanager
 def time_block(label: str) -> Generator[None, None, None]:
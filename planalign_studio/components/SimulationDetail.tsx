@@ -25,9 +25,11 @@ import {
   ScrollText,
   ShieldCheck,
   Loader2,
+  Timer,
 } from 'lucide-react';
 import { downloadRunProvenanceBundle, getRunDetails, getArtifactDownloadUrl, getResultsExportUrl, listRuns, getRunById, RunDetails, Artifact, RunSummary } from '../services/api';
 import LogViewer from './simulation/LogViewer';
+import TraceViewer from './simulation/TraceViewer';
 import EvidencePackPanel from './EvidencePackPanel';
 
 const formatBytes = (bytes: number): string => {
@@ -108,7 +110,7 @@ export default function SimulationDetail() {
   const [runs, setRuns] = useState<RunSummary[]>([]);
   const [expandedRuns, setExpandedRuns] = useState<Set<string>>(new Set());
   const [runArtifacts, setRunArtifacts] = useState<Record<string, Artifact[]>>({});
-  const [activeRunTab, setActiveRunTab] = useState<Record<string, 'artifacts' | 'logs' | 'evidence'>>({});
+  const [activeRunTab, setActiveRunTab] = useState<Record<string, 'artifacts' | 'logs' | 'trace' | 'evidence'>>({});
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [configExpanded, setConfigExpanded] = useState(false);
@@ -447,6 +449,17 @@ export default function SimulationDetail() {
                         <ScrollText size={14} className="mr-1.5" />
                         Logs
                       </button>
+                      <button
+                        onClick={() => setActiveRunTab(t => ({ ...t, [run.id]: 'trace' }))}
+                        className={`flex items-center px-4 py-2.5 text-sm font-medium border-b-2 transition-colors ${
+                          activeRunTab[run.id] === 'trace'
+                            ? 'border-fidelity-green text-fidelity-green'
+                            : 'border-transparent text-ink-muted hover:text-ink-muted'
+                        }`}
+                      >
+                        <Timer size={14} className="mr-1.5" />
+                        Trace
+                      </button>
                       {run.status === 'completed' && index === 0 && run.start_year !== null && run.end_year !== null && (
                         <button
                           onClick={() => setActiveRunTab(t => ({ ...t, [run.id]: 'evidence' }))}
@@ -530,6 +543,12 @@ export default function SimulationDetail() {
                           runId={run.id}
                           isRunning={run.status === 'running'}
                         />
+                      ) : activeRunTab[run.id] === 'trace' ? (
+                        <TraceViewer
+                          scenarioId={details.scenario_id}
+                          runId={run.id}
+                          isRunning={run.status === 'running'}
+                        />
                       ) : run.start_year !== null && run.end_year !== null ? (
                         <EvidencePackPanel
                           workspaceId={details.workspace_id}
@@ -0,0 +1,194 @@
+import React, { useState, useEffect, useMemo } from 'react';
+import { Download, AlertCircle, Timer } from 'lucide-react';
+import { RunTrace, RunTraceSpan, fetchRunTrace, getRunTraceDownloadUrl } from '../../services/api';
+
+interface TraceViewerProps {
+  scenarioId: string;
+  runId: string;
+  isRunning?: boolean;
+}
+
+interface StageRow {
+  stage: string;
+  seconds: number;
+  residueSeconds: number;
+  peakTreeRssMb: number | null;
+}
+
+interface ModelRow {
+  name: string;
+  seconds: number;
+  runs: number;
+  rows: number;
+  peakTreeRssMb: number | null;
+  failed: boolean;
+}
+
+const TOP_MODELS = 15;
+
+function formatSeconds(seconds: number): string {
+  if (seconds < 1) return `${Math.round(seconds * 1000)} ms`;
+  if (seconds < 120) return `${seconds.toFixed(1)} s`;
+  return `${Math.floor(seconds / 60)}m ${Math.round(seconds % 60)}s`;
+}
+
+function maxOrNull(current: number | null, value: number | null): number | null {
+  if (value === null) return current;
+  return current === null ? value : Math.max(current, value);
+}
+
+/** Sum stage spans across years, keeping workflow order. */
+function stageRows(spans: RunTraceSpan[]): StageRow[] {
+  const rows = new Map<string, StageRow>();
+  for (const span of spans) {
+    if (span.category !== 'stage') continue;
+    const row = rows.get(span.name) ?? { stage: span.name, seconds: 0, residueSeconds: 0, peakTreeRssMb: null };
+    row.seconds += span.duration_seconds;
+    row.residueSeconds += span.residue_seconds ?? 0;
+    row.peakTreeRssMb = maxOrNull(row.peakTreeRssMb, span.peak_tree_rss_mb);
+    rows.set(span.name, row);
+  }
+  return [...rows.values()];
+}
+
+/** Sum dbt model spans across years and invocations, slowest first. */
+function modelRows(spans: RunTraceSpan[]): ModelRow[] {
+  const rows = new Map<string, ModelRow>();
+  for (const span of spans) {
+    if (span.category !== 'dbt_node') continue;
+    const row = rows.get(span.name) ?? { name: span.name, seconds: 0, runs: 0, rows: 0, peakTreeRssMb: null, failed: false };
+    row.seconds += span.duration_seconds;
+    row.runs += 1;
+    row.rows += span.rows_affected ?? 0;
+    row.peakTreeRssMb = maxOrNull(row.peakTreeRssMb, span.peak_tree_rss_mb);
+    row.failed = row.failed || (span.status !== null && !['success', 'pass'].includes(span.status));
+    rows.set(span.name, row);
+  }
+  return [...rows.values()].sort((a, b) => b.seconds - a.seconds).slice(0, TOP_MODELS);
+}
+
+export default function TraceViewer({ scenarioId, runId, isRunning = false }: TraceViewerProps) {
+  const [trace, setTrace] = useState<RunTrace | null>(null);
+  const [loading, setLoading] = useState(false);
+  const [error, setError] = useState<string | null>(null);
+
+  useEffect(() => {
+    let cancelled = false;
+    setLoading(true);
+    setError(null);
+    fetchRunTrace(scenarioId, runId)
+      .then(data => { if (!cancelled) setTrace(data); })
+      .catch(e => { if (!cancelled) setError(e instanceof Error ? e.message : 'Failed to load trace'); })
+      .finally(() => { if (!cancelled) setLoading(false); });
+    return () => { cancelled = true; };
+  }, [scenarioId, runId]);
+
+  const stages = useMemo(() => stageRows(trace?.spans ?? []), [trace]);
+  const models = useMemo(() => modelRows(trace?.spans ?? []), [trace]);
+  const total = trace?.total_seconds ?? 0;
+  const slowestStage = Math.max(...stages.map(s => s.seconds), 0);
+
+  if (loading) {
+    return (
+      <div className="flex items-center justify-center py-8 text-ink-muted">
+        <div className="animate-spin rounded-full h-5 w-5 border-b-2 border-fidelity-green mr-2" />
+        Loading trace...
+      </div>
+    );
+  }
+
+  if (error) {
+    return (
+      <div className="flex items-center py-4 text-danger-ink">
+        <AlertCircle size={16} className="mr-2" />
+        {error}
+      </div>
+    );
+  }
+
+  if (trace && !trace.trace_available) {
+    return (
+      <div className="flex flex-col items-center justify-center py-8 text-ink-muted">
+        <Timer size={32} className="mb-2 opacity-40" />
+        <p className="text-sm">
+          {isRunning ? 'The trace is written when the simulation finishes.' : 'No trace was recorded for this run.'}
+        </p>
+      </div>
+    );
+  }
+
+  return (
+    <div className="flex flex-col gap-4">
+      {/* Toolbar */}
+      <div className="flex items-center gap-3 flex-wrap">
+        <span className="text-sm text-ink-muted">
+          Total <span className="font-semibold text-ink">{formatSeconds(total)}</span>
+        </span>
+        <div className="ml-auto flex items-center gap-2">
+          <span className="text-xs text-ink-muted">Opens in ui.perfetto.dev or chrome://tracing</span>
+          <a
+            href={getRunTraceDownloadUrl(scenarioId, runId)}
+            download="simulation.trace.json"
+            className="flex items-center px-3 py-1.5 text-sm bg-surface-subtle hover:bg-surface-disabled text-ink-muted rounded-lg font-medium"
+          >
+            <Download size={14} className="mr-1.5" />
+            Download Trace
+          </a>
+        </div>
+      </div>
+
+      {/* Stage breakdown */}
+      <div>
+        <h4 className="text-xs font-semibold uppercase tracking-wide text-ink-muted mb-2">Time by stage (all years)</h4>
+        <div className="space-y-1.5">
+          {stages.map(row => (
+            <div key={row.stage} className="flex items-center gap-3 text-xs">
+              <span className="w-40 shrink-0 font-mono text-ink truncate">{row.stage}</span>
+              <div className="flex-1 h-3 bg-surface-subtle rounded overflow-hidden">
+                <div
+                  className="h-full bg-fidelity-green"
+                  style={{ width: `${slowestStage > 0 ? (row.seconds / slowestStage) * 100 : 0}%` }}
+                />
+              </div>
+              <span className="w-20 shrink-0 text-right text-ink">{formatSeconds(row.seconds)}</span>
+              <span className="w-28 shrink-0 text-right text-ink-muted" title="Time outside dbt and child spans">
+                {formatSeconds(row.residueSeconds)} overhead
+              </span>
+            </div>
+          ))}
+        </div>
+      </div>
+
+      {/* Slowest models */}
+      {models.length > 0 && (
+        <div>
+          <h4 className="text-xs font-semibold uppercase tracking-wide text-ink-muted mb-2">Slowest dbt models</h4>
+          <table className="w-full text-xs">
+            <thead>
+              <tr className="text-left text-ink-muted border-b border-border">
+                <th className="py-1.5 font-medium">Model</th>
+                <th className="py-1.5 font-medium text-right">Time</th>
+                <th className="py-1.5 font-medium text-right">Runs</th>
+                <th className="py-1.5 font-medium text-right">Rows</th>
+                <th className="py-1.5 font-medium text-right">Peak RSS</th>
+              </tr>
+            </thead>
+            <tbody>
+              {models.map(row => (
+                <tr key={row.name} className="border-b border-border last:border-0">
+                  <td className={`py-1.5 font-mono truncate max-w-[280px] ${row.failed ? 'text-danger-ink' : 'text-ink'}`}>{row.name}</td>
+                  <td className="py-1.5 text-right text-ink">{formatSeconds(row.seconds)}</td>
+                  <td className="py-1.5 text-right text-ink-muted">{row.runs}</td>
+                  <td className="py-1.5 text-right text-ink-muted">{row.rows.toLocaleString()}</td>
+                  <td className="py-1.5 text-right text-ink-muted">
+                    {row.peakTreeRssMb !== null ? `${Math.round(row.peakTreeRssMb)} MB` : '—'}
+                  </td>
+                </tr>
+              ))}
+            </tbody>
+          </table>
+        </div>
+      )}
+    </div>
+  );
+}
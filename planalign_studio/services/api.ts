@@ -1189,6 +1189,56 @@ export function getRunLogDownloadUrl(scenarioId: string, runId: string): string
   return getArtifactDownloadUrl(scenarioId, `runs/${runId}/simulation.log`);
 }
 
+// ============================================================================
+// Run Trace Endpoints
+// ============================================================================
+
+export type TraceSpanCategory =
+  | 'run'
+  | 'year'
+  | 'phase'
+  | 'stage'
+  | 'dbt_invocation'
+  | 'dbt_node'
+  | 'dbt_phase';
+
+export interface RunTraceSpan {
+  span_id: number;
+  parent_id: number | null;
+  name: string;
+  category: TraceSpanCategory;
+  thread: string | null;
+  start_seconds: number;
+  duration_seconds: number;
+  residue_seconds: number | null;
+  year: number | null;
+  stage: string | null;
+  status: string | null;
+  rows_affected: number | null;
+  peak_rss_mb: number | null;
+  peak_tree_rss_mb: number | null;
+  tree_cpu_seconds: number | null;
+}
+
+export interface RunTrace {
+  run_id: string;
+  trace_available: boolean;
+  total_seconds: number | null;
+  spans: RunTraceSpan[];
+}
+
+export async function fetchRunTrace(scenarioId: string, runId: string): Promise<RunTrace> {
+  const response = await fetchWithAuth(
+    `${API_BASE}/api/scenarios/${scenarioId}/runs/${runId}/trace`
+  );
+  return handleResponse<RunTrace>(response);
+}
+
+/** Chrome-trace JSON; open it in https://ui.perfetto.dev or chrome://tracing. */
+export function getRunTraceDownloadUrl(scenarioId: string, runId: string): string {
+  return getArtifactDownloadUrl(scenarioId, `runs/${runId}/simulation.trace.json`);
+}
+
 // ============================================================================
 // File Upload Endpoints
 // ============================================================================
@@ -13,7 +13,9 @@ from unittest.mock import MagicMock
 import pytest
 
 from planalign_api.models.export import (
+    ArchiveFormat,
     BulkOperationStatus,
+    ConflictResolution,
     ExportStatus,
 )
 from planalign_api.models.workspace import Workspace
@@ -382,3 +384,148 @@ class TestBulkExport:
         assert export_service.get_bulk_export_status(started.operation_id) is None
         # File should be deleted
         assert not archive_path.exists()
+
+
+def _add_run(scenario_path: Path, run_id: str, payload: bytes) -> Path:
+    run_dir = scenario_path / "runs" / run_id
+    run_dir.mkdir(parents=True)
+    (run_dir / "run_metadata.json").write_text(
+        json.dumps({"run_id": run_id, "status": "completed"})
+    )
+    (run_dir / "simulation.duckdb").write_bytes(payload)
+    (run_dir / "census.parquet").write_bytes(b"shared census bytes" * 100)
+    return run_dir
+
+
+def _tree(root: Path) -> dict:
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+class TestZstdArchive:
+    """tar.zst exports: deduplication, current-result filtering, increments."""
+
+    RUN_A = "11111111-1111-1111-1111-111111111111"
+    RUN_B = "22222222-2222-2222-2222-222222222222"
+
+    @pytest.fixture
+    def runs_workspace(self, temp_workspace):
+        scenario_path = temp_workspace / "scenarios" / "scenario-1"
+        _add_run(scenario_path, self.RUN_A, b"old run")
+        _add_run(scenario_path, self.RUN_B, b"new run")
+        (scenario_path / "current_result.json").write_text(
+            json.dumps({"schema_version": 1, "run_id": self.RUN_B})
+        )
+        return temp_workspace
+
+    @pytest.fixture
+    def real_storage(self, tmp_path):
+        from planalign_api.storage.workspace_storage import WorkspaceStorage
+
+        return WorkspaceStorage(tmp_path / "workspaces")
+
+    def _export(self, service, workspace_path, output, **kwargs):
+        manifest = service.create_manifest(
+            "test-workspace-123",
+            "Test Workspace",
+            workspace_path,
+            current_results_only=kwargs.pop("current_results_only", False),
+        )
+        return service.create_zstd_archive(workspace_path, manifest, output, **kwargs)
+
+    def test_round_trip_stores_identical_files_once(
+        self, runs_workspace, real_storage, tmp_path
+    ):
+        service = ExportService(real_storage)
+        archive = tmp_path / "export.tar.zst"
+        _, manifest = self._export(service, runs_workspace, archive)
+
+        assert len(manifest.files) == manifest.contents.file_count
+        assert len(manifest.blobs) == len(manifest.files) - 1  # census deduped
+        assert service.validate_archive(archive, archive.stat().st_size).valid
+
+        imported = service.import_workspace(archive)
+        restored = real_storage._workspace_path(imported.workspace_id)
+        expected = _tree(runs_workspace)
+        actual = _tree(restored)
+        assert actual.pop("workspace.json") != expected.pop("workspace.json")
+        assert {k: v for k, v in expected.items() if not k.startswith(".exports")} == (
+            actual
+        )
+
+    def test_current_results_only_drops_superseded_runs(
+        self, runs_workspace, real_storage, tmp_path
+    ):
+        service = ExportService(real_storage)
+        _, manifest = self._export(
+            service,
+            runs_workspace,
+            tmp_path / "current.tar.zst",
+            current_results_only=True,
+        )
+
+        runs = {path.split("/")[3] for path in manifest.files if "/runs/" in path}
+        assert runs == {self.RUN_B}
+
+    def test_incremental_export_carries_only_changed_files(
+        self, runs_workspace, real_storage, tmp_path
+    ):
+        service = ExportService(real_storage)
+        base_archive = tmp_path / "base.tar.zst"
+        _, base = self._export(service, runs_workspace, base_archive)
+
+        changed = runs_workspace / "scenarios" / "scenario-1" / "notes.txt"
+        changed.write_text("added after the base export")
+        delta_archive = tmp_path / "delta.tar.zst"
+        _, delta = self._export(
+            service, runs_workspace, delta_archive, since_export_id=base.export_id
+        )
+
+        assert delta.base_export_id == base.export_id
+        assert [delta.files[p].sha256 for p in delta.files if p.endswith("notes.txt")]
+        assert len(delta.blobs) == 1
+
+        validation = service.validate_archive(
+            delta_archive, delta_archive.stat().st_size
+        )
+        assert validation.valid
+        assert any("Incremental" in warning for warning in validation.warnings)
+        with pytest.raises(ValueError, match="base export"):
+            service.import_workspace(delta_archive)
+
+        imported = service.import_workspace(
+            delta_archive,
+            conflict_resolution=ConflictResolution.RENAME,
+            base_archives=[base_archive],
+        )
+        restored = real_storage._workspace_path(imported.workspace_id)
+        assert (restored / "scenarios" / "scenario-1" / "notes.txt").read_text() == (
+            "added after the base export"
+        )
+
+    def test_bulk_export_keeps_request_order(self, export_service, mock_storage):
+        with tempfile.TemporaryDirectory() as root:
+            workspaces = {}
+            for index in range(3):
+                path = Path(root) / f"ws-{index}"
+                path.mkdir()
+                (path / "workspace.json").write_text("{}")
+                workspace = MagicMock(spec=Workspace)
+                workspace.name = f"Workspace {index}"
+                workspace.storage_path = str(path)
+                workspaces[f"ws-{index}"] = workspace
+            mock_storage.get_workspace.side_effect = workspaces.get
+            mock_storage.is_simulation_running.return_value = False
+
+            ids = ["ws-2", "ws-0", "ws-1"]
+            started = export_service.start_bulk_export(ids)
+            result = export_service.execute_bulk_export(
+                started.operation_id, ids, archive_format=ArchiveFormat.ZSTD
+            )
+
+            assert [r.workspace_id for r in result.results] == ids
+            assert all(r.filename.endswith(".tar.zst") for r in result.results)
+            export_service.cleanup_bulk_export(started.operation_id)
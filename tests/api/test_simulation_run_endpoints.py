@@ -294,3 +294,59 @@ def test_run_logs_http_happy_path(http_client):
     response = http_client.get(f"/api/scenarios/scenario-1/runs/{RUN_ID}/logs")
     assert response.status_code == 200
     assert response.json()["run_id"] == RUN_ID
+
+
+def _call_get_run_trace(storage, run_id, *, include_phases=False):
+    return asyncio.run(
+        simulations.get_run_trace(
+            "scenario-1", run_id, include_phases=include_phases, storage=storage
+        )
+    )
+
+
+def test_get_run_trace_without_trace_file(run_storage):
+    storage, _, _ = run_storage
+
+    trace = _call_get_run_trace(storage, RUN_ID)
+
+    assert trace.run_id == RUN_ID
+    assert trace.trace_available is False
+    assert trace.spans == []
+
+
+def test_get_run_trace_reads_chrome_trace(run_storage):
+    from planalign_orchestrator.monitoring.tracing import RunTracer
+
+    storage, _, run_dir = run_storage
+    tracer = RunTracer(output_path=run_dir / "simulation.trace.json")
+    with tracer.span("simulation", "run"):
+        with tracer.span("year 2025", "year", year=2025):
+            with tracer.span("dbt run", "dbt_invocation") as invocation:
+                pass
+            tracer.add_span(
+                "execute",
+                "dbt_phase",
+                parent=invocation,
+                start_wall=0.0,
+                end_wall=0.0,
+            )
+    tracer.finish()
+    tracer.write_chrome_trace()
+
+    trace = _call_get_run_trace(storage, RUN_ID)
+    with_phases = _call_get_run_trace(storage, RUN_ID, include_phases=True)
+
+    assert trace.trace_available is True
+    assert [span.category for span in trace.spans] == ["run", "year", "dbt_invocation"]
+    assert trace.spans[2].year == 2025
+    assert trace.total_seconds == trace.spans[0].duration_seconds
+    assert len(with_phases.spans) == 4
+
+
+def test_get_run_trace_rejects_traversal_ids(run_storage):
+    storage, _, _ = run_storage
+
+    with pytest.raises(HTTPException) as exc_info:
+        _call_get_run_trace(storage, "../..")
+
+    assert exc_info.value.status_code == 400
@@ -13,7 +13,7 @@ STUDIO_ROOT = REPO_ROOT / "planalign_studio"
 COMPONENT_ROOT = STUDIO_ROOT / "components"
 PALETTE_PATH = STUDIO_ROOT / "theme" / "chart-palettes.json"
 
-EXPECTED_COMPONENT_COUNT = 55
+EXPECTED_COMPONENT_COUNT = 56
 EXPECTED_RECHARTS_CONSUMER_COUNT = 13
 EXPECTED_RECHARTS_CHART_COUNT = 31
 
@@ -33,7 +33,8 @@ def enrollment_db():
         """CREATE TABLE fct_yearly_events (
         event_id VARCHAR, scenario_id VARCHAR, plan_design_id VARCHAR, employee_id VARCHAR,
         event_type VARCHAR, effective_date DATE, simulation_year INTEGER, event_sequence INTEGER,
-        event_details VARCHAR, employee_deferral_rate DECIMAL(9, 6))"""
+        event_details VARCHAR, employee_deferral_rate DECIMAL(9, 6),
+        enrollment_change_type VARCHAR)"""
     )
     conn.execute(
         """INSERT INTO int_baseline_workforce VALUES
@@ -62,7 +63,7 @@ def test_prior_fact_overrides_census_and_never_enrolled_control_stays_eligible(
 ):
     enrollment_db.execute(
         """INSERT INTO fct_yearly_events VALUES
-      ('optout', 'default', 'default', 'census-5pct', 'enrollment_change', DATE '2025-04-01', 2025, 1, 'Auto-enrollment opt-out', 0.00)"""
+      ('optout', 'default', 'default', 'census-5pct', 'enrollment_change', DATE '2025-04-01', 2025, 1, 'Auto-enrollment opt-out', 0.00, 'opt_out')"""
     )
     EnrollmentDecisionProjection(DirectConnectionManager(enrollment_db)).rebuild(2026)
     rows = enrollment_db.execute(
@@ -76,8 +77,8 @@ def test_prior_fact_overrides_census_and_never_enrolled_control_stays_eligible(
 def test_projection_is_scenario_and_plan_scoped(enrollment_db):
     enrollment_db.execute(
         """INSERT INTO fct_yearly_events VALUES
-      ('a', 'scenario-a', 'plan-a', 'never-enrolled', 'enrollment', DATE '2025-01-01', 2025, 1, 'Enrollment', 0.04),
-      ('b', 'scenario-b', 'plan-b', 'never-enrolled', 'enrollment_change', DATE '2025-02-01', 2025, 1, 'Auto-enrollment opt-out', 0.00)"""
+      ('a', 'scenario-a', 'plan-a', 'never-enrolled', 'enrollment', DATE '2025-01-01', 2025, 1, 'Enrollment', 0.04, NULL),
+      ('b', 'scenario-b', 'plan-b', 'never-enrolled', 'enrollment_change', DATE '2025-02-01', 2025, 1, 'Auto-enrollment opt-out', 0.00, 'opt_out')"""
     )
     projection = EnrollmentDecisionProjection(DirectConnectionManager(enrollment_db))
     projection.rebuild(2026, "scenario-a", "plan-a")
@@ -95,7 +96,7 @@ def test_participant_lineage_trace_under_five_minutes(enrollment_db):
     """Reconcile census, authoritative facts, and projection provenance."""
     enrollment_db.execute(
         """INSERT INTO fct_yearly_events VALUES
-      ('enroll', 'default', 'default', 'never-enrolled', 'enrollment', DATE '2025-03-01', 2025, 1, 'Enrollment', 0.04)"""
+      ('enroll', 'default', 'default', 'never-enrolled', 'enrollment', DATE '2025-03-01', 2025, 1, 'Enrollment', 0.04, NULL)"""
     )
     started = time.monotonic()
     EnrollmentDecisionProjection(DirectConnectionManager(enrollment_db)).rebuild(2026)
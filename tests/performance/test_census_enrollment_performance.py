@@ -56,7 +56,8 @@ def test_projection_rebuilds_enterprise_scale_within_contract():
                    DATE '2025-06-01' AS effective_date, 2025 AS simulation_year,
                    i AS event_sequence,
                    CASE WHEN i % 11 = 0 THEN 'Auto-enrollment opt-out' ELSE 'Enrollment' END AS event_details,
-                   CASE WHEN i % 11 = 0 THEN 0.00 ELSE 0.04 END::DECIMAL(9, 6) AS employee_deferral_rate
+                   CASE WHEN i % 11 = 0 THEN 0.00 ELSE 0.04 END::DECIMAL(9, 6) AS employee_deferral_rate,
+                   CASE WHEN i % 11 = 0 THEN 'opt_out' END AS enrollment_change_type
             FROM range(?) AS events(i)""",
             [EMPLOYEES, HISTORY_ROWS],
         )
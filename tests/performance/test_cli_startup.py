@@ -0,0 +1,84 @@
+"""Import-time budget for ``planalign`` startup (lazy command registration).
+
+Every ``planalign`` invocation -- including the ``planalign simulate`` subprocess
+Studio starts per run -- pays the CLI's import cost before any work begins. Command
+modules and their heavy dependencies must load only when their command runs.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Tuple
+
+import pytest
+
+pytestmark = pytest.mark.performance
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "cli_startup_import_budget.json"
+REPO_ROOT = Path(__file__).resolve().parents[2]
+INVOCATIONS = (
+    ("--help",),
+    ("simulate", "--help"),
+    ("status", "--help"),
+)
+
+
+def _import_profile(*args: str) -> Tuple[float, Dict[str, int]]:
+    """Run ``planalign <args>`` under ``-X importtime``; return (seconds, modules)."""
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import sys; from planalign_cli.main import cli_main; "
+            f"sys.argv = ['planalign', *{list(args)!r}]; cli_main()",
+        ],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert completed.returncode == 0, completed.stdout + completed.stderr
+    modules: Dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:") :].split("|", 2)
+        modules[name.strip()] = int(self_us)
+    return sum(modules.values()) / 1_000_000, modules
+
+
+@pytest.mark.parametrize("args", INVOCATIONS, ids=" ".join)
+def test_cli_startup_stays_within_import_budget(args: Tuple[str, ...]) -> None:
+    budget = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+    seconds, modules = _import_profile(*args)
+
+    eager = sorted(
+        name
+        for name in modules
+        if name.split(".")[0] in set(budget["forbidden_modules"])
+    )
+    assert not eager, f"planalign {' '.join(args)} eagerly imported: {eager[:10]}"
+    assert seconds <= budget["max_import_seconds"], (
+        f"planalign {' '.join(args)} spent {seconds:.2f}s importing modules "
+        f"(budget {budget['max_import_seconds']}s)"
+    )
+
+
+def test_lazy_commands_still_resolve() -> None:
+    from typer.testing import CliRunner
+
+    from planalign_cli.main import app
+
+    runner = CliRunner()
+    listing = runner.invoke(app, ["--help"])
+    assert listing.exit_code == 0
+    for name in ("calibrate", "fit", "backtest", "optimize"):
+        assert name in listing.output
+        detail = runner.invoke(app, [name, "--help"])
+        assert detail.exit_code == 0, detail.output
+        assert "Usage" in detail.output
@@ -0,0 +1,121 @@
+"""Horizon gate: Python-managed per-year work must not grow with the year index.
+
+Drives the orchestrator's own per-year SQL -- the purge of a populated year
+and the incremental enrollment projection fold -- over a 20-year horizon
+against an event ledger that grows by one year of events each year, then fits
+the per-year cost with the same guard the orchestrator applies to dbt models.
+Anything that rescans every prior year (the #466 delete, a full ledger replay)
+costs more each year and fails here long before a 5-year benchmark notices.
+"""
+
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+import duckdb
+import pytest
+
+from planalign_orchestrator.monitoring.horizon import (
+    HORIZON_EXPONENT_TOLERANCE,
+    fit_horizon_growth,
+)
+from planalign_orchestrator.pipeline.enrollment_projection import (
+    EnrollmentDecisionProjection,
+)
+from planalign_orchestrator.pipeline.state_manager import StateManager
+
+
+class DirectConnectionManager:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute_with_retry(self, callback, **_kwargs):
+        return callback(self.connection)
+
+
+EMPLOYEES = 50_000
+EVENTS_PER_YEAR = 100_000
+START_YEAR = 2025
+HORIZON = 20
+REPEATS = 3
+
+
+def _append_year_events(conn, year: int) -> None:
+    conn.execute(
+        """INSERT INTO fct_yearly_events
+        SELECT 'event-' || ?::VARCHAR || '-' || i::VARCHAR, 'default', 'default',
+               'employee-' || lpad((i % ?)::VARCHAR, 6, '0'),
+               CASE WHEN i % 11 = 0 THEN 'enrollment_change' ELSE 'enrollment' END,
+               make_date(?, 6, 1), ?, i,
+               CASE WHEN i % 11 = 0 THEN 'Auto-enrollment opt-out' ELSE 'Enrollment' END,
+               CASE WHEN i % 11 = 0 THEN 0.00 ELSE 0.04 END::DECIMAL(9, 6),
+               CASE WHEN i % 11 = 0 THEN 'opt_out' END
+        FROM range(?) AS events(i)""",
+        [year, EMPLOYEES, year, year, EVENTS_PER_YEAR],
+    )
+
+
+def _best_of(action, setup=None) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+@pytest.mark.performance
+def test_per_year_orchestrator_work_stays_flat_over_twenty_years():
+    conn = duckdb.connect(":memory:")
+    try:
+        conn.execute(
+            """CREATE TABLE int_baseline_workforce AS
+            SELECT 'employee-' || lpad(i::VARCHAR, 6, '0') AS employee_id,
+                   DATE '2020-01-01' AS employee_enrollment_date,
+                   0.05::DECIMAL(9, 6) AS employee_deferral_rate,
+                   i % 2 = 0 AS is_enrolled_at_census
+            FROM range(?) AS employees(i)""",
+            [EMPLOYEES],
+        )
+        conn.execute(
+            """CREATE TABLE fct_yearly_events (
+                event_id VARCHAR, scenario_id VARCHAR, plan_design_id VARCHAR,
+                employee_id VARCHAR, event_type VARCHAR, effective_date DATE,
+                simulation_year INTEGER, event_sequence BIGINT, event_details VARCHAR,
+                employee_deferral_rate DECIMAL(9, 6), enrollment_change_type VARCHAR)"""
+        )
+        db = DirectConnectionManager(conn)
+        state = StateManager(
+            db, None, SimpleNamespace(setup={}, scenario_id=None, plan_design_id=None)
+        )
+        # verify_every=0 isolates the fold; the periodic full check is a
+        # deliberate, bounded cost.
+        projection = EnrollmentDecisionProjection(db, incremental=True, verify_every=0)
+
+        timings: dict[str, dict[int, float]] = {"clear_year": {}, "projection": {}}
+        for year in range(START_YEAR, START_YEAR + HORIZON):
+            timings["projection"][year] = _best_of(lambda: projection.rebuild(year))
+            # Each timed purge removes a populated year, as a re-run does, so
+            # the DELETE path is measured rather than the empty-year probe.
+            timings["clear_year"][year] = _best_of(
+                lambda: state.maybe_clear_year_data(year),
+                setup=lambda: _append_year_events(conn, year),
+            )
+            assert conn.execute(
+                "SELECT count(*) FROM fct_yearly_events WHERE simulation_year = ?",
+                [year],
+            ).fetchone() == (0,)
+            _append_year_events(conn, year)
+
+        findings = fit_horizon_growth(timings, start_year=START_YEAR, min_seconds=0.0)
+
+        assert {f.model for f in findings} == {"clear_year", "projection"}
+        growing = [f.describe() for f in findings if f.flagged]
+        assert (
+            not growing
+        ), f"per-year cost grows faster than year^{HORIZON_EXPONENT_TOLERANCE}: {growing}"
+    finally:
+        conn.close()
@@ -27,6 +27,10 @@ from planalign_orchestrator.run_metadata import check_and_record_run
 from planalign_orchestrator.utils import DatabaseConnectionManager
 import planalign_backtest.runner as runner_module
 from planalign_backtest.models import SeedRun
+from planalign_backtest.runner import run_rolling_backtest
+from planalign_backtest.split import plan_split
+from planalign_fit import FitOptions
+from tests.fixtures.synthetic_census import generate_history
 
 pytestmark = pytest.mark.integration
 
@@ -277,6 +281,7 @@ def test_multi_seed_backtest_rerun_is_byte_identical(
                 output=root / "pack",
                 workdir=root / "run",
                 keep_databases=True,
+                parallel=1,
             ),
         )
 
@@ -327,3 +332,64 @@ def test_backtested_pack_run_records_only_current_score_reference(
         pack_dir, tmp_path / "stale.duckdb", tmp_path / "stale-apply"
     )
     assert stale is None
+
+
+def test_rolling_backtest_scores_every_origin_with_error_trends(
+    tmp_path, monkeypatch
+) -> None:
+    history = generate_history(tmp_path / "history", headcount=300, years=5)
+    simulated: list[tuple[int, int]] = []
+
+    def fake_run_seed(applied, split, seed, workdir):
+        simulated.append((split.boundary_year, seed))
+        return SeedRun(
+            seed=seed,
+            database=workdir / f"seed_{seed}.duckdb",
+            config_fingerprint=f"stable-{seed}",
+            years_simulated=split.holdout_years,
+        )
+
+    def fake_predicted(database, split):
+        # Error grows with the origin, so the trend slope must be positive.
+        value = 1.0 + (split.boundary_year - history.years[1]) / 10
+        return {
+            MetricValue(metric="headcount.total", period=period): value
+            for period in (*split.holdout_years, "cumulative")
+        }
+
+    monkeypatch.setattr(runner_module, "run_seed", fake_run_seed)
+    monkeypatch.setattr(runner_module, "extract_predicted", fake_predicted)
+    monkeypatch.setattr(
+        runner_module,
+        "extract_actuals",
+        lambda snapshot_set, split, bands: {
+            MetricValue(metric="headcount.total", period=period): 1.0
+            for period in (*split.holdout_years, "cumulative")
+        },
+    )
+
+    rolling = run_rolling_backtest(
+        history.directory,
+        BacktestOptions(
+            seeds=(42, 43),
+            workdir=tmp_path / "run",
+            fit_options=FitOptions(credibility_k=25),
+            parallel=1,
+        ),
+    )
+
+    boundaries = tuple(origin.split.boundary_year for origin in rolling.origins)
+    assert boundaries == tuple(history.years[1:-1])
+    assert rolling.origins[-1].split == plan_split(
+        load_snapshots(history.directory, duckdb.connect()), 1
+    )
+    for origin in rolling.origins:
+        assert tuple(origin.pack.manifest.snapshot_years) == origin.split.fit_years
+    assert sorted(simulated) == sorted(
+        (year, seed) for year in boundaries for seed in (42, 43)
+    )
+    (trend,) = [t for t in rolling.scorecard.trends if t.metric == "headcount.total"]
+    assert trend.boundary_years == boundaries
+    assert trend.slope is not None and trend.slope > 0
+    assert rolling.scorecard.verdict == "fail"
+    assert rolling.scorecard.origins[0].verdict == "pass"
@@ -3,7 +3,7 @@
 import pytest
 
 from planalign_backtest.errors import BacktestError
-from planalign_backtest.split import plan_split
+from planalign_backtest.split import plan_rolling_splits, plan_split
 from planalign_fit.snapshots import Snapshot, SnapshotSet
 
 pytestmark = pytest.mark.fast
@@ -32,3 +32,19 @@ def test_holdout_out_of_range_names_value(holdout: int) -> None:
 def test_infeasible_holdout_names_both_counts() -> None:
     with pytest.raises(BacktestError, match=r"2-year holdout of 3.*leaves 1"):
         plan_split(_set(2021, 2022, 2023), 2)
+
+
+@pytest.mark.parametrize(
+    ("holdout", "boundaries"), ((1, (2022, 2023, 2024)), (2, (2022, 2023)))
+)
+def test_rolling_splits_cover_every_feasible_boundary(holdout, boundaries) -> None:
+    splits = plan_rolling_splits(_set(2021, 2022, 2023, 2024, 2025), holdout)
+
+    assert tuple(split.boundary_year for split in splits) == boundaries
+    assert all(len(split.holdout_years) == holdout for split in splits)
+    assert splits[-1] == plan_split(_set(2021, 2022, 2023, 2024, 2025), holdout)
+
+
+def test_rolling_splits_reject_what_a_single_split_rejects() -> None:
+    with pytest.raises(BacktestError, match=r"2-year holdout of 3"):
+        plan_rolling_splits(_set(2021, 2022, 2023), 2)
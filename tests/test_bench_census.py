@@ -0,0 +1,177 @@
+"""Tests for census profiles and synthetic census generation.
+
+Generated censuses must be deterministic for a seed, match the staged census
+schema, and reproduce the profile they were sampled from closely enough that
+fitting the output recovers it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from types import SimpleNamespace
+
+import duckdb
+import numpy as np
+import pytest
+
+from planalign_bench import (
+    ProfileError,
+    default_profile,
+    fit_profile,
+    load_profile,
+    pack_deferral_defaults,
+    sample_chunk,
+    save_profile,
+    write_census,
+)
+
+pytestmark = [pytest.mark.fast]
+
+CENSUS_COLUMNS = [
+    "employee_id",
+    "employee_ssn",
+    "employee_birth_date",
+    "employee_hire_date",
+    "employee_termination_date",
+    "employee_gross_compensation",
+    "employee_capped_compensation",
+    "active",
+    "employee_deferral_rate",
+    "employee_contribution",
+    "pre_tax_contribution",
+    "roth_contribution",
+    "after_tax_contribution",
+    "employer_core_contribution",
+    "employer_match_contribution",
+    "eligibility_entry_date",
+    "scheduled_hours_per_week",
+    "auto_escalation_opt_out",
+    "eligibility_override",
+]
+
+
+@pytest.fixture(scope="module")
+def profile():
+    return default_profile()
+
+
+def _read(path, sql):
+    with duckdb.connect() as conn:
+        return conn.execute(sql.format(census=f"read_parquet('{path}')")).fetchall()
+
+
+def test_profile_round_trips_through_json(profile, tmp_path):
+    path = save_profile(profile, tmp_path / "profile.json")
+
+    assert load_profile(path) == profile
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda p: {
+            "levels": (replace(p.levels[0], share=p.levels[0].share * 2),)
+            + p.levels[1:]
+        },
+        lambda p: {"default_rate_share": 1.5},
+        lambda p: {
+            "correlation": ((1.0, 0.9, 0.9), (0.9, 1.0, -0.9), (0.9, -0.9, 1.0))
+        },
+    ],
+    ids=["shares", "default_share", "correlation"],
+)
+def test_invalid_profile_is_rejected(profile, tmp_path, change):
+    broken = replace(profile, **change(profile))
+
+    with pytest.raises(ProfileError):
+        write_census(broken, 10, tmp_path / "census.parquet")
+
+
+def test_census_matches_the_staged_schema(profile, tmp_path):
+    summary = write_census(profile, 2_000, tmp_path / "census.parquet")
+
+    with duckdb.connect() as conn:
+        columns = [
+            row[0]
+            for row in conn.execute(
+                f"DESCRIBE SELECT * FROM read_parquet('{summary.path}')"
+            ).fetchall()
+        ]
+    assert columns == CENSUS_COLUMNS
+    assert summary.employees == 2_000
+    ((unique_ids, bad_dates, over_limit),) = _read(
+        summary.path,
+        """
+        SELECT count(DISTINCT employee_id),
+               count(*) FILTER (WHERE employee_hire_date < employee_birth_date + INTERVAL 18 YEAR
+                                   OR employee_termination_date < employee_hire_date),
+               count(*) FILTER (WHERE employee_capped_compensation > employee_gross_compensation)
+        FROM {census}
+        """,
+    )
+    assert (unique_ids, bad_dates, over_limit) == (2_000, 0, 0)
+
+
+def test_generation_is_deterministic_per_seed(profile, tmp_path):
+    first = write_census(profile, 3_000, tmp_path / "a.parquet", seed=7)
+    second = write_census(profile, 3_000, tmp_path / "b.parquet", seed=7)
+    other = write_census(profile, 3_000, tmp_path / "c.parquet", seed=8)
+
+    query = "SELECT sum(employee_gross_compensation), sum(employee_deferral_rate) FROM {census}"
+    assert _read(first.path, query) == _read(second.path, query)
+    assert _read(first.path, query) != _read(other.path, query)
+
+
+def test_fitting_a_generated_census_recovers_the_profile(profile, tmp_path):
+    census = write_census(profile, 40_000, tmp_path / "census.parquet", seed=3)
+
+    fitted = fit_profile(census.path, as_of=profile.as_of)
+
+    assert fitted.source.endswith("census.parquet")
+    for original, recovered in zip(profile.levels, fitted.levels):
+        assert recovered.level_id == original.level_id
+        assert recovered.share == pytest.approx(original.share, abs=0.01)
+        assert recovered.participation_rate == pytest.approx(
+            original.participation_rate, abs=0.05
+        )
+        median = len(original.age_quantiles) // 2
+        assert recovered.age_quantiles[median] == pytest.approx(
+            original.age_quantiles[median], abs=1.5
+        )
+    assert fitted.default_deferral_rate == pytest.approx(profile.default_deferral_rate)
+
+
+def test_default_rates_follow_segment_table(profile):
+    everyone_defaults = replace(
+        profile,
+        default_rate_share=1.0,
+        levels=tuple(
+            replace(level, participation_rate=1.0) for level in profile.levels
+        ),
+    )
+    defaults = {("young", "moderate"): 0.02, ("senior", "executive"): 0.08}
+
+    chunk = sample_chunk(everyone_defaults, 5_000, np.random.default_rng(0), defaults)
+
+    rates = set(np.round(chunk["deferral_rate"].unique(), 4))
+    assert rates <= {0.02, 0.08, profile.default_deferral_rate}
+    assert 0.02 in rates
+
+
+def test_pack_deferral_defaults_translate_income_segments():
+    pack = SimpleNamespace(
+        seed_files={
+            "default_deferral_rates.csv": (
+                "scenario_id,age_segment,income_segment,default_rate\n"
+                "default,young,low_income,0.04\n"
+                "other,young,low_income,0.09\n"
+                "default,senior,executive,0.06\n"
+            )
+        }
+    )
+
+    assert pack_deferral_defaults(pack) == {
+        ("young", "low"): 0.04,
+        ("senior", "executive"): 0.06,
+    }
+    assert pack_deferral_defaults(SimpleNamespace(seed_files={})) is None
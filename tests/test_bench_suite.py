@@ -0,0 +1,174 @@
+"""Tests for the scale benchmark suite.
+
+Simulations are replaced by a fake executor that writes the run trace a real
+``planalign simulate --trace`` would, so case plumbing, trace metrics, skip
+rules, scaling flags and baseline comparison run without dbt.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from planalign_bench import (
+    BenchmarkResult,
+    analyse_scaling,
+    build_cases,
+    compare_to_baseline,
+    default_profile,
+    load_report,
+    run_benchmark,
+    write_report,
+)
+from planalign_orchestrator.monitoring.sampler import ResourceSampler
+from planalign_orchestrator.monitoring.tracing import RunTracer, trace_path_for
+
+pytestmark = [pytest.mark.fast]
+
+
+class FakeSimulate:
+    """Records commands and writes a trace sized by the census in the config."""
+
+    def __init__(self, fail_from: int | None = None):
+        self.fail_from = fail_from
+        self.commands: list[list[str]] = []
+
+    def __call__(self, command, env, log_path, timeout):
+        self.commands.append(command)
+        assert env["PLANALIGN_ENTRY_POINT"] == "perf_harness"
+        config = yaml.safe_load(
+            Path(command[command.index("--config") + 1]).read_text()
+        )
+        employees = int(Path(config["setup"]["census_parquet_path"]).name.split("_")[1])
+        if self.fail_from is not None and employees >= self.fail_from:
+            return 1
+        years = range(
+            config["simulation"]["start_year"], config["simulation"]["end_year"] + 1
+        )
+        database = Path(command[command.index("--database") + 1])
+        tracer = RunTracer(trace_path_for(database), ResourceSampler(interval=0.05))
+        with tracer.span("simulation", "run") as run:
+            for year in years:
+                with tracer.span("EVENT_GENERATION", "stage", stage="EVENT_GENERATION"):
+                    with tracer.span("dbt run", "dbt_invocation"):
+                        pass
+        tracer.finish()
+        run.tree_cpu_seconds = employees / 1_000
+        run.peak_tree_rss_mb = 200 + employees / 100
+        tracer.write_chrome_trace()
+        return 0
+
+
+@pytest.fixture
+def base_config(tmp_path):
+    path = tmp_path / "base.yaml"
+    path.write_text(
+        yaml.safe_dump({"simulation": {"start_year": 2025, "end_year": 2027}})
+    )
+    return path
+
+
+def _result(employees, years, wall, rss=500.0):
+    return BenchmarkResult(
+        employees, years, "ok", wall_seconds=wall, cpu_seconds=wall, peak_rss_mb=rss
+    )
+
+
+def test_cases_grow_size_within_each_horizon():
+    cases = build_cases([1_000, 100], [5, 1])
+
+    assert [c.case_id for c in cases] == ["100x1y", "1000x1y", "100x5y", "1000x5y"]
+
+
+def test_run_benchmark_reads_metrics_from_the_trace(tmp_path, base_config):
+    fake = FakeSimulate()
+
+    report = run_benchmark(
+        build_cases([200, 400], [1, 2]),
+        profile=default_profile(),
+        config_path=base_config,
+        workdir=tmp_path / "bench",
+        start_year=2025,
+        executor=fake,
+    )
+
+    assert [r.status for r in report.results] == ["ok"] * 4
+    two_years = report.results[-1]
+    assert two_years.dbt_invocations == 2
+    assert two_years.cpu_seconds == pytest.approx(0.4)
+    assert two_years.peak_rss_mb == pytest.approx(204)
+    assert set(two_years.stage_seconds) == {"EVENT_GENERATION"}
+    assert "2025-2026" in fake.commands[-1] and "--trace" in fake.commands[-1]
+    # One census per size, shared across horizons.
+    assert len(list((tmp_path / "bench").glob("census_*.parquet"))) == 2
+    config = yaml.safe_load((tmp_path / "bench" / "400x2y" / "config.yaml").read_text())
+    assert config["setup"]["plan_year_end_date"] == "2024-12-31"
+    assert config["simulation"]["end_year"] == 2026
+
+
+def test_larger_sizes_are_skipped_after_a_failure(tmp_path, base_config):
+    report = run_benchmark(
+        build_cases([100, 200, 300], [1]),
+        profile=default_profile(),
+        config_path=base_config,
+        workdir=tmp_path / "bench",
+        start_year=2025,
+        executor=FakeSimulate(fail_from=200),
+    )
+
+    assert [r.status for r in report.results] == ["ok", "failed", "skipped"]
+    assert report.results[1].error.startswith("exit code 1")
+
+
+def test_superlinear_scaling_is_flagged():
+    results = [
+        _result(10_000, 1, 10.0),
+        _result(100_000, 1, 100.0),
+        _result(1_000_000, 1, 3_000.0),
+        _result(10_000, 5, 45.0),
+    ]
+
+    findings = analyse_scaling(results)
+    wall = {
+        (f.dimension, f.lower, f.upper): f
+        for f in findings
+        if f.metric == "wall_seconds"
+    }
+
+    assert wall[("employees", 10_000, 100_000)].exponent == pytest.approx(1.0)
+    assert not wall[("employees", 10_000, 100_000)].superlinear
+    assert wall[("employees", 100_000, 1_000_000)].superlinear
+    assert not wall[("years", 1, 5)].superlinear
+    assert not any(f.superlinear for f in findings if f.metric == "peak_rss_mb")
+
+
+def test_report_round_trips_and_compares_to_a_baseline(tmp_path):
+    from planalign_bench.suite import BenchmarkReport
+
+    baseline = BenchmarkReport(
+        generated_at="2026-01-01T00:00:00+00:00",
+        planalign_version="test",
+        environment={},
+        profile_source="default",
+        start_year=2025,
+        seed=42,
+        results=[_result(10_000, 1, 10.0), _result(100_000, 1, 100.0)],
+    )
+    baseline.scaling = analyse_scaling(baseline.results)
+    loaded = load_report(write_report(baseline, tmp_path / "baseline.json"))
+    current = BenchmarkReport(
+        **{
+            **loaded.__dict__,
+            "results": [_result(10_000, 1, 10.5), _result(100_000, 1, 140.0)],
+        }
+    )
+
+    assert loaded == baseline
+    regressions = compare_to_baseline(current, loaded)
+    assert {(r.case_id, r.metric) for r in regressions} == {
+        ("100000x1y", "wall_seconds"),
+        ("100000x1y", "cpu_seconds"),
+    }
+    assert regressions[0].ratio == pytest.approx(1.4)
@@ -34,7 +34,7 @@ def _create_snapshot_table(conn: duckdb.DuckDBPyConnection) -> None:
 
 
 def _create_events_table(conn: duckdb.DuckDBPyConnection) -> None:
-    """Create fct_yearly_events table (needed by _load_scenario_data)."""
+    """Create fct_yearly_events table (read by the event comparison)."""
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS fct_yearly_events (
@@ -0,0 +1,162 @@
+"""Adaptive ensembles stop early once bands and threshold verdicts converge."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from planalign_ensemble.adaptive import ConvergenceMonitor, wave_sizes
+from planalign_ensemble.models import (
+    AdaptiveStopping,
+    EnsembleSpec,
+    MetricSeedValue,
+    Threshold,
+)
+from planalign_ensemble.planner import plan_ensemble
+from planalign_ensemble.runner import run_ensemble
+
+
+def _values(seeds: range, value_of) -> list[MetricSeedValue]:
+    return [
+        MetricSeedValue(
+            ensemble_id="ens",
+            scenario_id="s",
+            metric="total_compensation",
+            simulation_year=2027,
+            seed=seed,
+            value=value_of(seed),
+        )
+        for seed in seeds
+    ]
+
+
+def _write_seed_snapshot(database: Path, value: float) -> None:
+    database.parent.mkdir(parents=True, exist_ok=True)
+    with duckdb.connect(str(database)) as conn:
+        conn.execute(
+            "CREATE TABLE fct_workforce_snapshot (simulation_year INTEGER, "
+            "employment_status VARCHAR, prorated_annual_compensation DOUBLE)"
+        )
+        conn.execute(
+            "INSERT INTO fct_workforce_snapshot VALUES (2027, 'active', ?)", [value]
+        )
+
+
+@pytest.mark.fast
+def test_first_wave_covers_min_seeds_and_waves_never_exceed_budget() -> None:
+    rule = AdaptiveStopping(wave_size=3)
+
+    assert list(wave_sizes(rule, budget=20, min_seeds=5, workers=8)) == [
+        5,
+        3,
+        3,
+        3,
+        3,
+        3,
+    ]
+    assert list(wave_sizes(AdaptiveStopping(), budget=7, min_seeds=2, workers=4)) == [
+        4,
+        3,
+    ]
+
+
+@pytest.mark.fast
+def test_monitor_requires_consecutive_stable_waves() -> None:
+    monitor = ConvergenceMonitor(
+        AdaptiveStopping(stable_waves=2),
+        min_seeds=4,
+        seed_budget=100,
+        thresholds=(Threshold(metric="total_compensation", value=100.0),),
+    )
+
+    first = monitor.update(_values(range(4), lambda _: 100.0), seeds_run=4)
+    second = monitor.update(_values(range(8), lambda _: 100.0), seeds_run=8)
+    third = monitor.update(_values(range(12), lambda _: 100.0), seeds_run=12)
+
+    assert (first.converged, first.reason) == (False, "first wave")
+    assert (second.converged, second.stable_waves) == (False, 1)
+    assert third.converged and third.seeds_run == 12
+
+
+@pytest.mark.fast
+def test_monitor_resets_when_a_band_or_probability_moves() -> None:
+    monitor = ConvergenceMonitor(
+        AdaptiveStopping(stable_waves=1),
+        min_seeds=2,
+        seed_budget=6,
+        thresholds=(Threshold(metric="total_compensation", value=100.0),),
+    )
+
+    monitor.update(_values(range(2), lambda _: 100.0), seeds_run=2)
+    moved = monitor.update(
+        _values(range(4), lambda seed: 100.0 if seed < 2 else 150.0), seeds_run=4
+    )
+    exhausted = monitor.update(
+        _values(range(6), lambda seed: 100.0 if seed < 2 else 150.0 + seed),
+        seeds_run=6,
+    )
+
+    assert not moved.converged and "band moved" in moved.reason
+    assert not exhausted.converged
+    assert exhausted.reason.startswith("seed budget exhausted")
+
+
+@pytest.mark.fast
+def test_monitor_can_require_a_narrow_mean_interval() -> None:
+    monitor = ConvergenceMonitor(
+        AdaptiveStopping(stable_waves=1, max_relative_ci_width=0.01),
+        min_seeds=2,
+        seed_budget=10,
+    )
+
+    decision = monitor.update(
+        _values(range(4), lambda seed: 100.0 + 10 * seed), seeds_run=4
+    )
+
+    assert "CI width" in decision.reason
+
+
+@pytest.mark.integration
+def test_adaptive_ensemble_stops_early_and_records_the_seeds_run(
+    tmp_path, monkeypatch
+) -> None:
+    plan = plan_ensemble(
+        EnsembleSpec(
+            scenario_id="adaptive",
+            seed_count=40,
+            start_year=2027,
+            end_year=2027,
+            min_seeds=4,
+            adaptive=AdaptiveStopping(wave_size=4, stable_waves=2),
+        ),
+        output_root=tmp_path,
+    )
+    executed: list[int] = []
+
+    import planalign_ensemble.runner as runner
+
+    def fake_seed_worker(job):
+        executed.append(job.seed)
+        _write_seed_snapshot(job.db_path, 1000.0 + (job.seed % 2))
+        return {"config_fingerprint": "fixture"}
+
+    monkeypatch.setattr(runner, "run_seed_worker", fake_seed_worker)
+
+    result = run_ensemble(plan, parallel=1, config=object())
+
+    assert result.stopping is not None and result.stopping.converged
+    assert len(executed) == result.stopping.seeds_run == 12
+    assert result.plan.seeds == plan.seeds[:12]
+    assert not any(path.exists() for path in list(plan.seed_db_paths.values())[12:])
+    assert all(d.n_seeds_requested == 12 for d in result.distributions)
+    with duckdb.connect(str(plan.ensemble_db_path), read_only=True) as conn:
+        seed_list, seed_count, stopping = conn.execute(
+            "SELECT ensemble_seed_list, ensemble_seed_count, ensemble_stopping_rule "
+            "FROM run_metadata"
+        ).fetchone()
+    assert json.loads(seed_list) == list(plan.seeds[:12])
+    assert seed_count == 12
+    assert json.loads(stopping)["seed_budget"] == 40
@@ -4,11 +4,15 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from planalign_ensemble.attribution import (
+    _BOOTSTRAP_ITERATIONS,
     _AnchorObservation,
+    _bootstrap_cis,
     _combine_anchor_observations,
+    _stable_seed,
     calculate_variance_shares,
     not_stochastic_shares,
     resolve_baselines,
@@ -251,6 +255,58 @@ def test_bootstrap_ci_is_deterministic_across_repeated_calls() -> None:
     assert first.ci_high == second.ci_high
 
 
+def _replicate_by_replicate_ci(key, subsystem, observations):
+    """The per-replicate loop the batched bootstrap must reproduce exactly."""
+    rng = np.random.default_rng(_stable_seed(key, subsystem))
+    means = []
+    for _ in range(_BOOTSTRAP_ITERATIONS):
+        shares = []
+        for observation in observations:
+            n = len(observation.baseline_values)
+            indices = rng.integers(0, n, size=n)
+            baseline = np.var(np.asarray(observation.baseline_values)[indices], ddof=1)
+            frozen = np.var(np.asarray(observation.frozen_values)[indices], ddof=1)
+            if baseline != 0.0:
+                shares.append(1.0 - frozen / baseline)
+        if shares:
+            means.append(float(np.mean(shares)))
+    low, high = np.percentile(means, [2.5, 97.5])
+    return float(low), float(high), _BOOTSTRAP_ITERATIONS
+
+
+@pytest.mark.fast
+def test_batched_bootstrap_matches_per_key_replicate_loop() -> None:
+    """Batching keys of mixed shapes keeps each key's own seeded stream."""
+    rng = np.random.default_rng(7)
+
+    def anchor(seed: int, n: int, constant: bool = False) -> _AnchorObservation:
+        baseline = np.ones(n) if constant else rng.normal(100.0, 5.0, n)
+        return _AnchorObservation(
+            anchor_seed=seed,
+            baseline_values=tuple(baseline),
+            frozen_values=tuple(baseline * rng.uniform(0.2, 1.0, n)),
+        )
+
+    items = [
+        (("total_employer_plan_cost", 2029), Subsystem.HIRING, [anchor(1, 6)]),
+        (
+            ("participation_rate", 2030),
+            Subsystem.TERMINATION,
+            [anchor(1, 6), anchor(2, 9)],
+        ),
+        (
+            ("total_employer_plan_cost", 2030),
+            Subsystem.HIRING,
+            [anchor(1, 6, constant=True), anchor(2, 9)],
+        ),
+    ]
+
+    batched = _bootstrap_cis(items)
+
+    assert batched == [_replicate_by_replicate_ci(*item) for item in items]
+    assert _bootstrap_cis(items[1:2]) == batched[1:2]
+
+
 @pytest.mark.fast
 def test_enrollment_and_merit_are_structurally_not_stochastic() -> None:
     """No random draw must never be rendered as a measured zero contribution."""
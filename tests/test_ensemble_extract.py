@@ -5,7 +5,11 @@ from __future__ import annotations
 import duckdb
 import pytest
 
-from planalign_ensemble.extract import extract_seed_metrics
+from planalign_ensemble.extract import (
+    attach_batch_size,
+    extract_completed_outcomes,
+    extract_seed_metrics,
+)
 from planalign_ensemble.models import (
     CANONICAL_METRICS,
     METRIC_REGISTRY,
@@ -84,3 +88,48 @@ def test_canonical_metric_registry_is_stable_and_complete() -> None:
         "participation_status",
     )
     assert METRIC_REGISTRY["avg_deferral_rate"].null_excludes_population is True
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("batch_size", [1, 2, 64])
+def test_batched_extraction_matches_per_seed_reads(tmp_path, batch_size) -> None:
+    """Attach batches reproduce the serial per-seed values in seed order."""
+    outcomes = []
+    for seed in (7, 3, 11):
+        database = tmp_path / f"seed_{seed}.duckdb"
+        _write_snapshot(database, include_plan_cost=seed != 3)
+        with duckdb.connect(str(database)) as conn:
+            conn.execute(
+                "UPDATE fct_workforce_snapshot "
+                "SET prorated_annual_compensation = prorated_annual_compensation + ?",
+                [seed],
+            )
+        outcomes.append(SeedRunOutcome(seed=seed, db_path=database, status="completed"))
+    outcomes.append(
+        SeedRunOutcome(seed=5, db_path=tmp_path / "missing.duckdb", status="failed")
+    )
+    empty = tmp_path / "seed_9.duckdb"
+    duckdb.connect(str(empty)).close()
+    outcomes.append(SeedRunOutcome(seed=9, db_path=empty, status="completed"))
+
+    expected = []
+    for outcome in sorted(outcomes, key=lambda item: item.seed):
+        expected.extend(
+            extract_seed_metrics(outcome, ensemble_id="ens", scenario_id="baseline")
+        )
+    actual = extract_completed_outcomes(
+        outcomes, ensemble_id="ens", scenario_id="baseline", batch_size=batch_size
+    )
+
+    assert actual == expected
+    plan_cost = {
+        value.seed: value.value
+        for value in actual
+        if value.metric == "total_employer_plan_cost"
+    }
+    assert plan_cost == {3: None, 7: 45.0, 11: 45.0}
+
+
+@pytest.mark.fast
+def test_attach_batch_size_is_bounded() -> None:
+    assert 1 <= attach_batch_size() <= 64
@@ -0,0 +1,123 @@
+"""Publish-time evidence summary: identical packs, safe fallback."""
+
+import json
+
+import duckdb
+import pytest
+
+from planalign_api.services.simulation.evidence_summary import (
+    precompute_published_evidence,
+)
+from planalign_ensemble.models import CANONICAL_METRICS
+from planalign_evidence import summary
+from planalign_evidence.service import EvidenceTarget, build_evidence_pack
+from planalign_evidence.summary import (
+    SUMMARY_FILENAME,
+    SUMMARY_MANIFEST_FILENAME,
+    load_evidence_summary,
+    precompute_evidence_summary,
+)
+from tests.fixtures.evidence_pack import create_evidence_scenario
+
+
+THREE_YEARS = (
+    ("a", 2025, "active", 100, 5, 8, "participating", 0.05),
+    ("b", 2025, "active", 200, 0, 4, "not_participating", 0),
+    ("a", 2026, "active", 105, 5, 9, "participating", 0.05),
+    ("c", 2026, "active", 90, 4, 6, "participating", 0.04),
+    ("a", 2027, "active", 110, 6, 10, "participating", 0.06),
+    ("c", 2027, "terminated", 45, 2, 3, "participating", 0.04),
+    ("d", 2027, "active", 150, 8, 12, "not_participating", 0),
+)
+
+
+@pytest.fixture
+def scenario(tmp_path):
+    return create_evidence_scenario(tmp_path, rows=THREE_YEARS)
+
+
+def _target(scenario, run_id=None):
+    return EvidenceTarget(
+        scenario.database_path,
+        scenario.result_store,
+        scenario.scenario_id,
+        run_id or scenario.run_id,
+        scenario.workspace_id,
+        "Evidence Scenario",
+        run_dir=scenario.run_dir,
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("metric", CANONICAL_METRICS)
+def test_precomputed_packs_equal_live_packs_for_every_pair(scenario, metric) -> None:
+    target = _target(scenario)
+    pairs = ((2025, 2026), (2025, 2027), (2026, 2027))
+    live = {pair: build_evidence_pack(target, metric, *pair) for pair in pairs}
+
+    manifest = precompute_evidence_summary(target)
+
+    assert manifest["years"] == [2025, 2026, 2027]
+    assert manifest["metrics"] == list(CANONICAL_METRICS)
+    precomputed = load_evidence_summary(target)
+    assert precomputed.columns == target.inspect().columns
+    for (base_year, target_year), pack in live.items():
+        assert precomputed.row(metric, base_year, target_year)
+        assert build_evidence_pack(target, metric, base_year, target_year) == pack
+
+
+@pytest.mark.fast
+def test_packs_read_the_summary_instead_of_the_snapshot(scenario) -> None:
+    target = _target(scenario)
+    precompute_evidence_summary(target)
+    with duckdb.connect(str(scenario.database_path)) as connection:
+        connection.execute(
+            "UPDATE fct_workforce_snapshot SET employer_match_amount = 0"
+        )
+
+    pack = build_evidence_pack(target, "employer_match_cost", 2025, 2027)
+
+    assert pack.change.target_value.value == "16"
+
+
+@pytest.mark.fast
+def test_summaries_for_another_run_or_format_are_ignored(scenario, monkeypatch) -> None:
+    target = _target(scenario)
+    precompute_evidence_summary(target)
+    assert load_evidence_summary(target).row("active_headcount", 2025, 2030) is None
+
+    other = _target(scenario, run_id="00000000-0000-0000-0000-000000000999")
+    assert load_evidence_summary(other) is None
+    monkeypatch.setattr(summary, "SUMMARY_FORMAT_VERSION", 2)
+    assert load_evidence_summary(target) is None
+
+
+@pytest.mark.fast
+def test_manifest_without_its_parquet_is_a_cache_miss(scenario) -> None:
+    target = _target(scenario)
+    precompute_evidence_summary(target)
+    (scenario.run_dir / SUMMARY_FILENAME).unlink()
+
+    assert (scenario.run_dir / SUMMARY_MANIFEST_FILENAME).exists()
+    assert load_evidence_summary(target) is None
+    live = build_evidence_pack(target, "employer_match_cost", 2025, 2027)
+    assert live.change.target_value.value == "16"
+
+
+@pytest.mark.fast
+def test_publish_job_is_optional_and_best_effort(scenario, caplog) -> None:
+    args = (scenario.run_dir, scenario.scenario_id, scenario.run_id)
+
+    precompute_published_evidence(*args, {"storage": {"evidence_summary": False}})
+    assert not (scenario.run_dir / SUMMARY_FILENAME).exists()
+
+    precompute_published_evidence(*args, {})
+    manifest = json.loads(
+        (scenario.run_dir / SUMMARY_MANIFEST_FILENAME).read_text(encoding="utf-8")
+    )
+    assert manifest["run_id"] == scenario.run_id
+    assert manifest["rows"] > 0
+
+    scenario.database_path.write_bytes(b"not a database")
+    precompute_published_evidence(*args, {})
+    assert "Evidence precomputation failed" in caplog.text
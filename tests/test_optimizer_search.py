@@ -188,3 +188,78 @@ def test_exact_duplicates_do_not_consume_budget(monkeypatch, tmp_path: Path) ->
     assert len(_FailedPool.submitted) == 2
     assert run.candidates[1].is_duplicate_of == "candidate-0000"
     assert run.candidates[2].is_duplicate_of is None
+
+
+class _OutOfOrderPool:
+    """Incremental pool double that finishes outstanding jobs newest-first."""
+
+    newest_first = True
+    released_while_busy = 0
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+
+    def run_incremental(self, worker, jobs, next_jobs, *, on_event=None):
+        pending, results = list(jobs), {}
+        while pending:
+            job = pending.pop() if self.newest_first else pending.pop(0)
+            results[job.name] = JobResult(name=job.name, status="failed")
+            released = next_jobs(results[job.name])
+            if released and pending:
+                type(self).released_while_busy += len(released)
+            pending.extend(released)
+        return results
+
+
+class _FirstInFirstOutPool(_OutOfOrderPool):
+    newest_first = False
+
+
+def test_incremental_search_is_independent_of_completion_order(
+    tmp_path: Path,
+) -> None:
+    baseline = load_simulation_config(
+        "config/simulation_config.yaml", env_overrides=False
+    )
+    runs = [
+        run_optimizer(
+            _optimizer_spec(),
+            baseline,
+            max_runs=12,
+            search_seed=5,
+            database_dir=tmp_path / name,
+            pool_factory=pool,
+            search_window=3,
+        )[0]
+        for name, pool in (
+            ("batch", _FailedPool),
+            ("newest", _OutOfOrderPool),
+            ("oldest", _FirstInFirstOutPool),
+        )
+    ]
+
+    expected = [c.lever_values for c in runs[0].candidates]
+    assert all([c.lever_values for c in run.candidates] == expected for run in runs)
+    assert len([c for c in runs[1].candidates if c.is_duplicate_of is None]) == 12
+
+
+def test_refinements_are_released_before_the_seed_phase_finishes(
+    tmp_path: Path,
+) -> None:
+    baseline = load_simulation_config(
+        "config/simulation_config.yaml", env_overrides=False
+    )
+    _FirstInFirstOutPool.released_while_busy = 0
+    run, _ = run_optimizer(
+        _optimizer_spec(),
+        baseline,
+        max_runs=10,
+        search_seed=5,
+        database_dir=tmp_path,
+        pool_factory=_FirstInFirstOutPool,
+        search_window=2,
+    )
+
+    # Every refinement is queued while earlier candidates are still running.
+    assert _FirstInFirstOutPool.released_while_busy == 4
+    assert len([c for c in run.candidates if c.is_duplicate_of is None]) == 10
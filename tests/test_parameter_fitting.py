@@ -26,9 +26,10 @@ from planalign_fit import (
     verify_pack,
     write_pack,
 )
+from planalign_fit import bootstrap
 from planalign_fit.apply import apply_pack
 from planalign_fit.hazards import termination_level_factor
-from planalign_fit.ipf import FactorCell, solve
+from planalign_fit.ipf import FactorCell, FactorTable, solve, solve_batch
 from planalign_fit.models import PromotionBasis
 from planalign_fit.pack import PackError
 from planalign_fit.promotion import classify
@@ -301,6 +302,61 @@ class TestIPFSolver:
         assert solution.base == 0.0
         assert solution.converged
 
+    def test_batch_returns_exactly_what_each_table_fits_alone(self):
+        rows, cols = ["a", "b", "c"], ["x", "y"]
+        tables = [
+            FactorTable.from_cells(
+                [
+                    FactorCell(
+                        row=row,
+                        col=col,
+                        exposure=100.0 + 37 * i + 11 * j + k,
+                        events=(5.0 + (i * 7 + j * 3 + k) % 11) * (k != 2 or i),
+                        offset=1.0 - 0.1 * k,
+                    )
+                    for i, row in enumerate(rows)
+                    for j, col in enumerate(cols)
+                ],
+                rows,
+                cols,
+            )
+            for k in range(4)
+        ]
+        tables.append(FactorTable.from_cells([], rows, cols))
+
+        batched = solve_batch(tables, normalize="col")
+
+        assert batched == [solve(table, normalize="col") for table in tables]
+        assert len({solution.iterations for solution in batched[:-1]}) > 1
+        assert batched[-1].base == 0.0 and batched[-1].converged
+
+    def test_unfitted_labels_keep_a_multiplier_of_one(self):
+        cells = [
+            FactorCell(row="a", col="x", exposure=1_000.0, events=100.0),
+            FactorCell(row="b", col="x", exposure=1_000.0, events=50.0),
+            FactorCell(row="legacy", col="x", exposure=1_000.0, events=300.0),
+        ]
+
+        table = FactorTable.from_cells(cells, ["a", "b"], ["x"])
+        solution = solve(table, normalize="none")
+
+        assert table.rows == ("a", "b", "legacy")
+        assert set(solution.row_multipliers) == {"a", "b"}
+        assert solution.base * solution.col_multipliers["x"] == pytest.approx(0.3)
+        assert table.exposure_by("row") == {"a": 1e3, "b": 1e3, "legacy": 1e3}
+
+    def test_replicates_share_codes_and_reject_a_shape_change(self):
+        table = FactorTable.from_cells(
+            [FactorCell(row="a", col="x", exposure=100.0, events=10.0)], ["a"], ["x"]
+        )
+
+        replicate = table.with_counts([200.0], [10.0])
+
+        assert solve(replicate, normalize="none").base == pytest.approx(0.05)
+        assert replicate.row_codes is table.row_codes
+        with pytest.raises(ValueError, match="expected 1 cells"):
+            table.with_counts([1.0, 2.0], [0.0, 0.0])
+
 
 class TestSnapshotValidation:
     """Bad snapshot directories fail loudly, before any fitting happens."""
@@ -577,6 +633,71 @@ class TestReport:
         assert json.loads(payload)["fingerprint"] == fit_run.pack.manifest.fingerprint
 
 
+class TestBootstrap:
+    """Employee-resampled refits attach percentile intervals to every value."""
+
+    @pytest.fixture(scope="class")
+    def small_history(self, tmp_path_factory: pytest.TempPathFactory):
+        directory = tmp_path_factory.mktemp("bootstrap-census")
+        return generate_history(directory / "snapshots", headcount=1_200, years=3)
+
+    def test_intervals_cover_every_fitted_value_without_moving_the_pack(
+        self, small_history
+    ):
+        point = fit_parameter_pack(small_history.directory, FitOptions())
+        run = fit_parameter_pack(
+            small_history.directory,
+            FitOptions(bootstrap_replicates=6, bootstrap_seed=11, parallel=1),
+        )
+
+        assert run.pack.manifest.fingerprint == point.pack.manifest.fingerprint
+        assert run.result.bootstrap is not None
+        for value in run.result.all_fitted():
+            lower, upper = value.interval
+            assert lower <= upper
+        uncertainty = run.pack.manifest.uncertainty
+        assert uncertainty["replicates"] == 6 and uncertainty["seed"] == 11
+        assert set(uncertainty["intervals"]) == {
+            value.name for value in run.result.all_fitted()
+        }
+        assert "Bootstrap interval |" in render_fit_report(run)
+        assert "Bootstrap interval" not in render_fit_report(point)
+        assert point.pack.manifest.uncertainty == {}
+
+    def test_replicates_are_reproducible_and_independent_of_chunking(
+        self, small_history, monkeypatch
+    ):
+        options = FitOptions(bootstrap_replicates=4, bootstrap_seed=3, parallel=1)
+        with duckdb.connect(":memory:") as conn:
+            transitions = build_transitions(
+                conn,
+                load_snapshots(small_history.directory, conn),
+                load_band_definitions(),
+            )
+            source = bootstrap.export_source(
+                transitions, small_history.directory.parent / "bootstrap"
+            )
+        priors = load_priors()
+
+        whole = bootstrap.bootstrap_intervals(transitions, source, priors, options)
+        again = bootstrap.bootstrap_intervals(transitions, source, priors, options)
+        monkeypatch.setattr(bootstrap, "CHUNKS_PER_WORKER", 1)
+        one_chunk = bootstrap.bootstrap_intervals(transitions, source, priors, options)
+
+        assert whole == again == one_chunk
+        assert all(count == 4 for _, _, count in whole.intervals.values())
+
+    def test_summary_is_an_equal_tailed_percentile_interval(self):
+        summary = bootstrap.summarize(
+            {"rate": [float(value) for value in range(101)]},
+            replicates=101,
+            seed=0,
+            level=0.9,
+        )
+
+        assert summary.intervals["rate"] == pytest.approx((5.0, 95.0, 101))
+
+
 class TestSyntheticFixture:
     """The grading harness itself must be gradeable (#511, research.md R-7).
 
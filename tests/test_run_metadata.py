@@ -186,6 +186,8 @@ class TestTableLifecycle:
             "ensemble_member_paths",
             # Issue #543: which anchor seed an attribution_frozen run pinned to.
             "ensemble_frozen_anchor_seed",
+            # Adaptive ensembles: the stopping rule and why it stopped.
+            "ensemble_stopping_rule",
         }
 
     def test_second_stamp_appends_and_retains_first(self, db_manager, minimal_config):
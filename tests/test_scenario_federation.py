@@ -0,0 +1,111 @@
+"""Tests for the federated multi-scenario DuckDB session."""
+
+from unittest.mock import MagicMock
+
+import duckdb
+import pytest
+
+from planalign_api.services.comparison_service import ComparisonService
+from planalign_api.services.database_path_resolver import ResolvedDatabasePath
+from planalign_api.services.scenario_federation import ScenarioFederation
+
+
+def _write_database(path, rows, with_compensation=True):
+    columns = "employee_id VARCHAR, simulation_year INTEGER, employment_status VARCHAR"
+    if with_compensation:
+        columns += ", prorated_annual_compensation DOUBLE"
+    with duckdb.connect(str(path)) as conn:
+        conn.execute(f"CREATE TABLE fct_workforce_snapshot ({columns})")
+        placeholders = ", ".join("?" * (4 if with_compensation else 3))
+        for row in rows:
+            conn.execute(
+                f"INSERT INTO fct_workforce_snapshot VALUES ({placeholders})",
+                list(row if with_compensation else row[:3]),
+            )
+    return path
+
+
+def _resolver(paths):
+    resolver = MagicMock()
+    resolver.resolve.side_effect = lambda workspace_id, scenario_id: (
+        ResolvedDatabasePath(path=str(paths[scenario_id]), source="scenario")
+        if scenario_id in paths
+        else ResolvedDatabasePath(path=None, source="scenario")
+    )
+    return resolver
+
+
+@pytest.fixture
+def databases(tmp_path):
+    return {
+        "baseline": _write_database(
+            tmp_path / "baseline.duckdb",
+            [("E1", 2025, "active", 100.0), ("E2", 2025, "active", 50.0)],
+        ),
+        "legacy": _write_database(
+            tmp_path / "legacy.duckdb",
+            [("E1", 2025, "active", None)],
+            with_compensation=False,
+        ),
+    }
+
+
+@pytest.mark.fast
+def test_union_tags_rows_and_fills_missing_columns(databases):
+    federation = ScenarioFederation.for_scenarios(
+        _resolver(databases), "ws", ["baseline", "legacy", "gone"]
+    )
+
+    with federation:
+        included = federation.union(
+            "fct_workforce_snapshot", ["employee_id", "prorated_annual_compensation"]
+        )
+        rows = federation.connection.execute(
+            "SELECT scenario_id, SUM(prorated_annual_compensation), COUNT(*) "
+            "FROM fct_workforce_snapshot GROUP BY 1 ORDER BY 1"
+        ).fetchall()
+        empty = federation.union("fct_yearly_events", ["event_type"])
+        events = federation.connection.execute(
+            "SELECT COUNT(*) FROM fct_yearly_events"
+        ).fetchone()
+
+    assert included == ["baseline", "legacy"]
+    assert federation.missing == ["gone"]
+    assert rows == [("baseline", 150.0, 2), ("legacy", None, 1)]
+    assert empty == [] and events == (0,)
+
+
+@pytest.mark.fast
+def test_shared_database_is_attached_once_and_usable_per_scenario(databases):
+    paths = {"a": databases["baseline"], "b": databases["baseline"]}
+
+    with ScenarioFederation(paths) as federation:
+        federation.union("fct_workforce_snapshot", ["employee_id"])
+        attached = federation.connection.execute(
+            "SELECT COUNT(*) FROM duckdb_databases() WHERE database_name LIKE 'scenario_%'"
+        ).fetchone()
+        by_scenario = federation.connection.execute(
+            "SELECT scenario_id, COUNT(*) FROM fct_workforce_snapshot "
+            "GROUP BY 1 ORDER BY 1"
+        ).fetchall()
+        with federation.use("b") as conn:
+            local = conn.execute(
+                "SELECT COUNT(*) FROM fct_workforce_snapshot"
+            ).fetchone()
+
+    assert attached == (1,)
+    assert by_scenario == [("a", 2), ("b", 2)]
+    assert local == (2,)
+
+
+@pytest.mark.fast
+def test_comparison_needs_the_baseline_database(databases):
+    service = ComparisonService(storage=MagicMock(), db_resolver=_resolver(databases))
+
+    assert service.compare_scenarios("ws", ["gone", "baseline"], "gone") is None
+    result = service.compare_scenarios("ws", ["baseline", "legacy"], "baseline")
+
+    year = result.workforce_comparison[0]
+    assert year.values["baseline"].avg_compensation == 75.0
+    assert year.values["legacy"].avg_compensation == 0.0
+    assert year.deltas["legacy"].headcount == -1
@@ -400,3 +400,111 @@ class TestSyncModelsValidation:
                 operation="invalid-op",
                 message="Test",
             )
+
+
+class TestSyncManifestRules:
+    """Test which paths the change manifest treats as syncable."""
+
+    def test_generated_run_artifacts_are_excluded(self):
+        from planalign_api.services.sync_manifest import is_syncable
+
+        run = "ws/scenarios/sc/runs/r1"
+        assert is_syncable("ws/workspace.json")
+        assert is_syncable(f"{run}/run_metadata.json")
+        assert is_syncable(f"{run}/config.yaml")
+        assert not is_syncable(f"{run}/dbt_project/dbt_project.yml")
+        assert not is_syncable(f"{run}/dbt_project/target/manifest.json")
+        assert not is_syncable(f"{run}/archive.json")
+        assert not is_syncable(f"{run}/simulation.trace.json")
+        assert not is_syncable(f"{run}/evidence_summary.json")
+        assert not is_syncable(f"{run}/archive/fct_workforce_snapshot.parquet")
+        assert not is_syncable("ws/.exports/abc.json")
+        assert not is_syncable("ws/scenarios/sc/simulation.duckdb")
+        for database_dir in ("ws", "ws/scenarios/sc", run):
+            ledger = f"{database_dir}/simulation.payroll_ledger"
+            assert not is_syncable(f"{ledger}/payroll_ledger_2025.json")
+            assert not is_syncable(f"{ledger}/payroll_ledger_2025.parquet")
+        assert is_syncable(".gitignore", always_synced=(".gitignore",))
+
+
+class TestSyncAgainstLocalRemote:
+    """Test init/status/push end to end against a local bare repository."""
+
+    @pytest.fixture
+    def remote_dir(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Repo.init(tmpdir, bare=True)
+            yield Path(tmpdir)
+
+    def _remote_files(self, remote_dir):
+        tree = Repo(remote_dir).commit("main").tree
+        return {item.path for item in tree.traverse() if item.type == "blob"}
+
+    def test_push_syncs_metadata_and_skips_run_artifacts(
+        self, sync_service, sample_workspace, remote_dir
+    ):
+        status = sync_service.init(remote_url=str(remote_dir), branch="main")
+        assert status.local_changes == 0
+
+        run_dir = sample_workspace / "scenarios" / "test-scenario-456" / "runs" / "r1"
+        (run_dir / "dbt_project" / "target").mkdir(parents=True)
+        (run_dir / "dbt_project" / "target" / "manifest.json").write_text("{}")
+        (run_dir / "dbt_project" / "models").symlink_to(sample_workspace)
+        (run_dir / "run_metadata.json").write_text("{}")
+        assert sync_service.get_status().local_changes == 1
+
+        result = sync_service.push()
+        assert result.success, result.message
+        files = self._remote_files(remote_dir)
+        assert "test-workspace-123/workspace.json" in files
+        assert (
+            "test-workspace-123/scenarios/test-scenario-456/runs/r1/run_metadata.json"
+            in files
+        )
+        assert not any("dbt_project" in path for path in files)
+        assert ".planalign-sync-log.json" not in files
+
+        assert sync_service.push().files_pushed == 0
+
+    def test_push_skips_payroll_ledger_cache(
+        self, sync_service, sample_workspace, remote_dir
+    ):
+        sync_service.init(remote_url=str(remote_dir), branch="main")
+        sync_service.push()
+
+        ledger_dir = (
+            sample_workspace / "scenarios" / "test-scenario-456"
+        ) / "simulation.payroll_ledger"
+        ledger_dir.mkdir()
+        (ledger_dir / "payroll_ledger_2025.parquet").write_bytes(b"PAR1")
+        (ledger_dir / "payroll_ledger_2025.json").write_text("{}")
+        (sample_workspace / "base_config.yaml").write_text("simulation: {}\n")
+        assert sync_service.get_status().local_changes == 1
+
+        assert sync_service.push().files_pushed == 1
+        assert not any(
+            "payroll_ledger" in path for path in self._remote_files(remote_dir)
+        )
+
+    def test_status_and_push_follow_the_manifest(
+        self, sync_service, sample_workspace, remote_dir
+    ):
+        sync_service.init(remote_url=str(remote_dir), branch="main")
+        sync_service.push()
+
+        (sample_workspace / "base_config.yaml").write_text("simulation: {}\n")
+        (
+            sample_workspace / "scenarios" / "test-scenario-456" / "scenario.json"
+        ).unlink()
+        assert sync_service.get_status().local_changes == 2
+        [info] = sync_service.get_workspace_sync_info()
+        assert info.has_local_changes
+
+        result = sync_service.push()
+        assert result.success and result.files_pushed == 2
+        files = self._remote_files(remote_dir)
+        assert "test-workspace-123/base_config.yaml" in files
+        assert (
+            "test-workspace-123/scenarios/test-scenario-456/scenario.json" not in files
+        )
+        assert sync_service.get_status().local_changes == 0
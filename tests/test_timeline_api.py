@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+import duckdb
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -84,3 +85,51 @@ def test_parameter_bounds_and_read_only_surface(client: TestClient) -> None:
         client.post("/api/workspaces/ws/scenarios/scenario/employees").status_code
         == 405
     )
+
+
+@pytest.fixture
+def ledger_client(tmp_path: Path) -> TestClient:
+    database = tmp_path / "simulation.duckdb"
+    with duckdb.connect(str(database)) as conn:
+        conn.execute(
+            """
+            CREATE TABLE fct_workforce_snapshot AS SELECT * FROM (VALUES
+                ('EMP_A', 2025, DATE '2020-01-01', NULL::DATE, 78000.0),
+                ('EMP_B', 2025, DATE '2021-01-01', NULL::DATE, 52000.0)
+            ) AS t(employee_id, simulation_year, employee_hire_date,
+                   termination_date, current_compensation);
+            CREATE TABLE fct_yearly_events (
+                employee_id VARCHAR, event_type VARCHAR, simulation_year INTEGER,
+                effective_date DATE, compensation_amount DOUBLE,
+                previous_compensation DOUBLE, event_sequence INTEGER
+            );
+            """
+        )
+    storage = _Storage()
+    service = TimelineService(storage, _Resolver(database))  # type: ignore[arg-type]
+    app = FastAPI()
+    app.include_router(router, prefix="/api/workspaces")
+    app.dependency_overrides[get_storage] = lambda: storage
+    app.dependency_overrides[get_timeline_service] = lambda: service
+    return TestClient(app)
+
+
+@pytest.mark.fast
+def test_payroll_ledger_is_built_on_request_and_paged(
+    ledger_client: TestClient, tmp_path: Path
+) -> None:
+    url = "/api/workspaces/ws/scenarios/scenario/payroll-ledger"
+
+    one = ledger_client.get(url, params={"employee_id": "EMP_B", "page_size": 5})
+    assert one.status_code == 200
+    assert one.json()["total"] == 26
+    assert len(one.json()["results"]) == 5
+    assert not (tmp_path / "simulation.payroll_ledger").exists()
+
+    everyone = ledger_client.get(url, params={"year": 2025, "page": 2})
+    assert everyone.status_code == 200
+    assert everyone.json()["total"] == 52
+    assert everyone.json()["results"] == []
+    assert (tmp_path / "simulation.payroll_ledger").is_dir()
+
+    assert ledger_client.get(url, params={"year": 2030}).status_code == 404
@@ -36,6 +36,10 @@ def test_wrapper_delegates_to_canonical_builder(monkeypatch, tmp_path):
     assert spec.dbt_project_dir == tmp_path / "overlay"
     assert spec.initialization is InitializationPolicy.NONE
     assert spec.entry_point == "cli.simulate"
+    assert spec.trace is False
+
+    wrapper.create_orchestrator(threads=1, trace=True)
+    assert captured["spec"].trace is True
 
 
 def test_wrapper_preserves_progress_adapter(monkeypatch, tmp_path):
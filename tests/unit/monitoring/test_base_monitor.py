@@ -126,44 +126,40 @@ class TestPerformanceMonitor:
         assert metrics.error_message == "Test error"
 
     @pytest.mark.fast
-    def test_nested_operations_share_sampler(self, performance_monitor):
-        """Nested run/year operations must not stop each other's sampler."""
-        with patch("planalign_orchestrator.monitoring.base.threading.Thread") as thread:
-            thread_instance = thread.return_value
-            thread_instance.is_alive.return_value = True
-
+    def test_operations_mark_the_shared_sampler_without_threads(
+        self, performance_monitor
+    ):
+        """Operations record marks; only the shared sampler owns a thread."""
+        sampler = performance_monitor._sampler
+        with patch("threading.Thread") as thread, patch.object(
+            sampler, "acquire"
+        ) as acquire, patch.object(sampler, "release") as release:
             with performance_monitor.time_operation("outer"):
-                assert thread.call_count == 1
-                assert len(performance_monitor._active_metrics) == 1
-
                 with performance_monitor.time_operation("inner"):
-                    assert thread.call_count == 1
-                    assert len(performance_monitor._active_metrics) == 2
-
-                assert len(performance_monitor._active_metrics) == 1
-                assert not performance_monitor._stop_event.is_set()
+                    pass
+            with performance_monitor.time_operation("second"):
+                pass
 
-            assert len(performance_monitor._active_metrics) == 0
-            thread_instance.join.assert_not_called()
+            thread.assert_not_called()
+            acquire.assert_called_once()
+            release.assert_not_called()
 
             performance_monitor.close()
-            thread_instance.join.assert_called_once_with(timeout=1.0)
+            release.assert_called_once()
 
     @pytest.mark.fast
-    def test_sequential_operations_reuse_live_sampler(self, performance_monitor):
-        """Short sequential operations should reuse a sampler without joining."""
-        with patch("planalign_orchestrator.monitoring.base.threading.Thread") as thread:
-            thread_instance = thread.return_value
-            thread_instance.is_alive.return_value = True
-
-            with performance_monitor.time_operation("first"):
-                pass
-            with performance_monitor.time_operation("second"):
-                pass
-
-            assert thread.call_count == 1
-            thread_instance.join.assert_not_called()
-            performance_monitor.close()
+    def test_operation_attributes_sampled_tree_usage(self, performance_monitor):
+        """Peak tree memory and CPU come from samples between the marks."""
+        sampler = performance_monitor._sampler
+        with patch.object(sampler, "acquire"), patch.object(sampler, "release"):
+            with performance_monitor.time_operation("op") as metrics:
+                sampler.sample_now()
+                sum(range(200_000))
+                sampler.sample_now()
+
+        assert metrics.peak_tree_memory_mb >= metrics.end_memory_mb
+        assert metrics.peak_memory_mb >= metrics.start_memory_mb
+        assert metrics.tree_cpu_seconds is not None
 
     @pytest.mark.fast
     def test_get_metrics_empty(self, performance_monitor):
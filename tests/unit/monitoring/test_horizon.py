@@ -0,0 +1,205 @@
+"""
+Tests for the horizon scaling guard.
+
+Covers per-year model timing capture from ``run_results.json`` (directly and
+through ``DbtRunner``), the Theil-Sen growth fit and its flags, rebuilding
+timings from a run trace, and the orchestrator's run-summary warning.
+"""
+
+import json
+import logging
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from planalign_orchestrator.dbt_runner import DbtResult, DbtRunner
+from planalign_orchestrator.monitoring.horizon import (
+    ModelYearTimings,
+    fit_horizon_growth,
+    timings_from_trace_spans,
+)
+from planalign_orchestrator.monitoring.sampler import ResourceSampler
+from planalign_orchestrator.monitoring.tracing import RunTracer, load_trace_spans
+from planalign_orchestrator.pipeline_orchestrator import PipelineOrchestrator
+
+
+def _iso(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _write_run_results(path, execute_seconds: dict[str, float]):
+    start = datetime.now(timezone.utc)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {
+                "results": [
+                    {
+                        "unique_id": unique_id,
+                        "status": "success",
+                        "timing": [
+                            {
+                                "name": "compile",
+                                "started_at": _iso(start),
+                                "completed_at": _iso(start + timedelta(seconds=0.5)),
+                            },
+                            {
+                                "name": "execute",
+                                "started_at": _iso(start),
+                                "completed_at": _iso(
+                                    start + timedelta(seconds=seconds)
+                                ),
+                            },
+                        ],
+                    }
+                    for unique_id, seconds in execute_seconds.items()
+                ]
+            }
+        )
+    )
+
+
+def _series(years, seconds_for):
+    return {year: seconds_for(year - years[0] + 1) for year in years}
+
+
+@pytest.mark.fast
+class TestModelYearTimings:
+    def test_records_execute_seconds_per_model_and_year(self, tmp_path):
+        results = tmp_path / "run_results.json"
+        timings = ModelYearTimings()
+        since = time.time() - 1
+        _write_run_results(
+            results,
+            {"model.planalign.int_a": 2.0, "test.planalign.not_null_a": 1.0},
+        )
+
+        assert timings.record_run_results(results, year=2026, since=since) == 1
+        timings.record_run_results(results, year=2026, since=since)
+
+        assert timings.seconds == {"model.planalign.int_a": {2026: pytest.approx(4.0)}}
+
+    def test_stale_or_unattributed_results_are_ignored(self, tmp_path):
+        results = tmp_path / "run_results.json"
+        _write_run_results(results, {"model.planalign.int_a": 2.0})
+        stale = time.time() - 60
+        os.utime(results, (stale, stale))
+        timings = ModelYearTimings()
+
+        assert timings.record_run_results(results, year=2026, since=time.time()) == 0
+        assert timings.record_run_results(results, year=None, since=0) == 0
+        assert (
+            timings.record_run_results(tmp_path / "missing.json", year=2026, since=0)
+            == 0
+        )
+        assert timings.seconds == {}
+
+    def test_runner_records_each_invocation_under_its_year(self, tmp_path, monkeypatch):
+        runner = DbtRunner(executable="echo", dbt_artifacts_dir=tmp_path)
+        timings = ModelYearTimings()
+        runner.configure_model_timings(timings)
+
+        def _execute_once(command_args, **_kwargs):
+            _write_run_results(
+                runner.target_path / "run_results.json", {"model.planalign.int_a": 1.5}
+            )
+            return DbtResult(True, "", "", 0.0, 0, list(command_args))
+
+        monkeypatch.setattr(runner, "_execute_once", _execute_once)
+        runner.set_schedule_context(stage="EVENT_GENERATION", year=2027)
+        runner.execute_command(["run"], retry=False)
+        runner.execute_command(["run"], simulation_year=2028, retry=False)
+
+        assert set(timings.seconds["model.planalign.int_a"]) == {2027, 2028}
+
+
+@pytest.mark.fast
+class TestFitHorizonGrowth:
+    YEARS = list(range(2025, 2045))
+
+    def test_linear_per_year_growth_is_flagged(self):
+        findings = fit_horizon_growth(
+            {
+                "model.planalign.reads_all_years": _series(
+                    self.YEARS, lambda i: 0.2 * i
+                ),
+                "model.planalign.constant": _series(self.YEARS, lambda i: 3.0),
+            },
+            start_year=2025,
+        )
+
+        steep, flat = findings
+        assert steep.model == "model.planalign.reads_all_years"
+        assert steep.exponent == pytest.approx(1.0, abs=0.01)
+        assert steep.flagged
+        assert (steep.first_year, steep.last_year) == (2026, 2044)
+        assert flat.exponent == pytest.approx(0.0)
+        assert not flat.flagged
+        assert "year^1.00" in steep.describe()
+
+    def test_noise_and_a_slow_first_year_do_not_flag(self):
+        seconds = _series(self.YEARS, lambda i: 2.0 + 0.1 * ((i * 7) % 3))
+        seconds[2025] = 30.0  # cold first year, excluded from the fit
+        seconds[2033] = 12.0  # one slow year
+
+        (finding,) = fit_horizon_growth({"model.planalign.m": seconds}, start_year=2025)
+
+        assert not finding.flagged
+
+    def test_short_or_cheap_models_are_not_reported(self):
+        findings = fit_horizon_growth(
+            {
+                "model.planalign.short": _series(self.YEARS[:4], lambda i: float(i)),
+                "model.planalign.cheap": _series(self.YEARS, lambda i: 0.001 * i),
+            },
+            start_year=2025,
+        )
+
+        assert findings == []
+
+    def test_timings_rebuild_from_a_run_trace(self, tmp_path):
+        tracer = RunTracer(
+            output_path=tmp_path / "simulation.trace.json",
+            sampler=ResourceSampler(interval=0.05),
+        )
+        with tracer.span("simulation", "run"):
+            for year in (2025, 2026):
+                with tracer.span("dbt run", "dbt_invocation", year=year) as invocation:
+                    _write_run_results(
+                        tmp_path / "run_results.json",
+                        {"model.planalign.int_a": 0.25 * (year - 2024)},
+                    )
+                tracer.add_dbt_results(invocation, tmp_path / "run_results.json")
+        tracer.finish()
+
+        timings = timings_from_trace_spans(
+            load_trace_spans(tracer.write_chrome_trace())
+        )
+
+        assert timings.seconds["model.planalign.int_a"] == {
+            2025: pytest.approx(0.25, abs=1e-3),
+            2026: pytest.approx(0.5, abs=1e-3),
+        }
+
+
+@pytest.mark.fast
+def test_orchestrator_warns_about_flagged_models(caplog):
+    timings = ModelYearTimings()
+    for year in range(2025, 2035):
+        timings.add("model.planalign.int_slow", year, 0.5 * (year - 2024))
+    orchestrator = SimpleNamespace(model_timings=timings)
+
+    with caplog.at_level(logging.WARNING):
+        findings = PipelineOrchestrator._check_horizon_growth(orchestrator, 2025)
+
+    assert [f.model for f in findings if f.flagged] == ["model.planalign.int_slow"]
+    assert "Horizon scaling: model.planalign.int_slow" in caplog.text
+    assert (
+        PipelineOrchestrator._check_horizon_growth(
+            SimpleNamespace(model_timings=None), 2025
+        )
+        == []
+    )
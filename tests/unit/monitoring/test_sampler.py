@@ -0,0 +1,90 @@
+"""
+Tests for the process-wide ResourceSampler.
+
+Covers mark/window attribution over the ring buffer, buffer wrap-around,
+subscriptions, and the acquire/release thread lifecycle.
+"""
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+from planalign_orchestrator.monitoring.sampler import (
+    ResourceSampler,
+    get_resource_sampler,
+)
+
+
+@pytest.fixture
+def sampler():
+    return ResourceSampler(interval=0.01, capacity=8)
+
+
+@pytest.mark.fast
+class TestResourceSampler:
+    def test_window_without_samples_reports_duration_only(self, sampler):
+        start = sampler.mark()
+        window = sampler.window(start)
+
+        assert window.sample_count == 0
+        assert window.peak_tree_rss_mb is None
+        assert window.duration_seconds >= 0
+
+    def test_window_attributes_only_samples_between_marks(self, sampler):
+        sampler.sample_now()
+        start = sampler.mark()
+        sampler.sample_now()
+        sampler.sample_now()
+        end = sampler.mark()
+        sampler.sample_now()
+
+        window = sampler.window(start, end)
+
+        assert window.sample_count == 2
+        assert window.peak_rss_mb > 0
+        assert window.peak_tree_rss_mb >= window.peak_rss_mb
+        assert window.tree_cpu_seconds >= 0
+
+    def test_child_processes_count_toward_the_tree(self, sampler):
+        child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+        try:
+            time.sleep(0.2)
+            start = sampler.mark()
+            sampler.sample_now()
+            window = sampler.window(start)
+        finally:
+            child.kill()
+            child.wait()
+
+        assert window.peak_tree_rss_mb > window.peak_rss_mb
+
+    def test_overwritten_samples_are_skipped(self, sampler):
+        start = sampler.mark()
+        for _ in range(sampler.capacity * 2 + 3):
+            sampler.sample_now()
+
+        assert sampler.window(start).sample_count == sampler.capacity
+
+    def test_subscriptions_share_one_thread_and_stop_without_join(self, sampler):
+        calls = []
+        first = sampler.subscribe(lambda: calls.append("a"), 0.01)
+        second = sampler.subscribe(lambda: calls.append("b"), 0.01)
+        thread = sampler._thread
+        deadline = time.monotonic() + 2
+        while {"a", "b"} - set(calls) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert {"a", "b"} <= set(calls)
+        assert sampler._thread is thread
+
+        sampler.unsubscribe(first)
+        assert sampler.running
+        sampler.unsubscribe(second)
+        assert not sampler.running
+        thread.join(timeout=2)
+        assert not thread.is_alive()
+
+    def test_shared_sampler_is_a_singleton(self):
+        assert get_resource_sampler() is get_resource_sampler()
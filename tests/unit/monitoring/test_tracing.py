@@ -0,0 +1,212 @@
+"""
+Tests for RunTracer span recording and export.
+
+Covers span nesting and attribute inheritance, residue accounting, dbt
+run_results ingestion, Chrome-trace round-tripping and persistence to
+``run_trace_spans``.
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import duckdb
+import pytest
+
+from planalign_orchestrator.monitoring.sampler import ResourceSampler
+from planalign_orchestrator.monitoring.tracing import (
+    TRACE_TABLE,
+    RunTracer,
+    load_trace_spans,
+    trace_path_for,
+)
+
+
+@pytest.fixture
+def tracer(tmp_path):
+    return RunTracer(
+        output_path=tmp_path / "simulation.trace.json",
+        sampler=ResourceSampler(interval=0.01, capacity=64),
+    )
+
+
+def _iso(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _write_run_results(path, *, start: datetime, node_seconds: float = 0.2):
+    compile_end = start + timedelta(seconds=0.05)
+    execute_end = start + timedelta(seconds=node_seconds)
+    path.write_text(
+        json.dumps(
+            {
+                "results": [
+                    {
+                        "unique_id": "model.planalign.fct_yearly_events",
+                        "status": "success",
+                        "thread_id": "Thread-1",
+                        "adapter_response": {"rows_affected": 1200},
+                        "timing": [
+                            {
+                                "name": "compile",
+                                "started_at": _iso(start),
+                                "completed_at": _iso(compile_end),
+                            },
+                            {
+                                "name": "execute",
+                                "started_at": _iso(compile_end),
+                                "completed_at": _iso(execute_end),
+                            },
+                        ],
+                    },
+                    {
+                        "unique_id": "model.planalign.never_started",
+                        "status": "skipped",
+                        "timing": [],
+                    },
+                ]
+            }
+        )
+    )
+
+
+@pytest.mark.fast
+class TestRunTracer:
+    def test_trace_path_sits_beside_the_database(self, tmp_path):
+        assert trace_path_for(tmp_path / "simulation.duckdb") == (
+            tmp_path / "simulation.trace.json"
+        )
+
+    def test_spans_nest_and_inherit_year_and_stage(self, tracer):
+        with tracer.span("simulation", "run"):
+            with tracer.span("year 2025", "year", year=2025):
+                with tracer.span("EVENT_GENERATION", "stage", stage="EVENT_GENERATION"):
+                    with tracer.span("dbt run", "dbt_invocation") as invocation:
+                        pass
+        tracer.finish()
+
+        run, year, stage, _ = tracer.spans
+        assert run.parent_id is None
+        assert year.parent_id == run.span_id
+        assert stage.parent_id == year.span_id
+        assert invocation.parent_id == stage.span_id
+        assert invocation.attributes == {"year": 2025, "stage": "EVENT_GENERATION"}
+
+    def test_worker_thread_spans_nest_per_thread(self, tracer):
+        barrier = threading.Barrier(2)
+
+        def invoke(model):
+            with tracer.span(f"dbt run {model}", "dbt_invocation") as invocation:
+                barrier.wait(timeout=5)
+                with tracer.span("results", "dbt_results") as results:
+                    barrier.wait(timeout=5)
+            return invocation, results
+
+        with tracer.span("STATE_ACCUMULATION", "stage", stage="STATE_ACCUMULATION"):
+            with ThreadPoolExecutor(2, thread_name_prefix="dbt-model") as pool:
+                pairs = list(pool.map(invoke, ("a", "b")))
+            with tracer.span("after", "stage_phase") as after:
+                pass
+        tracer.finish()
+
+        stage = tracer.spans[0]
+        assert after.parent_id == stage.span_id
+        assert after.thread == "orchestrator"
+        for invocation, results in pairs:
+            assert invocation.parent_id == stage.span_id
+            assert results.parent_id == invocation.span_id
+            assert invocation.thread.startswith("dbt-model")
+            assert results.thread == invocation.thread
+            assert invocation.attributes["stage"] == "STATE_ACCUMULATION"
+        assert pairs[0][0].thread != pairs[1][0].thread
+        assert all(span.end_seconds is not None for span in tracer.spans)
+
+    def test_residue_is_time_outside_children(self, tracer):
+        with tracer.span("stage", "stage") as stage:
+            time.sleep(0.03)
+            with tracer.span("child", "dbt_invocation") as child:
+                time.sleep(0.03)
+        tracer.finish()
+
+        assert child.residue_seconds == pytest.approx(child.duration_seconds)
+        assert stage.residue_seconds == pytest.approx(
+            stage.duration_seconds - child.duration_seconds
+        )
+        assert stage.residue_seconds >= 0.02
+
+    def test_failed_span_is_marked_and_open_spans_close_on_finish(self, tracer):
+        with pytest.raises(RuntimeError):
+            with tracer.span("stage", "stage") as failed:
+                raise RuntimeError("boom")
+        context = tracer.span("simulation", "run")
+        context.__enter__()
+        tracer.finish(status="failed")
+
+        assert failed.attributes["status"] == "error"
+        assert tracer.spans[-1].end_seconds is not None
+        assert tracer.spans[-1].attributes["status"] == "failed"
+
+    def test_dbt_results_become_node_and_phase_spans(self, tracer, tmp_path):
+        results = tmp_path / "run_results.json"
+        with tracer.span("dbt run", "dbt_invocation", year=2026) as invocation:
+            _write_run_results(results, start=datetime.now(timezone.utc))
+        added = tracer.add_dbt_results(invocation, results)
+
+        assert added == 1
+        node = next(s for s in tracer.spans if s.category == "dbt_node")
+        phases = [s for s in tracer.spans if s.category == "dbt_phase"]
+        assert node.name == "model.planalign.fct_yearly_events"
+        assert node.thread == "Thread-1"
+        assert node.attributes["rows_affected"] == 1200
+        assert node.attributes["year"] == 2026
+        assert node.duration_seconds == pytest.approx(0.2, abs=1e-3)
+        assert [p.name for p in phases] == ["compile", "execute"]
+        assert node.residue_seconds == pytest.approx(0.0, abs=1e-6)
+
+    def test_stale_run_results_are_ignored(self, tracer, tmp_path):
+        results = tmp_path / "run_results.json"
+        _write_run_results(results, start=datetime.now(timezone.utc))
+        stale = time.time() - 60
+        os.utime(results, (stale, stale))
+        with tracer.span("dbt seed", "dbt_invocation") as invocation:
+            pass
+
+        assert tracer.add_dbt_results(invocation, results) == 0
+        assert [s.category for s in tracer.spans] == ["dbt_invocation"]
+
+    def test_chrome_trace_round_trips(self, tracer, tmp_path):
+        results = tmp_path / "run_results.json"
+        with tracer.span("simulation", "run"):
+            with tracer.span("dbt run", "dbt_invocation") as invocation:
+                _write_run_results(results, start=datetime.now(timezone.utc))
+            tracer.add_dbt_results(invocation, results)
+        tracer.finish()
+
+        path = tracer.write_chrome_trace()
+        payload = json.loads(path.read_text())
+        threads = {e["args"]["name"] for e in payload["traceEvents"] if e["ph"] == "M"}
+        spans = load_trace_spans(path)
+
+        assert threads == {"orchestrator", "Thread-1"}
+        assert [s["category"] for s in spans][:2] == ["run", "dbt_invocation"]
+        node = next(s for s in spans if s["category"] == "dbt_node")
+        assert node["thread"] == "Thread-1"
+        assert node["rows_affected"] == 1200
+
+    def test_persist_replaces_the_runs_rows(self, tracer):
+        with tracer.span("simulation", "run"):
+            with tracer.span("year 2025", "year", year=2025):
+                pass
+        tracer.finish()
+        conn = duckdb.connect()
+
+        assert tracer.persist(conn, "run-1") == 2
+        assert tracer.persist(conn, "run-1") == 2
+        rows = conn.execute(
+            f"SELECT name, category, simulation_year FROM {TRACE_TABLE} "
+            "WHERE run_id = 'run-1' ORDER BY span_id"
+        ).fetchall()
+        assert rows == [("simulation", "run", None), ("year 2025", "year", 2025)]
@@ -177,7 +177,7 @@ def test_stop_monitoring_is_idempotent(tmp_path):
     # Never started; stop should not raise and leaves state clean.
     mgr.stop_monitoring()
     assert mgr._monitoring_active is False
-    assert mgr._monitoring_thread is None
+    assert mgr._subscription is None
 
 
 # ---------------------------------------------------------------------------
@@ -405,3 +405,60 @@ def test_warn_stale_years_noop_on_fresh_database(caplog):
     ):
         manager.warn_if_stale_years_beyond(2025)  # must not raise or warn
     assert not caplog.records
+
+
+class RecordingConnection:
+    """Forward to DuckDB while recording every statement issued."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.statements: list[str] = []
+
+    def execute(self, sql, *args):
+        self.statements.append(" ".join(sql.split()))
+        return self.connection.execute(sql, *args)
+
+
+@pytest.mark.fast
+@pytest.mark.unit
+def test_year_purge_reads_catalog_once_and_skips_empty_years(in_memory_db):
+    _insert_scenario_rows(in_memory_db, "scenario-a")
+    _insert_stale_deferral_rows(in_memory_db)
+    recording = RecordingConnection(in_memory_db)
+    manager = StateManager(
+        DirectConnectionManager(recording),
+        MagicMock(),
+        SimpleNamespace(scenario_id="scenario-a", plan_design_id="plan-a"),
+    )
+
+    manager.maybe_clear_year_data(2025)
+    manager.clear_year_fact_rows(2025)
+
+    catalog_reads = [s for s in recording.statements if "information_schema" in s]
+    deletes = [s for s in recording.statements if s.startswith("DELETE")]
+    assert len(catalog_reads) == 1
+    # Only the three fact tables hold 2025 rows; the accumulator's 2027 rows
+    # are probed but not written, and the repeated fact clear writes nothing.
+    assert sorted(d.split()[2] for d in deletes) == [
+        "fct_employer_match_events",
+        "fct_workforce_snapshot",
+        "fct_yearly_events",
+    ]
+    assert _scenario_counts(in_memory_db, "scenario-a") == (0, 0, 0)
+
+
+@pytest.mark.fast
+@pytest.mark.unit
+def test_fact_clear_sees_tables_created_after_catalog_load(in_memory_db):
+    in_memory_db.execute("DROP TABLE IF EXISTS fct_employer_match_events")
+    manager = StateManager(
+        DirectConnectionManager(in_memory_db),
+        MagicMock(),
+        SimpleNamespace(scenario_id="scenario-a", plan_design_id="plan-a"),
+    )
+    manager.maybe_clear_year_data(2025)
+
+    _insert_scenario_rows(in_memory_db, "scenario-a")
+    manager.clear_year_fact_rows(2025)
+
+    assert _scenario_counts(in_memory_db, "scenario-a") == (0, 0, 0)
@@ -32,7 +32,8 @@ def projection_db():
         """CREATE TABLE fct_yearly_events (
           event_id VARCHAR, scenario_id VARCHAR, plan_design_id VARCHAR,
           employee_id VARCHAR, event_type VARCHAR, effective_date DATE,
-          simulation_year INTEGER, event_sequence INTEGER, event_details VARCHAR, employee_deferral_rate DECIMAL(9, 6)
+          simulation_year INTEGER, event_sequence INTEGER, event_details VARCHAR, employee_deferral_rate DECIMAL(9, 6),
+          enrollment_change_type VARCHAR
         )"""
     )
     conn.execute(
@@ -47,9 +48,9 @@ def projection_db():
 def test_projection_uses_prior_facts_and_preserves_scope(projection_db):
     projection_db.execute(
         """INSERT INTO fct_yearly_events VALUES
-          ('enroll-new', 'scenario-a', 'plan-a', 'new', 'enrollment', DATE '2025-02-01', 2025, 1, 'Voluntary enrollment', 0.04),
-          ('optout-base', 'scenario-a', 'plan-a', 'baseline', 'enrollment_change', DATE '2025-06-01', 2025, 2, 'Auto-enrollment opt-out', 0.00),
-          ('other-scope', 'scenario-b', 'plan-a', 'new', 'enrollment_change', DATE '2025-07-01', 2025, 2, 'Auto-enrollment opt-out', 0.00)
+          ('enroll-new', 'scenario-a', 'plan-a', 'new', 'enrollment', DATE '2025-02-01', 2025, 1, 'Voluntary enrollment', 0.04, NULL),
+          ('optout-base', 'scenario-a', 'plan-a', 'baseline', 'enrollment_change', DATE '2025-06-01', 2025, 2, 'Auto-enrollment opt-out', 0.00, 'opt_out'),
+          ('other-scope', 'scenario-b', 'plan-a', 'new', 'enrollment_change', DATE '2025-07-01', 2025, 2, 'Auto-enrollment opt-out', 0.00, 'opt_out')
         """
     )
     result = EnrollmentDecisionProjection(
@@ -72,7 +73,7 @@ def test_projection_uses_prior_facts_and_preserves_scope(projection_db):
 def test_projection_excludes_current_year_events(projection_db):
     projection_db.execute(
         """INSERT INTO fct_yearly_events VALUES
-          ('future-event', 'scenario-a', 'plan-a', 'new', 'enrollment', DATE '2026-02-01', 2026, 1, 'Voluntary enrollment', 0.04)
+          ('future-event', 'scenario-a', 'plan-a', 'new', 'enrollment', DATE '2026-02-01', 2026, 1, 'Voluntary enrollment', 0.04, NULL)
         """
     )
     EnrollmentDecisionProjection(DirectConnectionManager(projection_db)).rebuild(
@@ -89,8 +90,8 @@ def test_projection_excludes_current_year_events(projection_db):
 def test_projection_replay_is_deterministic_and_latest_event_wins(projection_db):
     projection_db.execute(
         """INSERT INTO fct_yearly_events VALUES
-      ('enroll', 'default', 'default', 'new', 'enrollment', DATE '2025-01-01', 2025, 1, 'Enrollment', 0.03),
-      ('optout', 'default', 'default', 'new', 'enrollment_change', DATE '2025-01-01', 2025, 2, 'Auto-enrollment opt-out', 0.00)"""
+      ('enroll', 'default', 'default', 'new', 'enrollment', DATE '2025-01-01', 2025, 1, 'Enrollment', 0.03, NULL),
+      ('optout', 'default', 'default', 'new', 'enrollment_change', DATE '2025-01-01', 2025, 2, 'Auto-enrollment opt-out', 0.00, 'opt_out')"""
     )
     projection = EnrollmentDecisionProjection(DirectConnectionManager(projection_db))
     first = projection.rebuild(2026)
@@ -110,6 +111,50 @@ def test_projection_replay_is_deterministic_and_latest_event_wins(projection_db)
     ).fetchone() == (False, True, "optout")
 
 
+@pytest.mark.fast
+@pytest.mark.unit
+@pytest.mark.parametrize("incremental", [False, True])
+def test_projection_reads_opt_outs_from_a_ledger_without_change_type(
+    projection_db, incremental
+):
+    """A database published before enrollment_change_type existed still projects."""
+    projection_db.execute(
+        "ALTER TABLE fct_yearly_events DROP COLUMN enrollment_change_type"
+    )
+    projection_db.execute(
+        """INSERT INTO fct_yearly_events VALUES
+          ('enroll', 'default', 'default', 'new', 'enrollment', DATE '2025-02-01', 2025, 1, 'Voluntary enrollment', 0.04),
+          ('optout', 'default', 'default', 'baseline', 'enrollment_change', DATE '2025-06-01', 2025, 2, 'Auto-enrollment opt-out', 0.00)"""
+    )
+    projection = EnrollmentDecisionProjection(
+        DirectConnectionManager(projection_db), incremental=incremental
+    )
+    projection.rebuild(2025)
+    assert projection.rebuild(2026).incremental is incremental
+
+    assert projection_db.execute(
+        "SELECT employee_id, is_enrolled, ever_opted_out "
+        "FROM enrollment_decision_projection ORDER BY employee_id"
+    ).fetchall() == [("baseline", False, True), ("new", True, False)]
+
+
+@pytest.mark.fast
+@pytest.mark.unit
+def test_projection_falls_back_to_text_for_untyped_historical_rows(projection_db):
+    """Rows that predate a schema sync carry a NULL change type."""
+    projection_db.execute(
+        """INSERT INTO fct_yearly_events VALUES
+          ('legacy-optout', 'default', 'default', 'baseline', 'enrollment_change', DATE '2025-06-01', 2025, 2, 'Auto-enrollment opt-out', 0.00, NULL),
+          ('typed-change', 'default', 'default', 'new', 'enrollment_change', DATE '2025-06-01', 2025, 2, 'Rate change', 0.05, 'rate_change')"""
+    )
+    EnrollmentDecisionProjection(DirectConnectionManager(projection_db)).rebuild(2026)
+
+    assert projection_db.execute(
+        "SELECT employee_id, is_enrolled, ever_opted_out "
+        "FROM enrollment_decision_projection ORDER BY employee_id"
+    ).fetchall() == [("baseline", False, True), ("new", True, False)]
+
+
 @pytest.mark.fast
 @pytest.mark.unit
 def test_projection_carries_strict_prior_authoritative_enrollment(projection_db):
@@ -167,6 +212,7 @@ EXPECTED_PROJECTION_COLUMNS = {
     "latest_event_id",
     "latest_event_year",
     "latest_event_effective_date",
+    "first_enrollment_event_date",
     "authoritative_enrollment_date",
     "authoritative_is_enrolled",
 }
@@ -231,7 +277,7 @@ def test_ensure_table_preserves_current_schema_table_and_rows():
         conn.execute(
             "INSERT INTO enrollment_decision_projection VALUES "
             "('kept', 2025, 'default', 'default', DATE '2020-01-01', true, "
-            "false, 'baseline_census', 0.05, NULL, NULL, NULL, NULL, NULL)"
+            "false, 'baseline_census', 0.05, NULL, NULL, NULL, NULL, NULL, NULL)"
         )
 
         projection.ensure_table()
@@ -242,3 +288,92 @@ def test_ensure_table_preserves_current_schema_table_and_rows():
         ).fetchone() == (1,)
     finally:
         conn.close()
+
+
+LEDGER = """INSERT INTO fct_yearly_events VALUES
+  ('e1', 'default', 'default', 'new', 'enrollment', DATE '2025-02-01', 2025, 1, 'Voluntary enrollment', 0.04, NULL),
+  ('e2', 'default', 'default', 'baseline', 'enrollment_change', DATE '2025-06-01', 2025, 2, 'Auto-enrollment opt-out', 0.00, 'opt_out'),
+  ('e3', 'default', 'default', 'baseline', 'enrollment', DATE '2026-03-01', 2026, 1, 'Re-enrollment', NULL, NULL),
+  ('e4', 'default', 'default', 'hire-2026', 'enrollment', DATE '2026-09-01', 2026, 1, 'Auto enrollment', 0.06, NULL),
+  ('e5', 'default', 'default', 'new', 'enrollment_change', DATE '2024-12-31', 2026, 3, 'Back-dated rate change', 0.08, 'rate_change'),
+  ('e6', 'default', 'default', 'hire-2026', 'enrollment_change', DATE '2027-01-01', 2027, 1, 'Rate increase', 0.07, 'rate_change'),
+  ('e7', 'default', 'default', 'new', 'enrollment_change', DATE '2025-02-01', 2027, 1, 'Auto-enrollment opt-out', 0.00, 'opt_out')
+"""
+
+
+def _projection_rows(conn):
+    return conn.execute(
+        "SELECT * EXCLUDE (authoritative_enrollment_date, authoritative_is_enrolled) "
+        "FROM enrollment_decision_projection ORDER BY employee_id"
+    ).fetchall()
+
+
+@pytest.mark.fast
+@pytest.mark.unit
+def test_incremental_fold_matches_full_rebuild_each_year(projection_db):
+    projection_db.execute(LEDGER)
+    incremental = EnrollmentDecisionProjection(
+        DirectConnectionManager(projection_db), incremental=True, verify_every=0
+    )
+    full = EnrollmentDecisionProjection(DirectConnectionManager(projection_db))
+
+    for year in (2025, 2026, 2027, 2028):
+        folded = incremental.rebuild(year)
+        folded_rows = _projection_rows(projection_db)
+        full.rebuild(year)
+        assert folded_rows == _projection_rows(projection_db), year
+        assert folded.incremental is (year > 2025)
+
+
+@pytest.mark.fast
+@pytest.mark.unit
+def test_repeated_rebuild_of_a_year_folds_from_the_retained_base(projection_db):
+    projection_db.execute(LEDGER)
+    projection = EnrollmentDecisionProjection(
+        DirectConnectionManager(projection_db), incremental=True, verify_every=0
+    )
+    projection.rebuild(2026)
+    first = projection.rebuild(2027)
+    first_rows = _projection_rows(projection_db)
+
+    second = projection.rebuild(2027)
+
+    assert first.incremental and second.incremental
+    assert _projection_rows(projection_db) == first_rows
+
+
+@pytest.mark.fast
+@pytest.mark.unit
+def test_verified_fold_publishes_full_rebuild_on_mismatch(projection_db, caplog):
+    projection_db.execute(LEDGER)
+    projection = EnrollmentDecisionProjection(
+        DirectConnectionManager(projection_db), incremental=True, verify_every=1
+    )
+    projection.rebuild(2026)
+    # Simulate drift in the fold base (e.g. the prior year changed underneath).
+    projection_db.execute(
+        "UPDATE enrollment_decision_projection SET ever_opted_out = true"
+    )
+
+    projection.rebuild(2027)
+
+    assert "differs from a full rebuild" in caplog.text
+    assert projection_db.execute(
+        "SELECT ever_opted_out FROM enrollment_decision_projection "
+        "WHERE employee_id = 'hire-2026'"
+    ).fetchone() == (False,)
+
+
+@pytest.mark.fast
+@pytest.mark.unit
+def test_fold_requires_a_prior_year_this_instance_published(projection_db):
+    projection_db.execute(LEDGER)
+    EnrollmentDecisionProjection(DirectConnectionManager(projection_db)).rebuild(2026)
+    projection = EnrollmentDecisionProjection(
+        DirectConnectionManager(projection_db), incremental=True
+    )
+
+    assert projection.rebuild(2027).incremental is False
+    assert projection.rebuild(2028).incremental is True
+    projection.ensure_table()
+    assert projection.rebuild(2029).incremental is False
@@ -0,0 +1,158 @@
+"""Unit tests for the on-demand payroll ledger.
+
+Covers the pay calendar, the salary rate on each payday, per-year Parquet
+caching keyed to the run's rows, and the employee-scoped path that builds
+nothing.
+"""
+
+from __future__ import annotations
+
+from contextlib import nullcontext
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+
+import duckdb
+import pytest
+
+from planalign_orchestrator.payroll_ledger import (
+    LEDGER_EAGER,
+    LEDGER_ON_DEMAND,
+    PayrollLedger,
+    PayrollLedgerError,
+    ledger_directory,
+    ledger_mode,
+    pay_calendar,
+)
+from planalign_orchestrator.pipeline_orchestrator import PipelineOrchestrator
+
+pytestmark = [pytest.mark.fast, pytest.mark.orchestrator]
+
+
+@pytest.fixture
+def run_db(tmp_path: Path) -> Path:
+    database = tmp_path / "simulation.duckdb"
+    with duckdb.connect(str(database)) as conn:
+        conn.execute(
+            """
+            CREATE TABLE fct_workforce_snapshot (
+                employee_id VARCHAR, simulation_year INTEGER,
+                employee_hire_date DATE, termination_date DATE,
+                current_compensation DECIMAL(10, 2)
+            );
+            INSERT INTO fct_workforce_snapshot VALUES
+                ('E1', 2025, '2020-01-01', NULL, 104000),
+                ('E2', 2025, '2025-06-02', NULL, 52000),
+                ('E3', 2025, '2019-01-01', '2025-03-15', 78000),
+                ('E1', 2026, '2020-01-01', NULL, 110000),
+                ('E2', 2026, '2025-06-02', NULL, 52000);
+            CREATE TABLE fct_yearly_events (
+                employee_id VARCHAR, event_type VARCHAR, simulation_year INTEGER,
+                effective_date DATE, compensation_amount DECIMAL(10, 2),
+                previous_compensation DECIMAL(10, 2), event_sequence INTEGER
+            );
+            INSERT INTO fct_yearly_events VALUES
+                ('E1', 'raise', 2025, '2025-07-01', 104000, 100000, 1),
+                ('E2', 'hire', 2025, '2025-06-02', 52000, NULL, 1),
+                ('E3', 'termination', 2025, '2025-03-15', NULL, NULL, 1),
+                ('E1', 'promotion', 2026, '2026-02-01', 110000, 104000, 1);
+            """
+        )
+    return database
+
+
+def _ledger(database: Path) -> PayrollLedger:
+    conn = duckdb.connect(str(database), read_only=True)
+    return PayrollLedger(conn, ledger_directory(database))
+
+
+def test_pay_calendar_counts_fridays_from_the_first_of_january():
+    periods = pay_calendar(2025)
+
+    assert periods[0].end_date == date(2025, 1, 3)
+    assert periods[0].start_date == date(2024, 12, 21)
+    assert len(periods) == 26
+    assert len(pay_calendar(2021)) == 27  # Jan 1 2021 is a Friday
+
+
+def test_rate_follows_the_latest_change_by_payday(run_db: Path):
+    rows = _ledger(run_db).read([2025])
+    e1 = rows[rows.employee_id == "E1"].set_index("pay_period_end_date")
+
+    assert float(e1.loc["2025-06-20", "annual_salary_rate_on_pay_date"]) == 100000
+    assert float(e1.loc["2025-07-04", "annual_salary_rate_on_pay_date"]) == 104000
+    assert float(e1.loc["2025-07-04", "period_earnings"]) == 4000
+    # New hires are paid from their first payday; leavers until termination.
+    assert len(rows[rows.employee_id == "E2"]) == 15
+    e3 = rows[rows.employee_id == "E3"]
+    assert len(e3) == 6
+    assert bool(e3.iloc[-1]["is_last_period_before_termination"])
+
+
+def test_later_years_open_on_last_years_closing_rate(run_db: Path):
+    rows = _ledger(run_db).read([2026], ["E1"])
+
+    assert float(rows.iloc[0]["annual_salary_rate_on_pay_date"]) == 104000
+    assert float(rows.iloc[-1]["annual_salary_rate_on_pay_date"]) == 110000
+
+
+def test_whole_years_are_cached_and_reused(run_db: Path):
+    ledger = _ledger(run_db)
+
+    ledger.read([2025])
+
+    assert ledger.cached_years() == [2025]
+    assert sorted(p.name for p in ledger.directory.glob("*.parquet")) == [
+        "payroll_ledger_2025.parquet"
+    ]
+    assert ledger.materialize([2025]) == []
+    assert ledger.materialize([2025], force=True) == [2025]
+
+
+def test_employee_requests_on_uncached_years_write_nothing(run_db: Path):
+    ledger = _ledger(run_db)
+
+    rows = ledger.read(None, ["E2", "E2"])
+
+    assert set(rows.simulation_year) == {2025, 2026}
+    assert set(rows.employee_id) == {"E2"}
+    assert not ledger.directory.exists()
+
+
+def test_resimulated_years_are_rebuilt(run_db: Path):
+    ledger = _ledger(run_db)
+    ledger.materialize()
+    ledger.connection.close()
+    with duckdb.connect(str(run_db)) as conn:
+        conn.execute(
+            "UPDATE fct_yearly_events SET compensation_amount = 108000 "
+            "WHERE employee_id = 'E1' AND simulation_year = 2025"
+        )
+
+    ledger = _ledger(run_db)
+
+    assert ledger.cached_years() == [2026]  # 2026 opens on 2025's snapshot rate
+    rows = ledger.read([2025], ["E1"])
+    assert float(rows.iloc[-1]["annual_salary_rate_on_pay_date"]) == 108000
+
+
+def test_unsimulated_years_are_rejected(run_db: Path):
+    with pytest.raises(PayrollLedgerError, match="2030"):
+        _ledger(run_db).read([2030])
+
+
+def test_eager_mode_builds_when_the_run_completes(run_db: Path):
+    assert ledger_mode({}) == LEDGER_ON_DEMAND
+    assert ledger_mode({"storage": {"payroll_ledger": "Eager"}}) == LEDGER_EAGER
+
+    for mode, expected in ((LEDGER_ON_DEMAND, False), (LEDGER_EAGER, True)):
+        with duckdb.connect(str(run_db)) as conn:
+            db_manager = SimpleNamespace(
+                db_path=run_db, get_connection=lambda conn=conn: nullcontext(conn)
+            )
+            orchestrator = SimpleNamespace(
+                config=SimpleNamespace(storage={"payroll_ledger": mode}),
+                db_manager=db_manager,
+            )
+            PipelineOrchestrator._materialize_payroll_ledger(orchestrator, [2025, 2026])
+        assert ledger_directory(run_db).exists() is expected
@@ -170,3 +170,38 @@ def test_run_start_warns_about_stale_years_beyond_end_year(tmp_path: Path, caplo
     ).fetchone()[0]
     conn.close()
     assert remaining_2027 > 0
+
+
+def test_traced_run_writes_year_and_stage_spans(tmp_path: Path):
+    from planalign_orchestrator.monitoring.tracing import load_trace_spans
+
+    dbp = tmp_path / "p.duckdb"
+    _seed_minimal(dbp, [2025, 2026])
+    cfg = SimulationConfig(
+        scenario_id="test-scenario",
+        plan_design_id="test-plan",
+        simulation=SimulationSettings(start_year=2025, end_year=2026),
+        compensation=CompensationSettings(),
+        enrollment=EnrollmentSettings(),
+        setup={"clear_tables": False},
+    )
+    result = build_orchestrator(
+        ConstructionSpec(
+            config=cfg,
+            database=DatabaseConnectionManager(db_path=dbp),
+            runner_override=DummyRunner(working_dir=tmp_path),
+            reports_dir=tmp_path / "reports",
+            entry_point="invariant_test",
+            trace=True,
+        )
+    )
+
+    result.orchestrator.execute_multi_year_simulation(dry_run=True)
+
+    spans = load_trace_spans(tmp_path / "p.trace.json")
+    run = next(span for span in spans if span["category"] == "run")
+    years = [span for span in spans if span["category"] == "year"]
+    stages = [span for span in spans if span["category"] == "stage"]
+    assert [span["year"] for span in years] == [2025, 2026]
+    assert all(span["parent_id"] == run["span_id"] for span in years)
+    assert {span["year"] for span in stages} == {2025, 2026}
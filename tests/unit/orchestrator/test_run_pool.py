@@ -13,6 +13,7 @@ from pathlib import Path
 
 import pytest
 
+from planalign_orchestrator.resources.duckdb_profile import PROFILE_ENV_VAR
 from planalign_orchestrator.run_pool import (
     WORKER_MEMORY_BUDGET_MIB,
     EventKind,
@@ -127,6 +128,10 @@ def _slow_echo_worker(job: ScenarioJob) -> dict:
     return {"name": job.name, "seed": job.seed, "pid": os.getpid()}
 
 
+def _profile_worker(job: ScenarioJob) -> dict:
+    return {"profile": os.environ.get(PROFILE_ENV_VAR)}
+
+
 def _lock_holding_worker(job: ScenarioJob) -> dict:
     """Hold a context manager across a long sleep, so SIGTERM must unwind it."""
     marker = Path(job.payload["marker"])
@@ -183,6 +188,15 @@ class TestPoolExecution:
         results = ScenarioRunPool(1).run(_echo_worker, [_job("a")], on_event=explode)
         assert results["a"].succeeded
 
+    def test_incremental_run_executes_follow_up_jobs(self):
+        def follow_up(result):
+            return [_job(f"{result.name}+")] if len(result.name) < 3 else []
+
+        results = ScenarioRunPool(1).run_incremental(
+            _echo_worker, [_job("a"), _job("b")], follow_up
+        )
+        assert list(results) == ["a", "b", "a+", "b+", "a++", "b++"]
+
     def test_rejects_zero_workers(self):
         with pytest.raises(ValueError, match="must be >= 1"):
             ScenarioRunPool(0)
@@ -200,6 +214,15 @@ class TestPoolParallelExecution:
         assert all(r.succeeded for r in results.values())
         assert os.getpid() not in {r.value["pid"] for r in results.values()}
 
+    def test_workers_default_to_their_share_of_the_duckdb_budget(self, monkeypatch):
+        monkeypatch.delenv(PROFILE_ENV_VAR, raising=False)
+        jobs = [_job(f"s{i}") for i in range(3)]
+
+        results = ScenarioRunPool(3).run(_profile_worker, jobs)
+
+        assert {r.value["profile"] for r in results.values()} == {"worker:3"}
+        assert PROFILE_ENV_VAR not in os.environ
+
     def test_work_spreads_across_workers(self):
         """Jobs long enough to overlap must land on more than one worker."""
         jobs = [_job(f"s{i}", sleep=0.3) for i in range(4)]
@@ -219,6 +242,23 @@ class TestPoolParallelExecution:
         }
         assert strip(serial) == strip(parallel)
 
+    def test_incremental_run_keeps_workers_for_follow_up_jobs(self):
+        """Follow-ups queue while the first jobs are still running."""
+        released = []
+
+        def follow_up(result):
+            if result.name.startswith("s"):
+                released.append(result.name)
+                return [_job(f"r{result.name}", sleep=0.3)]
+            return []
+
+        jobs = [_job(f"s{i}", sleep=0.3) for i in range(2)]
+        results = ScenarioRunPool(3).run_incremental(_slow_echo_worker, jobs, follow_up)
+
+        assert set(results) == {"s0", "s1", "rs0", "rs1"}
+        assert all(r.succeeded for r in results.values())
+        assert sorted(released) == ["s0", "s1"]
+
     def test_failure_in_one_worker_is_contained(self):
         jobs = [_job("ok1"), _job("bad", boom=True), _job("ok2")]
         results = ScenarioRunPool(3).run(_failing_worker, jobs)
@@ -0,0 +1,216 @@
+"""
+Tests for DuckDB resource profiles and spill accounting.
+
+Covers preset derivation from the worker budget, profile resolution order,
+binding a profile to a run, the settings each consumer receives (the
+orchestrator's connection pool, dbt's environment, API reads) and the spill
+monitor's report.
+"""
+
+import os
+from types import SimpleNamespace
+
+import duckdb
+import pytest
+
+from planalign_orchestrator.config import DuckDBResourceSettings
+from planalign_orchestrator.dbt_runner import DbtRunner
+from planalign_orchestrator.monitoring.sampler import ResourceSampler
+from planalign_orchestrator.monitoring.spill import SpillMonitor
+from planalign_orchestrator.pipeline_orchestrator import PipelineOrchestrator
+from planalign_orchestrator.resources.duckdb_profile import (
+    DBT_TARGET,
+    PROFILE_ENV_VAR,
+    DuckDBResourceProfile,
+    ResourceProfileError,
+    profile_from_name,
+    read_connection_config,
+    resolve_resource_profile,
+    worker_profile,
+)
+from planalign_orchestrator.run_pool import WORKER_MEMORY_BUDGET_MIB
+from planalign_orchestrator.utils import DatabaseConnectionManager
+
+
+def _setting(conn, name):
+    return conn.execute("SELECT current_setting(?)", [name]).fetchone()[0]
+
+
+@pytest.mark.fast
+class TestProfiles:
+    def test_worker_profile_splits_the_pool_budget(self):
+        profile = worker_profile(3, cpu_count=8)
+
+        assert profile.name == "worker:3"
+        assert profile.memory_limit_mib < WORKER_MEMORY_BUDGET_MIB
+        assert profile.threads == 2  # (8 - 1 reserved) // 3
+
+    def test_names_parse_and_reject_unknown_presets(self):
+        assert profile_from_name("standard").memory_limit_mib == 4096
+        assert profile_from_name("worker:4").name == "worker:4"
+        for bad in ("huge", "worker:0", "worker:x", "standard:2"):
+            with pytest.raises(ResourceProfileError):
+                profile_from_name(bad)
+
+    def test_nothing_selected_keeps_previous_behavior(self, tmp_path):
+        assert resolve_resource_profile(None, tmp_path / "s.duckdb", environ={}) is None
+        assert (
+            resolve_resource_profile(
+                DuckDBResourceSettings(), tmp_path / "s.duckdb", environ={}
+            )
+            is None
+        )
+        assert read_connection_config(environ={}) == {}
+
+    def test_config_wins_over_environment_and_fields_override_preset(self, tmp_path):
+        settings = DuckDBResourceSettings(profile="worker", threads=3)
+
+        profile = resolve_resource_profile(
+            settings, tmp_path / "s.duckdb", environ={PROFILE_ENV_VAR: "standard"}
+        )
+
+        assert profile.name == "worker"
+        assert profile.threads == 3
+        assert profile.memory_limit_mib == worker_profile().memory_limit_mib
+
+    def test_environment_selects_when_config_is_silent(self, tmp_path):
+        profile = resolve_resource_profile(
+            DuckDBResourceSettings(),
+            tmp_path / "s.duckdb",
+            environ={PROFILE_ENV_VAR: "worker:2"},
+        )
+
+        assert profile.name == "worker:2"
+        assert read_connection_config(environ={PROFILE_ENV_VAR: "worker:2"}) == (
+            worker_profile(2).settings()
+        )
+
+    def test_bind_resolves_every_setting_for_the_run(self, tmp_path):
+        database = tmp_path / "scenario.duckdb"
+
+        beside = DuckDBResourceProfile("standard", memory_limit_mib=512).bind(database)
+        rooted = DuckDBResourceProfile("standard").bind(
+            database, spill_root=tmp_path / "spill"
+        )
+
+        assert beside.is_bound and rooted.is_bound
+        assert beside.temp_directory == tmp_path / "scenario.duckdb.tmp"
+        assert rooted.temp_directory == (
+            tmp_path / "spill" / f"scenario-{os.getpid()}.tmp"
+        )
+        assert rooted.threads == (os.cpu_count() or 1)
+        assert rooted.max_spill_mib >= 1
+
+    def test_dbt_env_selects_the_profile_target(self, tmp_path):
+        profile = DuckDBResourceProfile(
+            "worker", memory_limit_mib=960, threads=2, max_spill_mib=2048
+        ).bind(tmp_path / "s.duckdb")
+
+        env = profile.dbt_env()
+
+        assert env["PLANALIGN_DBT_TARGET"] == DBT_TARGET
+        assert env["PLANALIGN_DUCKDB_MEMORY_LIMIT"] == "960MiB"
+        assert env["PLANALIGN_DUCKDB_THREADS"] == "2"
+        assert env["PLANALIGN_DUCKDB_TEMP_DIRECTORY"] == str(tmp_path / "s.duckdb.tmp")
+        assert env["PLANALIGN_DUCKDB_MAX_TEMP_SIZE"] == "2048MiB"
+        with pytest.raises(ResourceProfileError):
+            DuckDBResourceProfile("worker").dbt_env()
+
+
+@pytest.mark.fast
+class TestConsumers:
+    def test_connection_manager_applies_the_profile(self, tmp_path):
+        database = tmp_path / "s.duckdb"
+        profile = DuckDBResourceProfile(
+            "worker", memory_limit_mib=256, threads=2, max_spill_mib=128
+        ).bind(database)
+
+        with DatabaseConnectionManager(database, resource_profile=profile) as db:
+            with db.get_connection() as conn:
+                assert _setting(conn, "memory_limit") == "256.0 MiB"
+                assert _setting(conn, "temp_directory") == str(profile.temp_directory)
+                # Deterministic mode keeps its single thread.
+                assert _setting(conn, "threads") == 1
+
+    def test_profile_applied_later_reopens_connections(self, tmp_path):
+        database = tmp_path / "s.duckdb"
+        with DatabaseConnectionManager(database) as db:
+            with db.get_connection() as conn:
+                assert _setting(conn, "memory_limit") == "953.6 MiB"  # PRAGMA '1GB'
+            db.apply_resource_profile(
+                DuckDBResourceProfile("standard", memory_limit_mib=512).bind(database)
+            )
+            with db.get_connection() as conn:
+                assert _setting(conn, "memory_limit") == "512.0 MiB"
+
+    def test_dbt_runner_exports_the_profile(self, tmp_path):
+        profile = DuckDBResourceProfile("worker", memory_limit_mib=960).bind(
+            tmp_path / "s.duckdb"
+        )
+        runner = DbtRunner(executable="echo", database_path=str(tmp_path / "s.duckdb"))
+        runner.configure_resource_profile(profile)
+
+        env = runner._build_subprocess_env()
+
+        assert env["PLANALIGN_DBT_TARGET"] == DBT_TARGET
+        assert env["PLANALIGN_DUCKDB_MEMORY_LIMIT"] == "960MiB"
+
+
+class TestSpillMonitor:
+    @pytest.mark.fast
+    def test_tracks_peak_and_per_file_volume(self, tmp_path):
+        spill = tmp_path / "s.duckdb.tmp"
+        monitor = SpillMonitor(spill)
+
+        monitor.poll()  # not created yet: nothing spilled
+        spill.mkdir()
+        (spill / "duckdb_temp_block-1.block").write_bytes(b"x" * 3 * 1024 * 1024)
+        (spill / "duckdb_temp_block-2.block").write_bytes(b"x" * 1024 * 1024)
+        monitor.poll()
+        (spill / "duckdb_temp_block-1.block").unlink()
+        (spill / "duckdb_temp_block-3.block").write_bytes(b"x" * 2 * 1024 * 1024)
+        report = monitor.stop()
+
+        assert report.spilled
+        assert report.files == 3
+        assert report.peak_mib == pytest.approx(4.0)
+        assert report.written_mib == pytest.approx(6.0)
+        assert "6.0 MiB" in report.describe()
+
+    @pytest.mark.slow
+    def test_captures_a_real_duckdb_spill(self, tmp_path):
+        database = tmp_path / "s.duckdb"
+        profile = DuckDBResourceProfile(
+            "tiny", memory_limit_mib=32, threads=1, max_spill_mib=1024
+        ).bind(database)
+        monitor = SpillMonitor(
+            profile.temp_directory,
+            interval=0.01,
+            sampler=ResourceSampler(interval=0.01),
+        )
+        monitor.start()
+        conn = duckdb.connect(str(database), config=profile.connect_config())
+        try:
+            conn.execute(
+                """CREATE TABLE sorted AS
+                SELECT i, repeat('x', 40) || i::VARCHAR AS s
+                FROM range(1000000) AS t(i) ORDER BY s DESC"""
+            )
+        finally:
+            conn.close()
+            report = monitor.stop()
+
+        assert report.spilled
+        assert report.peak_mib > 0
+
+    @pytest.mark.fast
+    def test_orchestrator_records_the_report(self):
+        monitor = SimpleNamespace(
+            stop=lambda: SpillMonitor("missing").report(),
+        )
+        orchestrator = SimpleNamespace(spill_monitor=monitor, spill_report=None)
+
+        PipelineOrchestrator._stop_spill_monitor(orchestrator)
+
+        assert orchestrator.spill_report is not None
+        assert not orchestrator.spill_report.spilled
@@ -0,0 +1,123 @@
+"""Tests for columnar_archive: published runs rewritten as views over Parquet."""
+
+import json
+import shutil
+
+import duckdb
+import pytest
+
+from planalign_api.services.simulation.columnar_archive import (
+    ARCHIVE_DIRNAME,
+    MANIFEST_FILENAME,
+    archive_run_database,
+    compact_published_run,
+    relink_archives,
+)
+
+SNAPSHOT_QUERY = (
+    "SELECT * FROM fct_workforce_snapshot ORDER BY simulation_year, employee_id"
+)
+
+
+def _published_run(tmp_path):
+    run_dir = tmp_path / "workspace" / "runs" / "run-1"
+    (run_dir / "dbt_project" / "target").mkdir(parents=True)
+    (run_dir / "dbt_project" / "target" / "manifest.json").write_text("{}")
+    database = run_dir / "simulation.duckdb"
+    with duckdb.connect(str(database)) as conn:
+        conn.execute("CREATE TYPE status AS ENUM ('active', 'terminated')")
+        conn.execute(
+            """
+            CREATE TABLE fct_workforce_snapshot AS
+            SELECT (2025 + i % 3)::INTEGER AS simulation_year,
+                   'EMP' || lpad(((i * 7919) % 900)::VARCHAR, 4, '0') AS employee_id,
+                   (CASE WHEN i % 4 = 0 THEN 'terminated' ELSE 'active' END)::status
+                     AS employment_status,
+                   (50000 + i * 10.5)::DECIMAL(12, 2) AS prorated_annual_compensation
+            FROM range(900) t(i)
+            """
+        )
+        conn.execute("CREATE TABLE run_metadata AS SELECT 2025 AS start_year")
+        conn.execute("CREATE TABLE int_employee_state_by_year AS SELECT 1 AS x")
+        conn.execute(
+            "CREATE VIEW vw_active AS SELECT * FROM fct_workforce_snapshot "
+            "WHERE employment_status = 'active'"
+        )
+        conn.execute("CREATE VIEW vw_state AS SELECT * FROM int_employee_state_by_year")
+    return run_dir
+
+
+def _snapshot(database):
+    with duckdb.connect(str(database), read_only=True) as conn:
+        return (
+            conn.execute(SNAPSHOT_QUERY).fetchall(),
+            conn.execute("DESCRIBE fct_workforce_snapshot").fetchall(),
+        )
+
+
+@pytest.mark.fast
+class TestArchiveRunDatabase:
+    def test_catalog_reads_identically_and_drops_working_state(self, tmp_path):
+        run_dir = _published_run(tmp_path)
+        database = run_dir / "simulation.duckdb"
+        before = _snapshot(database)
+
+        manifest = archive_run_database(run_dir)
+
+        assert _snapshot(database) == before
+        assert set(manifest["tables"]) == {"fct_workforce_snapshot", "run_metadata"}
+        assert manifest["tables"]["fct_workforce_snapshot"]["sort"] == [
+            "simulation_year",
+            "employee_id",
+        ]
+        assert manifest["skipped_views"] == ["vw_state"]
+        assert not (run_dir / "dbt_project" / "target").exists()
+        with duckdb.connect(str(database), read_only=True) as conn:
+            kinds = dict(
+                conn.execute(
+                    "SELECT table_name, table_type FROM information_schema.tables"
+                ).fetchall()
+            )
+            assert conn.execute("SELECT COUNT(*) FROM vw_active").fetchone() == (675,)
+        assert kinds == {
+            "fct_workforce_snapshot": "VIEW",
+            "run_metadata": "VIEW",
+            "vw_active": "VIEW",
+        }
+
+    def test_archival_is_idempotent_and_can_be_disabled(self, tmp_path):
+        run_dir = _published_run(tmp_path)
+        compact_published_run(run_dir, {"storage": {"columnar_archive": False}})
+        assert not (run_dir / MANIFEST_FILENAME).exists()
+
+        compact_published_run(run_dir, {})
+        archived = (run_dir / "simulation.duckdb").read_bytes()
+
+        assert archive_run_database(run_dir) is None
+        assert (run_dir / "simulation.duckdb").read_bytes() == archived
+
+    def test_interrupted_archive_is_rebuilt_from_the_untouched_database(self, tmp_path):
+        run_dir = _published_run(tmp_path)
+        before = _snapshot(run_dir / "simulation.duckdb")
+        (run_dir / ARCHIVE_DIRNAME).mkdir()
+        (run_dir / ARCHIVE_DIRNAME / "fct_workforce_snapshot.parquet").write_text("")
+
+        archive_run_database(run_dir)
+
+        assert _snapshot(run_dir / "simulation.duckdb") == before
+
+    def test_copied_workspace_is_relinked_to_its_own_parquet(self, tmp_path):
+        run_dir = _published_run(tmp_path)
+        before = _snapshot(run_dir / "simulation.duckdb")
+        archive_run_database(run_dir)
+        copied = tmp_path / "imported"
+        shutil.copytree(tmp_path / "workspace", copied)
+        shutil.rmtree(tmp_path / "workspace")
+
+        assert relink_archives(copied) == 1
+        assert relink_archives(copied) == 0
+
+        moved_run = copied / "runs" / "run-1"
+        assert _snapshot(moved_run / "simulation.duckdb") == before
+        manifest = json.loads((moved_run / MANIFEST_FILENAME).read_text())
+        assert manifest["archive_dir"] == str((moved_run / ARCHIVE_DIRNAME).resolve())
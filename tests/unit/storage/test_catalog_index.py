@@ -0,0 +1,180 @@
+"""Tests for the persistent workspace/scenario catalog behind navigation reads."""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from planalign_api.models.scenario import ScenarioCreate
+from planalign_api.models.workspace import WorkspaceCreate
+from planalign_api.services import storage_usage
+from planalign_api.storage import catalog_index
+from planalign_api.storage.catalog_index import CATALOG_FILENAME, catalog_for
+from planalign_api.storage.workspace_storage import WorkspaceStorage
+
+pytestmark = pytest.mark.fast
+
+
+@pytest.fixture(autouse=True)
+def fresh_process():
+    """Each test starts as a freshly started API process would."""
+    _restart()
+    yield
+    _restart()
+
+
+def _restart() -> None:
+    catalog_index._catalogs.clear()
+    storage_usage.invalidate()
+
+
+def _write_scenario(workspace_dir: Path, scenario_id: str, **fields) -> Path:
+    scenario_dir = workspace_dir / "scenarios" / scenario_id
+    scenario_dir.mkdir(parents=True, exist_ok=True)
+    path = scenario_dir / "scenario.json"
+    path.write_text(
+        json.dumps(
+            {
+                "id": scenario_id,
+                "workspace_id": workspace_dir.name,
+                "name": scenario_id,
+                "created_at": "2026-01-01T00:00:00+00:00",
+                **fields,
+            }
+        )
+    )
+    return path
+
+
+def _forbid_metadata_reads(monkeypatch) -> None:
+    def fail(path):
+        raise AssertionError(f"navigation read parsed {path}")
+
+    monkeypatch.setattr(catalog_index, "_load_json", fail)
+
+
+def test_storage_mutations_keep_catalog_current(tmp_path, monkeypatch):
+    storage = WorkspaceStorage(tmp_path)
+    workspace = storage.create_workspace(WorkspaceCreate(name="Plan A"), {})
+    first = storage.create_scenario(workspace.id, ScenarioCreate(name="Base"))
+    second = storage.create_scenario(workspace.id, ScenarioCreate(name="High"))
+    storage.update_scenario_status(workspace.id, first.id, "completed", run_id="r1")
+
+    with monkeypatch.context() as patched:
+        _forbid_metadata_reads(patched)
+        [summary] = storage.list_workspaces()
+        assert storage.find_workspace_id_for_scenario(second.id) == workspace.id
+
+    assert (summary.name, summary.scenario_count) == ("Plan A", 2)
+    assert summary.last_run_at is not None
+
+    storage.delete_scenario(workspace.id, second.id)
+    assert storage.list_workspaces()[0].scenario_count == 1
+    assert storage.find_workspace_id_for_scenario(second.id) is None
+
+    storage.delete_workspace(workspace.id)
+    assert storage.list_workspaces() == []
+    assert storage.find_workspace_id_for_scenario(first.id) is None
+
+
+def test_startup_reparses_only_files_changed_while_down(tmp_path, monkeypatch):
+    storage = WorkspaceStorage(tmp_path)
+    workspace = storage.create_workspace(WorkspaceCreate(name="Plan A"), {})
+    scenario = storage.create_scenario(workspace.id, ScenarioCreate(name="Base"))
+    storage.create_scenario(workspace.id, ScenarioCreate(name="Untouched"))
+    storage.list_workspaces()
+    _restart()
+
+    scenario_json = (
+        tmp_path / workspace.id / "scenarios" / scenario.id / "scenario.json"
+    )
+    data = json.loads(scenario_json.read_text())
+    data["last_run_at"] = "2026-03-04T05:06:07+00:00"
+    scenario_json.write_text(json.dumps(data))
+
+    parsed = []
+    original = catalog_index._load_json
+    monkeypatch.setattr(
+        catalog_index,
+        "_load_json",
+        lambda path: parsed.append(path) or original(path),
+    )
+    [summary] = WorkspaceStorage(tmp_path).list_workspaces()
+
+    assert parsed == [scenario_json]
+    assert summary.last_run_at.isoformat() == "2026-03-04T05:06:07+00:00"
+
+
+def test_measured_storage_survives_restart_until_runs_change(tmp_path):
+    storage = WorkspaceStorage(tmp_path)
+    workspace = storage.create_workspace(WorkspaceCreate(name="Plan A"), {})
+    scenario = storage.create_scenario(workspace.id, ScenarioCreate(name="Base"))
+    (tmp_path / workspace.id / "blob.bin").write_bytes(b"x" * (1024 * 1024))
+    storage_usage.workspace_totals(tmp_path)
+    measured = storage.list_workspaces()[0].storage_used_mb
+    _restart()
+
+    storage = WorkspaceStorage(tmp_path)
+    assert storage.list_workspaces()[0].storage_used_mb == measured
+
+    storage.delete_scenario_database(workspace.id, scenario.id)
+    assert storage.list_workspaces()[0].storage_used_mb == measured
+    (tmp_path / workspace.id / "scenarios" / scenario.id / "simulation.duckdb").touch()
+    storage.delete_scenario_database(workspace.id, scenario.id)
+    assert storage.list_workspaces()[0].storage_used_mb is None
+
+
+def test_out_of_band_workspaces_are_picked_up(tmp_path):
+    storage = WorkspaceStorage(tmp_path)
+    workspace = storage.create_workspace(WorkspaceCreate(name="Plan A"), {})
+    scenario = storage.create_scenario(workspace.id, ScenarioCreate(name="Base"))
+    assert len(storage.list_workspaces()) == 1
+
+    # An import copies a workspace tree into place without going through
+    # WorkspaceStorage.
+    shutil.copytree(tmp_path / workspace.id, tmp_path / "imported")
+    assert [s.id for s in storage.list_workspaces()] == sorted(
+        [workspace.id, "imported"]
+    )
+
+    # A scenario written behind the catalog's back is found by the probe.
+    _write_scenario(tmp_path / workspace.id, "late")
+    assert storage.find_workspace_id_for_scenario("late") == workspace.id
+    assert catalog_for(tmp_path).workspace_for_scenario("late") == workspace.id
+    assert storage.find_workspace_id_for_scenario(scenario.id) in {
+        workspace.id,
+        "imported",
+    }
+
+
+def test_reconcile_indexes_current_result_pointer(tmp_path):
+    workspace_dir = tmp_path / "ws"
+    workspace_dir.mkdir()
+    (workspace_dir / "workspace.json").write_text(
+        json.dumps({"id": "ws", "name": "W", "created_at": "2026-01-01T00:00:00"})
+    )
+    scenario_json = _write_scenario(workspace_dir, "sc")
+    (scenario_json.parent / "current_result.json").write_text(
+        json.dumps({"run_id": "run-7"})
+    )
+
+    catalog = catalog_for(tmp_path)
+    assert catalog.current_run_id("ws", "sc") == "run-7"
+
+    (scenario_json.parent / "current_result.json").unlink()
+    catalog.reconcile()
+    assert catalog.current_run_id("ws", "sc") is None
+
+
+def test_corrupt_catalog_is_rebuilt_from_the_tree(tmp_path):
+    storage = WorkspaceStorage(tmp_path)
+    workspace = storage.create_workspace(WorkspaceCreate(name="Plan A"), {})
+    _restart()
+    for path in tmp_path.glob(f"{CATALOG_FILENAME}*"):
+        path.unlink()
+    (tmp_path / CATALOG_FILENAME).write_bytes(b"not a sqlite database" * 100)
+
+    assert [s.id for s in WorkspaceStorage(tmp_path).list_workspaces()] == [
+        workspace.id
+    ]
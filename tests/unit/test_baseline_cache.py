@@ -0,0 +1,184 @@
+"""Unit tests for the validate-change baseline cache (no simulation needed)."""
+
+import os
+import time
+from pathlib import Path
+
+import duckdb
+import yaml
+
+from planalign_orchestrator.baseline_cache import (
+    ENTRY_FILE,
+    BaselineCache,
+    BaselineCacheKey,
+    baseline_cache_key,
+    compare_fingerprints,
+    fingerprint_marts,
+)
+
+
+def _database(path: Path, statements: list[str]) -> Path:
+    with duckdb.connect(str(path)) as connection:
+        for statement in statements:
+            connection.execute(statement)
+    return path
+
+
+def _key(head: str = "abc123") -> BaselineCacheKey:
+    return BaselineCacheKey(
+        head_sha=head,
+        config_fingerprint="cfg",
+        census_sha="census",
+        horizon="2025-2027",
+    )
+
+
+def test_fingerprints_are_order_independent_and_duplicate_preserving(tmp_path):
+    create = "CREATE TABLE fct_test (id INTEGER, created_at TIMESTAMP)"
+    a = _database(
+        tmp_path / "a.duckdb",
+        [create, "INSERT INTO fct_test VALUES (1, now()), (2, now()), (2, now())"],
+    )
+    b = _database(
+        tmp_path / "b.duckdb",
+        [create, "INSERT INTO fct_test VALUES (2, NULL), (1, NULL), (2, NULL)"],
+    )
+    c = _database(
+        tmp_path / "c.duckdb",
+        [create, "INSERT INTO fct_test VALUES (1, NULL), (1, NULL), (2, NULL)"],
+    )
+
+    fa = fingerprint_marts(a, ["fct_test", "dim_absent"], ["created_at"])
+    fb = fingerprint_marts(b, ["fct_test", "dim_absent"], ["created_at"])
+    fc = fingerprint_marts(c, ["fct_test", "dim_absent"], ["created_at"])
+
+    assert fa["dim_absent"] is None
+    assert compare_fingerprints(fa, fb) == {
+        "dim_absent": ("absent", "absent"),
+        "fct_test": (0, 0),
+    }
+    assert compare_fingerprints(fa, fc)["fct_test"] == (
+        "fingerprint-mismatch",
+        "fingerprint-mismatch",
+    )
+
+
+def test_fingerprint_comparison_reports_schema_and_presence(tmp_path):
+    a = _database(
+        tmp_path / "a.duckdb",
+        ["CREATE TABLE fct_x (id INTEGER)", "CREATE TABLE fct_y (id INTEGER)"],
+    )
+    b = _database(tmp_path / "b.duckdb", ["CREATE TABLE fct_x (id BIGINT)"])
+
+    diffs = compare_fingerprints(
+        fingerprint_marts(a, ["fct_x", "fct_y"]),
+        fingerprint_marts(b, ["fct_x", "fct_y"]),
+    )
+
+    assert diffs["fct_x"] == ("schema-mismatch", "schema-mismatch")
+    assert diffs["fct_y"] == ("present", "absent")
+
+
+def test_cache_round_trip_and_key_isolation(tmp_path):
+    db = _database(
+        tmp_path / "baseline.duckdb",
+        ["CREATE TABLE fct_test (id INTEGER)", "INSERT INTO fct_test VALUES (1)"],
+    )
+    cache = BaselineCache(tmp_path / "cache", store_database=True)
+
+    assert cache.get(_key()) is None
+    cache.put(
+        _key(),
+        db_path=db,
+        marts=["fct_test"],
+        excluded=(),
+        wall_s=12.5,
+        peak_rss_mb=900.0,
+        invocation_count=30,
+    )
+
+    hit = cache.get(_key())
+    assert hit is not None
+    assert (hit.wall_s, hit.peak_rss_mb, hit.invocation_count) == (12.5, 900.0, 30)
+    assert hit.db_path is not None and hit.db_path.is_file()
+    assert hit.fingerprints == fingerprint_marts(db, ["fct_test"])
+    assert cache.get(_key(head="def456")) is None
+
+
+def test_fingerprint_only_cache_keeps_no_database(tmp_path):
+    db = _database(tmp_path / "baseline.duckdb", ["CREATE TABLE fct_test (id INTEGER)"])
+    cache = BaselineCache(tmp_path / "cache")
+    cache.put(
+        _key(),
+        db_path=db,
+        marts=["fct_test"],
+        excluded=(),
+        wall_s=1.0,
+        peak_rss_mb=None,
+        invocation_count=None,
+    )
+
+    hit = cache.get(_key())
+    assert hit is not None and hit.db_path is None
+
+
+def test_evict_by_age_then_least_recently_used_size(tmp_path):
+    db = _database(tmp_path / "baseline.duckdb", ["CREATE TABLE fct_test (id INTEGER)"])
+    cache = BaselineCache(tmp_path / "cache", store_database=True, max_age_days=1)
+    keys = [_key(head=h) for h in ("old", "lru", "fresh")]
+    for key in keys:
+        cache.put(
+            key,
+            db_path=db,
+            marts=["fct_test"],
+            excluded=(),
+            wall_s=1.0,
+            peak_rss_mb=None,
+            invocation_count=None,
+        )
+    now = time.time()
+    for key, age in zip(keys, (3 * 86400, 600, 0)):
+        entry = tmp_path / "cache" / key.digest / ENTRY_FILE
+        os.utime(entry, (now - age, now - age))
+    entry_size = sum(
+        p.stat().st_size for p in (tmp_path / "cache" / keys[2].digest).rglob("*")
+    )
+    cache.max_bytes = entry_size
+
+    evicted = cache.evict(now=now)
+
+    assert evicted == [keys[0].digest, keys[1].digest]
+    assert cache.get(keys[2]) is not None
+
+
+def test_cache_key_tracks_census_content_not_path_or_horizon(tmp_path):
+    census_a = tmp_path / "a.parquet"
+    census_b = tmp_path / "moved.parquet"
+    census_a.write_bytes(b"census-bytes")
+    census_b.write_bytes(b"census-bytes")
+
+    def key_for(census: Path, start: int, end: int, growth: float) -> BaselineCacheKey:
+        config = tmp_path / f"config_{census.stem}_{start}_{growth}.yaml"
+        config.write_text(
+            yaml.safe_dump(
+                {
+                    "setup": {"census_parquet_path": str(census)},
+                    "simulation": {
+                        "start_year": start,
+                        "end_year": end,
+                        "target_growth_rate": growth,
+                    },
+                }
+            )
+        )
+        return baseline_cache_key(
+            head_sha="abc",
+            effective_config=config,
+            horizon=(start, end),
+            repo_root=tmp_path,
+        )
+
+    base = key_for(census_a, 2025, 2027, 0.03)
+    assert key_for(census_b, 2025, 2027, 0.03).digest == base.digest
+    assert key_for(census_a, 2025, 2029, 0.03).digest != base.digest
+    assert key_for(census_a, 2025, 2027, 0.05).digest != base.digest
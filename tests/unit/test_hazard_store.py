@@ -0,0 +1,132 @@
+"""Shared hazard cache store: derived params hash and cross-database reuse.
+
+Every fresh scenario, seed or Studio-attempt database used to rebuild
+``int_effective_parameters`` and the four ``dim_*_hazards`` tables with dbt even
+when the hazard inputs were identical. The store publishes one Parquet copy per
+params hash; a later database with the same hash copies it in instead.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import duckdb
+import pytest
+
+from planalign_orchestrator.hazard_cache_manager import HazardCacheManager
+from planalign_orchestrator.hazard_store import HazardStore, hazard_inputs
+
+REPO_DBT = Path(__file__).resolve().parents[2] / "dbt"
+TABLES = HazardCacheManager.store_tables()
+
+
+def _mini_project(root: Path) -> Path:
+    (root / "models").mkdir(parents=True)
+    (root / "seeds").mkdir()
+    (root / "macros").mkdir()
+    (root / "dbt_project.yml").write_text(
+        "name: mini\nvars:\n  hazard_rate: 0.1\n  unrelated_rate: 0.5\n"
+    )
+    (root / "models" / "dim_hazards.sql").write_text(
+        "{% set base = 'stg_base' %}\n"
+        "SELECT rate * {{ var('hazard_rate') }} FROM {{ ref(base) }}\n"
+    )
+    (root / "models" / "stg_base.sql").write_text("SELECT * FROM {{ ref('base') }}\n")
+    (root / "seeds" / "base.csv").write_text("rate\n0.2\n")
+    (root / "seeds" / "other.csv").write_text("x\n1\n")
+    return root
+
+
+def _write_caches(db_path: Path, params_hash: str) -> None:
+    with duckdb.connect(str(db_path)) as conn:
+        for table in TABLES:
+            conn.execute(f"CREATE OR REPLACE TABLE {table} AS SELECT 1 AS level_id")
+        conn.execute(
+            f"CREATE OR REPLACE TABLE {HazardCacheManager.METADATA_MODEL} AS "
+            "SELECT 'dim_termination_hazards' AS cache_name, ? AS params_hash, "
+            "now() AS built_at, TRUE AS is_current, 1 AS row_count, "
+            "'abc' AS data_checksum",
+            [params_hash],
+        )
+
+
+def _manager(db_path: Path, store: HazardStore, params_hash: str):
+    dbt_runner = MagicMock()
+    dbt_runner.database_path = str(db_path)
+    manager = HazardCacheManager(config=MagicMock(), dbt_runner=dbt_runner, store=store)
+    manager.compute_hazard_params_hash = MagicMock(return_value=params_hash)
+    return manager, dbt_runner
+
+
+@pytest.mark.fast
+def test_repo_hazard_closure_reaches_every_seed_it_reads():
+    inputs = hazard_inputs(REPO_DBT, TABLES)
+
+    # `ref(comp_levers)` is bound through `{% set %}` in int_effective_parameters.
+    assert "stg_comp_levers" in inputs.models
+    assert {"comp_levers", "config_termination_hazard_base"} <= set(inputs.seeds)
+    assert "config_age_bands" not in inputs.seeds
+    assert {"cola_rate", "merit_budget", "scenario_id"} <= inputs.var_names
+
+
+@pytest.mark.fast
+def test_hash_tracks_closure_inputs_and_ignores_everything_else(tmp_path):
+    project = _mini_project(tmp_path / "dbt")
+
+    def fingerprint(**invocation_vars):
+        return hazard_inputs(project, ["dim_hazards"]).fingerprint(invocation_vars)
+
+    baseline = fingerprint()
+    (project / "seeds" / "other.csv").write_text("x\n2\n")
+    assert fingerprint() == baseline
+    assert fingerprint(unrelated_rate=0.9) == baseline
+
+    assert fingerprint(hazard_rate=0.2) != baseline
+    (project / "seeds" / "base.csv").write_text("rate\n0.3\n")
+    assert fingerprint() != baseline
+
+
+@pytest.mark.fast
+def test_published_caches_install_into_a_fresh_database(tmp_path):
+    store = HazardStore(tmp_path / "store")
+    built = tmp_path / "built.duckdb"
+    fresh = tmp_path / "fresh.duckdb"
+    _write_caches(built, "h" * 64)
+    duckdb.connect(str(fresh)).close()
+
+    assert store.publish(built, "h" * 64, TABLES) is True
+    assert store.publish(built, "h" * 64, TABLES) is False
+    assert store.install(fresh, "x" * 64) is None
+    assert store.install(fresh, "h" * 64) == TABLES
+
+    with duckdb.connect(str(fresh)) as conn:
+        stored_hash = conn.execute(
+            "SELECT params_hash FROM hazard_cache_metadata"
+        ).fetchone()[0]
+    assert stored_hash == "h" * 64
+
+
+@pytest.mark.fast
+def test_store_hit_skips_dbt_and_miss_rebuilds_then_publishes(tmp_path):
+    store = HazardStore(tmp_path / "store")
+    first_db = tmp_path / "seed_1.duckdb"
+    second_db = tmp_path / "seed_2.duckdb"
+    for db in (first_db, second_db):
+        duckdb.connect(str(db)).close()
+
+    first, first_runner = _manager(first_db, store, "s" * 64)
+
+    def build(args, **kwargs):
+        if args[0] == "build":
+            _write_caches(first_db, kwargs["dbt_vars"]["hazard_params_hash"])
+        return MagicMock(success=True)
+
+    first_runner.execute_command.side_effect = build
+    first.ensure_hazard_caches_current()
+
+    second, second_runner = _manager(second_db, store, "s" * 64)
+    second.ensure_hazard_caches_current()
+
+    assert first_runner.execute_command.call_count == 2
+    assert store.contains("s" * 64)
+    second_runner.execute_command.assert_not_called()
+    assert second.should_rebuild_caches() is False